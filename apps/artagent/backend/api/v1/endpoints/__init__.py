@@ -7,6 +7,7 @@ WebSocket and REST endpoints for voice conversations.
 Endpoint Overview:
 ------------------
 health.py       - Health checks, readiness probes (GET /api/v1/health/*)
+diagnostics.py  - Event-loop stall diagnostics (GET /api/v1/diagnostics/*)
 calls.py        - ACS call lifecycle webhooks (POST /api/v1/calls/*)
 media.py        - ACS media streaming WebSocket (WS /api/v1/media/*)
 browser.py      - Browser WebSocket endpoints (WS /api/v1/browser/*)
@@ -25,7 +25,6 @@ from __future__ import annotations
 
 import asyncio
 import json
-import time
 import uuid
 from typing import Any
 
@@ -42,6 +41,11 @@ from apps.artagent.backend.src.ws_helpers.shared_ws import (
     send_agent_inventory,
 )
 from apps.artagent.backend.voice import VoiceLiveSDKHandler
+from apps.artagent.backend.voice.shared.endpointing import (
+    EndpointerConfig,
+    EndpointEventType,
+    EnergyEndpointer,
+)
 from fastapi import (
     APIRouter,
     HTTPException,
@@ -70,7 +74,6 @@ from ..handlers.media_handler import (
     MediaHandler,
     MediaHandlerConfig,
     TransportType,
-    pcm16le_rms,
 )
 from ..schemas.realtime import RealtimeStatusResponse
 
@@ -429,12 +432,18 @@ async def _process_voice_live_messages(
     conn_id: str,
 ) -> None:
     """
-    Process Voice Live PCM frames with RMS-based VAD.
+    Process Voice Live PCM frames with adaptive energy endpointing.
 
-    Matches media.py processing pattern.
+    Matches media.py processing pattern. The endpointer tracks the caller's
+    noise floor, so the commit on end of speech is not tied to a fixed RMS level.
     """
-    speech_active = False
-    silence_started_at: float | None = None
+    endpointer = EnergyEndpointer(
+        EndpointerConfig(
+            sample_rate=VOICE_LIVE_PCM_SAMPLE_RATE,
+            min_start_threshold=VOICE_LIVE_SPEECH_RMS_THRESHOLD,
+            hangover_ms=int(VOICE_LIVE_SILENCE_GAP_SECONDS * 1000),
+        )
+    )
 
     with tracer.start_as_current_span(
         "api.v1.browser.process_voice_live",
@@ -481,20 +490,10 @@ async def _process_voice_live_messages(
                         audio_bytes, sample_rate=VOICE_LIVE_PCM_SAMPLE_RATE
                     )
 
-                    # RMS-based speech detection
-                    rms_value = pcm16le_rms(audio_bytes)
-                    now = time.perf_counter()
-
-                    if rms_value >= VOICE_LIVE_SPEECH_RMS_THRESHOLD:
-                        speech_active = True
-                        silence_started_at = None
-                    elif speech_active:
-                        if silence_started_at is None:
-                            silence_started_at = now
-                        elif now - silence_started_at >= VOICE_LIVE_SILENCE_GAP_SECONDS:
+                    # Energy endpointing: commit the buffer on end of speech
+                    for event in endpointer.process(audio_bytes):
+                        if event.type is EndpointEventType.SPEECH_END:
                             await handler.commit_audio_buffer()
-                            speech_active = False
-                            silence_started_at = None
                     continue
 
                 # Handle text messages
@@ -520,7 +519,10 @@ async def _process_voice_live_messages(
             span.set_status(Status(StatusCode.ERROR, str(exc)))
             raise
         finally:
-            if speech_active:
+            span.set_attributes(
+                {f"endpointing.{k}": v for k, v in endpointer.stats.to_dict().items() if v is not None}
+            )
+            if endpointer.in_speech:
                 try:
                     await handler.commit_audio_buffer()
                 except Exception:
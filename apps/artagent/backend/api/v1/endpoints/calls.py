@@ -6,6 +6,7 @@ REST API endpoints for managing phone calls through Azure Communication Services
 """
 
 import asyncio
+import json
 from typing import Any
 
 from apps.artagent.backend.api.v1.schemas.call import (
@@ -61,6 +62,17 @@ def _coerce_optional_bool(value: Any) -> bool | None:
     return None
 
 
+async def _claim_call(http_request: Request, call_id: str | None) -> None:
+    """Record this worker as the owner of ``call_id`` in multi-worker mode."""
+    registry = getattr(http_request.app.state, "worker_registry", None)
+    if registry is None or not call_id:
+        return
+    try:
+        await registry.claim_async("call", call_id)
+    except Exception as exc:
+        logger.warning("Failed to claim call %s for this worker: %s", call_id, exc)
+
+
 def create_call_event(event_type: str, call_id: str, data: dict) -> CloudEvent:
     """
     Create a CloudEvent for call-related operations using the V1 event system.
@@ -243,10 +255,13 @@ async def initiate_call(
                     browser_session_id=browser_session_id,  # 🎯 Pass browser session for coordination
                     stream_mode=effective_stream_mode,
                     record_call=record_call_override,
+                    app_state=http_request.app.state,
                 )
                 if result.get("status") == "success":
                     call_id = result.get("callId")
                     recording_enabled = result.get("recording_enabled")
+                    # Callbacks and media for this call must reach this worker's state
+                    await _claim_call(http_request, call_id)
 
                     # Pre-initialize a Voice Live session bound to this call (no audio yet, no pool)
                     try:
@@ -667,8 +682,17 @@ async def answer_inbound_call(
                     acs_caller=http_request.app.state.acs_caller,
                     redis_mgr=getattr(http_request.app.state, "redis", None),
                     record_call=record_call_override,
+                    app_state=http_request.app.state,
                 )
 
+            if isinstance(result, JSONResponse) and result.status_code == 200:
+                try:
+                    answered = json.loads(result.body)
+                except ValueError:
+                    answered = {}
+                if isinstance(answered, dict):
+                    await _claim_call(http_request, answered.get("call_connection_id"))
+
             return result
 
         except Exception as exc:
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 import logging
 import os
 import secrets
@@ -12,6 +11,7 @@ from fastapi import APIRouter, Depends, HTTPException, Request, status
 from pydantic import BaseModel, EmailStr, Field
 from pymongo.errors import NetworkTimeout, PyMongoError
 from src.cosmosdb.manager import CosmosDBMongoCoreManager
+from src.pools.executors import COSMOS, run_blocking
 from src.cosmosdb.config import get_database_name, get_users_collection_name
 from src.stateful.state_managment import MemoManager
 
@@ -1445,7 +1445,7 @@ async def _persist_demo_user(response: DemoUserResponse) -> None:
             manager.close_connection()
 
     try:
-        await asyncio.to_thread(_upsert)
+        await run_blocking(COSMOS, _upsert)
     except (NetworkTimeout, PyMongoError) as exc:
         logger.exception("Failed to persist demo profile %s", document["_id"], exc_info=exc)
         raise HTTPException(
@@ -1655,7 +1655,7 @@ async def lookup_demo_user(
             manager.close_connection()
 
     try:
-        document = await asyncio.to_thread(_query)
+        document = await run_blocking(COSMOS, _query)
     except (NetworkTimeout, PyMongoError) as exc:
         logger.exception("Failed to lookup demo profile for email=%s", email, exc_info=exc)
         raise HTTPException(
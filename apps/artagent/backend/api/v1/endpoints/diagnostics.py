@@ -0,0 +1,49 @@
+"""
+Runtime Diagnostics Endpoints
+=============================
+
+Operational endpoints for investigating latency problems on a live worker.
+
+Endpoints:
+- GET /api/v1/diagnostics/event-loop - Event-loop lag and blocking call sites
+"""
+
+from typing import Any
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from utils.ml_logging import get_logger
+
+logger = get_logger("v1.diagnostics")
+
+router = APIRouter()
+
+
+@router.get(
+    "/diagnostics/event-loop",
+    summary="Event-Loop Stall Diagnostics",
+    description="""
+    Event-loop scheduling lag for this worker and the call sites that were
+    running on the loop thread while it was stalled.
+
+    Call sites are aggregated from stack samples taken by a watchdog thread
+    whenever the loop misses its heartbeat by more than the stall threshold
+    (``EVENT_LOOP_STALL_THRESHOLD_MS``). ``estimated_blocked_ms`` is the number
+    of samples times the sampling interval.
+    """,
+    tags=["Health"],
+)
+async def event_loop_diagnostics(
+    request: Request,
+    top: int = Query(20, ge=1, le=200, description="Number of call sites to return"),
+    reset: bool = Query(False, description="Clear statistics after reading them"),
+) -> dict[str, Any]:
+    """Return event-loop lag statistics and the heaviest blocking call sites."""
+    monitor = getattr(request.app.state, "loop_monitor", None)
+    if monitor is None:
+        raise HTTPException(status_code=503, detail="Event-loop monitor not enabled")
+
+    snapshot = monitor.snapshot(top=top)
+    if reset:
+        monitor.reset()
+        logger.info("event loop diagnostics reset")
+    return snapshot
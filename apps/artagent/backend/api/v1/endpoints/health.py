@@ -16,7 +16,7 @@ import re
 import time
 from collections.abc import Iterable
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Literal
 
 from config import (
     get_provider_status,
@@ -62,6 +62,7 @@ from apps.artagent.backend.api.v1.schemas.health import (
     ReadinessResponse,
     ServiceCheck,
 )
+from src.pools.executors import executor_snapshots
 from utils.ml_logging import get_logger
 
 logger = get_logger("v1.health")
@@ -606,6 +607,32 @@ async def readiness_check(
     return JSONResponse(content=response_data.dict(), status_code=status_code)
 
 
+def _sum_pool_metrics(a: PoolMetrics, b: PoolMetrics) -> PoolMetrics:
+    """Combine the same pool as reported by two worker processes."""
+    counters = (
+        "warm_pool_size",
+        "warm_pool_target",
+        "active_sessions",
+        "allocations_total",
+        "allocations_dedicated",
+        "allocations_warm",
+        "allocations_cold",
+        "warmup_cycles",
+        "warmup_failures",
+    )
+    return a.model_copy(
+        update={
+            **{name: getattr(a, name) + getattr(b, name) for name in counters},
+            "arrival_rate_per_s": a.arrival_rate_per_s + b.arrival_rate_per_s,
+            "recent_cold_fraction": max(a.recent_cold_fraction, b.recent_cold_fraction),
+            # Per-worker latency summaries cannot be combined
+            "acquire_latency_ms": {},
+            "ready": a.ready and b.ready,
+            "background_warmup": a.background_warmup or b.background_warmup,
+        }
+    )
+
+
 @router.get(
     "/pools",
     response_model=PoolsHealthResponse,
@@ -618,7 +645,9 @@ async def readiness_check(
     """,
     tags=["Health"],
 )
-async def pools_health(request: Request) -> PoolsHealthResponse:
+async def pools_health(
+    request: Request, scope: Literal["worker", "container"] = "worker"
+) -> PoolsHealthResponse:
     """
     Get resource pool health and metrics.
 
@@ -627,7 +656,31 @@ async def pools_health(request: Request) -> PoolsHealthResponse:
     - Allocation tier breakdown (DEDICATED/WARM/COLD)
     - Session cache statistics
     - Background warmup status
+
+    With ``scope=container`` in multi-worker mode, the pools of every live worker
+    process on this host are summed from their registry heartbeats.
     """
+    snapshots = [
+        pool.snapshot() if hasattr(pool, "snapshot") else {"name": pool_attr}
+        for pool_attr in ("tts_pool", "stt_pool")
+        if (pool := getattr(request.app.state, pool_attr, None)) is not None
+    ]
+    workers = 1
+    registry = getattr(request.app.state, "worker_registry", None)
+    if scope == "container" and registry is not None:
+        try:
+            infos = await registry.workers_async()
+        except Exception as exc:
+            logger.warning("Worker registry unavailable for pool health: %s", exc)
+            infos = []
+        if infos:
+            workers = len(infos)
+            snapshots = [
+                snapshot
+                for info in infos
+                for snapshot in info.get("status", {}).get("pools", {}).values()
+            ]
+
     pools_data: dict[str, PoolMetrics] = {}
     totals = {
         "warm": 0,
@@ -638,16 +691,11 @@ async def pools_health(request: Request) -> PoolsHealthResponse:
         "allocations_cold": 0,
     }
 
-    for pool_attr in ("tts_pool", "stt_pool"):
-        pool = getattr(request.app.state, pool_attr, None)
-        if pool is None:
-            continue
-
-        snapshot = pool.snapshot() if hasattr(pool, "snapshot") else {}
+    for snapshot in snapshots:
         metrics_raw = snapshot.get("metrics", {})
 
         pool_metrics = PoolMetrics(
-            name=snapshot.get("name", pool_attr),
+            name=snapshot.get("name", "pool"),
             ready=snapshot.get("ready", False),
             warm_pool_size=snapshot.get("warm_pool_size", 0),
             warm_pool_target=snapshot.get("warm_pool_target", 0),
@@ -660,8 +708,14 @@ async def pools_health(request: Request) -> PoolsHealthResponse:
             warmup_cycles=metrics_raw.get("warmup_cycles", 0),
             warmup_failures=metrics_raw.get("warmup_failures", 0),
             background_warmup=snapshot.get("background_warmup", False),
+            arrival_rate_per_s=metrics_raw.get("arrival_rate_per_s", 0.0),
+            recent_cold_fraction=metrics_raw.get("recent_cold_fraction", 0.0),
+            acquire_latency_ms=metrics_raw.get("acquire_latency_ms", {}),
+        )
+        existing = pools_data.get(pool_metrics.name)
+        pools_data[pool_metrics.name] = (
+            _sum_pool_metrics(existing, pool_metrics) if existing else pool_metrics
         )
-        pools_data[pool_metrics.name] = pool_metrics
 
         # Accumulate totals
         totals["warm"] += pool_metrics.warm_pool_size
@@ -685,6 +739,8 @@ async def pools_health(request: Request) -> PoolsHealthResponse:
         timestamp=time.time(),
         pools=pools_data,
         summary={
+            "scope": scope,
+            "workers": workers,
             "total_warm": totals["warm"],
             "total_active_sessions": totals["active_sessions"],
             "allocations_total": totals["allocations_total"],
@@ -698,6 +754,56 @@ async def pools_health(request: Request) -> PoolsHealthResponse:
     )
 
 
+@router.get(
+    "/executors",
+    summary="Workload Executor Health",
+    description="""
+    Get load and latency of the bounded thread pools per blocking workload class
+    (speech synthesis, speech recognition, Redis, Cosmos/tools, background I/O).
+
+    Reports utilization, queue depth, shed submissions and queue-wait/run-time
+    percentiles. An executor whose queue reached its shed limit is reported as saturated.
+    """,
+    tags=["Health"],
+)
+async def executors_health() -> dict[str, Any]:
+    """Get per-workload executor metrics."""
+    executors = executor_snapshots()
+    saturated = [
+        name for name, snapshot in executors.items() if snapshot["queued"] >= snapshot["shed_queue"]
+    ]
+    return {
+        "status": "degraded" if saturated else "healthy",
+        "timestamp": time.time(),
+        "saturated": saturated,
+        "executors": executors,
+    }
+
+
+@router.get(
+    "/speech-token",
+    summary="Speech Token Refresh Health",
+    description="""
+    Get the Azure AD token lifecycle for Speech services: time to expiry, next
+    scheduled background refresh, fetch counts by reason and fetch/refresh-lag
+    percentiles. Inline fetches mean a speech call paid token latency; the
+    status is degraded when the background refresh is not running.
+    """,
+    tags=["Health"],
+)
+async def speech_token_health(request: Request) -> dict[str, Any]:
+    """Get Speech AAD token refresh metrics."""
+    manager = getattr(request.app.state, "speech_token_manager", None)
+    if manager is None:
+        return {"status": "not_configured", "timestamp": time.time()}
+    snapshot = manager.snapshot()
+    return {
+        "status": "healthy" if snapshot["background_refresh"] else "degraded",
+        "timestamp": time.time(),
+        **snapshot,
+    }
+
+
 @router.get(
     "/appconfig",
     summary="App Configuration Status",
@@ -8,13 +8,28 @@ Supports Phase 3 Dashboard Integration for the telemetry plan.
 Endpoints:
 - GET /api/v1/metrics/sessions - List active sessions with basic metrics
 - GET /api/v1/metrics/session/{session_id} - Get detailed metrics for a session
+- GET /api/v1/metrics/session/{session_id}/waterfall - Per-turn stage timeline for a session
+- GET /api/v1/metrics/latency - Per-stage latency percentiles for this replica or the fleet
+- GET /api/v1/metrics/tools - Per-tool execution latency histograms for this replica
+- GET /api/v1/metrics/telemetry - Span sampling, exporter queue and log queue counters
 """
 
+import asyncio
 import json
+import time
 from typing import Any
 
+from apps.artagent.backend.registries.toolstore.registry import get_tool_latency_stats
 from fastapi import APIRouter, HTTPException, Query, Request
-from utils.ml_logging import get_logger
+from src.pools.executors import REDIS, run_blocking
+from src.tools.latency_sketch import QuantileSketch, process_sketches
+from src.tools.turn_timeline import (
+    CORE_KEY as TURN_TIMELINE_KEY,
+    STAGES as TURN_STAGES,
+    turn_timelines,
+)
+from utils.ml_logging import get_logger, log_queue_stats
+from utils.telemetry_config import span_pipeline_stats
 
 from ..schemas.metrics import (
     ActiveSessionsResponse,
@@ -51,6 +66,35 @@ def _get_latency_stats(samples: list[float]) -> LatencyStats:
     )
 
 
+def _get_aggregate_latency_stats(acc: dict[str, Any]) -> LatencyStats:
+    """
+    Latency statistics from a running stage aggregate (seconds) with its sketch.
+
+    Constant cost per stage regardless of how many samples the session recorded.
+    Percentiles keep the same minimum sample counts as ``_get_latency_stats``.
+    """
+    count = int(acc.get("count", 0))
+    if not count:
+        return LatencyStats(avg_ms=0, min_ms=0, max_ms=0, count=0)
+
+    percentiles: dict[str, float | None] = {"p50_ms": None, "p95_ms": None, "p99_ms": None}
+    if acc.get("sketch"):
+        p50, p95, p99 = QuantileSketch.from_dict(acc["sketch"]).quantiles((0.5, 0.95, 0.99))
+        percentiles["p50_ms"] = p50 * 1000
+        if count >= 20:
+            percentiles["p95_ms"] = p95 * 1000
+        if count >= 100:
+            percentiles["p99_ms"] = p99 * 1000
+
+    return LatencyStats(
+        avg_ms=acc["total"] / count * 1000,
+        min_ms=acc["min"] * 1000,
+        max_ms=acc["max"] * 1000,
+        count=count,
+        **percentiles,
+    )
+
+
 async def _get_session_metrics_from_redis(
     request: Request, session_id: str
 ) -> dict[str, Any] | None:
@@ -69,8 +113,8 @@ async def _get_session_metrics_from_redis(
         # Session data is stored at key: session:{session_id}
         session_key = f"session:{session_id}"
 
-        # Use sync client since that's what AzureRedisManager exposes
-        session_data = redis_manager.get_session_data(session_key)
+        # AzureRedisManager's client is synchronous; keep it off the event loop
+        session_data = await run_blocking(REDIS, redis_manager.get_session_data, session_key)
 
         if session_data:
             result = {}
@@ -120,6 +164,21 @@ async def _get_session_manager_data(request: Request) -> dict[str, Any]:
         return {"sessions": {}, "count": 0}
 
 
+async def _get_indexed_session_counts(request: Request, since: float) -> dict[str, int | None]:
+    """Count indexed sessions (total and active since ``since``) from the session index."""
+    redis_manager = getattr(request.app.state, "redis", None)
+    if not redis_manager:
+        return {"indexed_sessions": None, "recent_sessions": None}
+
+    try:
+        index = redis_manager.session_index
+        total, recent = await asyncio.gather(index.count_async(), index.count_async(since))
+        return {"indexed_sessions": total, "recent_sessions": recent}
+    except Exception as e:
+        logger.error(f"Failed to read session index counts: {e}")
+        return {"indexed_sessions": None, "recent_sessions": None}
+
+
 async def _get_session_metrics_data(request: Request) -> dict[str, Any]:
     """Get metrics from ThreadSafeSessionMetrics."""
     session_metrics = getattr(request.app.state, "session_metrics", None)
@@ -257,20 +316,25 @@ async def get_session_metrics(
             runs = latency_data.get("runs", {})
             turn_count = len(runs)
 
-            # Aggregate samples by stage
-            samples_by_stage: dict[str, list[float]] = {}
-            for run_id, run_data in runs.items():
-                for sample in run_data.get("samples", []):
-                    stage = sample.get("stage", "unknown")
-                    # Duration is in seconds, convert to ms
-                    dur_ms = sample.get("dur", 0) * 1000
-                    if stage not in samples_by_stage:
-                        samples_by_stage[stage] = []
-                    samples_by_stage[stage].append(dur_ms)
-
-            # Calculate stats for each stage
-            for stage, samples in samples_by_stage.items():
-                latency_summary[stage] = _get_latency_stats(samples)
+            stage_stats = latency_data.get("stage_stats") or {}
+            if stage_stats:
+                # Running aggregates cover every sample, including trimmed runs
+                for stage, acc in stage_stats.items():
+                    latency_summary[stage] = _get_aggregate_latency_stats(acc)
+            else:
+                # Sessions recorded before aggregates existed: rescan the samples
+                samples_by_stage: dict[str, list[float]] = {}
+                for run_id, run_data in runs.items():
+                    for sample in run_data.get("samples", []):
+                        stage = sample.get("stage", "unknown")
+                        # Duration is in seconds, convert to ms
+                        dur_ms = sample.get("dur", 0) * 1000
+                        if stage not in samples_by_stage:
+                            samples_by_stage[stage] = []
+                        samples_by_stage[stage].append(dur_ms)
+
+                for stage, samples in samples_by_stage.items():
+                    latency_summary[stage] = _get_latency_stats(samples)
 
             if latency_summary:
                 max_avg_ms = max((stats.avg_ms for stats in latency_summary.values()), default=0)
@@ -391,9 +455,11 @@ async def get_metrics_summary(
     """
     manager_data = await _get_session_manager_data(request)
     metrics_data = await _get_session_metrics_data(request)
+    index_counts = await _get_indexed_session_counts(request, time.time() - window_minutes * 60)
 
     return {
         "window_minutes": window_minutes,
+        **index_counts,
         "active_connections": metrics_data.get("active_connections", 0),
         "browser_sessions": manager_data["count"],
         "total_connected": metrics_data.get("total_connected", 0),
@@ -402,3 +468,130 @@ async def get_metrics_summary(
         "session_ids": list(manager_data["sessions"].keys()),
         "note": "For detailed latency analysis, use Application Insights KQL queries from TELEMETRY_PLAN.md",
     }
+
+
+@router.get(
+    "/session/{session_id}/waterfall",
+    summary="Get per-turn latency waterfall",
+    description=(
+        "Stage timestamps of each recent turn (end of speech through last audio frame "
+        "and barge-in), as millisecond offsets from the turn's first stage."
+    ),
+    tags=["Session Metrics"],
+)
+async def get_session_waterfall(
+    request: Request,
+    session_id: str,
+    last: int = Query(20, ge=1, le=200, description="Most recent turns to return"),
+) -> dict[str, Any]:
+    """
+    Get the per-turn latency waterfall for a session.
+
+    Sessions open on this replica are served from memory, including the turn
+    in progress (``in_progress``). Otherwise the waterfalls persisted in the
+    session's core memory are returned, so any replica can answer. Each turn
+    carries ``stages`` (offset of every stage reached) and ``segments`` (time
+    spent reaching each stage from the previous one, plus ``response``).
+
+    Raises:
+        HTTPException: 404 if the session has no recorded turns
+    """
+    timeline = turn_timelines().get(session_id)
+    if timeline is not None:
+        turns, source = timeline.waterfall(), "live"
+    else:
+        redis_data = await _get_session_metrics_from_redis(request, session_id)
+        corememory = (redis_data or {}).get("corememory") or {}
+        turns, source = corememory.get(TURN_TIMELINE_KEY), "redis"
+        if not turns:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Session '{session_id}' not found or has no turn timeline",
+            )
+    return {
+        "session_id": session_id,
+        "source": source,
+        "stages": list(TURN_STAGES),
+        "turns": turns[-last:],
+    }
+
+
+@router.get(
+    "/latency",
+    summary="Get stage latency percentiles",
+    description=(
+        "Per-stage latency percentiles from mergeable quantile sketches, for this "
+        "replica or merged across every replica publishing to Redis."
+    ),
+    tags=["Session Metrics"],
+)
+async def get_latency_percentiles(
+    request: Request,
+    scope: str = Query("process", pattern="^(process|fleet)$", description="process or fleet"),
+) -> dict[str, Any]:
+    """
+    Get per-stage latency percentiles (milliseconds).
+
+    ``process`` covers every stage sample recorded by this replica since it
+    started. ``fleet`` merges the sketches published to Redis by every live
+    replica. Cost depends on the number of stages, not on the sample count.
+
+    Raises:
+        HTTPException: 503 if the fleet view is requested without Redis
+    """
+    if scope == "process":
+        return {"scope": scope, "stages": process_sketches().summary(scale=1000)}
+
+    store = getattr(request.app.state, "latency_sketch_store", None)
+    if store is None:
+        raise HTTPException(status_code=503, detail="Fleet latency sketches are not available")
+    try:
+        fleet = await store.fleet_async()
+    except Exception as e:
+        logger.error(f"Failed to read fleet latency sketches: {e}")
+        raise HTTPException(status_code=503, detail="Fleet latency sketches are not available")
+    return {
+        "scope": scope,
+        "stages": {stage: sketch.summary(scale=1000) for stage, sketch in fleet.items()},
+    }
+
+
+@router.get(
+    "/tools",
+    summary="Get tool execution latency",
+    description="Per-tool call counts, errors and latency histograms for this replica.",
+    tags=["Session Metrics"],
+)
+async def get_tool_latency(
+    name: str | None = Query(None, description="Limit to one tool"),
+) -> dict[str, Any]:
+    """
+    Get per-tool execution latency recorded by the tool registry.
+
+    Each tool reports its call and error counts, p50/p95/p99 estimated from
+    fixed histogram buckets, and the bucket counts (upper bound in ms).
+    """
+    return {"tools": get_tool_latency_stats(name)}
+
+
+@router.get(
+    "/telemetry",
+    summary="Get telemetry pipeline counters",
+    description=(
+        "Span sampling decisions, span exporter queue depth and log queue drops "
+        "for this replica."
+    ),
+    tags=["Session Metrics"],
+)
+async def get_telemetry_pipeline() -> dict[str, Any]:
+    """
+    Get the telemetry pipeline counters of this replica.
+
+    ``spans.sampling`` counts turn-level spans, spans exported within the
+    per-name rate, slow or failed spans, spans held back and later retained
+    with a slow turn, held spans dropped, high-frequency events aggregated
+    into summary spans, and spans the exporter queue had to discard.
+    ``spans.exporters`` shows each batch exporter's queue depth; ``logs`` is
+    the background log queue.
+    """
+    return {"spans": span_pipeline_stats(), "logs": log_queue_stats()}
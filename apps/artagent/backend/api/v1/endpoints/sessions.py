@@ -3,7 +3,8 @@ Session Management Endpoints
 ============================
 
 REST API endpoints for managing and retrieving session information from Redis cache.
-Provides comprehensive session history and metadata management.
+Provides comprehensive session history and metadata management. Listing reads
+the session index (src/redis/session_index.py) instead of scanning the keyspace.
 
 Endpoints:
 - GET /api/v1/sessions - List all sessions with metadata
@@ -18,6 +19,8 @@ from typing import Any, Dict, List
 
 from fastapi import APIRouter, HTTPException, Query, Request
 from pydantic import BaseModel
+from src.pools.executors import REDIS, run_blocking
+from src.redis.session_index import ACTIVE_WINDOW_S, BACKFILL_MARKER_KEY, summarize_session
 from utils.ml_logging import get_logger
 
 logger = get_logger(__name__)
@@ -135,8 +138,8 @@ async def _get_redis_manager(request: Request):
     return redis_manager
 
 
-async def _scan_session_keys(redis_manager) -> List[str]:
-    """Scan for all session keys in Redis using pattern matching."""
+def _scan_session_keys(redis_manager) -> List[str]:
+    """Scan for all session keys in Redis (legacy path, only used for backfill)."""
     try:
         session_keys = []
 
@@ -269,320 +272,72 @@ async def _scan_session_keys(redis_manager) -> List[str]:
 
 async def _parse_session_data(session_key: str, redis_data: Dict[str, Any]) -> SessionMetadata | None:
     """Parse Redis session data into SessionMetadata."""
+    # Extract session ID from key (session:session_12345 -> session_12345)
+    session_id = session_key.replace("session:", "")
     try:
-        # Extract session ID from key (session:session_12345 -> session_12345)
-        session_id = session_key.replace("session:", "")
-
-        # Debug: Log the structure we're working with
-        logger.debug(f"Parsing session {session_id} with keys: {list(redis_data.keys()) if isinstance(redis_data, dict) else 'Not a dict'}")
-
-        # Initialize with defaults
-        current_time = time.time()
-        metadata = {
-            "session_id": session_id,
-            "created_at": current_time,
-            "last_activity": current_time,
-            "last_activity_readable": None,
-            "turn_count": 0,
-            "connection_status": "inactive",
-            "streaming_mode": None,
-            "user_email": None,
-            "profile_name": None,
-            "profile_type": None,
-            "agents_count": 0,
-            "scenarios_count": 0,
-            "active_agents_count": 0,
-            "scenario_agents_count": 0,
-            "custom_scenarios_count": 0,
-            "agents": [],
-            "scenarios": [],
-            "has_scenario_agents": False,
-            "has_custom_scenarios": False
-        }
-
-        # Parse core memory for session metadata
-        if "corememory" in redis_data:
-            try:
-                core_memory = redis_data["corememory"]
-                if isinstance(core_memory, str):
-                    core_memory = json.loads(core_memory)
-
-                # Extract session metadata from core memory
-                if isinstance(core_memory, dict):
-                    # Session info (may be in various locations)
-                    session_info = core_memory.get("session_info", {})
-                    metadata.update({
-                        "created_at": session_info.get("created_at", metadata["created_at"]),
-                        "last_activity": session_info.get("last_activity", metadata["last_activity"]),
-                        "streaming_mode": session_info.get("streaming_mode"),
-                        "user_email": session_info.get("user_email"),
-                    })
-
-                    # Extract profile information from various possible locations
-                    profile_data = (
-                        core_memory.get("session_profile", {}) or
-                        core_memory.get("profile", {}) or
-                        core_memory.get("user_profile", {})
-                    )
-                    if profile_data:
-                        metadata.update({
-                            "profile_name": (
-                                profile_data.get("display_name") or
-                                profile_data.get("name") or
-                                profile_data.get("profile_name") or
-                                profile_data.get("caller_name")
-                            ),
-                            "profile_type": (
-                                profile_data.get("profile_type") or
-                                profile_data.get("industry") or
-                                profile_data.get("scenario_type")
-                            ),
-                        })
-
-                    # Extract user email from various locations
-                    if not metadata["user_email"]:
-                        metadata["user_email"] = (
-                            core_memory.get("user_email") or
-                            core_memory.get("caller_email") or
-                            profile_data.get("email")
-                        )
-
-                    # Extract agent information from various possible locations
-                    agents_list = []
-                    agents_count = 0
-                    scenario_agents_count = 0
-                    active_count = 0
-                    active_agent_name = None
-
-                    # Method 1: Check session_scenario_config for agents list
-                    session_scenario_config = core_memory.get("session_scenario_config", {})
-                    if session_scenario_config and isinstance(session_scenario_config, dict):
-                        agents_in_scenario = session_scenario_config.get("agents", [])
-                        if agents_in_scenario:
-                            agents_count = len(agents_in_scenario)
-                            # These are scenario-specific agents
-                            scenario_agents_count = agents_count
-
-                            # Try to identify the active agent from various sources
-                            active_agent_name = (
-                                core_memory.get("active_agent") or
-                                core_memory.get("current_agent") or
-                                session_scenario_config.get("start_agent")
-                            )
-
-                            for agent_name in agents_in_scenario:
-                                is_active = (agent_name == active_agent_name)
-                                if is_active:
-                                    active_count = 1
-
-                                agents_list.append(SessionAgent(
-                                    name=agent_name,
-                                    is_active=is_active,
-                                    is_custom=True,  # Assume custom if in session scenario
-                                    tools=[],  # Tool details not readily available here
-                                ).model_dump())
-
-                    # Method 2: Check session_scenarios_all for agent information
-                    if not agents_count:
-                        session_scenarios = core_memory.get("session_scenarios_all", {})
-                        active_scenario_name = core_memory.get("active_scenario_name")
-
-                        if session_scenarios and active_scenario_name:
-                            active_scenario = session_scenarios.get(active_scenario_name, {})
-                            if active_scenario:
-                                agents_in_scenario = active_scenario.get("agents", [])
-                                if agents_in_scenario:
-                                    agents_count = len(agents_in_scenario)
-                                    scenario_agents_count = agents_count
-
-                                    active_agent_name = (
-                                        core_memory.get("active_agent") or
-                                        active_scenario.get("start_agent")
-                                    )
-
-                                    for agent_name in agents_in_scenario:
-                                        is_active = (agent_name == active_agent_name)
-                                        if is_active:
-                                            active_count = 1
-
-                                        agents_list.append(SessionAgent(
-                                            name=agent_name,
-                                            is_active=is_active,
-                                            is_custom=True,
-                                            tools=[],
-                                        ).model_dump())
-
-                    # Method 3: Fallback to agent_registry structure
-                    if not agents_count:
-                        agent_registry = core_memory.get("agent_registry", {})
-                        if agent_registry and isinstance(agent_registry, dict):
-                            agents_data = agent_registry.get("agents", {})
-                            active_agent = agent_registry.get("active_agent")
-
-                            for name, agent_config in agents_data.items():
-                                is_active = (name == active_agent)
-                                is_scenario_agent = (
-                                    agent_config.get("has_overrides", False) or
-                                    agent_config.get("source", "") != "base"
-                                )
-
-                                if is_active:
-                                    active_count += 1
-                                if is_scenario_agent:
-                                    scenario_agents_count += 1
-
-                                agents_list.append(SessionAgent(
-                                    name=name,
-                                    is_active=is_active,
-                                    is_custom=is_scenario_agent,
-                                    tools=agent_config.get("tool_names_override", []) or [],
-                                ).model_dump())
-
-                            agents_count = len(agents_data)
-
-                    metadata.update({
-                        "agents": agents_list,
-                        "agents_count": agents_count,
-                        "active_agents_count": active_count,
-                        "scenario_agents_count": scenario_agents_count,
-                        "has_scenario_agents": scenario_agents_count > 0,
-                    })
-
-                    logger.debug(f"Session {session_id} agents: count={agents_count}, scenario={scenario_agents_count}, active={active_count}")
-
-                    # Extract scenario information from various possible locations
-                    scenarios_list = []
-                    scenarios_count = 0
-                    custom_scenarios_count = 0
-                    active_scenario_name = core_memory.get("active_scenario_name")
-
-                    # Method 1: Try the new structure: session_scenarios_all + active_scenario_name
-                    session_scenarios = core_memory.get("session_scenarios_all", {})
-
-                    if session_scenarios and isinstance(session_scenarios, dict):
-                        scenarios_count = len(session_scenarios)
-                        custom_scenarios_count = scenarios_count  # Assume all are custom
-
-                        for name, scenario_config in session_scenarios.items():
-                            if isinstance(scenario_config, dict):
-                                is_active = (name == active_scenario_name)
-
-                                scenarios_list.append(SessionScenario(
-                                    name=name,
-                                    is_active=is_active,
-                                    agents=scenario_config.get("agents", []),
-                                    handoffs=scenario_config.get("handoffs", []),
-                                ).model_dump())
-
-                    # Fallback to scenario_registry structure
-                    else:
-                        scenario_registry = core_memory.get("scenario_registry", {})
-                        if scenario_registry and isinstance(scenario_registry, dict):
-                            scenarios_data = scenario_registry.get("scenarios", {})
-                            active_scenario = scenario_registry.get("active_scenario")
-
-                            scenarios_count = len(scenarios_data)
-
-                            for name, scenario_config in scenarios_data.items():
-                                is_active = (name == active_scenario)
-                                is_custom = scenario_config.get("is_custom", True)
-
-                                if is_custom:
-                                    custom_scenarios_count += 1
-
-                                scenarios_list.append(SessionScenario(
-                                    name=name,
-                                    is_active=is_active,
-                                    agents=scenario_config.get("agents", []),
-                                    handoffs=scenario_config.get("handoffs", []),
-                                ).model_dump())
-
-                    # Check for session_scenario_config as well (active scenario details)
-                    # Only add if we didn't find scenarios in the methods above
-                    if not scenarios_count:
-                        session_scenario_config = core_memory.get("session_scenario_config", {})
-                        if session_scenario_config and isinstance(session_scenario_config, dict):
-                            scenario_name = session_scenario_config.get("name")
-                            if scenario_name:
-                                scenarios_count = 1
-                                custom_scenarios_count = 1
-
-                                scenarios_list.append(SessionScenario(
-                                    name=scenario_name,
-                                    is_active=True,  # This is the active session scenario
-                                    agents=session_scenario_config.get("agents", []),
-                                    handoffs=session_scenario_config.get("handoffs", []),
-                                ).model_dump())
-
-                    metadata.update({
-                        "scenarios": scenarios_list,
-                        "scenarios_count": scenarios_count,
-                        "custom_scenarios_count": custom_scenarios_count,
-                        "has_custom_scenarios": custom_scenarios_count > 0,
-                    })
-
-                    logger.debug(f"Session {session_id} scenarios: count={scenarios_count}, custom={custom_scenarios_count}, active={active_scenario_name}")
-
-            except (json.JSONDecodeError, TypeError) as e:
-                logger.warning(f"Failed to parse corememory for {session_id}: {e}")
-
-        # Parse chat history for turn count and activity
-        if "chat_history" in redis_data:
-            try:
-                chat_history = redis_data["chat_history"]
-                if isinstance(chat_history, str):
-                    chat_history = json.loads(chat_history)
-
-                total_messages = 0
-                latest_timestamp = None
-
-                # Handle agent-specific chat history structure
-                if isinstance(chat_history, dict):
-                    for agent_name, agent_messages in chat_history.items():
-                        if isinstance(agent_messages, list):
-                            total_messages += len(agent_messages)
-
-                            # Look for timestamps in messages to find latest activity
-                            for msg in agent_messages:
-                                if isinstance(msg, dict):
-                                    # Check for timestamp in various formats
-                                    msg_timestamp = msg.get("timestamp")
-                                    if msg_timestamp:
-                                        if latest_timestamp is None or msg_timestamp > latest_timestamp:
-                                            latest_timestamp = msg_timestamp
-
-                # Handle simple list format (fallback)
-                elif isinstance(chat_history, list):
-                    total_messages = len(chat_history)
-
-                    # Get last activity from most recent message
-                    if chat_history:
-                        last_msg = chat_history[-1]
-                        if isinstance(last_msg, dict) and "timestamp" in last_msg:
-                            latest_timestamp = last_msg["timestamp"]
-
-                metadata["turn_count"] = total_messages
-                if latest_timestamp:
-                    metadata["last_activity"] = latest_timestamp
+        summary = summarize_session(
+            session_id, redis_data.get("corememory"), redis_data.get("chat_history")
+        )
+    except (json.JSONDecodeError, TypeError) as e:
+        logger.warning(f"Failed to parse session data for {session_id}: {e}")
+        summary = summarize_session(session_id, None, None)
+    return _session_metadata(summary)
 
-            except (json.JSONDecodeError, TypeError) as e:
-                logger.warning(f"Failed to parse chat_history for {session_id}: {e}")
 
-        # Format last activity timestamp
+def _session_metadata(summary: Dict[str, Any]) -> SessionMetadata | None:
+    """Build SessionMetadata from a session summary (parsed or from the index)."""
+    try:
+        now = time.time()
+        metadata = {name: summary[name] for name in SessionMetadata.model_fields if name in summary}
+        metadata["created_at"] = summary.get("created_at") or now
+        metadata["last_activity"] = summary.get("last_activity") or now
         metadata["last_activity_readable"] = _format_timestamp(metadata["last_activity"])
 
-        # Check if session appears to be active (recent activity within last hour)
-        current_time = time.time()
-        if current_time - metadata["last_activity"] < 3600:  # 1 hour
+        # Active = recent activity within the last hour and not ended since
+        ended_at = summary.get("ended_at")
+        ended = ended_at is not None and ended_at >= metadata["last_activity"]
+        if not ended and now - metadata["last_activity"] < ACTIVE_WINDOW_S:
             metadata["connection_status"] = "active"
 
         return SessionMetadata(**metadata)
 
     except Exception as e:
-        logger.error(f"Failed to parse session data for {session_key}: {e}")
+        logger.error(f"Failed to build session metadata for {summary.get('session_id')}: {e}")
         return None
 
 
+def _backfill_session_index(redis_manager) -> int:
+    """
+    Index sessions that were persisted before the session index existed.
+
+    Runs a one-off keyspace scan and records a marker key so later requests
+    (from any instance) never scan again. Blocking: call via a thread.
+    """
+    if redis_manager.get_value(BACKFILL_MARKER_KEY):
+        return 0
+
+    index = redis_manager.session_index
+    indexed = 0
+    for session_key in _scan_session_keys(redis_manager):
+        session_data = redis_manager.get_session_data(session_key)
+        if not session_data or not isinstance(session_data, dict):
+            continue
+        session_id = session_key.replace("session:", "")
+        try:
+            summary = summarize_session(
+                session_id, session_data.get("corememory"), session_data.get("chat_history")
+            )
+        except (json.JSONDecodeError, TypeError) as e:
+            logger.warning(f"Skipping unparseable session {session_id} during backfill: {e}")
+            continue
+        index.record(session_id, summary)
+        indexed += 1
+
+    redis_manager.set_value(BACKFILL_MARKER_KEY, str(time.time()))
+    logger.info(f"Backfilled session index with {indexed} sessions")
+    return indexed
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # ENDPOINTS
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -598,10 +353,15 @@ async def _parse_session_data(session_key: str, redis_data: Dict[str, Any]) -> S
 async def list_sessions(
     request: Request,
     limit: int = Query(50, ge=1, le=200, description="Maximum number of sessions to return"),
+    offset: int = Query(0, ge=0, description="Number of sessions to skip (paging)"),
     active_only: bool = Query(False, description="Return only active sessions"),
 ) -> SessionListResponse:
     """
-    List all sessions with their metadata.
+    List sessions with their metadata, most recent activity first.
+
+    Pages through the session index, so the cost depends on ``limit`` rather
+    than on the number of keys in Redis. ``total_count`` and ``active_count``
+    cover all indexed sessions, not just the returned page.
 
     Returns session information including:
     - Session ID and activity timestamps
@@ -612,53 +372,34 @@ async def list_sessions(
     redis_manager = await _get_redis_manager(request)
 
     try:
-        # Scan for session keys
-        session_keys = await _scan_session_keys(redis_manager)
-
-        sessions = []
-        active_count = 0
-
-        for session_key in session_keys[:limit]:  # Apply limit during processing
-            try:
-                # Get session data from Redis
-                session_data = redis_manager.get_session_data(session_key)
-
-                if not session_data:
-                    logger.debug(f"No data found for session key: {session_key}")
-                    continue
-
-                # Ensure session_data is a dictionary
-                if not isinstance(session_data, dict):
-                    logger.warning(f"Unexpected session data format for {session_key}: {type(session_data)}")
-                    continue
-
-                # Parse into metadata
-                session_metadata = await _parse_session_data(session_key, session_data)
-
-                if session_metadata:
-                    # Count active sessions
-                    if session_metadata.connection_status == "active":
-                        active_count += 1
+        index = redis_manager.session_index
+        page = await index.page_async(offset, limit, active_only=active_only)
 
-                    # Apply active filter
-                    if active_only and session_metadata.connection_status != "active":
-                        continue
-
-                    sessions.append(session_metadata)
+        # Sessions persisted before the index existed are indexed once on demand
+        if not page.total and not offset:
+            if await run_blocking(
+                REDIS, _backfill_session_index, redis_manager, critical=False
+            ):
+                page = await index.page_async(offset, limit, active_only=active_only)
 
-            except Exception as e:
-                logger.warning(f"Failed to process session {session_key}: {e}")
+        sessions = []
+        for summary in page.sessions:
+            session_metadata = _session_metadata(summary)
+            if not session_metadata:
                 continue
+            if active_only and session_metadata.connection_status != "active":
+                continue
+            sessions.append(session_metadata)
 
-        # Sort by last activity (most recent first)
-        sessions.sort(key=lambda s: s.last_activity, reverse=True)
-
-        logger.info(f"Retrieved {len(sessions)} sessions (active: {active_count})")
+        logger.info(
+            f"Retrieved {len(sessions)} sessions "
+            f"(offset: {offset}, indexed: {page.total}, active: {page.active})"
+        )
 
         return SessionListResponse(
             sessions=sessions,
-            total_count=len(sessions),
-            active_count=active_count,
+            total_count=page.total,
+            active_count=page.active,
         )
 
     except Exception as e:
@@ -698,7 +439,7 @@ async def get_session_details(
         session_key = f"session:{session_id}"
 
         # Get session data from Redis
-        session_data = redis_manager.get_session_data(session_key)
+        session_data = await run_blocking(REDIS, redis_manager.get_session_data, session_key)
 
         if not session_data:
             raise HTTPException(
@@ -826,7 +567,7 @@ async def delete_session(
         session_key = f"session:{session_id}"
 
         # Check if session exists
-        exists = redis_manager.redis_client.exists(session_key)
+        exists = await run_blocking(REDIS, redis_manager.redis_client.exists, session_key)
 
         if not exists:
             raise HTTPException(
@@ -834,8 +575,9 @@ async def delete_session(
                 detail=f"Session {session_id} not found"
             )
 
-        # Delete the session
-        deleted_count = redis_manager.delete_session(session_key)
+        # Delete the session and its index entry
+        deleted_count = await run_blocking(REDIS, redis_manager.delete_session, session_key)
+        await redis_manager.session_index.remove_async(session_id)
 
         logger.info(f"Deleted session {session_id} (deleted {deleted_count} keys)")
 
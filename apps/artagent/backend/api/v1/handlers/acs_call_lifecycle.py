@@ -21,6 +21,7 @@ from typing import Any
 from apps.artagent.backend.src.services.acs.call_transfer import (
     transfer_call as transfer_call_service,
 )
+from apps.artagent.backend.voice.speech_cascade.greeting_prefetch import greeting_prefetcher
 from azure.core.exceptions import HttpResponseError
 from azure.core.messaging import CloudEvent
 from config import (
@@ -151,6 +152,24 @@ class ACSLifecycleHandler:
         """
         self.logger = get_logger("api.v1.handlers.acs_lifecycle")
 
+    @staticmethod
+    def _start_greeting_prefetch(app_state, stream_mode, session_id: str | None = None):
+        """
+        Start greeting synthesis alongside call answer/placement.
+
+        Only media streams play a synthesized greeting; returns None otherwise.
+        """
+        if app_state is None or stream_mode != StreamMode.MEDIA:
+            return None
+        # Import here to avoid circular imports
+        from apps.artagent.backend.api.v1.handlers.media_handler import MediaHandler
+
+        try:
+            return MediaHandler.prefetch_greeting(app_state, session_id=session_id)
+        except Exception as exc:
+            logger.debug("Greeting prefetch not started: %s", exc)
+            return None
+
     async def _emit_call_event(
         self,
         event_type: str,
@@ -248,6 +267,7 @@ class ACSLifecycleHandler:
         browser_session_id: str = None,  # NEW: Browser session ID for UI coordination
         stream_mode: StreamMode | None = None,
         record_call: bool | None = None,
+        app_state: Any = None,
     ) -> dict[str, Any]:
         """
         Initiate an outbound call with orchestrator support.
@@ -264,6 +284,8 @@ class ACSLifecycleHandler:
         :type stream_mode: Optional[StreamMode]
         :param record_call: Optional override for enabling ACS call recording
         :type record_call: Optional[bool]
+        :param app_state: Application state; when given, the greeting is
+            synthesized while the call is placed
         :return: Call initiation result
         :rtype: Dict[str, Any]
         :raises HTTPException: When ACS caller is not initialized or call fails
@@ -287,13 +309,21 @@ class ACSLifecycleHandler:
                 "call.recording_enabled": recording_enabled,
             },
         ) as span:
+            greeting_prefetch = self._start_greeting_prefetch(
+                app_state, effective_stream_mode, session_id=browser_session_id
+            )
             try:
                 logger.info(f"Starting outbound call to {target_number} ")
 
                 start_time = time.perf_counter()
-                result = await acs_caller.initiate_call(
-                    target_number, stream_mode=effective_stream_mode
-                )
+                try:
+                    result = await acs_caller.initiate_call(
+                        target_number, stream_mode=effective_stream_mode
+                    )
+                except BaseException:
+                    if greeting_prefetch is not None:
+                        greeting_prefetch.cancel()
+                    raise
                 latency = time.perf_counter() - start_time
 
                 safe_set_span_attributes(
@@ -306,11 +336,14 @@ class ACSLifecycleHandler:
                 )
 
                 if result.get("status") != "created":
+                    if greeting_prefetch is not None:
+                        greeting_prefetch.cancel()
                     span.set_status(Status(StatusCode.ERROR, "Call initiation failed"))
                     logger.error(f"❌ Call initiation failed: {result}")
                     return {"status": "failed", "message": "Call initiation failed"}
 
                 call_id = result["call_id"]
+                greeting_prefetcher().bind(call_id, greeting_prefetch)
                 safe_set_span_attributes(
                     span,
                     {
@@ -436,6 +469,7 @@ class ACSLifecycleHandler:
         acs_caller,
         redis_mgr=None,
         record_call: bool | None = None,
+        app_state: Any = None,
     ) -> JSONResponse:
         """
         Accept and process inbound call events.
@@ -450,6 +484,8 @@ class ACSLifecycleHandler:
         :type redis_mgr: Optional[Any]
         :param record_call: Optional override for enabling ACS call recording
         :type record_call: Optional[bool]
+        :param app_state: Application state; when given, the greeting is
+            synthesized while the call is answered
         :return: Validation response or call acceptance status
         :rtype: JSONResponse
         :raises HTTPException: When ACS caller is not initialized or processing fails
@@ -481,6 +517,7 @@ class ACSLifecycleHandler:
                             span,
                             redis_mgr=redis_mgr,
                             record_call=record_call,
+                            app_state=app_state,
                         )
                     else:
                         logger.info(f"📝 Ignoring unhandled event type: {event_type}")
@@ -537,6 +574,7 @@ class ACSLifecycleHandler:
         span,
         redis_mgr=None,
         record_call: bool | None = None,
+        app_state: Any = None,
     ) -> JSONResponse:
         """
         Handle incoming call event.
@@ -574,20 +612,28 @@ class ACSLifecycleHandler:
             f"Answering incoming call from {caller_id} | recording_enabled={recording_enabled}"
         )
 
-        # Answer the call
+        # Answer the call while the greeting is synthesized
+        greeting_prefetch = self._start_greeting_prefetch(app_state, ACS_STREAMING_MODE)
         start_time = time.perf_counter()
-        answer_result = await acs_caller.answer_incoming_call(
-            incoming_call_context=incoming_call_context,
-            stream_mode=ACS_STREAMING_MODE,
-        )
+        try:
+            answer_result = await acs_caller.answer_incoming_call(
+                incoming_call_context=incoming_call_context,
+                stream_mode=ACS_STREAMING_MODE,
+            )
+        except BaseException:
+            if greeting_prefetch is not None:
+                greeting_prefetch.cancel()
+            raise
         latency = time.perf_counter() - start_time
 
+        call_connection_id = getattr(answer_result, "call_connection_id", None)
+        greeting_prefetcher().bind(call_connection_id, greeting_prefetch)
+
         if not answer_result:
             safe_set_span_attributes(span, {"call.answer_failed": True})
             span.set_status(Status(StatusCode.ERROR, "Failed to answer call"))
             raise HTTPException(500, "Failed to answer incoming call")
 
-        call_connection_id = getattr(answer_result, "call_connection_id", None)
         if call_connection_id:
             safe_set_span_attributes(
                 span,
@@ -44,6 +44,7 @@ import time
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import partial
 from typing import Any
 
 # Personalized greeting generation
@@ -77,17 +78,41 @@ from apps.artagent.backend.voice import (  # Browser barge-in controller; Speech
     send_user_transcript,
 )
 
+# Adaptive energy endpointing (noise-floor tracking VAD)
+from apps.artagent.backend.voice.shared.endpointing import (
+    EndpointerConfig,
+    EndpointEvent,
+    EndpointEventType,
+    EnergyEndpointer,
+)
+
+# Greeting synthesized during call setup (answer / outbound placement)
+from apps.artagent.backend.voice.speech_cascade.greeting_prefetch import (
+    GreetingAudio,
+    GreetingPrefetch,
+    greeting_prefetcher,
+)
+
 # Unified TTS Playback - single source of truth for voice synthesis
 from apps.artagent.backend.voice.speech_cascade.tts import TTSPlayback
-from config import ACS_STREAMING_MODE, GREETING, STOP_WORDS
+from config import (
+    ACS_STREAMING_MODE,
+    ENABLE_STREAMING_CALL_RECORDING,
+    GREETING,
+    STOP_WORDS,
+    STREAMING_RECORDING_BLOCK_KB,
+)
 from fastapi import WebSocket, WebSocketDisconnect
 from fastapi.websockets import WebSocketState
 from opentelemetry import trace
 from opentelemetry.trace import SpanKind, Status, StatusCode
+from src.blob.blob_helper import get_blob_helper
+from src.blob.recording_sink import CallRecordingSink
 from src.enums.stream_modes import StreamMode
 from src.pools.session_manager import SessionContext
 from src.stateful.state_managment import MemoManager
 from src.tools.latency_tool import LatencyTool
+from src.tools.turn_timeline import BARGE_IN, VAD_END, turn_timelines
 from utils.ml_logging import get_logger
 
 logger = get_logger("api.v1.handlers.media_handler")
@@ -102,6 +127,10 @@ SILENCE_GAP_MS: int = 500
 BROWSER_PCM_SAMPLE_RATE: int = 24000
 BROWSER_SPEECH_RMS_THRESHOLD: int = 200
 BROWSER_SILENCE_GAP_SECONDS: float = 0.5
+ACS_PCM_SAMPLE_RATE: int = 16000
+ACS_FRAME_MS: int = 20
+# Caller audio as fed to STT (browser mic and ACS media alike)
+STT_PCM_SAMPLE_RATE: int = 16000
 
 # Legacy aliases
 VOICE_LIVE_PCM_SAMPLE_RATE = BROWSER_PCM_SAMPLE_RATE
@@ -233,6 +262,7 @@ class MediaHandler:
         self.speech_cascade: SpeechCascadeHandler | None = None
         self._greeting_text: str = ""
         self._greeting_queued = False
+        self._greeting_prefetch: GreetingPrefetch | None = None  # ACS only
 
         # TTS Playback - unified handler for both transports
         self._tts_cancel_event: asyncio.Event = asyncio.Event()
@@ -245,6 +275,17 @@ class MediaHandler:
         self._last_barge_in_ts: float = 0.0
         self._barge_in_controller: BrowserBargeInController | None = None
 
+        # Endpointing (early barge-in + end-of-utterance hints) on the STT input audio
+        self._endpointer = EnergyEndpointer(
+            EndpointerConfig(sample_rate=STT_PCM_SAMPLE_RATE, hangover_ms=SILENCE_GAP_MS)
+        )
+        self._last_speech_end: EndpointEvent | None = None
+        self._last_speech_end_at: float | None = None
+
+        # In-call recording (ENABLE_STREAMING_CALL_RECORDING) at the caller audio rate
+        self._recording_sample_rate = STT_PCM_SAMPLE_RATE
+        self._recording: CallRecordingSink | None = None
+
         # State
         self._running = False
         self._stopped = False
@@ -312,39 +353,109 @@ class MediaHandler:
         handler._setup_websocket_state(memory_manager, tts_client, stt_client)
 
         # Initialize active agent in memory for this session
-        # Priority: 1. Session agent (Agent Builder), 2. Session scenario (ScenarioBuilder),
-        #           3. URL scenario param, 4. Unified agent (from disk)
+        start_agent, start_agent_name = cls._resolve_start_agent(
+            app_state, config.session_id, config.scenario, handler._session_short
+        )
+        if start_agent:
+            memory_manager.update_corememory("active_agent", start_agent_name)
+
+        # Derive greeting
+        handler._greeting_text = await handler._derive_greeting()
+        if config.transport == TransportType.ACS:
+            handler._greeting_prefetch = greeting_prefetcher().take(config.call_connection_id)
+
+        if ENABLE_STREAMING_CALL_RECORDING:
+            await handler._open_recording()
+
+        # Initialize TTS Playback (unified handler for voice synthesis)
+        handler._tts_playback = TTSPlayback(
+            websocket=config.websocket,
+            app_state=app_state,
+            session_id=config.session_id,
+            latency_tool=handler._latency_tool,
+            cancel_event=handler._tts_cancel_event,
+            recording_sink=handler._recording,
+        )
+
+        # Set active agent on TTS playback to ensure greetings use the correct voice
+        if start_agent_name:
+            handler._tts_playback.set_active_agent(start_agent_name)
+
+        # Create speech cascade
+        handler.speech_cascade = SpeechCascadeHandler(
+            connection_id=session_key,
+            orchestrator_func=handler._create_orchestrator_wrapper(),
+            recognizer=stt_client,
+            memory_manager=memory_manager,
+            on_barge_in=handler._on_barge_in,
+            on_greeting=handler._on_greeting,
+            on_announcement=handler._on_announcement,
+            on_partial_transcript=handler._on_partial_transcript,
+            on_user_transcript=handler._on_user_transcript,
+            on_tts_request=handler._on_tts_request,
+            latency_tool=handler._latency_tool,
+            redis_mgr=redis_mgr,
+        )
+
+        # Expose speech_cascade on websocket.state for orchestrator TTS callbacks
+        handler._websocket.state.speech_cascade = handler.speech_cascade
+        # Expose tts_playback for voice configuration updates on agent switch
+        handler._websocket.state.tts_playback = handler._tts_playback
+
+        # Per-turn stage timeline (marked by the cascade, orchestrator and TTS playback)
+        turn_timelines().open(config.session_id, memory_manager=memory_manager)
+
+        # Persist
+        await memory_manager.persist_to_redis_async(redis_mgr)
+
+        logger.info(
+            "[%s] MediaHandler created (%s)", handler._session_short, config.transport.value
+        )
+        return handler
+
+    @staticmethod
+    def _resolve_start_agent(
+        app_state: Any,
+        session_id: str | None,
+        scenario: str | None = None,
+        session_short: str = "prefetch",
+    ) -> tuple[Any, str]:
+        """Resolve the agent a session starts with, returning (agent or None, name).
+
+        Priority: 1. Session agent (Agent Builder), 2. Session scenario (ScenarioBuilder),
+                  3. URL scenario param, 4. Unified agent (from disk)
+        """
         scenario_start_agent = None
         try:
             # Always call resolve_orchestrator_config with session_id to check for
             # session-scoped scenarios (created via ScenarioBuilder). The resolver
             # will also check for URL-based scenarios if scenario_name is provided.
             scenario_cfg = resolve_orchestrator_config(
-                session_id=config.session_id,
-                scenario_name=config.scenario,  # May be None, that's fine
+                session_id=session_id,
+                scenario_name=scenario,  # May be None, that's fine
             )
             scenario_start_agent = scenario_cfg.start_agent or scenario_start_agent
             if scenario_start_agent:
                 logger.info(
                     "[%s] Resolved start_agent from scenario: %s (scenario=%s)",
-                    handler._session_short,
+                    session_short,
                     scenario_start_agent,
                     scenario_cfg.scenario_name,
                 )
         except Exception as exc:
             logger.warning(
                 "[%s] Failed to resolve scenario start_agent: %s",
-                handler._session_short,
+                session_short,
                 exc,
             )
 
-        session_agent = get_session_agent(config.session_id)
+        session_agent = get_session_agent(session_id)
         if session_agent:
             start_agent = session_agent
             start_agent_name = session_agent.name
             logger.info(
                 "[%s] Session initialized with session agent: %s (voice=%s)",
-                handler._session_short,
+                session_short,
                 start_agent_name,
                 session_agent.voice.name if session_agent.voice else "default",
             )
@@ -359,64 +470,54 @@ class MediaHandler:
             if start_agent:
                 logger.info(
                     "[%s] Session initialized with start agent: %s",
-                    handler._session_short,
+                    session_short,
                     start_agent_name,
                 )
             else:
                 logger.warning(
                     "[%s] Start agent '%s' not found in unified_agents (%d agents)",
-                    handler._session_short,
+                    session_short,
                     start_agent_name,
                     len(unified_agents),
                 )
 
-        if start_agent:
-            memory_manager.update_corememory("active_agent", start_agent_name)
+        return start_agent, start_agent_name
 
-        # Derive greeting
-        handler._greeting_text = await handler._derive_greeting()
+    @classmethod
+    def prefetch_greeting(
+        cls,
+        app_state: Any,
+        *,
+        session_id: str | None = None,
+        scenario: str | None = None,
+    ) -> GreetingPrefetch | None:
+        """
+        Start resolving and synthesizing the ACS greeting before the call connects.
 
-        # Initialize TTS Playback (unified handler for voice synthesis)
-        handler._tts_playback = TTSPlayback(
-            websocket=config.websocket,
-            app_state=app_state,
-            session_id=config.session_id,
-            latency_tool=handler._latency_tool,
-            cancel_event=handler._tts_cancel_event,
+        Call while the call is answered or placed, then bind the result to the
+        call connection id with ``greeting_prefetcher().bind``. ``create`` takes it
+        and the greeting is played from it if the text and voice still match.
+        """
+        return greeting_prefetcher().start(
+            partial(cls._prerender_greeting, app_state, session_id, scenario)
         )
 
-        # Set active agent on TTS playback to ensure greetings use the correct voice
-        if start_agent_name:
-            handler._tts_playback.set_active_agent(start_agent_name)
-
-        # Create speech cascade
-        handler.speech_cascade = SpeechCascadeHandler(
-            connection_id=session_key,
-            orchestrator_func=handler._create_orchestrator_wrapper(),
-            recognizer=stt_client,
-            memory_manager=memory_manager,
-            on_barge_in=handler._on_barge_in,
-            on_greeting=handler._on_greeting,
-            on_announcement=handler._on_announcement,
-            on_partial_transcript=handler._on_partial_transcript,
-            on_user_transcript=handler._on_user_transcript,
-            on_tts_request=handler._on_tts_request,
-            latency_tool=handler._latency_tool,
-            redis_mgr=redis_mgr,
+    @classmethod
+    async def _prerender_greeting(
+        cls, app_state: Any, session_id: str | None, scenario: str | None
+    ) -> GreetingAudio | None:
+        """Greeting audio as ``create`` would resolve it for a new session."""
+        start_agent, start_agent_name = cls._resolve_start_agent(
+            app_state, session_id, scenario, session_id[-8:] if session_id else "prefetch"
         )
+        memory_manager = MemoManager(session_id=session_id)
+        if start_agent:
+            memory_manager.update_corememory("active_agent", start_agent_name)
+        text = cls._derive_default_greeting(memory_manager, app_state, session_id=session_id)
 
-        # Expose speech_cascade on websocket.state for orchestrator TTS callbacks
-        handler._websocket.state.speech_cascade = handler.speech_cascade
-        # Expose tts_playback for voice configuration updates on agent switch
-        handler._websocket.state.tts_playback = handler._tts_playback
-
-        # Persist
-        await memory_manager.persist_to_redis_async(redis_mgr)
-
-        logger.info(
-            "[%s] MediaHandler created (%s)", handler._session_short, config.transport.value
-        )
-        return handler
+        playback = TTSPlayback(None, app_state, session_id)
+        playback.set_active_agent(start_agent_name)
+        return await playback.prerender_acs(text)
 
     @staticmethod
     def _load_memory_manager(redis_mgr, session_key: str, session_id: str) -> MemoManager:
@@ -681,6 +782,7 @@ class MediaHandler:
 
         self._barge_in_active = True
         self._last_barge_in_ts = now
+        turn_timelines().mark(self._session_id, BARGE_IN)
 
         try:
             logger.info("[%s] Barge-in (transport=%s)", self._session_short, self._transport.value)
@@ -939,6 +1041,9 @@ class MediaHandler:
 
             # Play via unified TTS handler
             if self._transport == TransportType.ACS:
+                prefetched = None
+                if is_greeting:
+                    prefetched, self._greeting_prefetch = self._greeting_prefetch, None
                 success = await self._tts_playback.play_to_acs(
                     text,
                     voice_name=voice_name,
@@ -946,6 +1051,7 @@ class MediaHandler:
                     voice_rate=voice_rate,
                     blocking=True,
                     on_first_audio=on_first_audio,
+                    prefetched=prefetched,
                 )
             else:
                 success = await self._tts_playback.play_to_browser(
@@ -1118,6 +1224,9 @@ class MediaHandler:
                     audio = msg.get("bytes")
                     if audio:
                         self.speech_cascade.write_audio(audio)
+                        if self._recording is not None:
+                            self._recording.write_inbound(audio)
+                        self._process_endpointing(audio)
 
                 span.set_attribute("messages", count)
                 span.set_status(Status(StatusCode.OK))
@@ -1173,6 +1282,9 @@ class MediaHandler:
         """Handle ACS AudioData."""
         section = data.get("audioData") or data.get("AudioData") or {}
         if section.get("silent", True):
+            if self._recording is not None:
+                self._recording.write_inbound_silence(ACS_FRAME_MS)
+            self._process_endpointing(None, silent_ms=ACS_FRAME_MS)
             return
 
         b64 = section.get("data")
@@ -1180,9 +1292,63 @@ class MediaHandler:
             return
 
         try:
-            self.speech_cascade.write_audio(base64.b64decode(b64))
+            audio = base64.b64decode(b64)
+            self.speech_cascade.write_audio(audio)
         except Exception as e:
             logger.error("[%s] Audio decode error: %s", self._session_short, e)
+            return
+        if self._recording is not None:
+            self._recording.write_inbound(audio)
+        self._process_endpointing(audio)
+
+    # =========================================================================
+    # Endpointing
+    # =========================================================================
+
+    def _process_endpointing(self, audio: bytes | None, *, silent_ms: float = 0.0) -> None:
+        """Feed inbound audio to the endpointer and dispatch speech boundaries."""
+        try:
+            if audio:
+                events = self._endpointer.process(audio)
+            else:
+                events = self._endpointer.process_silence(silent_ms)
+        except Exception as e:
+            logger.debug("[%s] Endpointing error: %s", self._session_short, e)
+            return
+
+        for event in events:
+            if event.type is EndpointEventType.SPEECH_START:
+                self._on_speech_start(event)
+            else:
+                self._on_speech_end(event)
+
+    def _on_speech_start(self, event: EndpointEvent) -> None:
+        """Cancel TTS as soon as caller speech is detected over playback."""
+        cascade = self.speech_cascade
+        if not cascade or not self._tts_playback or not self._tts_playback.is_playing:
+            return
+        logger.debug(
+            "[%s] Speech start over TTS (energy=%.0f floor=%.0f delay=%.0fms)",
+            self._session_short,
+            event.energy,
+            event.noise_floor,
+            event.delay_ms,
+        )
+        # Same path as STT partials: honours barge-in suppression and cancels
+        # the in-flight turn before the transport-specific stop.
+        cascade.thread_bridge.schedule_barge_in(cascade.barge_in_controller.handle_barge_in)
+
+    def _on_speech_end(self, event: EndpointEvent) -> None:
+        """Record end-of-utterance hint (precedes the STT final result)."""
+        self._last_speech_end = event
+        self._last_speech_end_at = time.perf_counter() - event.delay_ms / 1000.0
+        turn_timelines().mark(self._session_id, VAD_END, self._last_speech_end_at)
+        logger.debug(
+            "[%s] Speech end hint (stream=%.0fms floor=%.0f)",
+            self._session_short,
+            event.stream_ms,
+            event.noise_floor,
+        )
 
     def _handle_dtmf(self, data: dict[str, Any]) -> None:
         """Handle ACS DTMF."""
@@ -1217,18 +1383,70 @@ class MediaHandler:
                 self._stopped = True
                 self._running = False
 
+                if self._greeting_prefetch is not None:
+                    self._greeting_prefetch.cancel()
+                    self._greeting_prefetch = None
+
                 if self.speech_cascade:
                     try:
                         await self.speech_cascade.stop()
                     except Exception as e:
                         logger.error("[%s] Cascade stop error: %s", self._session_short, e)
 
+                await self._close_turn_timeline()
+                await self._close_recording()
+                await self._mark_session_ended()
                 await self._release_pools()
                 logger.info("[%s] Stopped", self._session_short)
 
             except Exception as e:
                 logger.error("[%s] Stop error: %s", self._session_short, e)
 
+    async def _open_recording(self) -> None:
+        """Start the in-call recording; a storage failure never fails the call."""
+        try:
+            self._recording = await get_blob_helper().open_recording(
+                self._call_connection_id,
+                sample_rate=self._recording_sample_rate,
+                block_size=STREAMING_RECORDING_BLOCK_KB * 1024,
+            )
+        except Exception as e:
+            logger.warning("[%s] Call recording unavailable: %s", self._session_short, e)
+
+    async def _close_recording(self) -> None:
+        """Commit the recording; only the tail block and header are left to upload."""
+        recording, self._recording = self._recording, None
+        if recording is None:
+            return
+        result = await recording.close()
+        if result.success:
+            logger.info(
+                "[%s] Recording committed to %s (%s)",
+                self._session_short,
+                result.blob_name,
+                recording.stats.to_dict(),
+            )
+        else:
+            logger.error("[%s] Recording failed: %s", self._session_short, result.error_message)
+
+    async def _close_turn_timeline(self) -> None:
+        """Finish the last turn's timeline and persist its waterfall."""
+        if not turn_timelines().close(self._session_id):
+            return
+        redis_mgr = getattr(self._app_state, "redis", None)
+        if redis_mgr is not None:
+            await self.memory_manager.persist_background(redis_mgr)
+
+    async def _mark_session_ended(self) -> None:
+        """Flag the session as ended in the session index used for listings."""
+        redis_mgr = getattr(self._app_state, "redis", None)
+        if redis_mgr is None:
+            return
+        try:
+            await redis_mgr.session_index.mark_ended_async(self.memory_manager.session_id)
+        except Exception as e:
+            logger.debug("[%s] Session index update failed: %s", self._session_short, e)
+
     async def _release_pools(self) -> None:
         """Release STT/TTS pools."""
         session_key = self._call_connection_id or self._session_id
@@ -1291,6 +1509,15 @@ class MediaHandler:
     def stream_mode(self) -> StreamMode:
         return self._stream_mode
 
+    @property
+    def last_speech_end_at(self) -> float | None:
+        """perf_counter() timestamp of the last detected end of caller speech."""
+        return self._last_speech_end_at
+
+    @property
+    def endpointing_stats(self) -> dict[str, Any]:
+        return {**self._endpointer.stats.to_dict(), "noise_floor": self._endpointer.noise_floor}
+
     @property
     def metadata(self) -> dict:
         return {
@@ -1347,6 +1574,9 @@ __all__ = [
     "BROWSER_PCM_SAMPLE_RATE",
     "BROWSER_SPEECH_RMS_THRESHOLD",
     "BROWSER_SILENCE_GAP_SECONDS",
+    "ACS_PCM_SAMPLE_RATE",
+    "ACS_FRAME_MS",
+    "STT_PCM_SAMPLE_RATE",
     "VOICE_LIVE_PCM_SAMPLE_RATE",
     "VOICE_LIVE_SPEECH_RMS_THRESHOLD",
     "VOICE_LIVE_SILENCE_GAP_SECONDS",
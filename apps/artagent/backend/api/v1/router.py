@@ -11,13 +11,25 @@ tag definitions and descriptions.
 
 from fastapi import APIRouter
 
-from .endpoints import agent_builder, browser, calls, health, media, metrics, scenario_builder, scenarios, sessions
+from .endpoints import (
+    agent_builder,
+    browser,
+    calls,
+    diagnostics,
+    health,
+    media,
+    metrics,
+    scenario_builder,
+    scenarios,
+    sessions,
+)
 
 # Create v1 router
 v1_router = APIRouter(prefix="/api/v1")
 
 # Include endpoint routers - tags are defined at endpoint level to avoid duplication
 v1_router.include_router(health.router)
+v1_router.include_router(diagnostics.router)
 v1_router.include_router(calls.router, prefix="/calls")
 v1_router.include_router(media.router, prefix="/media")
 v1_router.include_router(browser.router, prefix="/browser")
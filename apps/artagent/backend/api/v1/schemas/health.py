@@ -35,6 +35,16 @@ class PoolMetrics(BaseModel):
     background_warmup: bool = Field(
         ..., description="Whether background warmup is enabled", example=True
     )
+    arrival_rate_per_s: float = Field(
+        0.0, description="Predicted acquires per second (autoscaled pools)", example=0.4
+    )
+    recent_cold_fraction: float = Field(
+        0.0, description="Share of the last 100 acquires that were COLD", example=0.05
+    )
+    acquire_latency_ms: dict[str, dict[str, float]] = Field(
+        default_factory=dict,
+        description="Acquire latency summary per tier (worker scope only)",
+    )
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -110,14 +110,24 @@ from .settings import (  # Azure Communication Services; Security; Azure Identit
     ENABLE_DOCS,
     ENABLE_PERFORMANCE_LOGGING,
     ENABLE_SESSION_PERSISTENCE,
+    ENABLE_STREAMING_CALL_RECORDING,
     ENABLE_TRACING,
     ENTRA_AUDIENCE,
     ENTRA_EXEMPT_PATHS,
     ENTRA_ISSUER,
     ENTRA_JWKS_URL,
     ENVIRONMENT,
+    EVENT_LOOP_MONITOR_ENABLED,
+    EVENT_LOOP_STALL_THRESHOLD_MS,
+    EXECUTOR_BACKGROUND_WORKERS,
+    EXECUTOR_COSMOS_WORKERS,
+    EXECUTOR_QUEUE_PER_WORKER,
+    EXECUTOR_REDIS_WORKERS,
+    EXECUTOR_SPEECH_RECOGNITION_WORKERS,
+    EXECUTOR_SPEECH_SYNTHESIS_WORKERS,
     GREETING_VOICE_TTS,  # Deprecated alias for DEFAULT_TTS_VOICE
     HEARTBEAT_INTERVAL_SECONDS,
+    LATENCY_SKETCH_PUBLISH_INTERVAL_S,
     MAX_CONCURRENT_SESSIONS,
     MAX_WEBSOCKET_CONNECTIONS,
     METRICS_COLLECTION_INTERVAL,
@@ -135,19 +145,26 @@ from .settings import (  # Azure Communication Services; Security; Azure Identit
     SESSION_STATE_TTL,
     SESSION_TTL_SECONDS,
     SILENCE_DURATION_MS,
+    STREAMING_RECORDING_BLOCK_KB,
     STT_PROCESSING_TIMEOUT,
     TTS_CHUNK_SIZE,
     TTS_PROCESSING_TIMEOUT,
     TTS_SAMPLE_RATE_ACS,
     TTS_SAMPLE_RATE_UI,
     VAD_SEMANTIC_SEGMENTATION,
+    WARM_POOL_AUTOSCALE,
+    WARM_POOL_AUTOSCALE_HEADROOM,
     WARM_POOL_BACKGROUND_REFRESH,
     WARM_POOL_ENABLED,
+    WARM_POOL_MAX_SIZE,
+    WARM_POOL_REFILL_CONCURRENCY,
     WARM_POOL_REFRESH_INTERVAL,
     WARM_POOL_RESTART_ON_FAILURE,
     WARM_POOL_SESSION_MAX_AGE,
     WARM_POOL_STT_SIZE,
     WARM_POOL_TTS_SIZE,
+    WORKER_INTERNAL_BASE_PORT,
+    WORKER_PROCESSES,
     validate_app_settings,  # Backward compat alias
     validate_settings,
 )
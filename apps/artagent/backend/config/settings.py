@@ -267,6 +267,25 @@ WARM_POOL_BACKGROUND_REFRESH: bool = _env_bool("WARM_POOL_BACKGROUND_REFRESH", T
 WARM_POOL_REFRESH_INTERVAL: float = _env_float("WARM_POOL_REFRESH_INTERVAL", 30.0)
 WARM_POOL_SESSION_MAX_AGE: float = _env_float("WARM_POOL_SESSION_MAX_AGE", 1800.0)
 WARM_POOL_RESTART_ON_FAILURE: bool = _env_bool("WARM_POOL_RESTART_ON_FAILURE", True)
+# Size warm pools from the predicted arrival rate; the *_SIZE values become the floor
+WARM_POOL_AUTOSCALE: bool = _env_bool("WARM_POOL_AUTOSCALE", True)
+WARM_POOL_MAX_SIZE: int = _env_int("WARM_POOL_MAX_SIZE", 12)
+WARM_POOL_AUTOSCALE_HEADROOM: float = _env_float("WARM_POOL_AUTOSCALE_HEADROOM", 1.5)
+WARM_POOL_REFILL_CONCURRENCY: int = _env_int("WARM_POOL_REFILL_CONCURRENCY", 4)
+
+# Bounded thread pools per blocking workload class (see src/pools/executors.py);
+# each queues at most workers * EXECUTOR_QUEUE_PER_WORKER tasks
+EXECUTOR_SPEECH_SYNTHESIS_WORKERS: int = _env_int("EXECUTOR_SPEECH_SYNTHESIS_WORKERS", 32)
+EXECUTOR_SPEECH_RECOGNITION_WORKERS: int = _env_int("EXECUTOR_SPEECH_RECOGNITION_WORKERS", 8)
+EXECUTOR_REDIS_WORKERS: int = _env_int("EXECUTOR_REDIS_WORKERS", 16)
+EXECUTOR_COSMOS_WORKERS: int = _env_int("EXECUTOR_COSMOS_WORKERS", 8)
+EXECUTOR_BACKGROUND_WORKERS: int = _env_int("EXECUTOR_BACKGROUND_WORKERS", 4)
+EXECUTOR_QUEUE_PER_WORKER: int = _env_int("EXECUTOR_QUEUE_PER_WORKER", 8)
+
+# Worker processes (1 = single process; >1 runs shared-nothing workers with call affinity)
+WORKER_PROCESSES: int = _env_int("WORKER_PROCESSES", 1)
+# Worker i serves loopback hand-offs from sibling workers on WORKER_INTERNAL_BASE_PORT + i
+WORKER_INTERNAL_BASE_PORT: int = _env_int("WORKER_INTERNAL_BASE_PORT", 18080)
 
 
 # ==============================================================================
@@ -276,6 +295,9 @@ WARM_POOL_RESTART_ON_FAILURE: bool = _env_bool("WARM_POOL_RESTART_ON_FAILURE", T
 DTMF_VALIDATION_ENABLED: bool = _env_bool("DTMF_VALIDATION_ENABLED", False)
 ENABLE_AUTH_VALIDATION: bool = _env_bool("ENABLE_AUTH_VALIDATION", False)
 ENABLE_ACS_CALL_RECORDING: bool = _env_bool("ENABLE_ACS_CALL_RECORDING", False)
+# In-call recording tapped from the media pipeline, uploaded as staged blob blocks
+ENABLE_STREAMING_CALL_RECORDING: bool = _env_bool("ENABLE_STREAMING_CALL_RECORDING", False)
+STREAMING_RECORDING_BLOCK_KB: int = _env_int("STREAMING_RECORDING_BLOCK_KB", 4096)
 
 # Environment
 DEBUG_MODE: bool = _env_bool("DEBUG", False)
@@ -298,6 +320,10 @@ ENABLE_PERFORMANCE_LOGGING: bool = _env_bool("ENABLE_PERFORMANCE_LOGGING", True)
 ENABLE_TRACING: bool = _env_bool("ENABLE_TRACING", True)
 METRICS_COLLECTION_INTERVAL: int = _env_int("METRICS_COLLECTION_INTERVAL", 60)
 POOL_METRICS_INTERVAL: int = _env_int("POOL_METRICS_INTERVAL", 30)
+EVENT_LOOP_MONITOR_ENABLED: bool = _env_bool("EVENT_LOOP_MONITOR_ENABLED", True)
+EVENT_LOOP_STALL_THRESHOLD_MS: float = _env_float("EVENT_LOOP_STALL_THRESHOLD_MS", 100.0)
+# How often this replica publishes its latency sketches for fleet percentiles (0 disables)
+LATENCY_SKETCH_PUBLISH_INTERVAL_S: float = _env_float("LATENCY_SKETCH_PUBLISH_INTERVAL_S", 30.0)
 
 
 # ==============================================================================
@@ -354,6 +380,9 @@ def validate_settings() -> dict:
     elif MAX_WEBSOCKET_CONNECTIONS > 1000:
         warnings.append(f"MAX_WEBSOCKET_CONNECTIONS ({MAX_WEBSOCKET_CONNECTIONS}) is very high")
 
+    if WORKER_PROCESSES < 1:
+        issues.append("WORKER_PROCESSES must be at least 1")
+
     # Timeout settings
     if CONNECTION_TIMEOUT_SECONDS < 60:
         warnings.append(f"CONNECTION_TIMEOUT_SECONDS ({CONNECTION_TIMEOUT_SECONDS}) is quite short")
@@ -87,11 +87,30 @@ except Exception as e:
 # ============================================================================
 # Now safe to import modules that depend on environment variables
 # ============================================================================
+from src.acs.notification_dispatcher import get_notification_dispatcher
+from src.pools.executors import (
+    BACKGROUND,
+    COSMOS,
+    REDIS,
+    SPEECH_RECOGNITION,
+    SPEECH_SYNTHESIS,
+    configure_executors,
+    get_executor,
+    run_blocking,
+    shutdown_executors,
+)
 from src.pools.warmable_pool import WarmableResourcePool
+from src.pools.worker_registry import WorkerIdentity, WorkerRegistry
+from src.postcall.analytics_queue import PostCallAnalyticsQueue, set_analytics_queue
+from src.redis.latency_sketches import LatencySketchStore
+from src.tools.latency_sketch import process_sketches
+from utils.ml_logging import queue_root_handlers
 from utils.telemetry_config import setup_azure_monitor
 
 # Setup monitoring (configures loggers, metrics, Azure Monitor export)
 setup_azure_monitor(logger_name="")
+# Export log records from the background log thread instead of the calling coroutine
+queue_root_handlers()
 
 # Initialize OpenAI client
 from src.aoai.client import _init_client as _init_aoai_client
@@ -107,6 +126,7 @@ logger = get_logger("main")
 import asyncio
 import time
 from collections.abc import Awaitable, Callable
+from typing import Any
 
 StepCallable = Callable[[], Awaitable[None]]
 LifecycleStep = tuple[str, StepCallable, StepCallable | None]
@@ -122,9 +142,11 @@ from apps.artagent.backend.registries.toolstore.registry import initialize_tools
 from apps.artagent.backend.api.v1.events.registration import register_default_handlers
 from apps.artagent.backend.api.v1.router import v1_router
 from apps.artagent.backend.config import (
+    ACS_CALL_CALLBACK_PATH,
     ACS_CONNECTION_STRING,
     ACS_ENDPOINT,
     ACS_SOURCE_PHONE_NUMBER,
+    ACS_WEBSOCKET_PATH,
     ALLOWED_ORIGINS,
     AZURE_COSMOS_COLLECTION_NAME,
     AZURE_COSMOS_CONNECTION_STRING,
@@ -136,9 +158,20 @@ from apps.artagent.backend.config import (
     ENABLE_DOCS,
     ENTRA_EXEMPT_PATHS,
     ENVIRONMENT,
+    EVENT_LOOP_MONITOR_ENABLED,
+    EVENT_LOOP_STALL_THRESHOLD_MS,
+    EXECUTOR_BACKGROUND_WORKERS,
+    EXECUTOR_COSMOS_WORKERS,
+    EXECUTOR_QUEUE_PER_WORKER,
+    EXECUTOR_REDIS_WORKERS,
+    EXECUTOR_SPEECH_RECOGNITION_WORKERS,
+    EXECUTOR_SPEECH_SYNTHESIS_WORKERS,
+    LATENCY_SKETCH_PUBLISH_INTERVAL_S,
     OPENAPI_URL,
     REDOC_URL,
     SECURE_DOCS_URL,
+    WORKER_INTERNAL_BASE_PORT,
+    WORKER_PROCESSES,
     AppConfig,
 )
 from apps.artagent.backend.src.services import (
@@ -152,6 +185,11 @@ from apps.artagent.backend.src.services.acs.acs_caller import (
     initialize_acs_caller_instance,
 )
 from apps.artagent.backend.src.utils.auth import validate_entraid_token
+from apps.artagent.backend.src.utils.loop_monitor import LoopLagMonitor
+from apps.artagent.backend.src.utils.worker_affinity import (
+    WorkerAffinityMiddleware,
+    close_forward_clients,
+)
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -447,6 +485,39 @@ async def lifespan(app: FastAPI):
 
     from src.pools.session_manager import ThreadSafeSessionManager
 
+    async def start_loop_monitor() -> None:
+        if not EVENT_LOOP_MONITOR_ENABLED:
+            return
+        app.state.loop_monitor = LoopLagMonitor(threshold_ms=EVENT_LOOP_STALL_THRESHOLD_MS)
+        app.state.loop_monitor.start()
+
+    async def stop_loop_monitor() -> None:
+        if hasattr(app.state, "loop_monitor"):
+            await app.state.loop_monitor.stop()
+            logger.debug("event loop monitor stopped")
+
+    add_step("monitor", start_loop_monitor, stop_loop_monitor)
+
+    async def start_executors() -> None:
+        configure_executors(
+            {
+                SPEECH_SYNTHESIS: EXECUTOR_SPEECH_SYNTHESIS_WORKERS,
+                SPEECH_RECOGNITION: EXECUTOR_SPEECH_RECOGNITION_WORKERS,
+                REDIS: EXECUTOR_REDIS_WORKERS,
+                COSMOS: EXECUTOR_COSMOS_WORKERS,
+                BACKGROUND: EXECUTOR_BACKGROUND_WORKERS,
+            },
+            queue_per_worker=EXECUTOR_QUEUE_PER_WORKER,
+        )
+        # TTS call sites look the synthesis executor up on app.state
+        app.state.speech_executor = get_executor(SPEECH_SYNTHESIS)
+
+    async def stop_executors() -> None:
+        shutdown_executors(wait=False)
+        logger.debug("workload executors stopped")
+
+    add_step("executors", start_executors, stop_executors)
+
     async def start_core_state() -> None:
         try:
             app.state.redis = AzureRedisManager()
@@ -491,6 +562,72 @@ async def lifespan(app: FastAPI):
 
     add_step("core", start_core_state, stop_core_state)
 
+    async def start_latency_sketches() -> None:
+        app.state.latency_sketch_store = LatencySketchStore(app.state.redis)
+        if LATENCY_SKETCH_PUBLISH_INTERVAL_S > 0:
+            await app.state.latency_sketch_store.start(
+                process_sketches(), interval_s=LATENCY_SKETCH_PUBLISH_INTERVAL_S
+            )
+
+    async def stop_latency_sketches() -> None:
+        if hasattr(app.state, "latency_sketch_store"):
+            await app.state.latency_sketch_store.stop()
+            logger.debug("latency sketch publisher stopped")
+
+    add_step("latency", start_latency_sketches, stop_latency_sketches)
+
+    async def start_worker_registry() -> None:
+        # Only set when running under the multi-worker supervisor (workers.py)
+        identity = WorkerIdentity.from_env()
+        app.state.worker_registry = None
+        if identity is None:
+            return
+
+        def worker_status() -> dict[str, Any]:
+            pools = {}
+            for attr in ("tts_pool", "stt_pool"):
+                pool = getattr(app.state, attr, None)
+                if pool is not None and hasattr(pool, "snapshot"):
+                    pools[attr] = pool.snapshot()
+            return {"pools": pools}
+
+        app.state.worker_registry = WorkerRegistry(app.state.redis, identity)
+        await app.state.worker_registry.start(worker_status)
+        logger.info(
+            "worker registered",
+            extra={"worker_id": identity.worker_id, "internal_url": identity.internal_url},
+        )
+
+    async def stop_worker_registry() -> None:
+        if getattr(app.state, "worker_registry", None) is not None:
+            await app.state.worker_registry.stop()
+            logger.debug("worker registry stopped")
+        await close_forward_clients()
+
+    add_step("workers", start_worker_registry, stop_worker_registry)
+
+    async def start_speech_token() -> None:
+        # Fetch the Speech AAD token before the pools build their configs and
+        # keep it refreshed ahead of expiry so speech calls never fetch inline.
+        app.state.speech_token_manager = None
+        if os.getenv("AZURE_SPEECH_KEY") or not os.getenv("AZURE_SPEECH_RESOURCE_ID"):
+            logger.debug("Speech token refresh skipped: not using Azure AD auth")
+            return
+        try:
+            from src.speech.auth_manager import get_speech_token_manager
+
+            token_mgr = get_speech_token_manager()
+            await token_mgr.start()
+            app.state.speech_token_manager = token_mgr
+        except Exception as e:
+            logger.warning("Speech token refresh setup failed: %s", e)
+
+    async def stop_speech_token() -> None:
+        if getattr(app.state, "speech_token_manager", None) is not None:
+            await app.state.speech_token_manager.stop()
+
+    add_step("token", start_speech_token, stop_speech_token)
+
     async def start_speech_pools() -> None:
         async def make_tts() -> SpeechSynthesizer:
             import os
@@ -535,8 +672,12 @@ async def lifespan(app: FastAPI):
 
         # Import warm pool configuration
         from config import (
+            WARM_POOL_AUTOSCALE,
+            WARM_POOL_AUTOSCALE_HEADROOM,
             WARM_POOL_BACKGROUND_REFRESH,
             WARM_POOL_ENABLED,
+            WARM_POOL_MAX_SIZE,
+            WARM_POOL_REFILL_CONCURRENCY,
             WARM_POOL_REFRESH_INTERVAL,
             WARM_POOL_RESTART_ON_FAILURE,
             WARM_POOL_SESSION_MAX_AGE,
@@ -548,7 +689,7 @@ async def lifespan(app: FastAPI):
         async def warm_tts_connection(tts: SpeechSynthesizer) -> bool:
             """Warm TTS connection by synthesizing minimal audio."""
             try:
-                return await asyncio.to_thread(tts.warm_connection)
+                return await run_blocking(SPEECH_SYNTHESIS, tts.warm_connection, critical=False)
             except Exception as e:
                 logger.warning("TTS warm_fn failed: %s", e)
                 return False
@@ -556,23 +697,39 @@ async def lifespan(app: FastAPI):
         async def warm_stt_connection(stt: StreamingSpeechRecognizerFromBytes) -> bool:
             """Warm STT connection by calling prepare_start()."""
             try:
-                return await asyncio.to_thread(stt.warm_connection)
+                return await run_blocking(SPEECH_RECOGNITION, stt.warm_connection, critical=False)
             except Exception as e:
                 logger.warning("STT warm_fn failed: %s", e)
                 return False
 
+        async def close_tts_connection(tts: SpeechSynthesizer) -> None:
+            """Close the native synthesizer connections of a trimmed TTS."""
+            await run_blocking(SPEECH_SYNTHESIS, tts.reset_native_synthesizers, critical=False)
+
+        async def close_stt_connection(stt: StreamingSpeechRecognizerFromBytes) -> None:
+            """Close the pre-configured audio stream of a trimmed STT."""
+            await run_blocking(SPEECH_RECOGNITION, stt.close_stream, critical=False)
+
         if WARM_POOL_ENABLED:
             logger.debug(
-                "Initializing warm speech pools (TTS=%d, STT=%d, background=%s)",
+                "Initializing warm speech pools (TTS=%d, STT=%d, background=%s, autoscale=%s)",
                 WARM_POOL_TTS_SIZE,
                 WARM_POOL_STT_SIZE,
                 WARM_POOL_BACKGROUND_REFRESH,
+                WARM_POOL_AUTOSCALE,
             )
         else:
             logger.debug("Initializing speech pools (warm pool disabled, on-demand mode)")
 
         # Use WarmableResourcePool for both modes. When warm_pool_size=0,
         # it behaves identically to OnDemandResourcePool.
+        autoscale = WARM_POOL_ENABLED and WARM_POOL_AUTOSCALE
+        autoscale_options = {
+            "autoscale": autoscale,
+            "max_warm_size": WARM_POOL_MAX_SIZE if autoscale else None,
+            "autoscale_headroom": WARM_POOL_AUTOSCALE_HEADROOM,
+            "refill_concurrency": WARM_POOL_REFILL_CONCURRENCY,
+        }
         app.state.stt_pool = WarmableResourcePool(
             factory=make_stt,
             name="speech-stt",
@@ -581,6 +738,8 @@ async def lifespan(app: FastAPI):
             warmup_interval_sec=WARM_POOL_REFRESH_INTERVAL,
             session_awareness=False,
             warm_fn=warm_stt_connection if WARM_POOL_ENABLED else None,
+            close_fn=close_stt_connection,
+            **autoscale_options,
         )
 
         app.state.tts_pool = WarmableResourcePool(
@@ -592,6 +751,8 @@ async def lifespan(app: FastAPI):
             session_awareness=True,
             session_max_age_sec=WARM_POOL_SESSION_MAX_AGE,
             warm_fn=warm_tts_connection if WARM_POOL_ENABLED else None,
+            close_fn=close_tts_connection,
+            **autoscale_options,
         )
 
         await asyncio.gather(app.state.tts_pool.prepare(), app.state.stt_pool.prepare())
@@ -660,7 +821,8 @@ async def lifespan(app: FastAPI):
         Pre-warm Azure connections to eliminate cold-start latency.
 
         Phase 1 warmup (this step):
-        1. Azure AD token pre-fetch for Speech services (if using managed identity)
+        1. Azure AD token pre-fetch for Speech services (if using managed identity);
+           normally already done by the "token" step, which keeps it refreshed
         2. Azure OpenAI HTTP/2 connection establishment
 
         Phase 2 warmup is now handled by WarmableResourcePool:
@@ -685,7 +847,9 @@ async def lifespan(app: FastAPI):
                     from src.speech.auth_manager import get_speech_token_manager
 
                     token_mgr = get_speech_token_manager()
-                    success = await asyncio.to_thread(token_mgr.warm_token)
+                    if token_mgr.is_warmed:
+                        return ("speech_token", True)
+                    success = await run_blocking(BACKGROUND, token_mgr.warm_token)
                     return ("speech_token", success)
                 except Exception as e:
                     logger.warning("Speech token warmup setup failed: %s", e)
@@ -816,6 +980,32 @@ async def lifespan(app: FastAPI):
 
     add_step("services", start_external_services)
 
+    async def start_postcall_queue() -> None:
+        app.state.postcall_queue = PostCallAnalyticsQueue(app.state.cosmos)
+        await app.state.postcall_queue.start()
+        set_analytics_queue(app.state.postcall_queue)
+
+    async def stop_postcall_queue() -> None:
+        if hasattr(app.state, "postcall_queue"):
+            set_analytics_queue(None)
+            await app.state.postcall_queue.stop()
+            logger.debug(
+                "post-call analytics queue flushed",
+                extra=app.state.postcall_queue.stats.to_dict(),
+            )
+
+    add_step("postcall", start_postcall_queue, stop_postcall_queue)
+
+    async def start_notifications() -> None:
+        get_notification_dispatcher().start()
+
+    async def stop_notifications() -> None:
+        dispatcher = get_notification_dispatcher()
+        await asyncio.to_thread(dispatcher.shutdown)
+        logger.debug("notification dispatcher stopped", extra=dispatcher.stats.to_dict())
+
+    add_step("notifications", start_notifications, stop_notifications)
+
     async def start_agents() -> None:
         # ─────────────────────────────────────────────────────────────────────
         # Initialize Unified Agents (new modular structure)
@@ -1037,6 +1227,11 @@ def setup_app_middleware_and_routes(app: FastAPI):
         allow_headers=["*"],
         max_age=86400,
     )
+    app.add_middleware(
+        WorkerAffinityMiddleware,
+        http_paths=(ACS_CALL_CALLBACK_PATH,),
+        websocket_paths=(ACS_WEBSOCKET_PATH,),
+    )
 
     if ENABLE_AUTH_VALIDATION:
 
@@ -1107,6 +1302,13 @@ app = initialize_app()
 def main():
     """Entry point for uv run artagent-server."""
     port = int(os.environ.get("PORT", 8080))
+    if WORKER_PROCESSES > 1:
+        from apps.artagent.backend.workers import run_workers
+
+        run_workers(
+            port=port, workers=WORKER_PROCESSES, internal_base_port=WORKER_INTERNAL_BASE_PORT
+        )
+        return
     uvicorn.run(
         app,  # Use app object directly
         host="0.0.0.0",  # nosec: B104
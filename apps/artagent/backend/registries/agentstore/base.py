@@ -825,6 +825,7 @@ class UnifiedAgent:
         say: str | None = None,
         session_id: str | None = None,
         call_connection_id: str | None = None,
+        session_config: Any = None,
     ) -> None:
         """
         Apply this agent's configuration to a VoiceLive session.
@@ -839,6 +840,9 @@ class UnifiedAgent:
             say: Optional greeting text to trigger after session update
             session_id: Session ID for tracing
             call_connection_id: Call connection ID for tracing
+            session_config: Optional SessionConfigManager for the connection; when
+                given, tools are served from its per-agent cache and only the
+                fields that changed since the last update are sent
         """
         try:
             from azure.ai.voicelive.models import (
@@ -874,7 +878,12 @@ class UnifiedAgent:
             vad = self.build_voicelive_vad()
             modalities = self.get_voicelive_modalities()
             in_fmt, out_fmt = self.get_voicelive_audio_formats()
-            tools = self._build_voicelive_tools_with_handoffs(session_id)
+            if session_config is not None:
+                tools = session_config.tools(
+                    self.name, lambda: self._build_voicelive_tools_with_handoffs(session_id)
+                )
+            else:
+                tools = self._build_voicelive_tools_with_handoffs(session_id)
 
             logger.debug(
                 "[%s] Applying session | voice=%s",
@@ -919,9 +928,14 @@ class UnifiedAgent:
 
             # Apply session
             session_payload = RequestSession(**kwargs)
-            await conn.session.update(session=session_payload)
-
-            logger.info("[%s] Session updated successfully", self.name)
+            if session_config is not None:
+                if await session_config.apply(session_payload):
+                    logger.info("[%s] Session updated successfully", self.name)
+                else:
+                    logger.info("[%s] Session already up to date", self.name)
+            else:
+                await conn.session.update(session=session_payload)
+                logger.info("[%s] Session updated successfully", self.name)
             span.set_status(Status(StatusCode.OK))
 
             # Trigger greeting if provided
@@ -33,10 +33,12 @@ Usage:
 
 from apps.artagent.backend.registries.toolstore.registry import (  # Types; Core registration
     ToolDefinition,
+    ToolDispatchPlan,
     ToolExecutor,
     execute_tool,
     get_tool_definition,
     get_tool_executor,
+    get_tool_latency_stats,
     get_tool_schema,
     get_tools_for_agent,
     initialize_tools,
@@ -55,8 +57,10 @@ __all__ = [
     "list_tools",
     "get_tools_for_agent",
     "execute_tool",
+    "get_tool_latency_stats",
     "initialize_tools",
     # Types
     "ToolDefinition",
+    "ToolDispatchPlan",
     "ToolExecutor",
 ]
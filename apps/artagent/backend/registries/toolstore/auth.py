@@ -7,7 +7,6 @@ Tools for identity verification, MFA, and authentication.
 
 from __future__ import annotations
 
-import asyncio
 import os
 import random
 import re
@@ -15,6 +14,7 @@ import string
 from typing import TYPE_CHECKING, Any
 
 from apps.artagent.backend.registries.toolstore.registry import register_tool
+from src.pools.executors import COSMOS, run_blocking
 from utils.ml_logging import get_logger
 
 try:  # pragma: no cover - optional dependency during tests
@@ -301,7 +301,7 @@ async def _lookup_user_in_cosmos(
     )
 
     try:
-        document = await asyncio.to_thread(cosmos.read_document, query)
+        document = await run_blocking(COSMOS, cosmos.read_document, query)
         if document:
             logger.info(
                 "✓ Identity verified via Cosmos (exact match): %s",
@@ -311,7 +311,7 @@ async def _lookup_user_in_cosmos(
 
         # Second try: SSN-only lookup (in case speech-to-text misheard the name)
         ssn_only_query: dict[str, Any] = {"verification_codes.ssn4": ssn_last_4}
-        document = await asyncio.to_thread(cosmos.read_document, ssn_only_query)
+        document = await run_blocking(COSMOS, cosmos.read_document, ssn_only_query)
         if document:
             actual_name = document.get("full_name", "unknown")
             logger.warning(
@@ -390,7 +390,7 @@ async def _lookup_claim_in_cosmos(
     logger.info("🔍 Cosmos claim lookup | claim_number=%s", claim_number)
 
     try:
-        document = await asyncio.to_thread(cosmos.read_document, query)
+        document = await run_blocking(COSMOS, cosmos.read_document, query)
         if document:
             # Extract the matching claim from the document
             claims = document.get("demo_metadata", {}).get("claims", [])
@@ -7,13 +7,13 @@ Core banking tools for account info, transactions, cards, and user profiles.
 
 from __future__ import annotations
 
-import asyncio
 import os
 import random
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
 from apps.artagent.backend.registries.toolstore.registry import register_tool
+from src.pools.executors import COSMOS, REDIS, run_blocking
 from utils.ml_logging import get_logger
 
 from .constants import (
@@ -387,7 +387,7 @@ async def _lookup_user_by_client_id(client_id: str) -> dict[str, Any] | None:
 
     for query in queries:
         try:
-            document = await asyncio.to_thread(cosmos.read_document, query)
+            document = await run_blocking(COSMOS, cosmos.read_document, query)
             if document:
                 logger.info("📋 User profile loaded from Cosmos: %s", client_id)
                 # Sanitize document for JSON serialization
@@ -462,7 +462,7 @@ async def _get_card_application(session_id: str, client_id: str) -> dict[str, An
     key = _build_card_app_redis_key(session_id, client_id)
     
     try:
-        value = await asyncio.to_thread(redis_mgr.get_value, key)
+        value = await run_blocking(REDIS, redis_mgr.get_value, key)
         if value:
             return json.loads(value)
     except Exception as exc:
@@ -503,7 +503,7 @@ async def _delete_card_application(session_id: str, client_id: str) -> None:
     key = _build_card_app_redis_key(session_id, client_id)
     
     try:
-        await asyncio.to_thread(redis_mgr.delete_key, key)
+        await run_blocking(REDIS, redis_mgr.delete_key, key)
         logger.info("🗑️ Card application deleted: session=%s client=%s", session_id, client_id)
     except Exception as exc:
         logger.debug("Could not delete card application from Redis: %s", exc)
@@ -550,7 +550,7 @@ async def _get_esign_code(session_id: str, client_id: str) -> dict[str, str] | N
     key = _build_esign_redis_key(session_id, client_id)
     
     try:
-        value = await asyncio.to_thread(redis_mgr.get_value, key)
+        value = await run_blocking(REDIS, redis_mgr.get_value, key)
         if value:
             return json.loads(value)
     except Exception as exc:
@@ -567,7 +567,7 @@ async def _delete_esign_code(session_id: str, client_id: str) -> None:
     key = _build_esign_redis_key(session_id, client_id)
     
     try:
-        await asyncio.to_thread(redis_mgr.delete_key, key)
+        await run_blocking(REDIS, redis_mgr.delete_key, key)
         logger.info("🗑️ E-sign code deleted: session=%s client=%s", session_id, client_id)
     except Exception as exc:
         logger.debug("Could not delete e-sign code from Redis: %s", exc)
@@ -1323,7 +1323,7 @@ async def evaluate_card_eligibility(args: dict[str, Any]) -> dict[str, Any]:
     customer_data = None
     if mgr:
         try:
-            customer_data = await asyncio.to_thread(mgr.read_document, {"client_id": client_id})
+            customer_data = await run_blocking(COSMOS, mgr.read_document, {"client_id": client_id})
         except Exception as exc:
             logger.warning("Could not fetch customer data: %s", exc)
     
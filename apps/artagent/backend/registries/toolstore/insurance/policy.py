@@ -3,190 +3,38 @@ Insurance Policy Tools - Query User's Policy Data
 ==================================================
 
 Tools for querying policy information from the user's loaded demo profile.
-These tools query Cosmos DB directly to get policy data.
+These tools query Cosmos DB to get policy data.
 
 Data Source:
-- Tools query Cosmos DB directly to find policies by client_id or policy_number
+- Tools query Cosmos DB through the async InsuranceRepository (bounded
+  executor, per-session document cache, read timeout)
 - Falls back to _session_profile if available
 - Policies are stored in demo_metadata.policies
 """
 
 from __future__ import annotations
 
-import os
-import re
-from typing import TYPE_CHECKING, Any, Dict, List
+from typing import Any, Dict, List
 
+from apps.artagent.backend.registries.toolstore.insurance.repository import (
+    get_insurance_repository,
+)
 from apps.artagent.backend.registries.toolstore.registry import register_tool
 from utils.ml_logging import get_logger
 
-try:  # pragma: no cover - optional dependency during tests
-    from src.cosmosdb.manager import CosmosDBMongoCoreManager as _CosmosManagerImpl
-    from src.cosmosdb.config import get_database_name, get_users_collection_name
-except Exception:  # pragma: no cover - handled at runtime
-    _CosmosManagerImpl = None
-    def get_database_name() -> str:
-        return os.getenv("AZURE_COSMOS_DATABASE_NAME", "audioagentdb")
-    def get_users_collection_name() -> str:
-        return os.getenv("AZURE_COSMOS_USERS_COLLECTION_NAME", "users")
-
-if TYPE_CHECKING:  # pragma: no cover - typing only
-    from src.cosmosdb.manager import CosmosDBMongoCoreManager
-
 logger = get_logger("agents.tools.policy")
 
-# Cached Cosmos manager for policy tools
-_COSMOS_USERS_MANAGER: CosmosDBMongoCoreManager | None = None
-
 
 def _json(data: Any) -> Dict[str, Any]:
     """Wrap response data for consistent JSON output."""
     return data if isinstance(data, dict) else {"result": data}
 
 
-# ═══════════════════════════════════════════════════════════════════════════════
-# COSMOS DB HELPERS: Query policies directly from database
-# ═══════════════════════════════════════════════════════════════════════════════
-
-def _get_cosmos_manager() -> CosmosDBMongoCoreManager | None:
-    """Resolve the shared Cosmos DB client from FastAPI app state."""
-    try:
-        from apps.artagent.backend import main as backend_main
-    except Exception:  # pragma: no cover
-        return None
-
-    app = getattr(backend_main, "app", None)
-    state = getattr(app, "state", None) if app else None
-    return getattr(state, "cosmos", None)
-
-
-def _get_demo_users_manager() -> CosmosDBMongoCoreManager | None:
-    """Return a Cosmos DB manager pointed at the demo users collection."""
-    global _COSMOS_USERS_MANAGER
-    database_name = get_database_name()
-    container_name = get_users_collection_name()
-
-    if _COSMOS_USERS_MANAGER is not None:
-        return _COSMOS_USERS_MANAGER
-
-    base_manager = _get_cosmos_manager()
-    if base_manager is not None:
-        try:
-            db_name = getattr(getattr(base_manager, "database", None), "name", None)
-            coll_name = getattr(getattr(base_manager, "collection", None), "name", None)
-            if db_name == database_name and coll_name == container_name:
-                _COSMOS_USERS_MANAGER = base_manager
-                return _COSMOS_USERS_MANAGER
-        except Exception:
-            pass
-
-    if _CosmosManagerImpl is None:
-        logger.debug("Cosmos manager implementation unavailable for policy tools")
-        return None
-
-    try:
-        _COSMOS_USERS_MANAGER = _CosmosManagerImpl(
-            database_name=database_name,
-            collection_name=container_name,
-        )
-        logger.info(
-            "Policy tools connected to Cosmos demo users collection",
-            extra={"database": database_name, "collection": container_name},
-        )
-        return _COSMOS_USERS_MANAGER
-    except Exception as exc:  # pragma: no cover
-        logger.warning("Unable to initialize Cosmos manager for policy tools: %s", exc)
-        return None
-
-
-def _lookup_user_policies_in_cosmos(client_id: str) -> List[Dict[str, Any]]:
-    """
-    Look up a user's policies by client_id in Cosmos DB.
-    
-    Returns list of policy dicts, or empty list if not found.
-    """
-    cosmos = _get_demo_users_manager()
-    if cosmos is None:
-        return []
-
-    query: Dict[str, Any] = {"_id": client_id}
-    
-    logger.info("🔍 Cosmos policy lookup by client_id | client_id=%s", client_id)
-
-    try:
-        document = cosmos.read_document(query)
-        if document:
-            policies = document.get("demo_metadata", {}).get("policies", [])
-            logger.info("✓ Found %d policies for client %s in Cosmos", len(policies), client_id)
-            return policies
-    except Exception as exc:  # pragma: no cover
-        logger.warning("Cosmos policy lookup failed: %s", exc)
-
-    return []
-
-
-def _lookup_user_claims_in_cosmos(client_id: str) -> List[Dict[str, Any]]:
-    """
-    Look up a user's claims by client_id in Cosmos DB.
-    
-    Returns list of claim dicts, or empty list if not found.
-    """
-    cosmos = _get_demo_users_manager()
-    if cosmos is None:
-        return []
-
-    query: Dict[str, Any] = {"_id": client_id}
-    
-    logger.info("🔍 Cosmos claims lookup by client_id | client_id=%s", client_id)
-
-    try:
-        document = cosmos.read_document(query)
-        if document:
-            claims = document.get("demo_metadata", {}).get("claims", [])
-            logger.info("✓ Found %d claims for client %s in Cosmos", len(claims), client_id)
-            return claims
-    except Exception as exc:  # pragma: no cover
-        logger.warning("Cosmos claims lookup failed: %s", exc)
-
-    return []
-
-
-def _lookup_policy_by_number_in_cosmos(policy_number: str) -> tuple[Dict[str, Any] | None, List[Dict[str, Any]]]:
-    """
-    Look up a policy by policy number in Cosmos DB.
-    
-    Returns (policy_dict, all_user_policies) or (None, []) if not found.
-    """
-    cosmos = _get_demo_users_manager()
-    if cosmos is None:
-        return None, []
-
-    query: Dict[str, Any] = {
-        "demo_metadata.policies.policy_number": {"$regex": f"^{re.escape(policy_number)}$", "$options": "i"}
-    }
-    
-    logger.info("🔍 Cosmos policy lookup by number | policy_number=%s", policy_number)
-
-    try:
-        document = cosmos.read_document(query)
-        if document:
-            policies = document.get("demo_metadata", {}).get("policies", [])
-            policy_upper = policy_number.upper()
-            for policy in policies:
-                if policy.get("policy_number", "").upper() == policy_upper:
-                    logger.info("✓ Found policy %s in Cosmos", policy_number)
-                    return policy, policies
-    except Exception as exc:  # pragma: no cover
-        logger.warning("Cosmos policy lookup failed: %s", exc)
-
-    return None, []
-
-
 # ═══════════════════════════════════════════════════════════════════════════════
 # HELPER: Get policies from session profile
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def _get_policies_from_profile(args: Dict[str, Any]) -> List[Dict[str, Any]]:
+async def _get_policies_from_profile(args: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
     Extract policies list from session profile or Cosmos DB.
     
@@ -208,7 +56,7 @@ def _get_policies_from_profile(args: Dict[str, Any]) -> List[Dict[str, Any]]:
     
     # Try Cosmos DB lookup by client_id
     if client_id:
-        cosmos_policies = _lookup_user_policies_in_cosmos(client_id)
+        cosmos_policies = await get_insurance_repository().get_user_policies(client_id)
         if cosmos_policies:
             return cosmos_policies
     
@@ -233,7 +81,7 @@ def _get_policies_from_profile(args: Dict[str, Any]) -> List[Dict[str, Any]]:
     return []
 
 
-def _get_claims_from_profile(args: Dict[str, Any]) -> List[Dict[str, Any]]:
+async def _get_claims_from_profile(args: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
     Extract claims list from session profile or Cosmos DB.
     
@@ -255,7 +103,7 @@ def _get_claims_from_profile(args: Dict[str, Any]) -> List[Dict[str, Any]]:
     
     # Try Cosmos DB lookup by client_id
     if client_id:
-        cosmos_claims = _lookup_user_claims_in_cosmos(client_id)
+        cosmos_claims = await get_insurance_repository().get_user_claims(client_id)
         if cosmos_claims:
             return cosmos_claims
     
@@ -268,7 +116,7 @@ def _get_claims_from_profile(args: Dict[str, Any]) -> List[Dict[str, Any]]:
     return session_profile.get("claims", [])
 
 
-def _find_policy_by_number(args: Dict[str, Any], policy_number: str) -> Dict[str, Any] | None:
+async def _find_policy_by_number(args: Dict[str, Any], policy_number: str) -> Dict[str, Any] | None:
     """
     Find a policy by policy number.
     
@@ -279,12 +127,14 @@ def _find_policy_by_number(args: Dict[str, Any], policy_number: str) -> Dict[str
     policy_number_upper = policy_number.upper()
     
     # First try Cosmos DB direct lookup
-    cosmos_policy, _ = _lookup_policy_by_number_in_cosmos(policy_number_upper)
+    cosmos_policy, _ = await get_insurance_repository().find_policy_by_number(
+        policy_number_upper
+    )
     if cosmos_policy:
         return cosmos_policy
     
     # Fallback to session profile
-    policies = _get_policies_from_profile(args)
+    policies = await _get_policies_from_profile(args)
     for policy in policies:
         if policy.get("policy_number", "").upper() == policy_number_upper:
             return policy
@@ -352,7 +202,7 @@ async def search_policy_info(args: Dict[str, Any]) -> Dict[str, Any]:
             "message": "Please provide a query about what policy information you need.",
         })
     
-    policies = _get_policies_from_profile(args)
+    policies = await _get_policies_from_profile(args)
     
     if not policies:
         return _json({
@@ -537,7 +387,7 @@ async def get_policy_details(args: Dict[str, Any]) -> Dict[str, Any]:
             "message": "Policy number is required.",
         })
     
-    policy = _find_policy_by_number(args, policy_number)
+    policy = await _find_policy_by_number(args, policy_number)
     
     if not policy:
         return _json({
@@ -601,7 +451,7 @@ async def list_user_policies(args: Dict[str, Any]) -> Dict[str, Any]:
     policy_type_filter = (args.get("policy_type") or "all").lower()
     status_filter = (args.get("status") or "all").lower()
     
-    policies = _get_policies_from_profile(args)
+    policies = await _get_policies_from_profile(args)
     
     if not policies:
         return _json({
@@ -687,7 +537,7 @@ async def check_coverage(args: Dict[str, Any]) -> Dict[str, Any]:
             "message": "Please specify what type of coverage you want to check.",
         })
     
-    policies = _get_policies_from_profile(args)
+    policies = await _get_policies_from_profile(args)
     
     if not policies:
         return _json({
@@ -779,7 +629,7 @@ async def get_claims_summary(args: Dict[str, Any]) -> Dict[str, Any]:
     """Get summary of user's claims."""
     status_filter = (args.get("status") or "all").lower()
     
-    claims = _get_claims_from_profile(args)
+    claims = await _get_claims_from_profile(args)
     
     if not claims:
         return _json({
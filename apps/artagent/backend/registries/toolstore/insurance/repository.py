@@ -0,0 +1,335 @@
+"""
+Insurance Data Repository
+=========================
+
+Async data-access layer for the insurance tools (policy, FNOL, subrogation).
+
+The pymongo-based Cosmos manager is synchronous; calling ``read_document``
+from an async tool blocks the event loop and stalls audio for every call on
+the worker. ``InsuranceRepository`` instead:
+
+- Runs Cosmos reads on the shared ``cosmos`` executor
+  (``src.pools.executors``), so slow reads queue there with every other
+  Cosmos call instead of on the event loop.
+- Applies a per-read timeout; on timeout or error the lookup returns nothing
+  and the tools fall back to the session profile.
+- Caches user documents per session (keyed from ``utils.session_context``),
+  so policy, claims and subrogation lookups within a call share one fetch of
+  the user's ``demo_metadata``. Concurrent identical reads are coalesced.
+
+Usage:
+    from apps.artagent.backend.registries.toolstore.insurance.repository import (
+        get_insurance_repository,
+    )
+
+    repo = get_insurance_repository()
+    policies = await repo.get_user_policies(client_id)
+    claims = await repo.get_user_claims(client_id)  # served from cache
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from src.pools.executors import COSMOS, run_blocking
+from utils.ml_logging import get_logger
+from utils.session_context import get_session_correlation
+
+try:  # pragma: no cover - optional dependency during tests
+    from src.cosmosdb.config import get_database_name, get_users_collection_name
+    from src.cosmosdb.manager import CosmosDBMongoCoreManager as _CosmosManagerImpl
+except Exception:  # pragma: no cover - handled at runtime
+    _CosmosManagerImpl = None
+
+    def get_database_name() -> str:
+        return os.getenv("AZURE_COSMOS_DATABASE_NAME", "audioagentdb")
+
+    def get_users_collection_name() -> str:
+        return os.getenv("AZURE_COSMOS_USERS_COLLECTION_NAME", "users")
+
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from src.cosmosdb.manager import CosmosDBMongoCoreManager
+
+logger = get_logger("agents.tools.insurance.repository")
+
+
+@dataclass
+class RepositoryStats:
+    """Counters for cache efficiency and Cosmos read health."""
+
+    reads: int = 0
+    cache_hits: int = 0
+    coalesced: int = 0
+    timeouts: int = 0
+    errors: int = 0
+    read_ms_total: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for logging/telemetry."""
+        return {
+            "reads": self.reads,
+            "cache_hits": self.cache_hits,
+            "coalesced": self.coalesced,
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+            "avg_read_ms": round(self.read_ms_total / self.reads, 2) if self.reads else None,
+        }
+
+
+@dataclass
+class _SessionDocuments:
+    """Documents fetched for one session, keyed by lookup key."""
+
+    documents: dict[tuple[str, str], tuple[dict[str, Any], float]] = field(default_factory=dict)
+
+
+class InsuranceRepository:
+    """
+    Async, cached access to insurance demo user documents in Cosmos DB.
+
+    :param timeout_s: Per-read timeout before falling back to profile data
+    :param cache_ttl_s: How long a cached document is served
+    :param max_sessions: Number of sessions whose documents are retained
+    :param manager: Explicit Cosmos manager (defaults to the demo users collection)
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout_s: float = 2.0,
+        cache_ttl_s: float = 300.0,
+        max_sessions: int = 256,
+        manager: CosmosDBMongoCoreManager | None = None,
+    ) -> None:
+        self.timeout_s = timeout_s
+        self.cache_ttl_s = cache_ttl_s
+        self.max_sessions = max_sessions
+        self.stats = RepositoryStats()
+        self._manager = manager
+        self._sessions: OrderedDict[str, _SessionDocuments] = OrderedDict()
+        self._inflight: dict[tuple[str, tuple[str, str]], asyncio.Future] = {}
+
+    # ------------------------------------------------------------------ #
+    # Cosmos plumbing
+    # ------------------------------------------------------------------ #
+
+    def _get_manager(self) -> CosmosDBMongoCoreManager | None:
+        """Return a Cosmos DB manager pointed at the demo users collection."""
+        if self._manager is not None:
+            return self._manager
+
+        database_name = get_database_name()
+        container_name = get_users_collection_name()
+
+        base_manager = _get_app_cosmos_manager()
+        if base_manager is not None:
+            try:
+                db_name = getattr(getattr(base_manager, "database", None), "name", None)
+                coll_name = getattr(getattr(base_manager, "collection", None), "name", None)
+                if db_name == database_name and coll_name == container_name:
+                    self._manager = base_manager
+                    return self._manager
+            except Exception:
+                pass
+
+        if _CosmosManagerImpl is None:
+            logger.debug("Cosmos manager implementation unavailable for insurance tools")
+            return None
+
+        try:
+            self._manager = _CosmosManagerImpl(
+                database_name=database_name,
+                collection_name=container_name,
+            )
+            logger.info(
+                "Insurance tools connected to Cosmos demo users collection",
+                extra={"database": database_name, "collection": container_name},
+            )
+            return self._manager
+        except Exception as exc:  # pragma: no cover
+            logger.warning("Unable to initialize Cosmos manager for insurance tools: %s", exc)
+            return None
+
+    def _session_documents(self) -> _SessionDocuments:
+        correlation = get_session_correlation()
+        session_key = ""
+        if correlation is not None:
+            session_key = correlation.session_id or correlation.call_connection_id or ""
+        docs = self._sessions.get(session_key)
+        if docs is None:
+            docs = self._sessions[session_key] = _SessionDocuments()
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+        else:
+            self._sessions.move_to_end(session_key)
+        return docs
+
+    async def _read(
+        self, key: tuple[str, str], query: dict[str, Any]
+    ) -> dict[str, Any] | None:
+        """Read one document through the session cache and the Cosmos executor."""
+        docs = self._session_documents()
+        cached = docs.documents.get(key)
+        if cached and time.monotonic() - cached[1] < self.cache_ttl_s:
+            self.stats.cache_hits += 1
+            return cached[0]
+
+        inflight_key = (id(docs), key)
+        pending = self._inflight.get(inflight_key)
+        if pending is not None:
+            self.stats.coalesced += 1
+            return await asyncio.shield(pending)
+
+        manager = self._get_manager()
+        if manager is None:
+            return None
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._inflight[inflight_key] = future
+        document: dict[str, Any] | None = None
+        start = time.perf_counter()
+        try:
+            document = await asyncio.wait_for(
+                run_blocking(COSMOS, manager.read_document, query),
+                timeout=self.timeout_s,
+            )
+        except TimeoutError:
+            self.stats.timeouts += 1
+            logger.warning(
+                "Cosmos read timed out after %.1fs; using profile data | key=%s",
+                self.timeout_s,
+                key,
+            )
+        except Exception as exc:
+            self.stats.errors += 1
+            logger.warning("Cosmos read failed; using profile data | key=%s error=%s", key, exc)
+        finally:
+            self.stats.reads += 1
+            self.stats.read_ms_total += (time.perf_counter() - start) * 1000
+            self._inflight.pop(inflight_key, None)
+            future.set_result(document)
+
+        if document:
+            fetched_at = time.monotonic()
+            docs.documents[key] = (document, fetched_at)
+            # Lookups by policy/claim number warm the by-client lookup too
+            if document.get("_id") is not None:
+                docs.documents[("client_id", str(document["_id"]))] = (document, fetched_at)
+        return document
+
+    def invalidate(self, *, all_sessions: bool = False) -> None:
+        """Drop cached documents for the current session (or every session)."""
+        if all_sessions:
+            self._sessions.clear()
+            return
+        self._session_documents().documents.clear()
+
+    # ------------------------------------------------------------------ #
+    # Lookups
+    # ------------------------------------------------------------------ #
+
+    async def get_user_document(self, client_id: str) -> dict[str, Any] | None:
+        """User document by client_id (the document ``_id``)."""
+        return await self._read(("client_id", client_id), {"_id": client_id})
+
+    async def get_user_policies(self, client_id: str) -> list[dict[str, Any]]:
+        """Policies stored under ``demo_metadata.policies`` for a user."""
+        document = await self.get_user_document(client_id)
+        if not document:
+            return []
+        policies = document.get("demo_metadata", {}).get("policies", [])
+        logger.info("✓ Found %d policies for client %s in Cosmos", len(policies), client_id)
+        return policies
+
+    async def get_user_claims(self, client_id: str) -> list[dict[str, Any]]:
+        """Claims stored under ``demo_metadata.claims`` for a user."""
+        document = await self.get_user_document(client_id)
+        if not document:
+            return []
+        claims = document.get("demo_metadata", {}).get("claims", [])
+        logger.info("✓ Found %d claims for client %s in Cosmos", len(claims), client_id)
+        return claims
+
+    async def find_policy_by_number(
+        self, policy_number: str
+    ) -> tuple[dict[str, Any] | None, list[dict[str, Any]]]:
+        """Return (policy, all of the owner's policies) or (None, [])."""
+        policy_upper = policy_number.upper()
+        query = {
+            "demo_metadata.policies.policy_number": {
+                "$regex": f"^{re.escape(policy_number)}$",
+                "$options": "i",
+            }
+        }
+        document = await self._read(("policy_number", policy_upper), query)
+        if document:
+            policies = document.get("demo_metadata", {}).get("policies", [])
+            for policy in policies:
+                if policy.get("policy_number", "").upper() == policy_upper:
+                    logger.info("✓ Found policy %s in Cosmos", policy_number)
+                    return policy, policies
+        return None, []
+
+    async def find_claim_by_number(self, claim_number: str) -> dict[str, Any] | None:
+        """Return the claim with ``claim_number`` from its owner's document."""
+        claim_upper = claim_number.upper()
+        query = {
+            "demo_metadata.claims.claim_number": {
+                "$regex": f"^{re.escape(claim_number)}$",
+                "$options": "i",
+            }
+        }
+        document = await self._read(("claim_number", claim_upper), query)
+        if document:
+            for claim in document.get("demo_metadata", {}).get("claims", []):
+                if claim.get("claim_number", "").upper() == claim_upper:
+                    logger.info("✓ Claim found in Cosmos: %s", claim_number)
+                    return claim
+        return None
+
+
+def _get_app_cosmos_manager() -> CosmosDBMongoCoreManager | None:
+    """Resolve the shared Cosmos DB client from FastAPI app state."""
+    try:
+        from apps.artagent.backend import main as backend_main
+    except Exception:  # pragma: no cover
+        return None
+
+    app = getattr(backend_main, "app", None)
+    state = getattr(app, "state", None) if app else None
+    return getattr(state, "cosmos", None)
+
+
+_REPOSITORY: InsuranceRepository | None = None
+
+
+def get_insurance_repository() -> InsuranceRepository:
+    """Return the process-wide insurance repository."""
+    global _REPOSITORY
+    if _REPOSITORY is None:
+        _REPOSITORY = InsuranceRepository(
+            timeout_s=float(os.getenv("INSURANCE_COSMOS_TIMEOUT_S", "2.0")),
+        )
+    return _REPOSITORY
+
+
+def set_insurance_repository(repository: InsuranceRepository | None) -> None:
+    """Replace the process-wide repository (for testing)."""
+    global _REPOSITORY
+    _REPOSITORY = repository
+
+
+__all__ = [
+    "InsuranceRepository",
+    "RepositoryStats",
+    "get_insurance_repository",
+    "set_insurance_repository",
+]
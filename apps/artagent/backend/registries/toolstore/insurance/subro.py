@@ -11,7 +11,8 @@ B2B Context:
 - They call to check demand status, liability, coverage, limits, etc.
 
 Data Source:
-- Tools query Cosmos DB directly to find claims by claim_number
+- Tools query Cosmos DB through the async InsuranceRepository to find claims
+  by claim_number
 - Falls back to _session_profile if available
 - Falls back to MOCK_CLAIMS for testing if no other source is available
 """
@@ -19,12 +20,13 @@ Data Source:
 from __future__ import annotations
 
 import asyncio
-import os
 import random
-import re
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any, Dict, List
+from typing import Any, Dict, List
 
+from apps.artagent.backend.registries.toolstore.insurance.repository import (
+    get_insurance_repository,
+)
 from apps.artagent.backend.registries.toolstore.registry import register_tool
 from apps.artagent.backend.registries.toolstore.insurance.constants import (
     SUBRO_FAX_NUMBER,
@@ -43,119 +45,14 @@ except ImportError:
     def is_email_configured() -> bool:
         return False
 
-try:  # pragma: no cover - optional dependency during tests
-    from src.cosmosdb.manager import CosmosDBMongoCoreManager as _CosmosManagerImpl
-    from src.cosmosdb.config import get_database_name, get_users_collection_name
-except Exception:  # pragma: no cover - handled at runtime
-    _CosmosManagerImpl = None
-    def get_database_name() -> str:
-        return os.getenv("AZURE_COSMOS_DATABASE_NAME", "audioagentdb")
-    def get_users_collection_name() -> str:
-        return os.getenv("AZURE_COSMOS_USERS_COLLECTION_NAME", "users")
-
-if TYPE_CHECKING:  # pragma: no cover - typing only
-    from src.cosmosdb.manager import CosmosDBMongoCoreManager
-
 logger = get_logger("agents.tools.subro")
 
-# Cached Cosmos manager for subro tools
-_COSMOS_USERS_MANAGER: CosmosDBMongoCoreManager | None = None
-
 
 def _json(data: Any) -> Dict[str, Any]:
     """Wrap response data for consistent JSON output."""
     return data if isinstance(data, dict) else {"result": data}
 
 
-# ═══════════════════════════════════════════════════════════════════════════════
-# COSMOS DB HELPERS: Query claims directly from database
-# ═══════════════════════════════════════════════════════════════════════════════
-
-def _get_cosmos_manager() -> CosmosDBMongoCoreManager | None:
-    """Resolve the shared Cosmos DB client from FastAPI app state."""
-    try:
-        from apps.artagent.backend import main as backend_main
-    except Exception:  # pragma: no cover
-        return None
-
-    app = getattr(backend_main, "app", None)
-    state = getattr(app, "state", None) if app else None
-    return getattr(state, "cosmos", None)
-
-
-def _get_demo_users_manager() -> CosmosDBMongoCoreManager | None:
-    """Return a Cosmos DB manager pointed at the demo users collection."""
-    global _COSMOS_USERS_MANAGER
-    database_name = get_database_name()
-    container_name = get_users_collection_name()
-
-    if _COSMOS_USERS_MANAGER is not None:
-        return _COSMOS_USERS_MANAGER
-
-    base_manager = _get_cosmos_manager()
-    if base_manager is not None:
-        # Check if base manager targets our collection
-        try:
-            db_name = getattr(getattr(base_manager, "database", None), "name", None)
-            coll_name = getattr(getattr(base_manager, "collection", None), "name", None)
-            if db_name == database_name and coll_name == container_name:
-                _COSMOS_USERS_MANAGER = base_manager
-                return _COSMOS_USERS_MANAGER
-        except Exception:
-            pass
-
-    if _CosmosManagerImpl is None:
-        logger.debug("Cosmos manager implementation unavailable for subro tools")
-        return None
-
-    try:
-        _COSMOS_USERS_MANAGER = _CosmosManagerImpl(
-            database_name=database_name,
-            collection_name=container_name,
-        )
-        logger.info(
-            "Subro tools connected to Cosmos demo users collection",
-            extra={"database": database_name, "collection": container_name},
-        )
-        return _COSMOS_USERS_MANAGER
-    except Exception as exc:  # pragma: no cover
-        logger.warning("Unable to initialize Cosmos manager for subro tools: %s", exc)
-        return None
-
-
-def _lookup_claim_in_cosmos_sync(claim_number: str) -> Dict[str, Any] | None:
-    """
-    Synchronously query Cosmos DB for a claim by claim number.
-    
-    Returns the claim dict if found, None otherwise.
-    """
-    cosmos = _get_demo_users_manager()
-    if cosmos is None:
-        return None
-
-    # Query for user with matching claim in demo_metadata.claims
-    query: Dict[str, Any] = {
-        "demo_metadata.claims.claim_number": {"$regex": f"^{re.escape(claim_number)}$", "$options": "i"}
-    }
-
-    logger.info("🔍 Cosmos claim lookup (subro) | claim_number=%s", claim_number)
-
-    try:
-        document = cosmos.read_document(query)
-        if document:
-            # Extract the matching claim from the document
-            claims = document.get("demo_metadata", {}).get("claims", [])
-            claim_upper = claim_number.upper()
-            for claim in claims:
-                if claim.get("claim_number", "").upper() == claim_upper:
-                    logger.info("✓ Claim found in Cosmos (subro): %s", claim_number)
-                    return claim
-    except Exception as exc:  # pragma: no cover
-        logger.warning("Cosmos claim lookup failed (subro): %s", exc)
-
-    return None
-
-
 # ═══════════════════════════════════════════════════════════════════════════════
 # HELPER: Get claims from session profile or fallback to MOCK_CLAIMS
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -203,7 +100,7 @@ def _get_claims_from_profile(args: Dict[str, Any]) -> List[Dict[str, Any]]:
     return result
 
 
-def _find_claim_by_number(args: Dict[str, Any], claim_number: str) -> Dict[str, Any] | None:
+async def _find_claim_by_number(args: Dict[str, Any], claim_number: str) -> Dict[str, Any] | None:
     """
     Find a claim by claim number.
     
@@ -230,7 +127,7 @@ def _find_claim_by_number(args: Dict[str, Any], claim_number: str) -> Dict[str,
                 return claim
     
     # Second, try Cosmos DB direct lookup
-    cosmos_claim = _lookup_claim_in_cosmos_sync(claim_number_upper)
+    cosmos_claim = await get_insurance_repository().find_claim_by_number(claim_number_upper)
     if cosmos_claim:
         return cosmos_claim
     
@@ -272,7 +169,7 @@ async def get_claim_summary(args: Dict[str, Any]) -> Dict[str, Any]:
     """Get basic claim summary for CC rep."""
     claim_number = (args.get("claim_number") or "").strip().upper()
 
-    claim = _find_claim_by_number(args, claim_number)
+    claim = await _find_claim_by_number(args, claim_number)
     if not claim:
         return _json({"success": False, "message": f"Claim {claim_number} not found."})
 
@@ -317,7 +214,7 @@ async def get_subro_demand_status(args: Dict[str, Any]) -> Dict[str, Any]:
     if not claim_number:
         return _json({"success": False, "message": "Claim number is required."})
 
-    claim = _find_claim_by_number(args, claim_number)
+    claim = await _find_claim_by_number(args, claim_number)
     if not claim:
         return _json({"success": False, "message": f"Claim {claim_number} not found in our system."})
 
@@ -429,7 +326,7 @@ async def get_coverage_status(args: Dict[str, Any]) -> Dict[str, Any]:
     if not claim_number:
         return _json({"success": False, "message": "Claim number is required."})
 
-    claim = _find_claim_by_number(args, claim_number)
+    claim = await _find_claim_by_number(args, claim_number)
     if not claim:
         return _json({"success": False, "message": f"Claim {claim_number} not found in our system."})
 
@@ -500,7 +397,7 @@ async def get_liability_decision(args: Dict[str, Any]) -> Dict[str, Any]:
     if not claim_number:
         return _json({"success": False, "message": "Claim number is required."})
 
-    claim = _find_claim_by_number(args, claim_number)
+    claim = await _find_claim_by_number(args, claim_number)
     if not claim:
         return _json({"success": False, "message": f"Claim {claim_number} not found in our system."})
 
@@ -587,7 +484,7 @@ async def get_pd_policy_limits(args: Dict[str, Any]) -> Dict[str, Any]:
     if not claim_number:
         return _json({"success": False, "message": "Claim number is required."})
 
-    claim = _find_claim_by_number(args, claim_number)
+    claim = await _find_claim_by_number(args, claim_number)
     if not claim:
         return _json({"success": False, "message": f"Claim {claim_number} not found in our system."})
 
@@ -703,7 +600,7 @@ async def get_pd_payments(args: Dict[str, Any]) -> Dict[str, Any]:
     """Get PD payment history."""
     claim_number = (args.get("claim_number") or "").strip().upper()
 
-    claim = _find_claim_by_number(args, claim_number)
+    claim = await _find_claim_by_number(args, claim_number)
     if not claim:
         return _json({"success": False, "message": f"Claim {claim_number} not found."})
 
@@ -755,7 +652,7 @@ async def resolve_feature_owner(args: Dict[str, Any]) -> Dict[str, Any]:
     claim_number = (args.get("claim_number") or "").strip().upper()
     feature = (args.get("feature") or "").strip().upper()
 
-    claim = _find_claim_by_number(args, claim_number)
+    claim = await _find_claim_by_number(args, claim_number)
     if not claim:
         return _json({"success": False, "message": f"Claim {claim_number} not found."})
 
@@ -846,7 +743,7 @@ async def evaluate_rush_criteria(args: Dict[str, Any]) -> Dict[str, Any]:
     claim_number = (args.get("claim_number") or "").strip().upper()
 
     # AUTO-CHECK call history from claim records (SYSTEM IS SOURCE OF TRUTH)
-    claim = _find_claim_by_number(args, claim_number)
+    claim = await _find_claim_by_number(args, claim_number)
     actual_prior_calls = 0
     if claim:
         call_history = claim.get("call_history", [])
@@ -1589,7 +1486,7 @@ async def switch_claim(args: Dict[str, Any]) -> Dict[str, Any]:
         })
 
     # Look up the new claim
-    claim = _find_claim_by_number(args, new_claim_number)
+    claim = await _find_claim_by_number(args, new_claim_number)
     if not claim:
         return _json({
             "success": False,
@@ -247,6 +247,7 @@ register_tool(
     executor=_execute_personalized_greeting,
     is_handoff=False,
     tags={"banking", "greeting", "personalization"},
+    blocking=False,  # Pure string formatting; run inline
 )
 
 
@@ -5,6 +5,12 @@ Tool Registry Core
 Central registry for all agent tools.
 Self-contained - does not reference legacy vlagent/artagent structures.
 
+Each tool is compiled into a ToolDispatchPlan at registration (argument
+binding style, async/sync/blocking classification, and the OpenAI ``tools``
+entry), so executing a tool or building an agent's tool list does no
+signature inspection or schema rebuilding. Per-tool latency is collected in
+fixed-bucket histograms, served by ``GET /api/v1/metrics/tools``.
+
 Usage:
     from apps.artagent.backend.registries.toolstore.registry import (
         register_tool,
@@ -16,13 +22,15 @@ Usage:
 
 from __future__ import annotations
 
-import asyncio
 import inspect
+import time
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
+from functools import partial
 from typing import Any, TypeAlias
 
 from pydantic import BaseModel
+from src.pools.executors import COSMOS, run_blocking
 from utils.ml_logging import get_logger
 
 logger = get_logger("agents.tools.registry")
@@ -32,6 +40,37 @@ ToolExecutor: TypeAlias = Callable[..., Any]
 AsyncToolExecutor: TypeAlias = Callable[[dict[str, Any]], Awaitable[dict[str, Any]]]
 
 
+# Argument binding styles for ToolDispatchPlan
+CALL_NO_ARGS = "none"
+CALL_DICT = "dict"
+CALL_MODEL = "model"
+CALL_KWARGS = "kwargs"
+
+# Upper bounds (ms) of the per-tool latency histogram buckets
+LATENCY_BUCKETS_MS: tuple[float, ...] = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+@dataclass(frozen=True)
+class ToolDispatchPlan:
+    """Invocation strategy compiled once per tool at registration."""
+
+    call_style: str
+    is_async: bool
+    blocking: bool
+    model: type[BaseModel] | None
+    openai_tool: dict[str, Any]
+
+    def bind(self, raw_args: dict[str, Any]) -> tuple[list[Any], dict[str, Any]]:
+        """Coerce dict arguments into the tool's declared signature."""
+        if self.call_style == CALL_DICT:
+            return [raw_args], {}
+        if self.call_style == CALL_MODEL:
+            return [self.model(**raw_args)], {}
+        if self.call_style == CALL_NO_ARGS:
+            return [], {}
+        return [], raw_args
+
+
 @dataclass
 class ToolDefinition:
     """Complete tool definition with schema and executor."""
@@ -42,6 +81,57 @@ class ToolDefinition:
     is_handoff: bool = False
     description: str = ""
     tags: set[str] = field(default_factory=set)
+    plan: ToolDispatchPlan | None = None
+
+
+@dataclass
+class ToolLatencyStats:
+    """Per-tool execution latency histogram."""
+
+    calls: int = 0
+    errors: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    buckets: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+
+    def observe(self, duration_ms: float, *, ok: bool) -> None:
+        """Record one execution."""
+        self.calls += 1
+        if not ok:
+            self.errors += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if duration_ms <= bound:
+                self.buckets[i] += 1
+                return
+        self.buckets[-1] += 1
+
+    def quantile(self, q: float) -> float | None:
+        """Approximate quantile as the upper bound of the containing bucket."""
+        if not self.calls:
+            return None
+        rank = q * self.calls
+        seen = 0
+        for i, count in enumerate(self.buckets[:-1]):
+            seen += count
+            if seen >= rank:
+                return float(LATENCY_BUCKETS_MS[i])
+        return self.max_ms
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for logging/telemetry."""
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "avg_ms": round(self.total_ms / self.calls, 2) if self.calls else None,
+            "max_ms": round(self.max_ms, 2),
+            "p50_ms": self.quantile(0.5),
+            "p95_ms": self.quantile(0.95),
+            "buckets_ms": dict(
+                zip([*map(str, LATENCY_BUCKETS_MS), "+inf"], self.buckets, strict=True)
+            ),
+        }
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -51,6 +141,44 @@ class ToolDefinition:
 _TOOL_DEFINITIONS: dict[str, ToolDefinition] = {}
 _INITIALIZED: bool = False
 
+# Tool-list snapshots keyed by the requested tool names; cleared on registration
+_TOOL_LIST_SNAPSHOTS: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+_TOOL_LATENCY: dict[str, ToolLatencyStats] = {}
+_latency_histogram: Any = None
+
+
+def _compile_plan(
+    schema: dict[str, Any], executor: ToolExecutor, blocking: bool
+) -> ToolDispatchPlan:
+    """Inspect the executor once and build its dispatch plan."""
+    params = list(inspect.signature(executor).parameters.values())
+    model: type[BaseModel] | None = None
+
+    if not params:
+        call_style = CALL_NO_ARGS
+    elif len(params) == 1:
+        call_style = CALL_DICT
+        annotation = params[0].annotation
+        if annotation is not inspect.Parameter.empty and inspect.isclass(annotation):
+            try:
+                if issubclass(annotation, BaseModel):
+                    call_style, model = CALL_MODEL, annotation
+            except TypeError:
+                pass
+    else:
+        call_style = CALL_KWARGS
+
+    is_async = inspect.iscoroutinefunction(executor) or (
+        callable(executor) and inspect.iscoroutinefunction(type(executor).__call__)
+    )
+    return ToolDispatchPlan(
+        call_style=call_style,
+        is_async=is_async,
+        blocking=blocking and not is_async,
+        model=model,
+        openai_tool={"type": "function", "function": schema},
+    )
+
 
 def register_tool(
     name: str,
@@ -60,6 +188,7 @@ def register_tool(
     is_handoff: bool = False,
     tags: set[str] | None = None,
     override: bool = False,
+    blocking: bool = True,
 ) -> None:
     """
     Register a tool with schema and executor.
@@ -70,11 +199,14 @@ def register_tool(
     :param is_handoff: True if tool triggers agent handoff
     :param tags: Optional categorization tags (e.g., {'banking', 'auth'})
     :param override: If True, allow overriding existing registration
+    :param blocking: For sync executors, run in a worker thread (default). Pass
+        False for cheap, non-blocking sync tools to run them inline.
     """
     if name in _TOOL_DEFINITIONS and not override:
         logger.debug("Tool '%s' already registered, skipping", name)
         return
 
+    plan = _compile_plan(schema, executor, blocking)
     _TOOL_DEFINITIONS[name] = ToolDefinition(
         name=name,
         schema=schema,
@@ -82,8 +214,16 @@ def register_tool(
         is_handoff=is_handoff,
         description=schema.get("description", ""),
         tags=tags or set(),
+        plan=plan,
+    )
+    _TOOL_LIST_SNAPSHOTS.clear()
+    logger.debug(
+        "Registered tool: %s (handoff=%s, call=%s, async=%s)",
+        name,
+        is_handoff,
+        plan.call_style,
+        plan.is_async,
     )
-    logger.debug("Registered tool: %s (handoff=%s)", name, is_handoff)
 
 
 def get_tool_schema(name: str) -> dict[str, Any] | None:
@@ -130,17 +270,24 @@ def get_tools_for_agent(tool_names: list[str]) -> list[dict[str, Any]]:
     """
     Build OpenAI-compatible tool list for specified tools.
 
+    The list is snapshotted per tool-name combination; repeat calls return a
+    shallow copy of the snapshot without rebuilding any entries.
+
     :param tool_names: List of tool names to include
     :return: List of {"type": "function", "function": schema} dicts
     """
-    tools = []
-    for name in tool_names:
-        defn = _TOOL_DEFINITIONS.get(name)
-        if defn:
-            tools.append({"type": "function", "function": defn.schema})
-        else:
-            logger.warning("Tool '%s' not found in registry", name)
-    return tools
+    key = tuple(tool_names)
+    snapshot = _TOOL_LIST_SNAPSHOTS.get(key)
+    if snapshot is None:
+        snapshot = []
+        for name in tool_names:
+            defn = _TOOL_DEFINITIONS.get(name)
+            if defn:
+                snapshot.append(defn.plan.openai_tool)
+            else:
+                logger.warning("Tool '%s' not found in registry", name)
+        _TOOL_LIST_SNAPSHOTS[key] = snapshot
+    return list(snapshot)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -148,35 +295,46 @@ def get_tools_for_agent(tool_names: list[str]) -> list[dict[str, Any]]:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
-def _prepare_args(
-    fn: Callable[..., Any], raw_args: dict[str, Any]
-) -> tuple[list[Any], dict[str, Any]]:
-    """Coerce dict arguments into the tool's declared signature."""
-    signature = inspect.signature(fn)
-    params = list(signature.parameters.values())
+def _record_latency(name: str, duration_ms: float, ok: bool) -> None:
+    """Record tool latency in-process and as an OpenTelemetry histogram."""
+    global _latency_histogram
 
-    if not params:
-        return [], {}
+    stats = _TOOL_LATENCY.get(name)
+    if stats is None:
+        stats = _TOOL_LATENCY[name] = ToolLatencyStats()
+    stats.observe(duration_ms, ok=ok)
 
-    if len(params) == 1:
-        param = params[0]
-        annotation = param.annotation
-        if annotation is not inspect._empty and inspect.isclass(annotation):
-            try:
-                if issubclass(annotation, BaseModel):
-                    return [annotation(**raw_args)], {}
-            except TypeError:
-                pass
-        return [raw_args], {}
+    if _latency_histogram is None:
+        # Imported lazily: voice.shared imports this module at load time
+        from apps.artagent.backend.voice.shared.metrics_factory import LazyMeter
+
+        _latency_histogram = LazyMeter("agents.tools", version="1.0.0").histogram(
+            name="agents.tool.duration",
+            description="Tool execution latency in milliseconds",
+            unit="ms",
+        )
+    _latency_histogram.record(duration_ms, attributes={"tool.name": name, "tool.success": ok})
 
-    return [], raw_args
+
+def get_tool_latency_stats(name: str | None = None) -> dict[str, dict[str, Any]]:
+    """
+    Per-tool latency histograms collected by execute_tool.
+
+    :param name: Only return stats for this tool
+    """
+    if name is not None:
+        stats = _TOOL_LATENCY.get(name)
+        return {name: stats.to_dict()} if stats else {}
+    return {tool: stats.to_dict() for tool, stats in _TOOL_LATENCY.items()}
 
 
 async def execute_tool(name: str, arguments: dict[str, Any]) -> dict[str, Any]:
     """
     Execute a registered tool with the given arguments.
 
-    Handles both sync and async executors.
+    Dispatch follows the tool's precompiled plan: async executors are awaited,
+    blocking sync executors run in a worker thread, and non-blocking sync
+    executors run inline.
     """
     defn = _TOOL_DEFINITIONS.get(name)
     if not defn:
@@ -187,13 +345,19 @@ async def execute_tool(name: str, arguments: dict[str, Any]) -> dict[str, Any]:
         }
 
     fn = defn.executor
-    positional, keyword = _prepare_args(fn, arguments)
+    plan = defn.plan
+    positional, keyword = plan.bind(arguments)
 
+    start = time.perf_counter()
+    ok = False
     try:
-        if inspect.iscoroutinefunction(fn):
+        if plan.is_async:
             result = await fn(*positional, **keyword)
+        elif plan.blocking:
+            result = await run_blocking(COSMOS, partial(fn, *positional, **keyword))
         else:
-            result = await asyncio.to_thread(fn, *positional, **keyword)
+            result = fn(*positional, **keyword)
+        ok = True
 
         # Normalize result
         if isinstance(result, dict):
@@ -207,6 +371,8 @@ async def execute_tool(name: str, arguments: dict[str, Any]) -> dict[str, Any]:
             "error": str(exc),
             "message": f"Tool execution failed: {exc}",
         }
+    finally:
+        _record_latency(name, (time.perf_counter() - start) * 1000, ok)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -255,6 +421,8 @@ def reset_registry() -> None:
     """Reset the registry (for testing)."""
     global _INITIALIZED
     _TOOL_DEFINITIONS.clear()
+    _TOOL_LIST_SNAPSHOTS.clear()
+    _TOOL_LATENCY.clear()
     _INITIALIZED = False
 
 
@@ -267,8 +435,11 @@ __all__ = [
     "list_tools",
     "get_tools_for_agent",
     "execute_tool",
+    "get_tool_latency_stats",
     "initialize_tools",
     "reset_registry",
     "ToolDefinition",
+    "ToolDispatchPlan",
     "ToolExecutor",
+    "ToolLatencyStats",
 ]
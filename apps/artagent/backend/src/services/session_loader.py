@@ -13,10 +13,10 @@ Provides:
 
 from __future__ import annotations
 
-import asyncio
 from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
+from src.pools.executors import COSMOS, run_blocking
 from utils.ml_logging import get_logger
 
 if TYPE_CHECKING:
@@ -191,7 +191,7 @@ async def _lookup_cosmos_by_client_id(client_id: str) -> dict[str, Any] | None:
 
     for query in [{"client_id": client_id}, {"_id": client_id}]:
         try:
-            document = await asyncio.to_thread(cosmos.read_document, query)
+            document = await run_blocking(COSMOS, cosmos.read_document, query)
             if document:
                 logger.info("📋 Profile loaded from Cosmos by client_id: %s", client_id)
                 return _sanitize_for_json(document)
@@ -0,0 +1,282 @@
+"""
+Event-Loop Stall Monitor
+========================
+
+Continuously measures asyncio scheduling delay and attributes stalls to the
+code that caused them.
+
+Two cooperating parts:
+
+- A ticker task on the event loop sleeps for ``interval_s`` and records how
+  late it woke up (``event_loop.lag`` histogram, in ms). Each wake-up also
+  refreshes a heartbeat timestamp.
+- A watchdog thread checks the heartbeat. When the loop has not ticked for
+  longer than ``threshold_ms`` it samples the loop thread's current Python
+  stack via ``sys._current_frames()`` and aggregates the innermost frames by
+  call site, so a blocking ``time.sleep``/sync SDK call shows up by file and
+  line rather than as an anonymous latency spike.
+
+The aggregated call sites are served from ``/api/v1/diagnostics/event-loop``.
+
+Usage:
+    from apps.artagent.backend.src.utils.loop_monitor import LoopLagMonitor
+
+    monitor = LoopLagMonitor(threshold_ms=100)
+    monitor.start()          # from inside the running loop
+    ...
+    snapshot = monitor.snapshot(top=10)
+    await monitor.stop()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from apps.artagent.backend.voice.shared.metrics_factory import LazyMeter
+from utils.ml_logging import get_logger
+
+logger = get_logger("utils.loop_monitor")
+
+_meter = LazyMeter("artagent.event_loop", version="1.0.0")
+_loop_lag = _meter.histogram(
+    name="event_loop.lag",
+    description="Event-loop scheduling delay beyond the expected wake-up time",
+    unit="ms",
+)
+_loop_stalls = _meter.counter(
+    name="event_loop.stalls",
+    description="Number of event-loop stalls longer than the configured threshold",
+    unit="1",
+)
+
+_CWD = os.getcwd() + os.sep
+
+
+def _format_frame(frame: traceback.FrameSummary) -> str:
+    filename = frame.filename
+    if filename.startswith(_CWD):
+        filename = filename[len(_CWD) :]
+    return f"{filename}:{frame.lineno} in {frame.name}"
+
+
+@dataclass
+class BlockingSite:
+    """A call site observed on the loop thread while the loop was stalled."""
+
+    site: str
+    stack: tuple[str, ...]
+    samples: int = 0
+    stalls: int = 0
+    last_seen: float = 0.0
+    stall_heartbeat: float = field(default=0.0, repr=False)
+
+    def to_dict(self, sample_interval_ms: float) -> dict[str, Any]:
+        """Convert to dictionary for the diagnostics endpoint."""
+        return {
+            "site": self.site,
+            "samples": self.samples,
+            "stalls": self.stalls,
+            "estimated_blocked_ms": round(self.samples * sample_interval_ms, 1),
+            "last_seen": self.last_seen,
+            "stack": list(self.stack),
+        }
+
+
+@dataclass
+class LoopLagStats:
+    """Running lag statistics for the monitored loop."""
+
+    ticks: int = 0
+    stalls: int = 0
+    max_lag_ms: float = 0.0
+    last_stall_at: float | None = None
+    recent_lags_ms: deque[float] = field(default_factory=lambda: deque(maxlen=1024))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for logging/telemetry."""
+        lags = sorted(self.recent_lags_ms)
+        count = len(lags)
+        return {
+            "ticks": self.ticks,
+            "stalls": self.stalls,
+            "max_lag_ms": round(self.max_lag_ms, 2),
+            "p50_lag_ms": round(lags[count // 2], 2) if count else None,
+            "p99_lag_ms": round(lags[min(count - 1, int(count * 0.99))], 2) if count else None,
+            "last_stall_at": self.last_stall_at,
+        }
+
+
+class LoopLagMonitor:
+    """
+    Measure event-loop lag and attribute stalls to blocking call sites.
+
+    :param interval_s: Ticker sleep interval (lag resolution)
+    :param threshold_ms: Lag above which the loop is considered stalled
+    :param sample_interval_s: How often the watchdog samples a stalled loop
+    :param stack_depth: Innermost frames kept per sample
+    :param max_sites: Distinct call sites retained (least-sampled are dropped)
+    """
+
+    def __init__(
+        self,
+        *,
+        interval_s: float = 0.05,
+        threshold_ms: float = 100.0,
+        sample_interval_s: float = 0.01,
+        stack_depth: int = 8,
+        max_sites: int = 200,
+    ) -> None:
+        self.interval_s = interval_s
+        self.threshold_ms = threshold_ms
+        self.sample_interval_s = sample_interval_s
+        self.stack_depth = stack_depth
+        self.max_sites = max_sites
+        self.stats = LoopLagStats()
+
+        self._sites: dict[tuple[str, ...], BlockingSite] = {}
+        self._lock = threading.Lock()
+        self._heartbeat = time.monotonic()
+        self._loop_thread_id: int | None = None
+        self._ticker: asyncio.Task | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stopping = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._ticker is not None and not self._ticker.done()
+
+    def start(self) -> None:
+        """Start the ticker on the running loop and the watchdog thread."""
+        if self.running:
+            return
+        loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stopping.clear()
+        self._ticker = loop.create_task(self._tick(), name="event-loop-lag-ticker")
+        self._watchdog = threading.Thread(
+            target=self._watch, name="event-loop-watchdog", daemon=True
+        )
+        self._watchdog.start()
+        logger.debug(
+            "event loop monitor started",
+            extra={"threshold_ms": self.threshold_ms, "interval_s": self.interval_s},
+        )
+
+    async def stop(self) -> None:
+        """Stop the ticker and the watchdog thread."""
+        self._stopping.set()
+        if self._ticker is not None:
+            self._ticker.cancel()
+            try:
+                await self._ticker
+            except asyncio.CancelledError:
+                pass
+            self._ticker = None
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=1.0)
+            self._watchdog = None
+
+    def reset(self) -> None:
+        """Clear lag statistics and aggregated call sites."""
+        with self._lock:
+            self.stats = LoopLagStats()
+            self._sites.clear()
+
+    # ------------------------------------------------------------------ #
+    # Loop side
+    # ------------------------------------------------------------------ #
+
+    async def _tick(self) -> None:
+        while True:
+            expected = time.perf_counter() + self.interval_s
+            await asyncio.sleep(self.interval_s)
+            lag_ms = max(0.0, (time.perf_counter() - expected) * 1000)
+            self._heartbeat = time.monotonic()
+            self._observe(lag_ms)
+
+    def _observe(self, lag_ms: float) -> None:
+        stats = self.stats
+        stats.ticks += 1
+        stats.recent_lags_ms.append(lag_ms)
+        stats.max_lag_ms = max(stats.max_lag_ms, lag_ms)
+        _loop_lag.record(lag_ms)
+        if lag_ms >= self.threshold_ms:
+            stats.stalls += 1
+            stats.last_stall_at = time.time()
+            _loop_stalls.add(1)
+            logger.warning("event loop stalled for %.0fms", lag_ms)
+
+    # ------------------------------------------------------------------ #
+    # Watchdog side
+    # ------------------------------------------------------------------ #
+
+    def _watch(self) -> None:
+        # The loop is late once it misses its own wake-up by the threshold
+        stall_after_s = self.interval_s + self.threshold_ms / 1000
+        while not self._stopping.wait(self.sample_interval_s):
+            if time.monotonic() - self._heartbeat < stall_after_s:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            stack = tuple(
+                _format_frame(entry)
+                for entry in traceback.extract_stack(frame, limit=self.stack_depth)
+            )
+            del frame
+            if stack:
+                self._record_sample(stack)
+
+    def _record_sample(self, stack: tuple[str, ...]) -> None:
+        heartbeat = self._heartbeat
+        with self._lock:
+            site = self._sites.get(stack)
+            if site is None:
+                if len(self._sites) >= self.max_sites:
+                    coldest = min(self._sites, key=lambda key: self._sites[key].samples)
+                    del self._sites[coldest]
+                site = self._sites[stack] = BlockingSite(site=stack[-1], stack=stack)
+            site.samples += 1
+            site.last_seen = time.time()
+            # The heartbeat is frozen for the whole stall: count it once per site
+            if site.stall_heartbeat != heartbeat:
+                site.stall_heartbeat = heartbeat
+                site.stalls += 1
+
+    # ------------------------------------------------------------------ #
+    # Reporting
+    # ------------------------------------------------------------------ #
+
+    def blocking_sites(self, top: int = 20) -> list[dict[str, Any]]:
+        """Most frequently sampled blocking call sites, heaviest first."""
+        sample_ms = self.sample_interval_s * 1000
+        with self._lock:
+            sites = sorted(self._sites.values(), key=lambda s: s.samples, reverse=True)
+            return [site.to_dict(sample_ms) for site in sites[:top]]
+
+    def snapshot(self, top: int = 20) -> dict[str, Any]:
+        """Lag statistics and top blocking call sites."""
+        return {
+            "running": self.running,
+            "threshold_ms": self.threshold_ms,
+            "interval_ms": self.interval_s * 1000,
+            "sample_interval_ms": self.sample_interval_s * 1000,
+            "lag": self.stats.to_dict(),
+            "blocking_sites": self.blocking_sites(top),
+        }
+
+
+__all__ = [
+    "BlockingSite",
+    "LoopLagMonitor",
+    "LoopLagStats",
+]
@@ -0,0 +1,311 @@
+"""
+Worker Affinity Middleware
+==========================
+
+Routes ACS call traffic to the worker process that owns the call when the
+backend runs as several shared-nothing workers (see
+``apps/artagent/backend/workers.py``).
+
+All workers accept connections on the same public port, so an ACS callback or
+media WebSocket can land on any of them. For the routed paths the middleware
+resolves the call connection ID, claims the call in the ``WorkerRegistry``
+(first worker to touch a call owns it) and, when another live worker owns
+it, hands the request off over loopback:
+
+- HTTP callbacks are re-posted to the owner's internal port and its response
+  is returned unchanged
+- media WebSockets are accepted locally and relayed frame by frame to a
+  WebSocket opened on the owner's internal port
+
+Forwarded requests carry ``x-artagent-worker-forwarded`` so the owner never
+forwards again. If the owner cannot be reached the request is served
+locally. Without a registry on ``app.state.worker_registry`` (single-process
+mode) the middleware is a pass-through.
+
+Usage:
+    from apps.artagent.backend.src.utils.worker_affinity import WorkerAffinityMiddleware
+
+    app.add_middleware(
+        WorkerAffinityMiddleware,
+        http_paths=(ACS_CALL_CALLBACK_PATH,),
+        websocket_paths=(ACS_WEBSOCKET_PATH,),
+    )
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import weakref
+from collections.abc import Iterable
+from typing import Any
+from urllib.parse import parse_qs
+
+import httpx
+import websockets
+from src.pools.worker_registry import WorkerIdentity, WorkerRegistry
+from utils.ml_logging import get_logger
+
+logger = get_logger("utils.worker_affinity")
+
+# Live middleware instances, so shutdown can close their forwarding clients
+_MIDDLEWARES: weakref.WeakSet[WorkerAffinityMiddleware] = weakref.WeakSet()
+
+FORWARDED_HEADER = "x-artagent-worker-forwarded"
+CALL_ID_HEADER = "x-ms-call-connection-id"
+# Hop-by-hop and connection-specific headers are not replayed to the owner
+_SKIPPED_HEADERS = {
+    "host",
+    "content-length",
+    "connection",
+    "upgrade",
+    "transfer-encoding",
+    "sec-websocket-key",
+    "sec-websocket-version",
+    "sec-websocket-extensions",
+    "sec-websocket-accept",
+}
+
+
+def call_id_from_callback(body: bytes) -> str | None:
+    """Call connection ID of the first event in an ACS callback payload."""
+    try:
+        payload = json.loads(body)
+    except (ValueError, UnicodeDecodeError):
+        return None
+    event = payload[0] if isinstance(payload, list) and payload else payload
+    if isinstance(event, dict):
+        data = event.get("data")
+        if isinstance(data, dict):
+            return data.get("callConnectionId")
+    return None
+
+
+def _headers(scope: dict[str, Any]) -> dict[str, str]:
+    return {k.decode("latin-1").lower(): v.decode("latin-1") for k, v in scope["headers"]}
+
+
+def _call_id_from_scope(scope: dict[str, Any], headers: dict[str, str]) -> str | None:
+    query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+    return (query.get("call_connection_id") or [None])[0] or headers.get(CALL_ID_HEADER)
+
+
+def _forward_headers(headers: dict[str, str]) -> dict[str, str]:
+    forwarded = {k: v for k, v in headers.items() if k not in _SKIPPED_HEADERS}
+    forwarded[FORWARDED_HEADER] = "1"
+    return forwarded
+
+
+class WorkerAffinityMiddleware:
+    """
+    ASGI middleware handing ACS call traffic to the owning worker.
+
+    :param app: Wrapped ASGI application
+    :param http_paths: POST paths whose JSON body carries ``callConnectionId``
+    :param websocket_paths: WebSocket paths keyed by the ``call_connection_id``
+        query parameter or ``x-ms-call-connection-id`` header
+    :param forward_timeout_s: Timeout for forwarded HTTP requests
+    """
+
+    def __init__(
+        self,
+        app,
+        *,
+        http_paths: Iterable[str] = (),
+        websocket_paths: Iterable[str] = (),
+        forward_timeout_s: float = 10.0,
+    ) -> None:
+        self.app = app
+        self.http_paths = frozenset(http_paths)
+        self.websocket_paths = frozenset(websocket_paths)
+        self.forward_timeout_s = forward_timeout_s
+        self._client: httpx.AsyncClient | None = None
+        _MIDDLEWARES.add(self)
+
+    async def __call__(self, scope, receive, send) -> None:
+        registry = self._registry(scope)
+        if registry is None:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["type"] == "http" and scope["path"] in self.http_paths:
+            await self._route_http(registry, scope, receive, send)
+        elif scope["type"] == "websocket" and scope["path"] in self.websocket_paths:
+            await self._route_websocket(registry, scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
+
+    async def aclose(self) -> None:
+        """Close the HTTP client used for hand-offs; a later hand-off opens a new one."""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    @staticmethod
+    def _registry(scope) -> WorkerRegistry | None:
+        if scope["type"] not in ("http", "websocket"):
+            return None
+        app = scope.get("app")
+        state = getattr(app, "state", None)
+        return getattr(state, "worker_registry", None)
+
+    async def _owner(self, registry: WorkerRegistry, call_id: str) -> WorkerIdentity | None:
+        """Owning worker when it is not this one; ``None`` to serve locally."""
+        try:
+            owner = await registry.claim_async("call", call_id)
+        except Exception as exc:
+            logger.warning("Call ownership lookup failed for %s: %s", call_id, exc)
+            return None
+        return None if owner.worker_id == registry.worker_id else owner
+
+    # ------------------------------------------------------------------ #
+    # HTTP
+    # ------------------------------------------------------------------ #
+
+    async def _route_http(self, registry: WorkerRegistry, scope, receive, send) -> None:
+        headers = _headers(scope)
+        if scope["method"] != "POST" or FORWARDED_HEADER in headers:
+            await self.app(scope, receive, send)
+            return
+
+        chunks = []
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body"):
+                break
+        body = b"".join(chunks)
+
+        call_id = call_id_from_callback(body) or headers.get(CALL_ID_HEADER)
+        owner = await self._owner(registry, call_id) if call_id else None
+        if owner is not None and await self._forward_http(owner, scope, headers, body, send):
+            return
+
+        replayed = False
+
+        async def replay():
+            nonlocal replayed
+            if replayed:
+                return await receive()
+            replayed = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        await self.app(scope, replay, send)
+
+    async def _forward_http(
+        self, owner: WorkerIdentity, scope, headers: dict[str, str], body: bytes, send
+    ) -> bool:
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=self.forward_timeout_s)
+        url = owner.internal_url + scope["path"]
+        if scope.get("query_string"):
+            url += "?" + scope["query_string"].decode("latin-1")
+        try:
+            response = await self._client.post(url, content=body, headers=_forward_headers(headers))
+        except httpx.HTTPError as exc:
+            logger.warning(
+                "Hand-off to worker %s failed, serving locally: %s", owner.worker_id, exc
+            )
+            return False
+
+        response_headers = [
+            (k.encode("latin-1"), v.encode("latin-1"))
+            for k, v in response.headers.items()
+            if k.lower() not in ("content-length", "transfer-encoding", "content-encoding")
+        ]
+        response_headers.append((b"content-length", str(len(response.content)).encode()))
+        await send(
+            {
+                "type": "http.response.start",
+                "status": response.status_code,
+                "headers": response_headers,
+            }
+        )
+        await send({"type": "http.response.body", "body": response.content})
+        return True
+
+    # ------------------------------------------------------------------ #
+    # WebSocket
+    # ------------------------------------------------------------------ #
+
+    async def _route_websocket(self, registry: WorkerRegistry, scope, receive, send) -> None:
+        headers = _headers(scope)
+        call_id = None if FORWARDED_HEADER in headers else _call_id_from_scope(scope, headers)
+        owner = await self._owner(registry, call_id) if call_id else None
+        if owner is None:
+            await self.app(scope, receive, send)
+            return
+
+        url = owner.internal_url.replace("http://", "ws://", 1) + scope["path"]
+        if scope.get("query_string"):
+            url += "?" + scope["query_string"].decode("latin-1")
+        try:
+            try:
+                upstream = await websockets.connect(
+                    url, additional_headers=_forward_headers(headers), max_size=None
+                )
+            except TypeError:
+                upstream = await websockets.connect(
+                    url, extra_headers=_forward_headers(headers), max_size=None
+                )
+        except Exception as exc:
+            logger.warning(
+                "Hand-off to worker %s failed, serving locally: %s", owner.worker_id, exc
+            )
+            await self.app(scope, receive, send)
+            return
+
+        logger.debug("Relaying media for call %s to worker %s", call_id, owner.worker_id)
+        await self._relay(upstream, receive, send)
+
+    @staticmethod
+    async def _relay(upstream, receive, send) -> None:
+        message = await receive()
+        if message["type"] != "websocket.connect":
+            await upstream.close()
+            return
+        await send({"type": "websocket.accept"})
+
+        async def client_to_owner() -> None:
+            while True:
+                message = await receive()
+                if message["type"] == "websocket.disconnect":
+                    return
+                data = message.get("bytes")
+                await upstream.send(data if data is not None else message.get("text", ""))
+
+        async def owner_to_client() -> None:
+            try:
+                async for data in upstream:
+                    if isinstance(data, bytes):
+                        await send({"type": "websocket.send", "bytes": data})
+                    else:
+                        await send({"type": "websocket.send", "text": data})
+            except websockets.ConnectionClosed:
+                pass
+            await send({"type": "websocket.close", "code": upstream.close_code or 1000})
+
+        tasks = [asyncio.create_task(client_to_owner()), asyncio.create_task(owner_to_client())]
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await upstream.close()
+
+
+async def close_forward_clients() -> None:
+    """Close the hand-off HTTP clients of every ``WorkerAffinityMiddleware``."""
+    for middleware in list(_MIDDLEWARES):
+        await middleware.aclose()
+
+
+__all__ = [
+    "FORWARDED_HEADER",
+    "WorkerAffinityMiddleware",
+    "call_id_from_callback",
+    "close_forward_clients",
+]
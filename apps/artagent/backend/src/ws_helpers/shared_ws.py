@@ -38,6 +38,7 @@ from config import (
 from fastapi import WebSocket, WebSocketDisconnect
 from fastapi.websockets import WebSocketState
 from src.enums.stream_modes import StreamMode
+from src.pools.executors import SPEECH_SYNTHESIS, run_blocking
 from src.tools.latency_tool import LatencyTool
 from utils.ml_logging import get_logger
 
@@ -845,7 +846,8 @@ async def send_response_to_acs(
                 voice_to_use,
                 len(text),
             )
-            pcm_bytes = await asyncio.to_thread(
+            pcm_bytes = await run_blocking(
+                SPEECH_SYNTHESIS,
                 synth.synthesize_to_pcm,
                 text,
                 voice_to_use,
@@ -859,7 +861,8 @@ async def send_response_to_acs(
                 run_id,
                 synth_err,
             )
-            pcm_bytes = await asyncio.to_thread(
+            pcm_bytes = await run_blocking(
+                SPEECH_SYNTHESIS,
                 synth.synthesize_to_pcm,
                 text,
                 voice_to_use,
@@ -15,6 +15,8 @@ Contents:
     - OrchestratorMetrics: Token tracking and TTFT metrics
     - GreetingService: Centralized greeting resolution
     - resolve_start_agent: Unified start agent resolution
+    - EnergyEndpointer: Adaptive energy endpointing (speech start/end events)
+    - HistoryWindow: Incremental, token-budgeted conversation history
 
 Usage:
     from apps.artagent.backend.voice.shared import (
@@ -83,6 +85,22 @@ from .start_agent_resolver import (
     resolve_start_agent,
 )
 
+# Endpointing (adaptive energy VAD)
+from .endpointing import (
+    EndpointerConfig,
+    EndpointEvent,
+    EndpointEventType,
+    EnergyEndpointer,
+)
+
+# History window (token-budgeted prompt history)
+from .history_window import (
+    HistoryWindow,
+    HistoryWindowConfig,
+    TokenCounter,
+    get_token_counter,
+)
+
 __all__ = [
     # Context/Result (shared data classes)
     "OrchestratorContext",
@@ -116,4 +134,14 @@ __all__ = [
     "resolve_start_agent",
     "StartAgentResult",
     "StartAgentSource",
+    # Endpointing
+    "EnergyEndpointer",
+    "EndpointerConfig",
+    "EndpointEvent",
+    "EndpointEventType",
+    # History Window
+    "HistoryWindow",
+    "HistoryWindowConfig",
+    "TokenCounter",
+    "get_token_counter",
 ]
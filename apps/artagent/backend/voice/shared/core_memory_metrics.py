@@ -10,6 +10,7 @@ This module:
 - Updates core memory asynchronously in the background
 - Maintains the existing OpenTelemetry pipeline intact
 - Keeps a rolling window of recent metrics
+- Keeps a quantile sketch per metric type for session-wide averages and p95
 
 Usage:
     from voice.shared.core_memory_metrics import update_core_memory_metrics
@@ -27,6 +28,7 @@ Usage:
 import asyncio
 import time
 from typing import Any, Dict, Optional
+from src.tools.latency_sketch import QuantileSketch
 from utils.ml_logging import get_logger
 
 try:
@@ -82,6 +84,8 @@ async def update_core_memory_metrics(
             "turn_number": turn_number,
         }
         latency_data["current_turn"] = current_turn
+        sketch_state = latency_data.setdefault("sketches", {}).setdefault(metric_type, {})
+        QuantileSketch.from_dict(sketch_state).add(value_ms)
 
         # If this is a turn completion, move to recent_turns
         if metric_type == "turn_duration":
@@ -100,7 +104,7 @@ async def update_core_memory_metrics(
             latency_data["recent_turns"] = recent_turns
 
             # Update summary statistics
-            _update_summary_stats(latency_data, recent_turns)
+            _update_summary_stats(latency_data)
 
             # Clear current turn for next one
             latency_data["current_turn"] = {}
@@ -117,33 +121,15 @@ async def update_core_memory_metrics(
         logger.debug(f"Core memory metrics update failed (non-critical): {e}")
 
 
-def _update_summary_stats(latency_data: Dict[str, Any], recent_turns: list) -> None:
-    """Update summary statistics from recent turns."""
-    if not recent_turns:
-        return
-
-    # Calculate averages from recent turns
-    metrics_sums = {
-        "llm_ttft": 0,
-        "tts_ttfb": 0,
-        "stt_latency": 0,
-        "turn_duration": 0,
-    }
-    metrics_counts = {key: 0 for key in metrics_sums}
-
-    for turn in recent_turns:
-        for metric_type, data in turn.get("metrics", {}).items():
-            if metric_type in metrics_sums:
-                metrics_sums[metric_type] += data.get("value_ms", 0)
-                metrics_counts[metric_type] += 1
-
-    # Calculate averages
-    summary = latency_data["summary"]
-    summary["avg_llm_ttft"] = (metrics_sums["llm_ttft"] / metrics_counts["llm_ttft"]) if metrics_counts["llm_ttft"] > 0 else 0
-    summary["avg_tts_ttfb"] = (metrics_sums["tts_ttfb"] / metrics_counts["tts_ttfb"]) if metrics_counts["tts_ttfb"] > 0 else 0
-    summary["avg_stt_latency"] = (metrics_sums["stt_latency"] / metrics_counts["stt_latency"]) if metrics_counts["stt_latency"] > 0 else 0
-    summary["avg_turn_duration"] = (metrics_sums["turn_duration"] / metrics_counts["turn_duration"]) if metrics_counts["turn_duration"] > 0 else 0
-    summary["total_turns"] = len(recent_turns)
+def _update_summary_stats(latency_data: Dict[str, Any]) -> None:
+    """Update summary statistics from the per-metric sketches (whole session)."""
+    sketches = latency_data.get("sketches", {})
+    summary = latency_data.setdefault("summary", {})
+    for metric_type in ("llm_ttft", "tts_ttfb", "stt_latency", "turn_duration"):
+        sketch = QuantileSketch.from_dict(sketches.get(metric_type, {}))
+        summary[f"avg_{metric_type}"] = sketch.mean
+        summary[f"p95_{metric_type}"] = sketch.quantile(0.95)
+    summary["total_turns"] = QuantileSketch.from_dict(sketches.get("turn_duration", {})).count
 
 
 def schedule_core_memory_update(
@@ -0,0 +1,302 @@
+"""
+Adaptive Energy Endpointing
+===========================
+
+Energy-based speech start/end detection with a per-session noise floor.
+
+The fixed ``RMS_SILENCE_THRESHOLD`` comparison used by the browser and ACS
+paths fires constantly for callers on a noisy line and too late for quiet
+callers. ``EnergyEndpointer`` instead tracks a running low percentile of
+frame energy (the noise floor) and derives its thresholds from it:
+
+- Speech starts when energy exceeds ``floor * start_ratio`` for at least
+  ``min_speech_ms`` (rejects clicks and short bursts).
+- Speech continues while energy stays above the lower ``floor * end_ratio``
+  threshold (hysteresis avoids chattering at the boundary).
+- Speech ends after ``hangover_ms`` of continuous sub-threshold frames.
+
+Every frame feeds the noise window; a low percentile over a few seconds still
+lands in the pauses between words, so the floor follows stationary noise
+(fans, line hiss) without drifting up to speech level. No speech start is
+reported during the first ``calibration_ms`` while the floor settles.
+
+Time is measured in stream time (samples processed), so the endpointer is
+deterministic and can be evaluated offline against recorded clips.
+
+Usage:
+    from apps.artagent.backend.voice.shared.endpointing import (
+        EndpointEventType,
+        EnergyEndpointer,
+        EndpointerConfig,
+    )
+
+    endpointer = EnergyEndpointer(EndpointerConfig(sample_rate=16000))
+    for event in endpointer.process(pcm_bytes):
+        if event.type is EndpointEventType.SPEECH_START:
+            ...  # cancel TTS early
+        elif event.type is EndpointEventType.SPEECH_END:
+            ...  # hint end of utterance
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Any
+
+import numpy as np
+
+
+class EndpointEventType(StrEnum):
+    """Endpointing event types."""
+
+    SPEECH_START = "speech_start"
+    SPEECH_END = "speech_end"
+
+
+@dataclass(frozen=True)
+class EndpointEvent:
+    """A speech boundary detected by the endpointer."""
+
+    type: EndpointEventType
+    stream_ms: float  # Position in the stream where the boundary occurred
+    detected_ms: float  # Position in the stream when it was detected
+    energy: float
+    noise_floor: float
+
+    @property
+    def delay_ms(self) -> float:
+        """Detection delay (time between boundary and its detection)."""
+        return self.detected_ms - self.stream_ms
+
+
+@dataclass
+class EndpointerConfig:
+    """Tuning parameters for EnergyEndpointer."""
+
+    sample_rate: int = 16000
+    frame_ms: int = 20
+    # Absolute lower bound on the speech-start threshold (PCM16 RMS units)
+    min_start_threshold: float = 150.0
+    # Absolute lower bound on the speech-continue threshold
+    min_end_threshold: float = 90.0
+    start_ratio: float = 3.0
+    end_ratio: float = 2.0
+    min_speech_ms: int = 60
+    hangover_ms: int = 500
+    # Noise floor estimation
+    noise_percentile: float = 20.0
+    noise_window_ms: int = 3000
+    initial_noise_floor: float = 30.0
+    floor_update_every: int = 5
+    calibration_ms: int = 200
+
+
+@dataclass
+class EndpointerStats:
+    """Counters for endpointing quality and cost."""
+
+    frames: int = 0
+    speech_starts: int = 0
+    speech_ends: int = 0
+    rejected_bursts: int = 0  # Onsets shorter than min_speech_ms
+    speech_ms: float = 0.0
+    start_delay_ms_total: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for logging/telemetry."""
+        return {
+            "frames": self.frames,
+            "speech_starts": self.speech_starts,
+            "speech_ends": self.speech_ends,
+            "rejected_bursts": self.rejected_bursts,
+            "speech_ms": round(self.speech_ms, 1),
+            "avg_start_delay_ms": (
+                round(self.start_delay_ms_total / self.speech_starts, 1)
+                if self.speech_starts
+                else None
+            ),
+        }
+
+
+class _State(StrEnum):
+    SILENCE = "silence"
+    PENDING = "pending"
+    SPEECH = "speech"
+
+
+class EnergyEndpointer:
+    """
+    Per-session adaptive energy endpointer.
+
+    Not thread-safe; feed it from a single task (the media receive loop).
+    """
+
+    def __init__(self, config: EndpointerConfig | None = None) -> None:
+        self.config = config or EndpointerConfig()
+        cfg = self.config
+        self._frame_samples = max(1, cfg.sample_rate * cfg.frame_ms // 1000)
+        self._frame_bytes = self._frame_samples * 2
+        window_frames = max(1, cfg.noise_window_ms // cfg.frame_ms)
+        self._noise_window: deque[float] = deque(maxlen=window_frames)
+        self._carry = b""
+        self.stats = EndpointerStats()
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset speech state and noise floor (e.g. on stream restart)."""
+        self._state = _State.SILENCE
+        self._noise_floor = self.config.initial_noise_floor
+        self._noise_window.clear()
+        self._frames_since_floor_update = 0
+        self._stream_ms = 0.0
+        self._pending_start_ms = 0.0
+        self._pending_ms = 0.0
+        self._silence_ms = 0.0
+        self._carry = b""
+
+    # ------------------------------------------------------------------ #
+    # Properties
+    # ------------------------------------------------------------------ #
+
+    @property
+    def noise_floor(self) -> float:
+        return self._noise_floor
+
+    @property
+    def in_speech(self) -> bool:
+        return self._state is _State.SPEECH
+
+    @property
+    def stream_ms(self) -> float:
+        return self._stream_ms
+
+    @property
+    def start_threshold(self) -> float:
+        cfg = self.config
+        return max(cfg.min_start_threshold, self._noise_floor * cfg.start_ratio)
+
+    @property
+    def end_threshold(self) -> float:
+        cfg = self.config
+        return max(cfg.min_end_threshold, self._noise_floor * cfg.end_ratio)
+
+    # ------------------------------------------------------------------ #
+    # Processing
+    # ------------------------------------------------------------------ #
+
+    def process(self, pcm_bytes: bytes) -> list[EndpointEvent]:
+        """
+        Feed PCM16LE mono audio and return any boundaries detected.
+
+        Input chunks may be any size; they are re-framed internally.
+        """
+        data = self._carry + pcm_bytes if self._carry else pcm_bytes
+        usable = len(data) - (len(data) % self._frame_bytes)
+        self._carry = data[usable:]
+        if not usable:
+            return []
+
+        samples = np.frombuffer(data[:usable], dtype="<i2").astype(np.float32)
+        frames = samples.reshape(-1, self._frame_samples)
+        energies = np.sqrt(np.mean(frames * frames, axis=1))
+
+        events: list[EndpointEvent] = []
+        for energy in energies.tolist():
+            event = self._step(energy)
+            if event is not None:
+                events.append(event)
+        return events
+
+    def process_silence(self, duration_ms: float) -> list[EndpointEvent]:
+        """Advance stream time over a gap flagged silent by the transport."""
+        events: list[EndpointEvent] = []
+        frames = int(duration_ms // self.config.frame_ms)
+        for _ in range(frames):
+            event = self._step(0.0, update_floor=False)
+            if event is not None:
+                events.append(event)
+        return events
+
+    def _step(self, energy: float, *, update_floor: bool = True) -> EndpointEvent | None:
+        cfg = self.config
+        frame_ms = cfg.frame_ms
+        self._stream_ms += frame_ms
+        self.stats.frames += 1
+        if update_floor:
+            self._observe_noise(energy)
+        if self._stream_ms <= cfg.calibration_ms:
+            return None
+
+        if self._state is _State.SILENCE:
+            if energy < self.start_threshold:
+                return None
+            self._state = _State.PENDING
+            self._pending_start_ms = self._stream_ms - frame_ms
+            self._pending_ms = frame_ms
+            if self._pending_ms >= cfg.min_speech_ms:
+                return self._enter_speech(energy)
+            return None
+
+        if self._state is _State.PENDING:
+            if energy < self.end_threshold:
+                self._state = _State.SILENCE
+                self.stats.rejected_bursts += 1
+                return None
+            self._pending_ms += frame_ms
+            if self._pending_ms >= cfg.min_speech_ms:
+                return self._enter_speech(energy)
+            return None
+
+        # SPEECH
+        self.stats.speech_ms += frame_ms
+        if energy >= self.end_threshold:
+            self._silence_ms = 0.0
+            return None
+        self._silence_ms += frame_ms
+        if self._silence_ms < cfg.hangover_ms:
+            return None
+        self._state = _State.SILENCE
+        self.stats.speech_ends += 1
+        event = EndpointEvent(
+            type=EndpointEventType.SPEECH_END,
+            stream_ms=self._stream_ms - self._silence_ms,
+            detected_ms=self._stream_ms,
+            energy=energy,
+            noise_floor=self._noise_floor,
+        )
+        self._silence_ms = 0.0
+        return event
+
+    def _enter_speech(self, energy: float) -> EndpointEvent:
+        self._state = _State.SPEECH
+        self._silence_ms = 0.0
+        self.stats.speech_starts += 1
+        self.stats.start_delay_ms_total += self._stream_ms - self._pending_start_ms
+        return EndpointEvent(
+            type=EndpointEventType.SPEECH_START,
+            stream_ms=self._pending_start_ms,
+            detected_ms=self._stream_ms,
+            energy=energy,
+            noise_floor=self._noise_floor,
+        )
+
+    def _observe_noise(self, energy: float) -> None:
+        """Track frame energy and periodically refresh the noise floor."""
+        self._noise_window.append(energy)
+        self._frames_since_floor_update += 1
+        if self._frames_since_floor_update < self.config.floor_update_every:
+            return
+        self._frames_since_floor_update = 0
+        window = np.fromiter(self._noise_window, dtype=np.float32)
+        self._noise_floor = max(1.0, float(np.percentile(window, self.config.noise_percentile)))
+
+
+__all__ = [
+    "EndpointEvent",
+    "EndpointEventType",
+    "EndpointerConfig",
+    "EndpointerStats",
+    "EnergyEndpointer",
+]
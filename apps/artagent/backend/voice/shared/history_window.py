@@ -0,0 +1,435 @@
+"""
+Token-Budgeted History Window
+=============================
+
+Per-session cache of decoded conversation messages with a token budget.
+
+Rebuilding the prompt from scratch every turn re-decodes every JSON-encoded
+tool message and sends the full history to the model, so prompt size, build
+cost and LLM time-to-first-token all grow with call length. ``HistoryWindow``
+instead:
+
+- Decodes each stored message once and appends new messages incrementally
+  (the cache is rebuilt only if the underlying thread was replaced).
+- Counts tokens with ``tiktoken`` when installed, falling back to a
+  word/punctuation estimate, and caches the count per message.
+- Trims the oldest whole turns (a user message and everything that follows
+  it) to fit ``max_tokens``, so tool calls are never split from their results.
+- Always keeps the last ``pinned_turns`` turns; the system prompt is pinned by
+  the caller, which passes its size as ``system_tokens``.
+- Optionally replaces evicted turns with a short extractive summary so the
+  model keeps the gist of early conversation.
+
+Usage:
+    from apps.artagent.backend.voice.shared.history_window import (
+        HistoryWindow,
+        HistoryWindowConfig,
+    )
+
+    window = HistoryWindow(HistoryWindowConfig(max_tokens=4000))
+    system_tokens = window.counter.count(system_prompt)
+    history = window.build("Concierge", cm.get_history("Concierge"),
+                           system_tokens=system_tokens)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
+try:
+    import tiktoken
+except ImportError:  # Optional: fall back to estimated counts
+    tiktoken = None
+
+try:
+    from utils.ml_logging import get_logger
+
+    logger = get_logger("voice.shared.history_window")
+except ImportError:
+    import logging
+
+    logger = logging.getLogger("voice.shared.history_window")
+
+
+# Chat format framing overhead per message (role, separators)
+_TOKENS_PER_MESSAGE = 4
+_PIECE_RE = re.compile(r"\w+|[^\w\s]")
+_SUMMARY_LINE_CHARS = 160
+
+
+class TokenCounter:
+    """
+    Token counter backed by tiktoken, with an estimate when it is unavailable.
+
+    The estimate counts words and punctuation, charging long words extra, which
+    tracks BPE token counts far more closely than ``len(text) // 4`` for
+    conversational text.
+    """
+
+    def __init__(self, encoding_name: str = "o200k_base") -> None:
+        self.encoding_name = encoding_name
+        self._encoding = None
+        if tiktoken is not None:
+            try:
+                self._encoding = tiktoken.get_encoding(encoding_name)
+            except Exception as e:
+                logger.warning("tiktoken encoding %s unavailable, estimating: %s", encoding_name, e)
+
+    @property
+    def exact(self) -> bool:
+        """True when counts come from a real tokenizer."""
+        return self._encoding is not None
+
+    def count(self, text: str | None) -> int:
+        """Count tokens in a string."""
+        if not text:
+            return 0
+        if self._encoding is not None:
+            return len(self._encoding.encode(text, disallowed_special=()))
+        return sum(1 + (len(piece) - 1) // 6 for piece in _PIECE_RE.findall(text))
+
+    def count_message(self, message: dict[str, Any]) -> int:
+        """Count tokens for a chat message including tool calls and framing."""
+        tokens = _TOKENS_PER_MESSAGE
+        content = message.get("content")
+        if isinstance(content, str):
+            tokens += self.count(content)
+        elif content:
+            tokens += self.count(json.dumps(content, ensure_ascii=False))
+        tool_calls = message.get("tool_calls")
+        if tool_calls:
+            tokens += self.count(json.dumps(tool_calls, ensure_ascii=False))
+        if message.get("name"):
+            tokens += self.count(message["name"])
+        return tokens
+
+
+@lru_cache(maxsize=4)
+def get_token_counter(encoding_name: str = "o200k_base") -> TokenCounter:
+    """Return a shared TokenCounter (loading an encoding is expensive)."""
+    return TokenCounter(encoding_name)
+
+
+def decode_history_message(raw: dict[str, Any]) -> dict[str, Any]:
+    """
+    Expand a stored history message into a chat message.
+
+    Tool calls and tool results are stored as JSON in the ``content`` field;
+    plain messages are returned unchanged.
+    """
+    role = raw.get("role", "")
+    content = raw.get("content", "")
+    if role in ("assistant", "tool") and isinstance(content, str) and content.startswith("{"):
+        try:
+            decoded = json.loads(content)
+        except (json.JSONDecodeError, TypeError):
+            return raw
+        if isinstance(decoded, dict) and "role" in decoded:
+            return decoded
+    return raw
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+@dataclass
+class HistoryWindowConfig:
+    """
+    Budget settings for HistoryWindow.
+
+    Attributes:
+        max_tokens: Prompt budget for system prompt + history + user message
+        pinned_turns: Most recent turns that are never evicted
+        summarize_evicted: Replace evicted turns with an extractive summary
+        summary_max_tokens: Budget reserved for the summary message
+        encoding_name: tiktoken encoding used for counting
+    """
+
+    max_tokens: int = 6000
+    pinned_turns: int = 4
+    summarize_evicted: bool = True
+    summary_max_tokens: int = 200
+    encoding_name: str = "o200k_base"
+
+    @classmethod
+    def from_env(cls, prefix: str = "CASCADE_HISTORY", **defaults: Any) -> HistoryWindowConfig:
+        """
+        Build config from ``<prefix>_*`` environment variables.
+
+        ``defaults`` override the field defaults for variables that are unset.
+        """
+        base = cls(**defaults)
+        summarize = os.getenv(f"{prefix}_SUMMARIZE", str(base.summarize_evicted))
+        return cls(
+            max_tokens=_env_int(f"{prefix}_MAX_TOKENS", base.max_tokens),
+            pinned_turns=_env_int(f"{prefix}_PINNED_TURNS", base.pinned_turns),
+            summarize_evicted=summarize.lower() in ("1", "true", "yes"),
+            summary_max_tokens=_env_int(f"{prefix}_SUMMARY_TOKENS", base.summary_max_tokens),
+            encoding_name=os.getenv(f"{prefix}_ENCODING", base.encoding_name),
+        )
+
+
+@dataclass
+class HistoryWindowStats:
+    """Counters for history cache efficiency and trimming."""
+
+    builds: int = 0
+    decoded: int = 0  # Messages decoded and counted (cache misses)
+    rebuilds: int = 0  # Threads re-decoded because history was replaced
+    evicted_turns: int = 0  # Turns dropped by the most recent build
+    history_tokens: int = 0  # History tokens sent by the most recent build
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for logging/telemetry."""
+        return {
+            "builds": self.builds,
+            "decoded": self.decoded,
+            "rebuilds": self.rebuilds,
+            "evicted_turns": self.evicted_turns,
+            "history_tokens": self.history_tokens,
+        }
+
+
+@dataclass
+class _CachedMessage:
+    raw: dict[str, Any]
+    message: dict[str, Any]
+    tokens: int
+
+
+@dataclass
+class _CrossAgentScan:
+    scanned: int = 0
+    last_raw: dict[str, Any] | None = None
+    messages: list[dict[str, Any]] = field(default_factory=list)
+
+
+class HistoryWindow:
+    """
+    Incremental message cache and token-budgeted window for one session.
+
+    Threads are keyed by agent name. Not thread-safe; use from the turn loop.
+    """
+
+    def __init__(
+        self,
+        config: HistoryWindowConfig | None = None,
+        counter: TokenCounter | None = None,
+    ) -> None:
+        self.config = config or HistoryWindowConfig()
+        self.counter = counter or get_token_counter(self.config.encoding_name)
+        self.stats = HistoryWindowStats()
+        self._threads: dict[str, list[_CachedMessage]] = {}
+        self._cross_agent: dict[str, _CrossAgentScan] = {}
+        self._summaries: dict[str, tuple[int, dict[str, Any]]] = {}
+
+    def reset(self, key: str | None = None) -> None:
+        """Drop cached state for one thread or all threads."""
+        if key is None:
+            self._threads.clear()
+            self._cross_agent.clear()
+            self._summaries.clear()
+        else:
+            self._threads.pop(key, None)
+            self._cross_agent.pop(key, None)
+            self._summaries.pop(key, None)
+
+    # ------------------------------------------------------------------ #
+    # Incremental cache
+    # ------------------------------------------------------------------ #
+
+    def _sync(self, key: str, history: list[dict[str, Any]]) -> list[_CachedMessage]:
+        """Return cached entries for ``history``, decoding only new messages."""
+        entries = self._threads.get(key)
+        if entries is None:
+            entries = self._threads[key] = []
+        elif len(entries) > len(history) or (
+            entries and history[len(entries) - 1] is not entries[-1].raw
+        ):
+            # History was replaced (reload, clear, handoff seed); start over
+            entries.clear()
+            self._summaries.pop(key, None)
+            self.stats.rebuilds += 1
+
+        for raw in history[len(entries) :]:
+            message = decode_history_message(raw)
+            entries.append(_CachedMessage(raw, message, self.counter.count_message(message)))
+            self.stats.decoded += 1
+        return entries
+
+    def messages(self, key: str, history: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Return the full decoded history without applying the budget."""
+        return [entry.message for entry in self._sync(key, history)]
+
+    # ------------------------------------------------------------------ #
+    # Budgeted window
+    # ------------------------------------------------------------------ #
+
+    def build(
+        self,
+        key: str,
+        history: list[dict[str, Any]],
+        *,
+        system_tokens: int = 0,
+        reserve_tokens: int = 0,
+    ) -> list[dict[str, Any]]:
+        """
+        Return decoded history trimmed to the token budget.
+
+        Args:
+            key: Thread key (agent name)
+            history: Stored messages for the thread, oldest first
+            system_tokens: Tokens used by the pinned system prompt
+            reserve_tokens: Tokens reserved for the current user message
+
+        Returns:
+            Chat messages, optionally led by a summary of evicted turns.
+        """
+        cfg = self.config
+        entries = self._sync(key, history)
+        self.stats.builds += 1
+        budget = cfg.max_tokens - system_tokens - reserve_tokens
+        total = sum(entry.tokens for entry in entries)
+
+        if total <= budget:
+            self.stats.evicted_turns = 0
+            self.stats.history_tokens = total
+            return [entry.message for entry in entries]
+
+        # Turn boundaries: each user message starts a new turn
+        starts = [0] + [
+            i for i, entry in enumerate(entries) if i and entry.message.get("role") == "user"
+        ]
+        evictable = max(0, len(starts) - cfg.pinned_turns)
+        if cfg.summarize_evicted:
+            budget -= cfg.summary_max_tokens
+
+        cut = 0
+        evicted = 0
+        while total > budget and evicted < evictable:
+            end = starts[evicted + 1] if evicted + 1 < len(starts) else len(entries)
+            total -= sum(entry.tokens for entry in entries[cut:end])
+            cut = end
+            evicted += 1
+
+        kept = [entry.message for entry in entries[cut:]]
+        self.stats.evicted_turns = evicted
+        self.stats.history_tokens = total
+        if evicted:
+            logger.debug(
+                "History window trimmed | key=%s evicted_turns=%d kept=%d tokens=%d budget=%d",
+                key,
+                evicted,
+                len(kept),
+                total,
+                budget,
+            )
+        if evicted and cfg.summarize_evicted:
+            summary = self._summary(key, entries, cut)
+            if summary is not None:
+                self.stats.history_tokens += self.counter.count_message(summary)
+                return [summary, *kept]
+        return kept
+
+    def _summary(
+        self, key: str, entries: list[_CachedMessage], cut: int
+    ) -> dict[str, Any] | None:
+        """Build (or reuse) an extractive summary of ``entries[:cut]``."""
+        cached = self._summaries.get(key)
+        if cached and cached[0] == cut:
+            return cached[1]
+
+        lines: list[str] = []
+        used = 0
+        # Walk backwards so the most recent evicted context survives the cap
+        for entry in reversed(entries[:cut]):
+            message = entry.message
+            role = message.get("role")
+            content = message.get("content")
+            if role not in ("user", "assistant") or not isinstance(content, str):
+                continue
+            text = " ".join(content.split())
+            if not text:
+                continue
+            if len(text) > _SUMMARY_LINE_CHARS:
+                text = text[: _SUMMARY_LINE_CHARS - 3] + "..."
+            line = f"{'Caller' if role == 'user' else 'Agent'}: {text}"
+            line_tokens = self.counter.count(line) + 1
+            if used + line_tokens > self.config.summary_max_tokens:
+                break
+            lines.append(line)
+            used += line_tokens
+
+        if not lines:
+            return None
+        summary = {
+            "role": "system",
+            "content": "Earlier in this call (summarized):\n" + "\n".join(reversed(lines)),
+        }
+        self._summaries[key] = (cut, summary)
+        return summary
+
+    # ------------------------------------------------------------------ #
+    # Cross-agent context
+    # ------------------------------------------------------------------ #
+
+    def cross_agent_context(
+        self, histories: dict[str, list[dict[str, Any]]], active_agent: str
+    ) -> list[dict[str, Any]]:
+        """
+        Substantive user messages from other agents' threads, deduplicated.
+
+        Each thread is scanned incrementally; only messages appended since the
+        previous call are inspected.
+        """
+        seen: set[str] = set()
+        context: list[dict[str, Any]] = []
+        for agent_name, msgs in histories.items():
+            if agent_name == active_agent:
+                continue
+            for msg in self._scan_user_messages(agent_name, msgs):
+                key = msg.get("content", "").strip().lower()
+                if key not in seen:
+                    seen.add(key)
+                    context.append(msg)
+        return context
+
+    def _scan_user_messages(
+        self, agent_name: str, msgs: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        scan = self._cross_agent.get(agent_name)
+        if scan is None or scan.scanned > len(msgs) or (
+            scan.scanned and msgs[scan.scanned - 1] is not scan.last_raw
+        ):
+            scan = self._cross_agent[agent_name] = _CrossAgentScan()
+
+        for msg in msgs[scan.scanned :]:
+            if msg.get("role") != "user":
+                continue
+            content = msg.get("content", "").strip()
+            # Skip short or greeting-like messages
+            if len(content) <= 10 or content.lower().startswith("welcome"):
+                continue
+            scan.messages.append(msg)
+        scan.scanned = len(msgs)
+        scan.last_raw = msgs[-1] if msgs else None
+        return scan.messages
+
+
+__all__ = [
+    "HistoryWindow",
+    "HistoryWindowConfig",
+    "HistoryWindowStats",
+    "TokenCounter",
+    "decode_history_message",
+    "get_token_counter",
+]
@@ -28,6 +28,12 @@ Usage:
     )
 """
 
+from .greeting_prefetch import (
+    GreetingAudio,
+    GreetingPrefetch,
+    GreetingPrefetcher,
+    greeting_prefetcher,
+)
 from .handler import (
     BargeInController,
     ResponseSender,
@@ -62,6 +68,11 @@ __all__ = [
     "TTSPlayback",
     "SAMPLE_RATE_BROWSER",
     "SAMPLE_RATE_ACS",
+    # Greeting synthesized during call setup
+    "GreetingAudio",
+    "GreetingPrefetch",
+    "GreetingPrefetcher",
+    "greeting_prefetcher",
     # Orchestrator shim
     "CascadeOrchestratorAdapter",
     "StateKeys",  # Re-export of SessionStateKeys for backward compatibility
@@ -0,0 +1,261 @@
+"""
+Greeting Prefetch
+=================
+
+Synthesizes the call greeting while the call is still being set up.
+
+Without a prefetch the greeting is resolved and synthesized only once the
+media WebSocket has attached and ACS has sent its AudioMetadata, so the
+caller waits for answer, media connect and TTS one after another. The call
+lifecycle instead starts greeting resolution and synthesis as soon as it
+knows a call is coming (inbound call being answered, outbound call being
+placed) and binds the in-flight synthesis to the call connection id. When the
+media handler plays its greeting it takes the prefetch:
+
+- If the text, voice, style, rate and sample rate it resolved match the
+  prefetched audio, the ready PCM is streamed directly.
+- Otherwise (session context changed in between, synthesis failed or did not
+  finish within ``GREETING_PREFETCH_WAIT_S``) it synthesizes as before.
+
+Prefetches that are never claimed (call not connected, media handled by
+another worker) are cancelled after ``GREETING_PREFETCH_TTL_S``.
+
+Set ``GREETING_PREFETCH_ENABLED=false`` to disable.
+
+Usage:
+    from apps.artagent.backend.voice.speech_cascade.greeting_prefetch import (
+        greeting_prefetcher,
+    )
+
+    prefetch = greeting_prefetcher().start(lambda: playback.prerender_acs(text))
+    result = await acs_caller.answer_incoming_call(...)
+    greeting_prefetcher().bind(result.call_connection_id, prefetch)
+
+    # media handler, at greeting time
+    prefetch = greeting_prefetcher().take(call_connection_id)
+    pcm = await prefetch.audio_for(text, voice, style, rate, SAMPLE_RATE_ACS)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from utils.ml_logging import get_logger
+
+logger = get_logger("voice.speech_cascade.greeting_prefetch")
+
+GREETING_PREFETCH_ENABLED = os.getenv("GREETING_PREFETCH_ENABLED", "true").lower() in (
+    "true",
+    "1",
+    "yes",
+)
+# How long an unclaimed prefetch is kept before it is cancelled
+GREETING_PREFETCH_TTL_S = float(os.getenv("GREETING_PREFETCH_TTL_S", "60"))
+# How long playback waits for an in-flight prefetch before synthesizing itself
+GREETING_PREFETCH_WAIT_S = float(os.getenv("GREETING_PREFETCH_WAIT_S", "3"))
+GREETING_PREFETCH_MAX_PENDING = int(os.getenv("GREETING_PREFETCH_MAX_PENDING", "128"))
+
+
+@dataclass(frozen=True)
+class GreetingAudio:
+    """Synthesized greeting and the inputs it was synthesized from."""
+
+    text: str
+    voice: str
+    style: str
+    rate: str
+    sample_rate: int
+    pcm: bytes
+
+    def matches(self, text: str, voice: str, style: str, rate: str, sample_rate: int) -> bool:
+        """True when this audio is exactly what playback would synthesize."""
+        return (self.text, self.voice, self.style, self.rate, self.sample_rate) == (
+            text.strip(),
+            voice,
+            style,
+            rate,
+            sample_rate,
+        )
+
+
+class GreetingPrefetch:
+    """One in-flight greeting synthesis."""
+
+    def __init__(self, task: asyncio.Task, outcomes: Counter | None = None) -> None:
+        self.task = task
+        self.created_at = time.monotonic()
+        self.outcome: str | None = None
+        self._outcomes = outcomes if outcomes is not None else Counter()
+        task.add_done_callback(self._log_failure)
+
+    @staticmethod
+    def _log_failure(task: asyncio.Task) -> None:
+        # Retrieve the exception so an unclaimed failed prefetch is not reported as lost
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("Greeting prefetch synthesis failed: %s", task.exception())
+
+    @property
+    def done(self) -> bool:
+        return self.task.done()
+
+    def cancel(self) -> None:
+        """Stop the synthesis if it is still running."""
+        if not self.task.done():
+            self.task.cancel()
+
+    async def audio_for(
+        self,
+        text: str,
+        voice: str,
+        style: str,
+        rate: str,
+        sample_rate: int,
+        *,
+        timeout_s: float = GREETING_PREFETCH_WAIT_S,
+    ) -> bytes | None:
+        """
+        Prefetched PCM for this greeting, or None when playback must synthesize.
+
+        Waits up to ``timeout_s`` for a synthesis still in flight; on timeout
+        the prefetch is cancelled.
+        """
+        try:
+            audio = await asyncio.wait_for(asyncio.shield(self.task), timeout_s)
+        except TimeoutError:
+            self.cancel()
+            return self._finish("timeout")
+        except asyncio.CancelledError:
+            if not self.task.cancelled():
+                raise
+            return self._finish("cancelled")
+        except Exception as e:
+            logger.debug("Greeting prefetch failed: %s", e)
+            return self._finish("failed")
+
+        if not audio or not audio.pcm:
+            return self._finish("failed")
+        if not audio.matches(text, voice, style, rate, sample_rate):
+            return self._finish("stale")
+        self._finish("hit")
+        return audio.pcm
+
+    def _finish(self, outcome: str) -> None:
+        self.outcome = outcome
+        self._outcomes[outcome] += 1
+        logger.info(
+            "Greeting prefetch %s (%.0fms after start)",
+            outcome,
+            (time.monotonic() - self.created_at) * 1000,
+        )
+
+
+class GreetingPrefetcher:
+    """
+    Process-wide registry of greeting prefetches keyed by call connection id.
+
+    Use from the application event loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        enabled: bool = GREETING_PREFETCH_ENABLED,
+        ttl_s: float = GREETING_PREFETCH_TTL_S,
+        max_pending: int = GREETING_PREFETCH_MAX_PENDING,
+    ) -> None:
+        self.enabled = enabled
+        self.ttl_s = ttl_s
+        self.max_pending = max_pending
+        self._pending: dict[str, GreetingPrefetch] = {}
+        self._counts: Counter = Counter()
+        self._outcomes: Counter = Counter()
+
+    def start(
+        self, synthesize: Callable[[], Awaitable[GreetingAudio | None]]
+    ) -> GreetingPrefetch | None:
+        """Run ``synthesize`` in the background; None when prefetching is disabled."""
+        if not self.enabled:
+            return None
+        self._evict()
+        self._counts["started"] += 1
+        return GreetingPrefetch(asyncio.create_task(synthesize()), self._outcomes)
+
+    def bind(self, call_connection_id: str | None, prefetch: GreetingPrefetch | None) -> None:
+        """Make ``prefetch`` claimable by the media handler of ``call_connection_id``."""
+        if prefetch is None:
+            return
+        if not call_connection_id:
+            prefetch.cancel()
+            return
+        previous = self._pending.pop(call_connection_id, None)
+        if previous is not None and previous is not prefetch:
+            previous.cancel()
+        self._pending[call_connection_id] = prefetch
+        self._counts["bound"] += 1
+        self._evict()
+
+    def take(self, call_connection_id: str | None) -> GreetingPrefetch | None:
+        """Claim the prefetch bound to ``call_connection_id``, if any."""
+        if not call_connection_id:
+            return None
+        prefetch = self._pending.pop(call_connection_id, None)
+        if prefetch is not None:
+            self._counts["claimed"] += 1
+        return prefetch
+
+    def discard(self, call_connection_id: str | None) -> None:
+        """Cancel and forget the prefetch bound to ``call_connection_id``."""
+        prefetch = self._pending.pop(call_connection_id, None) if call_connection_id else None
+        if prefetch is not None:
+            prefetch.cancel()
+
+    def _evict(self) -> None:
+        now = time.monotonic()
+        expired = [
+            call_id
+            for call_id, prefetch in self._pending.items()
+            if now - prefetch.created_at > self.ttl_s
+        ]
+        # Oldest first (insertion order) when over capacity
+        overflow = len(self._pending) - len(expired) - self.max_pending
+        if overflow > 0:
+            expired += [call_id for call_id in self._pending if call_id not in expired][:overflow]
+        for call_id in expired:
+            self._pending.pop(call_id).cancel()
+            self._counts["expired"] += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Counters for logging/telemetry."""
+        return {
+            "pending": len(self._pending),
+            **{key: self._counts[key] for key in ("started", "bound", "claimed", "expired")},
+            "outcomes": dict(self._outcomes),
+        }
+
+
+_prefetcher: GreetingPrefetcher | None = None
+
+
+def greeting_prefetcher() -> GreetingPrefetcher:
+    """Process-wide ``GreetingPrefetcher``."""
+    global _prefetcher
+    if _prefetcher is None:
+        _prefetcher = GreetingPrefetcher()
+    return _prefetcher
+
+
+__all__ = [
+    "GREETING_PREFETCH_ENABLED",
+    "GREETING_PREFETCH_TTL_S",
+    "GREETING_PREFETCH_WAIT_S",
+    "GreetingAudio",
+    "GreetingPrefetch",
+    "GreetingPrefetcher",
+    "greeting_prefetcher",
+]
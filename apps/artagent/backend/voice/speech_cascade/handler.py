@@ -48,9 +48,11 @@ from typing import TYPE_CHECKING, Any, Protocol
 
 from opentelemetry import trace
 from opentelemetry.trace import SpanKind
+from src.pools.executors import SPEECH_RECOGNITION, get_executor
 from src.speech.speech_recognizer import StreamingSpeechRecognizerFromBytes
 from src.stateful.state_managment import MemoManager
 from src.tools.latency_tool import LatencyTool
+from src.tools.turn_timeline import turn_timelines
 from utils.ml_logging import get_logger
 from utils.telemetry_decorators import ConversationTurnSpan
 
@@ -707,6 +709,12 @@ class RouteTurnThread:
             getattr(self.memory_manager, "session_id", None) if self.memory_manager else None
         )
 
+        # Start the turn timeline at the recognizer's final result (before the queue hop)
+        final_at = time.perf_counter()
+        if event.timestamp:
+            final_at -= max(0.0, time.time() - event.timestamp)
+        turn_timelines().begin_turn(session_id, self._turn_number, final_at)
+
         # Create ConversationTurnSpan for end-to-end turn tracking
         # Manually manage span lifecycle to cover async TTS events
         turn = ConversationTurnSpan(
@@ -1094,7 +1102,7 @@ class SpeechCascadeHandler:
 
                 # Start recognizer
                 await asyncio.get_running_loop().run_in_executor(
-                    None, self.speech_sdk_thread.start_recognizer
+                    get_executor(SPEECH_RECOGNITION), self.speech_sdk_thread.start_recognizer
                 )
 
                 await self.route_turn_thread.start()
@@ -10,6 +10,7 @@ Metrics tracked:
 - Turn processing latency
 - Barge-in detection latency
 - TTS synthesis and streaming latencies
+- Synthesis time wasted on cancelled (barged-in) TTS
 
 Uses the shared metrics factory for lazy initialization, ensuring proper
 MeterProvider configuration before instrument creation.
@@ -72,6 +73,13 @@ _tts_streaming_histogram: LazyHistogram = _meter.histogram(
     unit="ms",
 )
 
+# Synthesis time spent before a barge-in cancelled the request
+_tts_cancelled_histogram: LazyHistogram = _meter.histogram(
+    name="speech_cascade.tts.cancelled_synthesis",
+    description="TTS synthesis time spent before cancellation in milliseconds",
+    unit="ms",
+)
+
 # Turn counter
 _turn_counter: LazyCounter = _meter.counter(
     name="speech_cascade.turn.count",
@@ -93,6 +101,13 @@ _tts_counter: LazyCounter = _meter.counter(
     unit="1",
 )
 
+# Cancelled TTS counter
+_tts_cancelled_counter: LazyCounter = _meter.counter(
+    name="speech_cascade.tts.cancelled",
+    description="Number of TTS synthesis operations cancelled in flight",
+    unit="1",
+)
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # METRIC RECORDING FUNCTIONS
@@ -291,6 +306,47 @@ def record_tts_synthesis(
     )
 
 
+def record_tts_cancelled(
+    cancelled_ms: float,
+    *,
+    session_id: str,
+    call_connection_id: str | None = None,
+    voice_name: str | None = None,
+    text_length: int | None = None,
+    transport: str = "browser",
+) -> None:
+    """
+    Record synthesis time spent on a TTS request cancelled by barge-in.
+
+    :param cancelled_ms: Time from synthesis start to cancellation in milliseconds
+    :param session_id: Session identifier for correlation
+    :param call_connection_id: Call connection ID
+    :param voice_name: Azure TTS voice used
+    :param text_length: Length of text being synthesized
+    :param transport: Transport type (browser/acs)
+    """
+    attributes = build_tts_attributes(
+        session_id,
+        transport=transport,
+        voice_name=voice_name,
+        text_length=text_length,
+        cancelled=True,
+    )
+    attributes["metric.type"] = "tts_cancelled"
+    if call_connection_id:
+        attributes["call.connection.id"] = call_connection_id
+
+    _tts_cancelled_histogram.record(cancelled_ms, attributes=attributes)
+    _tts_cancelled_counter.add(1, attributes={"session.id": session_id, "tts.transport": transport})
+
+    logger.debug(
+        "📊 TTS cancelled metric: %.2fms | session=%s voice=%s",
+        cancelled_ms,
+        session_id,
+        voice_name,
+    )
+
+
 def record_tts_streaming(
     latency_ms: float,
     *,
@@ -340,5 +396,6 @@ __all__ = [
     "record_turn_processing",
     "record_barge_in",
     "record_tts_synthesis",
+    "record_tts_cancelled",
     "record_tts_streaming",
 ]
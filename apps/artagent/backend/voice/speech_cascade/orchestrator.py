@@ -62,6 +62,10 @@ from apps.artagent.backend.voice.shared.config_resolver import (
     resolve_orchestrator_config,
 )
 from apps.artagent.backend.voice.shared.handoff_service import HandoffService
+from apps.artagent.backend.voice.shared.history_window import (
+    HistoryWindow,
+    HistoryWindowConfig,
+)
 from apps.artagent.backend.voice.shared.metrics import OrchestratorMetrics
 from apps.artagent.backend.voice.shared.session_state import (
     SessionStateKeys,
@@ -70,6 +74,12 @@ from apps.artagent.backend.voice.shared.session_state import (
 )
 from opentelemetry import trace
 from opentelemetry.trace import SpanKind, Status, StatusCode
+from src.tools.turn_timeline import (
+    FIRST_SENTENCE,
+    LLM_FIRST_TOKEN,
+    LLM_REQUEST,
+    turn_timelines,
+)
 
 
 
@@ -189,6 +199,7 @@ class CascadeConfig:
         session_id: Session identifier for tracing
         enable_rag: Whether to enable RAG search for responses
         streaming: Whether to stream responses (default False for sentence-level TTS)
+        history: Token budget for conversation history sent to the LLM
     """
 
     start_agent: str = DEFAULT_START_AGENT
@@ -197,6 +208,7 @@ class CascadeConfig:
     session_id: str | None = None
     enable_rag: bool = True
     streaming: bool = False  # Non-streaming matches legacy gpt_flow behavior
+    history: HistoryWindowConfig = field(default_factory=HistoryWindowConfig.from_env)
 
 
 # ─────────────────────────────────────────────────────────────────────
@@ -245,6 +257,8 @@ class CascadeOrchestratorAdapter:
     # Unified metrics tracking (replaces individual token/timing fields)
     _metrics: OrchestratorMetrics = field(default=None, init=False)  # type: ignore
 
+    # Decoded-message cache and token budget for prompt history
+    _history_window: HistoryWindow = field(default=None, init=False)  # type: ignore
 
     # Callbacks for integration with SpeechCascadeHandler
     _on_tts_chunk: Callable[[str], Awaitable[None]] | None = field(default=None, init=False)
@@ -258,7 +272,8 @@ class CascadeOrchestratorAdapter:
             call_connection_id=self.config.call_connection_id,
             session_id=self.config.session_id,
         )
-        
+        self._history_window = HistoryWindow(self.config.history)
+
         if not self.agents:
             self._load_agents()
 
@@ -675,26 +690,10 @@ class CascadeOrchestratorAdapter:
         # Get current agent's history (copy to avoid reference issues)
         agent_history = list(cm.get_history(self._active_agent) or [])
 
-        # Collect substantive user messages from other agents
-        all_histories = cm.history.get_all()
-        seen_content: set[str] = set()
-        cross_agent_context: list[dict[str, str]] = []
-
-        for agent_name, msgs in all_histories.items():
-            if agent_name == self._active_agent:
-                continue
-            for msg in msgs:
-                if msg.get("role") != "user":
-                    continue
-                content = msg.get("content", "").strip()
-                # Skip short or greeting-like messages
-                if len(content) <= 10 or content.lower().startswith("welcome"):
-                    continue
-                # Deduplicate
-                key = content.lower()
-                if key not in seen_content:
-                    seen_content.add(key)
-                    cross_agent_context.append(msg)
+        # Substantive user messages from other agents (scanned incrementally)
+        cross_agent_context = self._history_window.cross_agent_context(
+            cm.history.get_all(), self._active_agent
+        )
 
         # Cross-agent context first, then current agent's history
         return cross_agent_context + agent_history
@@ -796,6 +795,12 @@ class CascadeOrchestratorAdapter:
                 try:
                     # Build messages
                     messages = self._build_messages(context, agent)
+                    span.set_attribute(
+                        "cascade.history.tokens", self._history_window.stats.history_tokens
+                    )
+                    span.set_attribute(
+                        "cascade.history.evicted_turns", self._history_window.stats.evicted_turns
+                    )
 
                     # Get tools for current agent with automatic handoff tool injection
                     tools = self._get_tools_with_handoffs(agent)
@@ -1093,7 +1098,9 @@ class CascadeOrchestratorAdapter:
 
         Handles both simple messages (role + content) and complex messages
         (tool calls, tool results) which are stored as JSON in the content field.
-        
+        History is decoded incrementally and trimmed to the configured token
+        budget, keeping the system prompt and most recent turns.
+
         Also injects scenario-based handoff instructions if defined.
         """
         messages = []
@@ -1125,24 +1132,16 @@ class CascadeOrchestratorAdapter:
         if system_content:
             messages.append({"role": "system", "content": system_content})
 
-        # Conversation history - expand any JSON-encoded tool messages
-        for msg in context.conversation_history:
-            role = msg.get("role", "")
-            content = msg.get("content", "")
-
-            # Check if this is a JSON-encoded complex message (tool call or tool result)
-            if role in ("assistant", "tool") and content and content.startswith("{"):
-                try:
-                    decoded = json.loads(content)
-                    # If it has the expected structure, use it directly
-                    if isinstance(decoded, dict) and "role" in decoded:
-                        messages.append(decoded)
-                        continue
-                except (json.JSONDecodeError, TypeError):
-                    pass  # Not JSON, use as-is
-
-            # Regular message
-            messages.append(msg)
+        # Conversation history - cached decode of JSON tool messages, token-budgeted
+        counter = self._history_window.counter
+        messages.extend(
+            self._history_window.build(
+                agent.name or self._active_agent,
+                context.conversation_history,
+                system_tokens=counter.count(system_content),
+                reserve_tokens=counter.count(context.user_text),
+            )
+        )
 
         # Current user message
         if context.user_text:
@@ -1267,6 +1266,8 @@ class CascadeOrchestratorAdapter:
                 stream_error: list[Exception] = []
                 loop = asyncio.get_running_loop()
                 tool_call_detected = False  # Track if tool calls are streaming
+                timelines = turn_timelines()
+                timeline_session = self.config.session_id
 
                 # Sentence buffer state for aggressive TTS streaming
                 sentence_buffer = ""
@@ -1299,6 +1300,8 @@ class CascadeOrchestratorAdapter:
                             temperature,
                         )
                         chunk_count = 0
+                        first_token = False
+                        timelines.mark(timeline_session, LLM_REQUEST)
                         for chunk in client.chat.completions.create(
                             model=model_name,
                             messages=messages,
@@ -1316,6 +1319,12 @@ class CascadeOrchestratorAdapter:
                             delta = getattr(choice, "delta", None)
                             if not delta:
                                 continue
+                            if not first_token and (
+                                getattr(delta, "content", None)
+                                or getattr(delta, "tool_calls", None)
+                            ):
+                                first_token = True
+                                timelines.mark(timeline_session, LLM_FIRST_TOKEN)
 
                             # Tool calls - aggregate streamed chunks by index
                             # Check tool calls FIRST to detect before dispatching text
@@ -1432,6 +1441,7 @@ class CascadeOrchestratorAdapter:
                     if chunk is None:
                         break
                     if on_tts_chunk:
+                        timelines.mark(timeline_session, FIRST_SENTENCE)
                         try:
                             await on_tts_chunk(chunk)
                         except Exception as e:
@@ -1471,7 +1481,7 @@ class CascadeOrchestratorAdapter:
                     tool_calls.append(tc)
 
                 # Estimate token usage and track via metrics
-                output_tokens = len(response_text) // 4
+                output_tokens = self._history_window.counter.count(response_text)
                 self._metrics.add_tokens(output_tokens=output_tokens)
                 self._metrics.record_response()
 
@@ -1957,10 +1967,9 @@ class CascadeOrchestratorAdapter:
         
         Flow:
         1. Sync state from MemoManager
-        2. Build history (with cross-agent context)
-        3. Build context and call process_turn
-        4. Fire-and-forget Redis persistence
-        5. Return response
+        2. Build context from the active agent's history and call process_turn
+           (history is decoded incrementally and token-budgeted per turn)
+        3. Return response
 
         Args:
             transcript: User's transcribed speech
@@ -1976,10 +1985,7 @@ class CascadeOrchestratorAdapter:
         # Store reference for use in process_turn
         self._current_memo_manager = cm
 
-        # 2. Build conversation history using helper
-        history = self._get_conversation_history(cm)
-
-        # 3. Build context and process
+        # 2. Build context and process
 
         # Pull existing history for active agent
         # IMPORTANT: Make a copy of the history list to avoid reference issues.
@@ -2008,21 +2014,6 @@ class CascadeOrchestratorAdapter:
             except Exception:
                 logger.debug("Failed to append user turn to history", exc_info=True)
 
-        # Build session context from MemoManager for prompt rendering
-        session_context = {
-            "memo_manager": cm,
-            # Session profile and context for Jinja templates
-            "session_profile": cm.get_value_from_corememory("session_profile"),
-            "caller_name": cm.get_value_from_corememory("caller_name"),
-            "client_id": cm.get_value_from_corememory("client_id"),
-            "customer_intelligence": cm.get_value_from_corememory("customer_intelligence"),
-            "institution_name": cm.get_value_from_corememory("institution_name"),
-            "active_agent": cm.get_value_from_corememory("active_agent"),
-            "previous_agent": cm.get_value_from_corememory("previous_agent"),
-            "visited_agents": cm.get_value_from_corememory("visited_agents"),
-            "handoff_context": cm.get_value_from_corememory("handoff_context"),
-        }
-
         # Build context
         context = OrchestratorContext(
             session_id=self.config.session_id or "",
@@ -2035,7 +2026,7 @@ class CascadeOrchestratorAdapter:
 
         result = await self.process_turn(context, on_tts_chunk=on_tts_chunk)
 
-        # 4. Handle errors/interrupts
+        # 3. Handle errors/interrupts
         if result.error:
             logger.error("Turn processing error: %s", result.error)
             return None
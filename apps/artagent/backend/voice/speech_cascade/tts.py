@@ -23,17 +23,26 @@ import asyncio
 import base64
 import time
 import uuid
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from functools import partial
 from typing import TYPE_CHECKING, Any
 
 from fastapi import WebSocket
 from opentelemetry import trace
 from opentelemetry.trace import SpanKind, Status, StatusCode
+from src.blob.recording_sink import CallRecordingSink
+from src.speech.text_to_speech import SynthesisCancelledError
 from src.tools.latency_tool import LatencyTool
+from src.tools.turn_timeline import (
+    FIRST_FRAME_SENT,
+    LAST_FRAME_SENT,
+    TTS_FIRST_BYTE,
+    turn_timelines,
+)
 from utils.ml_logging import get_logger
 
-from .metrics import record_tts_streaming, record_tts_synthesis
+from .greeting_prefetch import GreetingAudio, GreetingPrefetch
+from .metrics import record_tts_cancelled, record_tts_streaming, record_tts_synthesis
 
 if TYPE_CHECKING:
     pass
@@ -62,6 +71,7 @@ class TTSPlayback:
         *,
         latency_tool: LatencyTool | None = None,
         cancel_event: asyncio.Event | None = None,
+        recording_sink: CallRecordingSink | None = None,
     ):
         """
         Initialize TTS playback.
@@ -72,6 +82,7 @@ class TTSPlayback:
             session_id: Session ID for agent lookup and logging
             latency_tool: Optional latency tracking
             cancel_event: Event to signal TTS cancellation (barge-in)
+            recording_sink: Optional call recording that receives sent audio
         """
         self._ws = websocket
         self._app_state = app_state
@@ -82,6 +93,7 @@ class TTSPlayback:
         self._tts_lock = asyncio.Lock()
         self._is_playing = False
         self._active_agent: str | None = None  # Track current agent for voice lookup
+        self._recording = recording_sink
 
     def set_active_agent(self, agent_name: str | None) -> None:
         """
@@ -178,6 +190,17 @@ class TTSPlayback:
         )
         return ("en-US-AvaMultilingualNeural", "conversational", None)
 
+    def _resolve_voice(
+        self,
+        voice_name: str | None = None,
+        voice_style: str | None = None,
+        voice_rate: str | None = None,
+    ) -> tuple[str, str, str]:
+        """Resolve voice from the agent if not provided, with default style and rate."""
+        if not voice_name:
+            voice_name, voice_style, voice_rate = self.get_agent_voice()
+        return voice_name, voice_style or "conversational", voice_rate or "medium"
+
     async def play_to_browser(
         self,
         text: str,
@@ -205,12 +228,7 @@ class TTSPlayback:
 
         run_id = uuid.uuid4().hex[:8]
 
-        # Resolve voice from agent if not provided
-        if not voice_name:
-            voice_name, voice_style, voice_rate = self.get_agent_voice()
-
-        style = voice_style or "conversational"
-        rate = voice_rate or "medium"
+        voice_name, style, rate = self._resolve_voice(voice_name, voice_style, voice_rate)
 
         logger.debug(
             "[%s] Browser TTS: voice=%s style=%s rate=%s (run=%s)",
@@ -271,6 +289,7 @@ class TTSPlayback:
         voice_rate: str | None = None,
         blocking: bool = False,
         on_first_audio: Callable[[], None] | None = None,
+        prefetched: GreetingPrefetch | None = None,
     ) -> bool:
         """
         Play TTS audio to ACS WebSocket.
@@ -282,6 +301,8 @@ class TTSPlayback:
             voice_rate: Override rate
             blocking: Whether to pace audio for real-time playback
             on_first_audio: Callback when first audio chunk is sent
+            prefetched: Greeting synthesized during call setup; its audio is
+                used only if it matches the resolved text and voice
 
         Returns:
             True if playback completed, False if cancelled or failed
@@ -291,12 +312,7 @@ class TTSPlayback:
 
         run_id = uuid.uuid4().hex[:8]
 
-        # Resolve voice from agent if not provided
-        if not voice_name:
-            voice_name, voice_style, voice_rate = self.get_agent_voice()
-
-        style = voice_style or "conversational"
-        rate = voice_rate or "medium"
+        voice_name, style, rate = self._resolve_voice(voice_name, voice_style, voice_rate)
 
         logger.debug(
             "[%s] ACS TTS: voice=%s style=%s rate=%s (run=%s)",
@@ -316,21 +332,30 @@ class TTSPlayback:
             synth = None
 
             try:
-                # Acquire TTS synthesizer from pool
-                synth, tier = await self._app_state.tts_pool.acquire_for_session(self._session_id)
+                pcm_bytes = None
+                if prefetched is not None:
+                    pcm_bytes = await prefetched.audio_for(
+                        text, voice_name, style, rate, SAMPLE_RATE_ACS
+                    )
 
-                # Validate synthesizer has valid config
-                if not synth or not getattr(synth, "is_ready", False):
-                    logger.error(
-                        "[%s] TTS synthesizer not initialized (missing speech config) - check Azure credentials",
-                        self._session_short,
+                if pcm_bytes is None:
+                    # Acquire TTS synthesizer from pool
+                    synth, tier = await self._app_state.tts_pool.acquire_for_session(
+                        self._session_id
                     )
-                    return False
 
-                # Synthesize audio
-                pcm_bytes = await self._synthesize(
-                    synth, text, voice_name, style, rate, SAMPLE_RATE_ACS
-                )
+                    # Validate synthesizer has valid config
+                    if not synth or not getattr(synth, "is_ready", False):
+                        logger.error(
+                            "[%s] TTS synthesizer not initialized (missing speech config) - check Azure credentials",
+                            self._session_short,
+                        )
+                        return False
+
+                    # Synthesize audio
+                    pcm_bytes = await self._synthesize(
+                        synth, text, voice_name, style, rate, SAMPLE_RATE_ACS
+                    )
 
                 if not pcm_bytes:
                     logger.warning("[%s] ACS TTS returned empty audio", self._session_short)
@@ -348,6 +373,32 @@ class TTSPlayback:
             finally:
                 self._is_playing = False
 
+    async def prerender_acs(self, text: str) -> GreetingAudio | None:
+        """
+        Synthesize ``text`` for ACS ahead of playback, e.g. while the call is answered.
+
+        Uses a pooled synthesizer that is not bound to the session, so it can
+        run before the media handler has acquired its own.
+        """
+        if not text or not text.strip():
+            return None
+
+        voice_name, style, rate = self._resolve_voice()
+        pool = self._app_state.tts_pool
+        synth = await pool.acquire()
+        try:
+            if not synth or not getattr(synth, "is_ready", False):
+                return None
+            pcm_bytes = await self._synthesize(
+                synth, text, voice_name, style, rate, SAMPLE_RATE_ACS
+            )
+        finally:
+            await pool.release(synth)
+
+        if not pcm_bytes:
+            return None
+        return GreetingAudio(text.strip(), voice_name, style, rate, SAMPLE_RATE_ACS, pcm_bytes)
+
     async def _synthesize(
         self,
         synth: Any,
@@ -397,14 +448,26 @@ class TTSPlayback:
             )
 
             try:
-                if executor:
-                    result = await loop.run_in_executor(executor, synth_func)
+                synth_async = getattr(synth, "synthesize_to_pcm_async", None)
+                if asyncio.iscoroutinefunction(synth_async):
+                    # Reuses cached native synthesizers; retries back off off-thread.
+                    # Cancelling it stops the native synthesis at the SDK level.
+                    synthesis = synth_async(
+                        text=text,
+                        voice=voice,
+                        sample_rate=sample_rate,
+                        style=style,
+                        rate=rate,
+                        executor=executor,
+                    )
                 else:
-                    result = await loop.run_in_executor(None, synth_func)
+                    synthesis = loop.run_in_executor(executor, synth_func)
+                result = await self._await_unless_cancelled(synthesis)
 
                 elapsed_ms = (time.perf_counter() - start_time) * 1000
 
                 if result:
+                    turn_timelines().mark(self._session_id, TTS_FIRST_BYTE)
                     audio_bytes = len(result)
                     span.set_attribute("tts.audio_bytes", audio_bytes)
                     span.set_status(Status(StatusCode.OK))
@@ -429,13 +492,49 @@ class TTSPlayback:
                     logger.warning("[%s] Synthesis returned None/empty", self._session_short)
 
                 return result
-                
+
+            except (asyncio.CancelledError, SynthesisCancelledError):
+                cancelled_ms = (time.perf_counter() - start_time) * 1000
+                span.set_attribute("tts.cancelled", True)
+                logger.debug(
+                    "[%s] Synthesis cancelled after %.2fms", self._session_short, cancelled_ms
+                )
+                record_tts_cancelled(
+                    cancelled_ms,
+                    session_id=self._session_id,
+                    voice_name=voice,
+                    text_length=text_len,
+                    transport=transport,
+                )
+                raise asyncio.CancelledError() from None
             except Exception as e:
                 span.set_status(Status(StatusCode.ERROR, str(e)))
                 span.record_exception(e)
                 logger.error("[%s] Synthesis failed: %s", self._session_short, e)
                 raise
 
+    async def _await_unless_cancelled(self, synthesis: Awaitable[bytes]) -> bytes:
+        """Await synthesis, abandoning it as soon as the cancel event fires.
+
+        Raises:
+            asyncio.CancelledError: Barge-in signalled before synthesis finished.
+        """
+        synth_task = asyncio.ensure_future(synthesis)
+        cancel_wait = asyncio.create_task(self._cancel_event.wait())
+        try:
+            done, _ = await asyncio.wait(
+                {synth_task, cancel_wait}, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            cancel_wait.cancel()
+            if not synth_task.done():
+                synth_task.cancel()
+
+        if cancel_wait in done:
+            self._cancel_event.clear()
+            raise asyncio.CancelledError()
+        return synth_task.result()
+
     async def _stream_to_browser(
         self,
         pcm_bytes: bytes,
@@ -497,9 +596,12 @@ class TTSPlayback:
                         }
                     )
                     chunks_sent += 1
+                    if self._recording is not None:
+                        self._recording.write_outbound(chunk, SAMPLE_RATE_BROWSER)
 
                     if not first_sent:
                         first_sent = True
+                        turn_timelines().mark(self._session_id, FIRST_FRAME_SENT)
                         first_audio_ms = (time.perf_counter() - start_time) * 1000
                         span.set_attribute("tts.first_audio_ms", first_audio_ms)
                         if on_first_audio:
@@ -511,6 +613,8 @@ class TTSPlayback:
                     await asyncio.sleep(0)
 
                 elapsed_ms = (time.perf_counter() - start_time) * 1000
+                if chunks_sent:
+                    turn_timelines().mark(self._session_id, LAST_FRAME_SENT)
                 
                 if not cancelled:
                     span.set_attribute("tts.chunks_sent", chunks_sent)
@@ -596,9 +700,12 @@ class TTSPlayback:
                         }
                     )
                     chunks_sent += 1
+                    if self._recording is not None:
+                        self._recording.write_outbound(chunk, SAMPLE_RATE_ACS)
 
                     if not first_sent:
                         first_sent = True
+                        turn_timelines().mark(self._session_id, FIRST_FRAME_SENT)
                         first_audio_ms = (time.perf_counter() - start_time) * 1000
                         span.set_attribute("tts.first_audio_ms", first_audio_ms)
                         if on_first_audio:
@@ -613,6 +720,8 @@ class TTSPlayback:
                         await asyncio.sleep(0)
 
                 elapsed_ms = (time.perf_counter() - start_time) * 1000
+                if chunks_sent:
+                    turn_timelines().mark(self._session_id, LAST_FRAME_SENT)
 
                 if not cancelled:
                     span.set_attribute("tts.chunks_sent", chunks_sent)
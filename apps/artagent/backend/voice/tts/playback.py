@@ -402,7 +402,18 @@ class TTSPlayback:
             rate=rate,
         )
 
-        if executor:
+        synth_async = getattr(synth, "synthesize_to_pcm_async", None)
+        if asyncio.iscoroutinefunction(synth_async):
+            # Reuses cached native synthesizers; retries back off off-thread
+            result = await synth_async(
+                text=text,
+                voice=voice,
+                sample_rate=sample_rate,
+                style=style,
+                rate=rate,
+                executor=executor,
+            )
+        elif executor:
             result = await loop.run_in_executor(executor, synth_func)
         else:
             result = await loop.run_in_executor(None, synth_func)
@@ -15,6 +15,7 @@ from .orchestrator import (
     register_voicelive_orchestrator,
     unregister_voicelive_orchestrator,
 )
+from .session_config import SessionConfigManager
 from .settings import VoiceLiveSettings, get_settings, reload_settings
 
 __all__ = [
@@ -26,6 +27,7 @@ __all__ = [
     "LiveOrchestrator",
     "TRANSFER_TOOL_NAMES",
     "CALL_CENTER_TRIGGER_PHRASES",
+    "SessionConfigManager",
     "VoiceLiveSettings",
     "get_settings",
     "reload_settings",
@@ -71,6 +71,7 @@ from opentelemetry import trace
 from opentelemetry.trace import SpanKind, Status, StatusCode
 from src.enums.monitoring import SpanAttr
 from utils.ml_logging import get_logger
+from utils.telemetry_config import span_sampling_policy
 from utils.telemetry_decorators import ConversationTurnSpan
 
 from .metrics import (
@@ -1858,9 +1859,16 @@ class VoiceLiveSDKHandler:
         type_value = getattr(event, "type", "unknown")
         type_str = type_value.value if isinstance(type_value, ServerEventType) else str(type_value)
 
-        # Skip creating spans for high-frequency noisy events
-        # These would create thousands of spans per conversation and make traces unusable
+        # Count high-frequency noisy events instead of creating spans for them
+        # These would create thousands of spans per conversation and make traces unusable;
+        # the counts are reported in one summary span per response
         if type_str in self._NOISY_EVENT_TYPES:
+            delta = getattr(event, "delta", None)
+            span_sampling_policy().count_event(
+                self.session_id,
+                type_str,
+                len(delta) if isinstance(delta, bytes | str) else 0,
+            )
             return
 
         logger.debug(
@@ -1894,6 +1902,20 @@ class VoiceLiveSDKHandler:
         ):
             pass
 
+        if type_str == "response.done":
+            summary = span_sampling_policy().drain_events(self.session_id)
+            if summary:
+                with tracer.start_as_current_span(
+                    "voicelive.response.events",
+                    kind=SpanKind.INTERNAL,
+                    attributes={
+                        "voicelive.session_id": self.session_id,
+                        "call.connection.id": self.call_connection_id,
+                        **summary,
+                    },
+                ):
+                    pass
+
     async def _commit_input_buffer(self) -> None:
         if not self._connection:
             return
@@ -50,17 +50,21 @@ from apps.artagent.backend.registries.toolstore import (
 from apps.artagent.backend.src.services.session_loader import load_user_profile_by_client_id
 from apps.artagent.backend.voice.handoffs import sanitize_handoff_context
 from apps.artagent.backend.voice.shared.handoff_service import HandoffService
+from apps.artagent.backend.voice.shared.history_window import HistoryWindow, HistoryWindowConfig
 from apps.artagent.backend.voice.shared.metrics import OrchestratorMetrics
 from apps.artagent.backend.voice.shared.session_state import (
     sync_state_from_memo,
     sync_state_to_memo,
 )
+from apps.artagent.backend.voice.voicelive.session_config import SessionConfigManager
 from azure.ai.voicelive.models import (
     AssistantMessageItem,
     FunctionCallOutputItem,
     InputTextContentPart,
     OutputTextContentPart,
+    RequestSession,
     ServerEventType,
+    SystemMessageItem,
     UserMessageItem,
 )
 from opentelemetry import trace
@@ -91,6 +95,14 @@ CALL_CENTER_TRIGGER_PHRASES = {
     "transfer me to the call center",
 }
 
+# Budget for the conversation re-injected on agent switch (VOICELIVE_HISTORY_* env vars).
+# Older turns are folded into one summary item so the injection stays the same size
+# however long the call has run.
+HISTORY_WINDOW_CONFIG = HistoryWindowConfig.from_env(
+    "VOICELIVE_HISTORY", max_tokens=1500, pinned_turns=3
+)
+_HISTORY_WINDOW_KEY = "voicelive"
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # SESSION ORCHESTRATOR REGISTRY
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -254,6 +266,9 @@ class LiveOrchestrator:
         self._last_user_message: str | None = None  # Keep for backward compatibility
         # Track assistant responses for conversation history persistence
         self._last_assistant_message: str | None = None
+        # Full call transcript as chat messages; trimmed by the window on injection
+        self._conversation: list[dict[str, str]] = []
+        self._history_window = HistoryWindow(HISTORY_WINDOW_CONFIG)
         self.call_connection_id = call_connection_id
         self._call_center_triggered = False
         self._transport = transport
@@ -275,6 +290,8 @@ class LiveOrchestrator:
         self._last_session_update_time: float = 0.0
         self._session_update_min_interval: float = 2.0  # Min seconds between updates
         self._pending_session_update: bool = False
+        # Last applied session config: diff-only, coalesced session.update
+        self._session_config = SessionConfigManager(conn)
 
         if self.messenger:
             try:
@@ -394,6 +411,9 @@ class LiveOrchestrator:
             stored_history = self._memo_manager.get_value_from_corememory("user_message_history")
             if stored_history and isinstance(stored_history, list):
                 self._user_message_history = deque(stored_history, maxlen=5)
+                self._conversation = [
+                    {"role": "user", "content": msg} for msg in stored_history if msg
+                ]
                 if stored_history:
                     self._last_user_message = stored_history[-1]
                 logger.debug(
@@ -469,6 +489,8 @@ class LiveOrchestrator:
 
         # Clear connection reference (do not close - handler owns it)
         self.conn = None
+        self._session_config.reset()
+        self._session_config.conn = None
 
         # Clear messenger reference to break circular refs
         self.messenger = None
@@ -484,6 +506,8 @@ class LiveOrchestrator:
         self._user_message_history.clear()
         self._last_user_message = None
         self._last_assistant_message = None
+        self._conversation = []
+        self._history_window.reset()
 
         # Clear pending greeting state
         self._pending_greeting = None
@@ -529,6 +553,9 @@ class LiveOrchestrator:
         # Clear cached HandoffService so it's recreated with new scenario
         self._handoff_service = None
 
+        # Tool lists depend on the scenario's handoff edges
+        self._session_config.invalidate_tools()
+
         # Clear visited agents for fresh scenario experience
         self.visited_agents.clear()
 
@@ -582,7 +609,7 @@ class LiveOrchestrator:
                 # Refresh context with new agent
                 self._refresh_session_context()
                 # Update VoiceLive session with new instructions
-                await self._update_session_context()
+                await self._update_session_context(coalesce=True)
                 logger.info(
                     "🔄 VoiceLive session updated for new agent | agent=%s",
                     self.active,
@@ -610,6 +637,12 @@ class LiveOrchestrator:
         between turns. By injecting the conversation history as explicit text
         items, we give the model concrete text to reference.
 
+        The transcript is trimmed to ``HISTORY_WINDOW_CONFIG``: the oldest whole
+        turns are dropped first and replaced by one summary item, so the number
+        of items sent is bounded and the same transcript always yields the same
+        items. All items are built up front and their sends are issued together
+        rather than awaited one by one; the WebSocket writer keeps them in order.
+
         This should be called:
         - After session.update on agent switch (_switch_to)
         - Before the first response is triggered
@@ -617,37 +650,38 @@ class LiveOrchestrator:
         The text items become part of the conversation context that the model
         sees for all subsequent responses.
         """
-        if not self.conn or not self._user_message_history:
+        if not self.conn or not self._conversation:
             return
 
         try:
-            # Inject each historical user message as a text conversation item
-            # This establishes explicit text context for the model
-            for msg in self._user_message_history:
-                if not msg or not msg.strip():
-                    continue
-                
-                # Create user message item with text content
-                text_part = InputTextContentPart(text=msg)
-                user_item = UserMessageItem(content=[text_part])
-                
-                # Add to conversation
-                await self.conn.conversation.item.create(item=user_item)
-            
-            # Also inject last assistant message if available
-            if self._last_assistant_message:
-                # Create assistant message with text content
-                text_part = OutputTextContentPart(text=self._last_assistant_message)
-                assistant_item = AssistantMessageItem(content=[text_part])
-                await self.conn.conversation.item.create(item=assistant_item)
+            messages = self._history_window.build(_HISTORY_WINDOW_KEY, self._conversation)
+            items = [self._history_item(message) for message in messages]
+            if not items:
+                return
+            create = self.conn.conversation.item.create
+            await asyncio.gather(*(create(item=item) for item in items))
 
             logger.info(
-                "[LiveOrchestrator] Injected %d conversation items for context",
-                len(self._user_message_history) + (1 if self._last_assistant_message else 0),
+                "[LiveOrchestrator] Injected %d conversation items for context "
+                "(evicted_turns=%d tokens=%d)",
+                len(items),
+                self._history_window.stats.evicted_turns,
+                self._history_window.stats.history_tokens,
             )
         except Exception:
             logger.debug("Failed to inject conversation history", exc_info=True)
 
+    @staticmethod
+    def _history_item(message: dict[str, Any]):
+        """Convert a windowed chat message into a VoiceLive conversation item."""
+        role = message.get("role")
+        text = message.get("content") or ""
+        if role == "assistant":
+            return AssistantMessageItem(content=[OutputTextContentPart(text=text)])
+        if role == "system":
+            return SystemMessageItem(content=[InputTextContentPart(text=text)])
+        return UserMessageItem(content=[InputTextContentPart(text=text)])
+
     def _refresh_session_context(self) -> None:
         """
         Refresh session context from MemoManager at the start of each turn.
@@ -693,7 +727,7 @@ class LiveOrchestrator:
         except Exception:
             logger.debug("Failed to refresh session context", exc_info=True)
 
-    async def _update_session_context(self) -> None:
+    async def _update_session_context(self, *, coalesce: bool = False) -> None:
         """
         Update VoiceLive session instructions with current context.
 
@@ -701,6 +735,10 @@ class LiveOrchestrator:
         reflect the latest conversation context. Without this, the realtime model
         tends to forget what was discussed in previous turns.
 
+        Instructions go through the connection's SessionConfigManager, so an
+        unchanged prompt is not resent. With ``coalesce`` the update is merged
+        with others requested in the coalescing window instead of sent now.
+
         The update includes:
         - Base agent instructions (from prompt template)
         - Explicit conversation recap (critical for context retention)
@@ -766,12 +804,12 @@ class LiveOrchestrator:
             if not updated_instructions:
                 return
 
-            # Update session with new instructions
-            from azure.ai.voicelive.models import RequestSession
-
-            await self.conn.session.update(
-                session=RequestSession(instructions=updated_instructions)
-            )
+            # Update session with new instructions (skipped when unchanged)
+            session = RequestSession(instructions=updated_instructions)
+            if coalesce:
+                self._session_config.schedule(session)
+            else:
+                await self._session_config.apply(session)
 
             logger.debug(
                 "[LiveOrchestrator] Updated session | agent=%s history_len=%d slots=%s",
@@ -851,7 +889,7 @@ class LiveOrchestrator:
         # This prevents blocking the event loop
         async def _do_session_update():
             try:
-                await self._update_session_context()
+                await self._update_session_context(coalesce=True)
             except Exception:
                 logger.debug("Background session update failed", exc_info=True)
 
@@ -1078,6 +1116,7 @@ class LiveOrchestrator:
             self._last_user_message = user_text
             # Add to bounded history for better handoff context
             self._user_message_history.append(user_text)
+            self._conversation.append({"role": "user", "content": user_text})
 
             # Reset TTS TTFB tracking for new turn and mark turn start
             self._tts_ttfb_recorded = False
@@ -1156,7 +1195,8 @@ class LiveOrchestrator:
             logger.info("[%s] Agent: %s", self.active, full_transcript)
             # Track assistant response for history persistence
             self._last_assistant_message = full_transcript
-            
+            self._conversation.append({"role": "assistant", "content": full_transcript})
+
             # Persist assistant turn to MemoManager for session continuity
             if self._memo_manager:
                 try:
@@ -1325,6 +1365,7 @@ class LiveOrchestrator:
                         say=None,
                         session_id=session_id,
                         call_connection_id=self.call_connection_id,
+                        session_config=self._session_config,
                     )
 
                 # CRITICAL: Inject conversation history as text items for context retention
@@ -0,0 +1,198 @@
+"""
+VoiceLive Session Config
+========================
+
+Tracks the session configuration last applied to a VoiceLive connection and
+sends only what changed.
+
+Agent switches, scenario changes, tool results and turn ends each build a
+``RequestSession`` (instructions, tools, voice, VAD, ...). Resending the whole
+payload each time makes the service re-apply unchanged voice and tool
+settings and puts every tool schema on the wire for an instructions tweak.
+``SessionConfigManager`` instead:
+
+- Compares each serialized field with the last applied value and sends only
+  the fields that changed; an update that changes nothing is skipped.
+- Coalesces background updates (``schedule``) requested within
+  ``coalesce_ms``: the latest value of each field wins and a single
+  ``session.update`` is sent. ``apply`` sends immediately, folding in
+  anything still pending, for updates that must land before a response.
+- Caches built tool lists per agent until ``invalidate_tools`` (scenario
+  change), so tool schemas are not rebuilt on every agent switch.
+
+Fields omitted from a ``session.update`` keep their current value on the
+service, which is what makes partial updates safe.
+
+Set ``VOICELIVE_SESSION_COALESCE_MS`` to tune the coalescing window.
+
+Usage:
+    from apps.artagent.backend.voice.voicelive.session_config import SessionConfigManager
+
+    session_config = SessionConfigManager(conn)
+    await session_config.apply(RequestSession(instructions=..., tools=...))
+    session_config.schedule(RequestSession(instructions=...))  # coalesced
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from collections.abc import Callable, Mapping
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from azure.ai.voicelive.models import RequestSession
+from utils.ml_logging import get_logger
+
+logger = get_logger("voicelive.session_config")
+
+# Window in which background session updates are merged into one
+VOICELIVE_SESSION_COALESCE_MS = float(os.getenv("VOICELIVE_SESSION_COALESCE_MS", "250"))
+
+_MISSING = object()
+
+
+@dataclass
+class SessionUpdateStats:
+    """Counters for session.update traffic on one connection."""
+
+    requested: int = 0  # apply() and schedule() calls
+    sent: int = 0  # session.update events sent
+    skipped: int = 0  # updates that changed nothing
+    coalesced: int = 0  # requests merged into a later update
+    fields_sent: int = 0
+    bytes_sent: int = 0
+    tool_cache_hits: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for logging/telemetry."""
+        return asdict(self)
+
+
+def _serialize(session: Any) -> dict[str, Any]:
+    """Plain JSON fields of a ``RequestSession`` (or mapping), unset fields omitted."""
+    if hasattr(session, "as_dict"):
+        return session.as_dict()
+    return dict(session)
+
+
+class SessionConfigManager:
+    """
+    Last-applied session state and coalesced, diff-only updates for one connection.
+
+    Not thread-safe; use from the connection's event loop.
+    """
+
+    def __init__(self, conn: Any, *, coalesce_ms: float = VOICELIVE_SESSION_COALESCE_MS) -> None:
+        self.conn = conn
+        self.coalesce_s = max(0.0, coalesce_ms) / 1000
+        self.stats = SessionUpdateStats()
+        self._applied: dict[str, Any] = {}
+        self._pending: dict[str, Any] = {}
+        self._flush_task: asyncio.Task | None = None
+        self._tools: dict[str, list[Any]] = {}
+        self._lock = asyncio.Lock()
+
+    # ------------------------------------------------------------------ #
+    # Tool payload cache
+    # ------------------------------------------------------------------ #
+
+    def tools(self, agent_name: str, build: Callable[[], list[Any]]) -> list[Any]:
+        """Return the cached tool list for ``agent_name``, building it on first use."""
+        cached = self._tools.get(agent_name)
+        if cached is not None:
+            self.stats.tool_cache_hits += 1
+            return cached
+        tools = self._tools[agent_name] = build()
+        return tools
+
+    def invalidate_tools(self, agent_name: str | None = None) -> None:
+        """Drop cached tool lists for one agent or all agents."""
+        if agent_name is None:
+            self._tools.clear()
+        else:
+            self._tools.pop(agent_name, None)
+
+    # ------------------------------------------------------------------ #
+    # Updates
+    # ------------------------------------------------------------------ #
+
+    def diff(self, session: Any) -> dict[str, Any]:
+        """Serialized fields of ``session`` that differ from the last applied state."""
+        return {
+            key: value
+            for key, value in _serialize(session).items()
+            if self._applied.get(key, _MISSING) != value
+        }
+
+    async def apply(self, session: Any) -> bool:
+        """
+        Send the changed fields of ``session`` now.
+
+        Pending scheduled fields are sent in the same update, overridden by
+        ``session``. Returns True when an update was sent.
+        """
+        self.stats.requested += 1
+        fields = _serialize(session)
+        if self._pending:
+            self.stats.coalesced += 1
+            fields = {**self._pending, **fields}
+            self._pending = {}
+        return await self._send(fields)
+
+    def schedule(self, session: Any) -> None:
+        """Queue ``session`` to be sent, merged with other requests, after the window."""
+        self.stats.requested += 1
+        if self._pending:
+            self.stats.coalesced += 1
+        self._pending.update(_serialize(session))
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def flush(self) -> bool:
+        """Send pending scheduled fields now instead of waiting for the window."""
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return False
+        return await self._send(pending)
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.coalesce_s)
+        try:
+            await self.flush()
+        except Exception:
+            logger.debug("Coalesced session update failed", exc_info=True)
+
+    async def _send(self, fields: Mapping[str, Any]) -> bool:
+        async with self._lock:
+            changed = self.diff(fields)
+            if not changed:
+                self.stats.skipped += 1
+                return False
+            if self.conn is None:
+                return False
+
+            await self.conn.session.update(session=RequestSession(changed))
+            self._applied.update(changed)
+            self.stats.sent += 1
+            self.stats.fields_sent += len(changed)
+            self.stats.bytes_sent += len(json.dumps(changed, default=str))
+            logger.debug("Session update sent | fields=%s", sorted(changed))
+            return True
+
+    def reset(self) -> None:
+        """Forget applied state and cached tools and drop any pending update."""
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        self._flush_task = None
+        self._pending = {}
+        self._applied = {}
+        self._tools = {}
+
+
+__all__ = [
+    "SessionConfigManager",
+    "SessionUpdateStats",
+    "VOICELIVE_SESSION_COALESCE_MS",
+]
@@ -0,0 +1,123 @@
+"""
+Worker Supervisor
+=================
+
+Runs the backend as several shared-nothing worker processes behind one port.
+
+Each voice call keeps its media pipeline, pooled speech clients and call
+context in the memory of the process that serves it, and a single process is
+bounded by one event loop and the GIL. The supervisor binds the public socket
+once and starts ``WORKER_PROCESSES`` spawned children that all accept on it.
+Child ``i`` also listens on ``127.0.0.1:WORKER_INTERNAL_BASE_PORT + i`` and
+exports its index and internal port (``ARTAGENT_WORKER_INDEX`` and
+``ARTAGENT_WORKER_INTERNAL_PORT``), which turns on its ``WorkerRegistry`` and
+the ``WorkerAffinityMiddleware`` hand-off so every callback and media stream of
+a call reaches the worker that owns it.
+
+Children that exit unexpectedly are restarted with the same index; calls they
+owned are taken over by whichever worker next receives their traffic.
+
+Usage:
+    WORKER_PROCESSES=4 uv run artagent-server
+
+    from apps.artagent.backend.workers import run_workers
+    run_workers("apps.artagent.backend.main:app", port=8080, workers=4)
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import signal
+import socket
+import time
+from typing import Any
+
+import uvicorn
+from src.pools.worker_registry import WORKER_INDEX_ENV, WORKER_INTERNAL_PORT_ENV
+from utils.ml_logging import get_logger
+
+logger = get_logger("workers")
+
+APP_PATH = "apps.artagent.backend.main:app"
+RESTART_BACKOFF_S = 1.0
+_spawn = multiprocessing.get_context("spawn")
+
+
+def _serve_worker(app_path: str, public: socket.socket, index: int, internal_port: int) -> None:
+    """Child process entry point: serve ``app_path`` on the public and internal sockets."""
+    os.environ[WORKER_INDEX_ENV] = str(index)
+    os.environ[WORKER_INTERNAL_PORT_ENV] = str(internal_port)
+
+    internal = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    internal.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    internal.bind(("127.0.0.1", internal_port))
+    internal.set_inheritable(True)
+
+    config = uvicorn.Config(app_path, lifespan="on", reload=False)
+    uvicorn.Server(config).run(sockets=[public, internal])
+
+
+def run_workers(
+    app_path: str = APP_PATH,
+    *,
+    host: str = "0.0.0.0",  # nosec: B104
+    port: int = 8080,
+    workers: int = 2,
+    internal_base_port: int = 18080,
+) -> None:
+    """
+    Bind ``host:port`` and serve it from ``workers`` processes until signalled.
+
+    :param app_path: Import string of the ASGI app each worker loads
+    :param host: Public bind address
+    :param port: Public port shared by all workers
+    :param workers: Number of worker processes
+    :param internal_base_port: Worker ``i`` listens on loopback ``internal_base_port + i``
+    """
+    public = uvicorn.Config(app_path, host=host, port=port).bind_socket()
+    stopping = False
+
+    def _start(index: int) -> Any:
+        process = _spawn.Process(
+            target=_serve_worker,
+            args=(app_path, public, index, internal_base_port + index),
+            name=f"artagent-worker-{index}",
+        )
+        process.start()
+        logger.info("Started worker %d (pid %s)", index, process.pid)
+        return process
+
+    def _stop(signum, _frame) -> None:
+        nonlocal stopping
+        stopping = True
+        logger.info("Received signal %s, stopping %d workers", signum, len(processes))
+
+    processes = [_start(index) for index in range(workers)]
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, _stop)
+
+    try:
+        while not stopping:
+            for index, process in enumerate(processes):
+                process.join(timeout=0)
+                if process.exitcode is not None and not stopping:
+                    logger.warning(
+                        "Worker %d (pid %s) exited with %s, restarting",
+                        index,
+                        process.pid,
+                        process.exitcode,
+                    )
+                    time.sleep(RESTART_BACKOFF_S)
+                    processes[index] = _start(index)
+            time.sleep(0.5)
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        for process in processes:
+            process.join()
+        public.close()
+
+
+__all__ = ["APP_PATH", "run_workers"]
@@ -9,6 +9,8 @@ This package includes:
 - SmsService: For sending SMS messages via Azure Communication Services
 - EmailTemplates: Professional email templates
 - SmsTemplates: Professional SMS templates
+- NotificationDispatcher: Shared worker pool that delivers both (bounded
+  backlog, retries with jitter, SMS batching)
 
 Example usage:
 
@@ -39,12 +41,15 @@ Example usage:
 
 from .email_service import EmailService
 from .email_templates import EmailTemplates
+from .notification_dispatcher import NotificationDispatcher, get_notification_dispatcher
 from .sms_service import SmsService, is_sms_configured, send_sms, send_sms_background, sms_service
 from .sms_templates import SmsTemplates
 
 __all__ = [
     "EmailService",
     "EmailTemplates",
+    "NotificationDispatcher",
+    "get_notification_dispatcher",
     "send_sms",
     "send_sms_background",
     "is_sms_configured",
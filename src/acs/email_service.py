@@ -8,14 +8,14 @@ Supports both plain text and HTML email formats with professional templates.
 
 from __future__ import annotations
 
-import asyncio
 import os
-import threading
 from typing import Any
 
 from utils.azure_auth import get_credential
 from utils.ml_logging import get_logger
 
+from .notification_dispatcher import get_notification_dispatcher
+
 # Email service imports
 try:
     from azure.communication.email import EmailClient
@@ -63,6 +63,54 @@ class EmailService:
         """Check if email service is properly configured."""
         return AZURE_EMAIL_AVAILABLE and self.client is not None and bool(self.sender_address)
 
+    def begin_email(
+        self,
+        email_address: str,
+        subject: str,
+        plain_text_body: str,
+        html_body: str | None = None,
+    ) -> Any:
+        """
+        Submit one email with the shared client and return its status poller.
+
+        Called by the notification dispatcher on its executor; errors raised
+        here happen before ACS accepted the message, so the dispatcher may
+        retry them.
+        """
+        # Prepare email message
+        message_content = {"subject": subject, "plainText": plain_text_body}
+
+        # Add HTML if provided
+        if html_body:
+            message_content["html"] = html_body
+
+        message = {
+            "senderAddress": self.sender_address,
+            "recipients": {"to": [{"address": email_address}]},
+            "content": message_content,
+        }
+
+        return self.client.begin_send(message)
+
+    def complete_email(self, poller: Any, email_address: str) -> dict[str, Any]:
+        """
+        Wait for an accepted email to finish sending.
+
+        The message is already queued by ACS, so errors here must not lead to
+        a resend.
+        """
+        result = poller.result()
+
+        # Extract message ID
+        message_id = getattr(result, "id", None) or getattr(result, "message_id", "unknown")
+
+        logger.info("📧 Email sent successfully to %s, message ID: %s", email_address, message_id)
+        return {
+            "success": True,
+            "message_id": message_id,
+            "service": "Azure Communication Services Email",
+        }
+
     async def send_email(
         self,
         email_address: str,
@@ -73,6 +121,9 @@ class EmailService:
         """
         Send email using Azure Communication Services Email.
 
+        Delivery runs on the shared notification dispatcher (bounded worker
+        pool with retries), so the caller's event loop is never blocked.
+
         Args:
             email_address: Recipient email address
             subject: Email subject line
@@ -82,45 +133,14 @@ class EmailService:
         Returns:
             Dict containing success status, message ID, and error details if any
         """
-        try:
-            if not self.is_configured():
-                return {
-                    "success": False,
-                    "error": "Azure Email service not configured or not available",
-                }
-
-            # Prepare email message
-            message_content = {"subject": subject, "plainText": plain_text_body}
-
-            # Add HTML if provided
-            if html_body:
-                message_content["html"] = html_body
-
-            message = {
-                "senderAddress": self.sender_address,
-                "recipients": {"to": [{"address": email_address}]},
-                "content": message_content,
-            }
-
-            # Send email
-            poller = self.client.begin_send(message)
-            result = poller.result()
-
-            # Extract message ID
-            message_id = getattr(result, "id", None) or getattr(result, "message_id", "unknown")
-
-            logger.info(
-                "📧 Email sent successfully to %s, message ID: %s", email_address, message_id
-            )
+        if not self.is_configured():
             return {
-                "success": True,
-                "message_id": message_id,
-                "service": "Azure Communication Services Email",
+                "success": False,
+                "error": "Azure Email service not configured or not available",
             }
-
-        except Exception as exc:
-            logger.error("Email sending failed: %s", exc)
-            return {"success": False, "error": f"Azure Email error: {str(exc)}"}
+        return await get_notification_dispatcher().send_email(
+            self, email_address, subject, plain_text_body, html_body
+        )
 
     def send_email_background(
         self,
@@ -131,7 +151,11 @@ class EmailService:
         callback: callable | None = None,
     ) -> None:
         """
-        Send email in background thread without blocking the main response.
+        Send email in the background without blocking the main response.
+
+        The email is queued on the shared notification dispatcher; if its
+        backlog is full the email is dropped and ``callback`` receives an
+        error result.
 
         Args:
             email_address: Recipient email address
@@ -140,41 +164,21 @@ class EmailService:
             html_body: Optional HTML version of the email
             callback: Optional callback function to handle the result
         """
-
-        def _send_email_background_task():
-            try:
-                # Create new event loop for background task
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-
-                # Send the email
-                result = loop.run_until_complete(
-                    self.send_email(email_address, subject, plain_text_body, html_body)
+        if not self.is_configured():
+            logger.warning("📧 Background email skipped: service not configured")
+            if callback:
+                callback(
+                    {
+                        "success": False,
+                        "error": "Azure Email service not configured or not available",
+                    }
                 )
+            return
 
-                # Log result
-                if result.get("success"):
-                    logger.info(
-                        "📧 Background email sent successfully: %s", result.get("message_id")
-                    )
-                else:
-                    logger.warning("📧 Background email failed: %s", result.get("error"))
-
-                # Call callback if provided
-                if callback:
-                    callback(result)
-
-            except Exception as exc:
-                logger.error("Background email task failed: %s", exc, exc_info=True)
-            finally:
-                loop.close()
-
-        try:
-            email_thread = threading.Thread(target=_send_email_background_task, daemon=True)
-            email_thread.start()
-            logger.info("📧 Email sending started in background thread")
-        except Exception as exc:
-            logger.error("Failed to start background email thread: %s", exc)
+        get_notification_dispatcher().send_email_background(
+            self, email_address, subject, plain_text_body, html_body, callback
+        )
+        logger.info("📧 Email queued for background delivery")
 
 
 # Global email service instance
@@ -0,0 +1,561 @@
+"""
+Notification Dispatcher
+=======================
+
+Shared delivery pipeline for the ACS email and SMS services.
+
+Previously every background notification started its own OS thread and event
+loop, and SMS built a new ``SmsClient`` per message, so tool-driven
+confirmation bursts created unbounded threads and repeated client setup. The
+dispatcher replaces that with:
+
+- One long-lived dispatcher thread running an event loop with a fixed set of
+  worker coroutines; blocking SDK calls run on a bounded executor of the same
+  size, so the thread count stays constant under bursts.
+- A bounded backlog. Awaiting callers wait for capacity (backpressure);
+  fire-and-forget callers are rejected with an error result when it is full.
+- Retry with full-jitter exponential backoff for errors raised before ACS
+  accepted a request (connection failures, throttling/server statuses) and
+  for SMS recipients that failed with a throttling/server status. An email
+  whose send was accepted is never sent again, even if polling its status
+  fails.
+- Batching of SMS with identical content: sends queued within a short window
+  are merged into one ``SmsClient.send`` call (up to ``sms_batch_size``
+  recipients) and the per-recipient responses are split back to each caller.
+
+Usage:
+    from src.acs.notification_dispatcher import get_notification_dispatcher
+
+    dispatcher = get_notification_dispatcher()
+    result = await dispatcher.send_email(email_service, address, subject, text, html)
+    dispatcher.send_sms_background(sms_service, ["+15551234567"], "Code: 123456")
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import os
+import random
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from utils.ml_logging import get_logger
+
+try:
+    from azure.core.exceptions import HttpResponseError, ServiceRequestError
+except ImportError:  # pragma: no cover - azure-core ships with the ACS SDKs
+    HttpResponseError = ServiceRequestError = ()
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .email_service import EmailService
+    from .sms_service import SmsService
+
+logger = get_logger("notification_dispatcher")
+
+# Request and SMS recipient statuses worth retrying (throttled or transient server errors)
+RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+_EMAIL = "email"
+_SMS = "sms"
+
+
+@dataclass
+class DispatcherStats:
+    """Counters for notification throughput and failures."""
+
+    submitted: int = 0
+    delivered: int = 0
+    failed: int = 0
+    retries: int = 0
+    rejected: int = 0
+    sms_batches: int = 0
+    sms_batched_messages: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for logging/telemetry."""
+        return {
+            "submitted": self.submitted,
+            "delivered": self.delivered,
+            "failed": self.failed,
+            "retries": self.retries,
+            "rejected": self.rejected,
+            "sms_batches": self.sms_batches,
+            "avg_sms_batch_size": (
+                round(self.sms_batched_messages / self.sms_batches, 2)
+                if self.sms_batches
+                else None
+            ),
+        }
+
+
+@dataclass
+class _Notification:
+    """One caller's notification and the future its result is delivered to."""
+
+    kind: str
+    service: Any
+    payload: dict[str, Any]
+    future: concurrent.futures.Future = field(default_factory=concurrent.futures.Future)
+    callback: Callable[[dict[str, Any]], None] | None = None
+    admitted: bool = False
+
+    def batch_key(self) -> tuple:
+        payload = self.payload
+        return (
+            id(self.service),
+            payload["message"],
+            payload["enable_delivery_report"],
+            payload["tag"],
+        )
+
+
+class NotificationDispatcher:
+    """
+    Long-lived worker pool that delivers email and SMS notifications.
+
+    :param workers: Concurrent deliveries (and executor threads for SDK calls)
+    :param queue_size: Notifications accepted but not yet completed
+    :param max_attempts: Delivery attempts per notification (including the first)
+    :param backoff_base_s: Base of the exponential retry backoff
+    :param backoff_max_s: Cap on a single retry delay
+    :param sms_batch_window_s: How long identical SMS wait to be merged
+    :param sms_batch_size: Maximum recipients per merged SMS request
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int = 4,
+        queue_size: int = 256,
+        max_attempts: int = 3,
+        backoff_base_s: float = 0.5,
+        backoff_max_s: float = 8.0,
+        sms_batch_window_s: float = 0.05,
+        sms_batch_size: int = 100,
+    ) -> None:
+        self.workers = workers
+        self.queue_size = queue_size
+        self.max_attempts = max_attempts
+        self.backoff_base_s = backoff_base_s
+        self.backoff_max_s = backoff_max_s
+        self.sms_batch_window_s = sms_batch_window_s
+        self.sms_batch_size = sms_batch_size
+        self.stats = DispatcherStats()
+
+        self._start_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        # Created on the dispatcher loop
+        self._queue: asyncio.Queue[list[_Notification]] | None = None
+        self._capacity: asyncio.Semaphore | None = None
+        self._sms_groups: dict[tuple, list[_Notification]] = {}
+
+    # ------------------------------------------------------------------ #
+    # Public API
+    # ------------------------------------------------------------------ #
+
+    async def send_email(
+        self,
+        service: EmailService,
+        email_address: str,
+        subject: str,
+        plain_text_body: str,
+        html_body: str | None = None,
+    ) -> dict[str, Any]:
+        """Deliver an email, waiting for capacity if the backlog is full."""
+        job = _Notification(
+            _EMAIL,
+            service,
+            {
+                "email_address": email_address,
+                "subject": subject,
+                "plain_text_body": plain_text_body,
+                "html_body": html_body,
+            },
+        )
+        return await self._submit_and_wait(job)
+
+    async def send_sms(
+        self,
+        service: SmsService,
+        to_phone_numbers: list[str],
+        message: str,
+        enable_delivery_report: bool = True,
+        tag: str | None = None,
+    ) -> dict[str, Any]:
+        """Deliver an SMS, waiting for capacity if the backlog is full."""
+        job = self._sms_job(service, to_phone_numbers, message, enable_delivery_report, tag)
+        return await self._submit_and_wait(job)
+
+    def send_email_background(
+        self,
+        service: EmailService,
+        email_address: str,
+        subject: str,
+        plain_text_body: str,
+        html_body: str | None = None,
+        callback: Callable[[dict[str, Any]], None] | None = None,
+    ) -> concurrent.futures.Future:
+        """Queue an email without waiting; rejected if the backlog is full."""
+        job = _Notification(
+            _EMAIL,
+            service,
+            {
+                "email_address": email_address,
+                "subject": subject,
+                "plain_text_body": plain_text_body,
+                "html_body": html_body,
+            },
+            callback=callback,
+        )
+        return self._submit_nowait(job)
+
+    def send_sms_background(
+        self,
+        service: SmsService,
+        to_phone_numbers: list[str],
+        message: str,
+        enable_delivery_report: bool = True,
+        tag: str | None = None,
+        callback: Callable[[dict[str, Any]], None] | None = None,
+    ) -> concurrent.futures.Future:
+        """Queue an SMS without waiting; rejected if the backlog is full."""
+        job = self._sms_job(service, to_phone_numbers, message, enable_delivery_report, tag)
+        job.callback = callback
+        return self._submit_nowait(job)
+
+    def start(self) -> None:
+        """Start the dispatcher thread now instead of on the first send."""
+        self._ensure_started()
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Stop the dispatcher thread; queued notifications are abandoned."""
+        with self._start_lock:
+            loop, thread = self._loop, self._thread
+            if loop is None or thread is None:
+                return
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=timeout)
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+            self._loop = self._thread = self._executor = None
+
+    # ------------------------------------------------------------------ #
+    # Submission
+    # ------------------------------------------------------------------ #
+
+    @staticmethod
+    def _sms_job(
+        service: SmsService,
+        to_phone_numbers: list[str],
+        message: str,
+        enable_delivery_report: bool,
+        tag: str | None,
+    ) -> _Notification:
+        return _Notification(
+            _SMS,
+            service,
+            {
+                "to": list(to_phone_numbers),
+                "message": message,
+                "enable_delivery_report": enable_delivery_report,
+                "tag": tag or "ARTAgent SMS",
+            },
+        )
+
+    async def _submit_and_wait(self, job: _Notification) -> dict[str, Any]:
+        loop = self._ensure_started()
+        accepted = asyncio.run_coroutine_threadsafe(self._accept(job, wait=True), loop)
+        await asyncio.wrap_future(accepted)
+        return await asyncio.wrap_future(job.future)
+
+    def _submit_nowait(self, job: _Notification) -> concurrent.futures.Future:
+        loop = self._ensure_started()
+        asyncio.run_coroutine_threadsafe(self._accept(job, wait=False), loop)
+        return job.future
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        with self._start_lock:
+            if self._loop is not None:
+                return self._loop
+            # Work submitted before the thread's loop runs is queued on it, so the
+            # caller never waits for the thread to come up.
+            loop = asyncio.new_event_loop()
+            self._queue = asyncio.Queue()
+            self._capacity = asyncio.Semaphore(self.queue_size)
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="notification-send"
+            )
+            self._thread = threading.Thread(
+                target=self._run, args=(loop,), name="notification-dispatcher", daemon=True
+            )
+            self._thread.start()
+            self._loop = loop
+            logger.info(
+                "Notification dispatcher started",
+                extra={"workers": self.workers, "queue_size": self.queue_size},
+            )
+            return loop
+
+    def _run(self, loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        workers = [loop.create_task(self._worker()) for _ in range(self.workers)]
+        try:
+            loop.run_forever()
+        finally:
+            for task in workers:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*workers, return_exceptions=True))
+            loop.close()
+
+    async def _accept(self, job: _Notification, *, wait: bool) -> None:
+        """Admit ``job`` to the backlog (runs on the dispatcher loop)."""
+        if not wait and self._capacity.locked():
+            self.stats.rejected += 1
+            logger.warning("Notification backlog full; dropping %s", job.kind)
+            self._complete(job, self._error_result(job, "Notification queue full"))
+            return
+        await self._capacity.acquire()
+        job.admitted = True
+        self.stats.submitted += 1
+
+        if job.kind == _EMAIL:
+            self._queue.put_nowait([job])
+            return
+
+        key = job.batch_key()
+        group = self._sms_groups.get(key)
+        if group is None:
+            group = self._sms_groups[key] = []
+            asyncio.get_running_loop().call_later(self.sms_batch_window_s, self._flush_sms, key)
+        group.append(job)
+        if sum(len(member.payload["to"]) for member in group) >= self.sms_batch_size:
+            self._flush_sms(key)
+
+    def _flush_sms(self, key: tuple) -> None:
+        group = self._sms_groups.pop(key, None)
+        if group:
+            self._queue.put_nowait(group)
+
+    # ------------------------------------------------------------------ #
+    # Delivery
+    # ------------------------------------------------------------------ #
+
+    async def _worker(self) -> None:
+        while True:
+            batch = await self._queue.get()
+            try:
+                if batch[0].kind == _EMAIL:
+                    results = [await self._deliver_email(batch[0])]
+                else:
+                    results = await self._deliver_sms(batch)
+            except Exception as exc:  # pragma: no cover - defensive
+                logger.error("Notification delivery crashed: %s", exc, exc_info=True)
+                results = [self._error_result(job, str(exc)) for job in batch]
+            for job, result in zip(batch, results, strict=True):
+                self._complete(job, result)
+
+    def _backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for the given (1-based) attempt."""
+        return random.uniform(0, min(self.backoff_max_s, self.backoff_base_s * 2 ** (attempt - 1)))
+
+    async def _call(self, fn: Callable[..., dict[str, Any]], *args: Any) -> dict[str, Any]:
+        """Run a blocking SDK call on the dispatcher's executor (single attempt)."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+
+    async def _call_with_retry(
+        self, fn: Callable[..., dict[str, Any]], *args: Any
+    ) -> dict[str, Any]:
+        """Run a blocking SDK call, retrying errors raised before the request was accepted."""
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                return await self._call(fn, *args)
+            except Exception as exc:
+                if attempt == self.max_attempts or not _is_retryable(exc):
+                    raise
+                self.stats.retries += 1
+                delay = self._backoff(attempt)
+                logger.warning(
+                    "Notification send failed (attempt %d/%d), retrying in %.2fs: %s",
+                    attempt,
+                    self.max_attempts,
+                    delay,
+                    exc,
+                )
+                await asyncio.sleep(delay)
+        raise RuntimeError("unreachable")  # pragma: no cover
+
+    async def _deliver_email(self, job: _Notification) -> dict[str, Any]:
+        """Send an email; only the send request is retried, never the status poll."""
+        payload = job.payload
+        try:
+            poller = await self._call_with_retry(
+                job.service.begin_email,
+                payload["email_address"],
+                payload["subject"],
+                payload["plain_text_body"],
+                payload["html_body"],
+            )
+            return await self._call(job.service.complete_email, poller, payload["email_address"])
+        except Exception as exc:
+            logger.error("Email sending failed: %s", exc)
+            return self._error_result(job, str(exc))
+
+    async def _deliver_sms(self, batch: list[_Notification]) -> list[dict[str, Any]]:
+        """
+        Send one merged SMS request for ``batch`` and split the responses.
+
+        Transport errors (whole request) and retryable recipient statuses share
+        one retry budget, so a message is sent at most ``max_attempts`` times.
+        """
+        first = batch[0]
+        payload = first.payload
+        numbers = list(dict.fromkeys(number for job in batch for number in job.payload["to"]))
+        self.stats.sms_batches += 1
+        self.stats.sms_batched_messages += len(batch)
+
+        responses: dict[str, dict[str, Any]] = {}
+        pending = numbers
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                result = await self._call(
+                    first.service.deliver_sms,
+                    pending,
+                    payload["message"],
+                    payload["enable_delivery_report"],
+                    payload["tag"],
+                )
+            except Exception as exc:
+                if attempt < self.max_attempts and _is_retryable(exc):
+                    self.stats.retries += 1
+                    delay = self._backoff(attempt)
+                    logger.warning(
+                        "SMS send failed (attempt %d/%d), retrying in %.2fs: %s",
+                        attempt,
+                        self.max_attempts,
+                        delay,
+                        exc,
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+                logger.error("SMS sending failed: %s", exc)
+                if not responses:
+                    return [self._error_result(job, str(exc)) for job in batch]
+                for number in pending:
+                    responses[number] = _failed_recipient(number, str(exc))
+                break
+
+            for entry in result["sent_messages"] + result["failed_messages"]:
+                responses[entry["to"]] = entry
+            pending = [
+                entry["to"]
+                for entry in result["failed_messages"]
+                if entry.get("http_status_code") in RETRYABLE_STATUS
+            ]
+            if not pending or attempt == self.max_attempts:
+                break
+            self.stats.retries += 1
+            await asyncio.sleep(self._backoff(attempt))
+
+        results = []
+        for job in batch:
+            entries = [
+                responses.get(number) or _failed_recipient(number, "No response for recipient")
+                for number in job.payload["to"]
+            ]
+            sent = [entry for entry in entries if entry["successful"]]
+            failed = [entry for entry in entries if not entry["successful"]]
+            results.append(
+                {
+                    "success": not failed,
+                    "sent_count": len(sent),
+                    "failed_count": len(failed),
+                    "sent_messages": sent,
+                    "failed_messages": failed,
+                    "service": "Azure Communication Services SMS",
+                    "tag": payload["tag"],
+                }
+            )
+        return results
+
+    def _complete(self, job: _Notification, result: dict[str, Any]) -> None:
+        if job.future.done():
+            return
+        if result.get("success"):
+            self.stats.delivered += 1
+        else:
+            self.stats.failed += 1
+        job.future.set_result(result)
+        if job.admitted:
+            self._capacity.release()
+        if job.callback is not None:
+            try:
+                job.callback(result)
+            except Exception as exc:
+                logger.error("Notification callback failed: %s", exc, exc_info=True)
+
+    @staticmethod
+    def _error_result(job: _Notification, error: str) -> dict[str, Any]:
+        if job.kind == _EMAIL:
+            return {"success": False, "error": f"Azure Email error: {error}"}
+        return {
+            "success": False,
+            "error": f"Azure SMS error: {error}",
+            "sent_messages": [],
+            "failed_messages": [],
+        }
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """True for errors raised before ACS accepted the request, so resending is safe."""
+    if isinstance(exc, (ConnectionError, ServiceRequestError)):
+        return True
+    return isinstance(exc, HttpResponseError) and exc.status_code in RETRYABLE_STATUS
+
+
+def _failed_recipient(number: str, error: str) -> dict[str, Any]:
+    return {
+        "to": number,
+        "message_id": None,
+        "http_status_code": None,
+        "successful": False,
+        "error_message": error,
+    }
+
+
+_DISPATCHER: NotificationDispatcher | None = None
+_DISPATCHER_LOCK = threading.Lock()
+
+
+def get_notification_dispatcher() -> NotificationDispatcher:
+    """Return the process-wide notification dispatcher."""
+    global _DISPATCHER
+    with _DISPATCHER_LOCK:
+        if _DISPATCHER is None:
+            _DISPATCHER = NotificationDispatcher(
+                workers=int(os.getenv("NOTIFICATION_WORKERS", "4")),
+                queue_size=int(os.getenv("NOTIFICATION_QUEUE_SIZE", "256")),
+                max_attempts=int(os.getenv("NOTIFICATION_MAX_ATTEMPTS", "3")),
+            )
+        return _DISPATCHER
+
+
+def set_notification_dispatcher(dispatcher: NotificationDispatcher | None) -> None:
+    """Replace the process-wide dispatcher (for testing)."""
+    global _DISPATCHER
+    with _DISPATCHER_LOCK:
+        _DISPATCHER = dispatcher
+
+
+__all__ = [
+    "DispatcherStats",
+    "NotificationDispatcher",
+    "RETRYABLE_STATUS",
+    "get_notification_dispatcher",
+    "set_notification_dispatcher",
+]
@@ -8,13 +8,14 @@ Supports delivery reports and custom tagging for message tracking.
 
 from __future__ import annotations
 
-import asyncio
 import os
 import threading
 from typing import Any
 
 from utils.ml_logging import get_logger
 
+from .notification_dispatcher import get_notification_dispatcher
+
 # SMS service imports
 try:
     from azure.communication.sms import SmsClient
@@ -33,11 +34,83 @@ class SmsService:
         """Initialize the SMS service with Azure configuration."""
         self.connection_string = os.getenv("AZURE_COMMUNICATION_SMS_CONNECTION_STRING")
         self.from_phone_number = os.getenv("AZURE_SMS_FROM_PHONE_NUMBER")
+        self._client: SmsClient | None = None
+        self._client_lock = threading.Lock()
 
     def is_configured(self) -> bool:
         """Check if SMS service is properly configured."""
         return AZURE_SMS_AVAILABLE and bool(self.connection_string) and bool(self.from_phone_number)
 
+    def _get_client(self) -> SmsClient:
+        """Return the shared SMS client, creating it on first use."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = SmsClient.from_connection_string(self.connection_string)
+        return self._client
+
+    def deliver_sms(
+        self,
+        to_phone_numbers: list[str],
+        message: str,
+        enable_delivery_report: bool = True,
+        tag: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Send one SMS request synchronously with the shared client (single attempt).
+
+        Called by the notification dispatcher on its executor, possibly with
+        the recipients of several merged sends; transport errors propagate so
+        the dispatcher can retry them.
+        """
+        sms_responses = self._get_client().send(
+            from_=self.from_phone_number,
+            to=to_phone_numbers,
+            message=message,
+            enable_delivery_report=enable_delivery_report,
+            tag=tag or "ARTAgent SMS",
+        )
+
+        # Process responses
+        sent_messages = []
+        failed_messages = []
+
+        for response in sms_responses:
+            message_data = {
+                "to": response.to,
+                "message_id": response.message_id,
+                "http_status_code": response.http_status_code,
+                "successful": response.successful,
+                "error_message": (
+                    response.error_message if hasattr(response, "error_message") else None
+                ),
+            }
+
+            if response.successful:
+                sent_messages.append(message_data)
+                logger.info(
+                    "📱 SMS sent successfully to %s, message ID: %s",
+                    response.to,
+                    response.message_id,
+                )
+            else:
+                failed_messages.append(message_data)
+                logger.error(
+                    "📱 SMS failed to %s: %s",
+                    response.to,
+                    message_data["error_message"] or "Unknown error",
+                )
+
+        return {
+            "success": len(failed_messages) == 0,
+            "sent_count": len(sent_messages),
+            "failed_count": len(failed_messages),
+            "sent_messages": sent_messages,
+            "failed_messages": failed_messages,
+            "service": "Azure Communication Services SMS",
+            "tag": tag or "ARTAgent SMS",
+        }
+
     async def send_sms(
         self,
         to_phone_numbers: str | list[str],
@@ -48,6 +121,10 @@ class SmsService:
         """
         Send SMS using Azure Communication Services SMS.
 
+        Delivery runs on the shared notification dispatcher, which merges
+        identical messages queued together into one request and retries
+        throttled recipients.
+
         Args:
             to_phone_numbers: Recipient phone number(s) - can be single string or list
             message: SMS message content
@@ -57,83 +134,21 @@ class SmsService:
         Returns:
             Dict containing success status, message IDs, and error details if any
         """
-        try:
-            if not self.is_configured():
-                return {
-                    "success": False,
-                    "error": "Azure SMS service not configured or not available",
-                    "sent_messages": [],
-                }
-
-            # Ensure phone numbers is a list
-            if isinstance(to_phone_numbers, str):
-                to_phone_numbers = [to_phone_numbers]
-
-            # Create SMS client
-            sms_client = SmsClient.from_connection_string(self.connection_string)
-
-            # Send SMS
-            sms_responses = sms_client.send(
-                from_=self.from_phone_number,
-                to=to_phone_numbers,
-                message=message,
-                enable_delivery_report=enable_delivery_report,
-                tag=tag or "ARTAgent SMS",
-            )
-
-            # Process responses
-            sent_messages = []
-            failed_messages = []
-
-            for response in sms_responses:
-                message_data = {
-                    "to": response.to,
-                    "message_id": response.message_id,
-                    "http_status_code": response.http_status_code,
-                    "successful": response.successful,
-                    "error_message": (
-                        response.error_message if hasattr(response, "error_message") else None
-                    ),
-                }
-
-                if response.successful:
-                    sent_messages.append(message_data)
-                    logger.info(
-                        "📱 SMS sent successfully to %s, message ID: %s",
-                        response.to,
-                        response.message_id,
-                    )
-                else:
-                    failed_messages.append(message_data)
-                    logger.error(
-                        "📱 SMS failed to %s: %s",
-                        response.to,
-                        (
-                            response.error_message
-                            if hasattr(response, "error_message")
-                            else "Unknown error"
-                        ),
-                    )
-
-            return {
-                "success": len(failed_messages) == 0,
-                "sent_count": len(sent_messages),
-                "failed_count": len(failed_messages),
-                "sent_messages": sent_messages,
-                "failed_messages": failed_messages,
-                "service": "Azure Communication Services SMS",
-                "tag": tag or "ARTAgent SMS",
-            }
-
-        except Exception as exc:
-            logger.error("SMS sending failed: %s", exc)
+        if not self.is_configured():
             return {
                 "success": False,
-                "error": f"Azure SMS error: {str(exc)}",
+                "error": "Azure SMS service not configured or not available",
                 "sent_messages": [],
-                "failed_messages": [],
             }
 
+        # Ensure phone numbers is a list
+        if isinstance(to_phone_numbers, str):
+            to_phone_numbers = [to_phone_numbers]
+
+        return await get_notification_dispatcher().send_sms(
+            self, to_phone_numbers, message, enable_delivery_report, tag
+        )
+
     def send_sms_background(
         self,
         to_phone_numbers: str | list[str],
@@ -143,7 +158,11 @@ class SmsService:
         callback: callable | None = None,
     ) -> None:
         """
-        Send SMS in background thread without blocking the main response.
+        Send SMS in the background without blocking the main response.
+
+        The SMS is queued on the shared notification dispatcher; if its
+        backlog is full the SMS is dropped and ``callback`` receives an error
+        result.
 
         Args:
             to_phone_numbers: Recipient phone number(s) - can be single string or list
@@ -152,42 +171,25 @@ class SmsService:
             tag: Optional tag for message tracking
             callback: Optional callback function to handle the result
         """
-
-        def _send_sms_background_task():
-            try:
-                # Create new event loop for background task
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-
-                # Send the SMS
-                result = loop.run_until_complete(
-                    self.send_sms(to_phone_numbers, message, enable_delivery_report, tag)
+        if not self.is_configured():
+            logger.warning("📱 Background SMS skipped: service not configured")
+            if callback:
+                callback(
+                    {
+                        "success": False,
+                        "error": "Azure SMS service not configured or not available",
+                        "sent_messages": [],
+                    }
                 )
+            return
+
+        if isinstance(to_phone_numbers, str):
+            to_phone_numbers = [to_phone_numbers]
 
-                # Log result
-                if result.get("success"):
-                    logger.info(
-                        "📱 Background SMS sent successfully: %d messages",
-                        result.get("sent_count", 0),
-                    )
-                else:
-                    logger.warning("📱 Background SMS failed: %s", result.get("error"))
-
-                # Call callback if provided
-                if callback:
-                    callback(result)
-
-            except Exception as exc:
-                logger.error("Background SMS task failed: %s", exc, exc_info=True)
-            finally:
-                loop.close()
-
-        try:
-            sms_thread = threading.Thread(target=_send_sms_background_task, daemon=True)
-            sms_thread.start()
-            logger.info("📱 SMS sending started in background thread")
-        except Exception as exc:
-            logger.error("Failed to start background SMS thread: %s", exc)
+        get_notification_dispatcher().send_sms_background(
+            self, to_phone_numbers, message, enable_delivery_report, tag, callback
+        )
+        logger.info("📱 SMS queued for background delivery")
 
 
 # Global SMS service instance
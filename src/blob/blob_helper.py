@@ -788,6 +788,49 @@ class AzureBlobHelper:
                 duration_ms=duration,
             )
 
+    async def open_recording(
+        self,
+        call_id: str,
+        sample_rate: int = 16000,
+        container_name: str | None = None,
+        **sink_options,
+    ):
+        """
+        Start an in-call recording that uploads staged blocks as audio arrives.
+
+        The blob is written to the same ``audio/{date}/{call_id}.wav`` path as
+        ``save_wav_to_blob`` and only becomes visible when the sink is closed.
+
+        Args:
+            call_id: Unique call identifier
+            sample_rate: Recording sample rate in Hz
+            container_name: Container name (uses default if not provided)
+            **sink_options: Extra ``CallRecordingSink`` options (block size, etc.)
+
+        Returns:
+            Started CallRecordingSink
+        """
+        from .recording_sink import AzureBlockStore, CallRecordingSink
+
+        if not call_id or not call_id.strip():
+            raise ValueError("Call ID is required and cannot be empty")
+
+        start_time = datetime.now(UTC)
+        container_name = container_name or self.container_name
+        blob_name = f"audio/{start_time.strftime('%Y-%m-%d')}/{call_id}.wav"
+
+        service = await self._get_blob_service()
+        blob_client = service.get_blob_client(container=container_name, blob=blob_name)
+        sink = CallRecordingSink(
+            AzureBlockStore(blob_client),
+            sample_rate=sample_rate,
+            metadata={"call_id": call_id, "created_at": start_time.isoformat()},
+            **sink_options,
+        )
+        await sink.start()
+        logger.info(f"Recording call '{call_id}' to '{blob_name}' as staged blocks")
+        return sink
+
     async def close(self):
         """Clean up resources."""
         if self._blob_service:
@@ -0,0 +1,513 @@
+"""
+Streaming Call Recording Sink
+=============================
+
+Records a call while it is in progress and uploads it as staged blob blocks.
+
+``AzureBlobHelper.save_wav_to_blob`` / ``stream_wav_to_blob`` upload a complete
+recording after hangup, so the whole call sits in memory (or on disk) and the
+upload lands on the end-of-call path. ``CallRecordingSink`` instead taps the
+PCM that already flows through the media handler and TTS playback:
+
+- Caller (inbound) and agent (outbound) audio become the left/right channels
+  of a 16-bit stereo WAV. Agent audio is placed on the caller timeline, so
+  faster-than-real-time TTS sends and silent gaps line up as heard.
+- Encoded audio is cut into fixed-size blocks that a background task stages
+  (``stage_block``) while the call continues.
+- At hangup only the tail block and the 44-byte WAV header are staged, then
+  the block list is committed with the header first. The header is written
+  last, so it carries the final sizes without rewriting any data.
+- Memory is bounded by ``max_pending_blocks * block_size`` plus one pending
+  block; if storage falls that far behind, further audio is dropped and counted
+  instead of buffered.
+
+Storage is pluggable through ``BlockStore``: ``AzureBlockStore`` wraps an
+async ``BlobClient`` (Azure or Azurite), and ``FilesystemBlockStore`` writes
+blocks to a local directory for tests and development.
+
+Usage:
+    from src.blob.recording_sink import CallRecordingSink, FilesystemBlockStore
+
+    sink = CallRecordingSink(FilesystemBlockStore("/tmp/rec/call.wav"), sample_rate=16000)
+    await sink.start()
+    sink.write_inbound(pcm_from_caller)
+    sink.write_outbound(pcm_from_tts)
+    result = await sink.close()  # BlobOperationResult
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import shutil
+import struct
+import time
+from array import array
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Protocol
+
+import numpy as np
+from utils.ml_logging import get_logger
+
+from src.pools.executors import BACKGROUND, run_blocking
+
+from .blob_helper import BlobOperationResult, BlobOperationType
+
+logger = get_logger("blob.recording_sink")
+
+BYTES_PER_SAMPLE = 2
+CHANNELS = 2
+WAV_HEADER_SIZE = 44
+DEFAULT_BLOCK_SIZE = 4 * 1024 * 1024
+# Anti-aliasing FIR length per unit of decimation factor
+DECIMATION_TAPS_PER_FACTOR = 32
+
+
+def wav_header(data_size: int, sample_rate: int, channels: int = CHANNELS) -> bytes:
+    """Return a 44-byte PCM16 WAV header for ``data_size`` bytes of audio."""
+    block_align = channels * BYTES_PER_SAMPLE
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + data_size,
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,
+        channels,
+        sample_rate,
+        sample_rate * block_align,
+        block_align,
+        BYTES_PER_SAMPLE * 8,
+        b"data",
+        data_size,
+    )
+
+
+@lru_cache(maxsize=8)
+def _lowpass_taps(factor: int) -> np.ndarray:
+    """Windowed-sinc low-pass for decimating by ``factor``.
+
+    Cutoff is 90% of the output Nyquist frequency, with unit gain at DC.
+    """
+    count = DECIMATION_TAPS_PER_FACTOR * factor + 1
+    n = np.arange(count) - (count - 1) / 2
+    cutoff = 0.45 / factor  # cycles per input sample
+    taps = 2 * cutoff * np.sinc(2 * cutoff * n) * np.hamming(count)
+    return taps / taps.sum()
+
+
+def _block_id(index: int) -> str:
+    # Block IDs within a blob must all have the same encoded length
+    return base64.b64encode(f"{index:08d}".encode()).decode()
+
+
+class BlockStore(Protocol):
+    """Destination that accepts staged blocks and commits them in order."""
+
+    name: str
+
+    async def stage_block(self, block_id: str, data: bytes) -> None: ...
+
+    async def commit(self, block_ids: list[str], metadata: dict[str, str]) -> None: ...
+
+    async def abort(self) -> None: ...
+
+
+class AzureBlockStore:
+    """``BlockStore`` backed by an async Azure ``BlobClient`` (also works with Azurite)."""
+
+    def __init__(self, blob_client: Any, content_type: str = "audio/wav") -> None:
+        self._client = blob_client
+        self._content_type = content_type
+        self.name = blob_client.blob_name
+        self.container_name = getattr(blob_client, "container_name", None)
+
+    async def stage_block(self, block_id: str, data: bytes) -> None:
+        await self._client.stage_block(block_id, data, length=len(data))
+
+    async def commit(self, block_ids: list[str], metadata: dict[str, str]) -> None:
+        from azure.storage.blob import BlobBlock, ContentSettings
+
+        await self._client.commit_block_list(
+            [BlobBlock(block_id=block_id) for block_id in block_ids],
+            content_settings=ContentSettings(content_type=self._content_type),
+            metadata=metadata,
+        )
+
+    async def abort(self) -> None:
+        # Uncommitted blocks are garbage-collected by the service after 7 days
+        return None
+
+
+class FilesystemBlockStore:
+    """
+    ``BlockStore`` that stages blocks as files and concatenates them on commit.
+
+    :param path: Final file path; blocks are staged in ``<path>.blocks/``
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.name = str(self.path)
+        self.container_name = None
+        self._staging = self.path.with_name(self.path.name + ".blocks")
+
+    def _block_path(self, block_id: str) -> Path:
+        return self._staging / base64.urlsafe_b64encode(block_id.encode()).decode()
+
+    async def stage_block(self, block_id: str, data: bytes) -> None:
+        await run_blocking(BACKGROUND, self._write_block, block_id, data)
+
+    async def commit(self, block_ids: list[str], metadata: dict[str, str]) -> None:
+        await run_blocking(BACKGROUND, self._commit, block_ids)
+
+    async def abort(self) -> None:
+        await run_blocking(BACKGROUND, shutil.rmtree, self._staging, True, critical=False)
+
+    def _write_block(self, block_id: str, data: bytes) -> None:
+        self._staging.mkdir(parents=True, exist_ok=True)
+        self._block_path(block_id).write_bytes(data)
+
+    def _commit(self, block_ids: list[str]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("wb") as out:
+            for block_id in block_ids:
+                with self._block_path(block_id).open("rb") as block:
+                    shutil.copyfileobj(block, out)
+        shutil.rmtree(self._staging, ignore_errors=True)
+
+
+@dataclass
+class RecordingStats:
+    """Counters for one recording."""
+
+    inbound_bytes: int = 0
+    outbound_bytes: int = 0
+    data_bytes: int = 0
+    blocks_staged: int = 0
+    stage_retries: int = 0
+    dropped_bytes: int = 0
+    tap_errors: int = 0
+    peak_buffered_bytes: int = 0
+    commit_ms: float | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for logging/telemetry."""
+        return {
+            "inbound_bytes": self.inbound_bytes,
+            "outbound_bytes": self.outbound_bytes,
+            "data_bytes": self.data_bytes,
+            "blocks_staged": self.blocks_staged,
+            "stage_retries": self.stage_retries,
+            "dropped_bytes": self.dropped_bytes,
+            "tap_errors": self.tap_errors,
+            "peak_buffered_bytes": self.peak_buffered_bytes,
+            "commit_ms": round(self.commit_ms, 2) if self.commit_ms is not None else None,
+        }
+
+
+class CallRecordingSink:
+    """
+    Incremental stereo WAV recorder that uploads staged blocks in the background.
+
+    ``write_*`` methods are synchronous, never wait on storage and never
+    raise (failures are counted in ``stats.tap_errors``), so they can be
+    called straight from the audio path.
+
+    :param store: Block destination
+    :param sample_rate: Recording sample rate; outbound audio at an integer
+        multiple of it is low-pass filtered and decimated to match
+    :param block_size: Bytes per staged block
+    :param max_pending_blocks: Blocks allowed to wait for upload before audio
+        is dropped
+    :param max_attempts: Attempts per block before the recording is failed
+    :param metadata: Blob metadata written on commit
+    """
+
+    def __init__(
+        self,
+        store: BlockStore,
+        *,
+        sample_rate: int = 16000,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        max_pending_blocks: int = 4,
+        max_attempts: int = 3,
+        metadata: dict[str, str] | None = None,
+    ) -> None:
+        self.store = store
+        self.sample_rate = sample_rate
+        # Keep blocks frame-aligned so every block holds whole stereo samples
+        frame = CHANNELS * BYTES_PER_SAMPLE
+        self.block_size = max(frame, block_size - block_size % frame)
+        self.max_pending_blocks = max_pending_blocks
+        self.max_attempts = max_attempts
+        self.metadata = dict(metadata or {})
+        self.stats = RecordingStats()
+
+        # Per-channel mono samples not yet interleaved, starting at ``_emitted``
+        self._inbound = bytearray()
+        self._outbound = bytearray()
+        self._emitted = 0
+        # Decimation state carried across outbound chunks: (rate, history, skip)
+        self._decimator: tuple[int, np.ndarray, int] | None = None
+        self._encoded = bytearray()
+        self._block_ids: list[str] = []
+        self._queue: asyncio.Queue | None = None
+        self._task: asyncio.Task | None = None
+        self._error: BaseException | None = None
+        self._closed = False
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def buffered_bytes(self) -> int:
+        """Bytes held in memory (unemitted channels, pending and queued blocks)."""
+        queued = self._queue.qsize() * self.block_size if self._queue else 0
+        return len(self._inbound) + len(self._outbound) + len(self._encoded) + queued
+
+    async def start(self) -> None:
+        """Start the background block uploader."""
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_pending_blocks)
+        self._task = asyncio.create_task(self._upload_loop(), name=f"recording:{self.store.name}")
+
+    # ------------------------------------------------------------------ #
+    # Audio taps
+    # ------------------------------------------------------------------ #
+
+    def write_inbound(self, pcm: bytes) -> None:
+        """Append caller PCM16 mono audio; it advances the recording timeline."""
+        if self._closed or not pcm:
+            return
+        try:
+            self._append_inbound(pcm)
+        except Exception as err:
+            self._tap_failed("inbound", err)
+
+    def _append_inbound(self, pcm: bytes) -> None:
+        self.stats.inbound_bytes += len(pcm)
+        self._inbound += pcm[: len(pcm) - len(pcm) % BYTES_PER_SAMPLE]
+        self._emit(self._emitted + len(self._inbound) // BYTES_PER_SAMPLE)
+
+    def write_inbound_silence(self, duration_ms: float) -> None:
+        """Advance the caller timeline for frames the transport marked silent."""
+        samples = int(self.sample_rate * duration_ms / 1000)
+        if samples > 0:
+            self.write_inbound(bytes(samples * BYTES_PER_SAMPLE))
+
+    def write_outbound(self, pcm: bytes, sample_rate: int | None = None) -> None:
+        """
+        Append agent PCM16 mono audio.
+
+        Audio starts no earlier than the current caller position, so gaps
+        between utterances are recorded as silence on the agent channel.
+        """
+        if self._closed or not pcm:
+            return
+        try:
+            self._append_outbound(pcm, sample_rate or self.sample_rate)
+        except Exception as err:
+            self._tap_failed("outbound", err)
+
+    def _append_outbound(self, pcm: bytes, sample_rate: int) -> None:
+        self.stats.outbound_bytes += len(pcm)
+        pcm = self._resample(pcm, sample_rate)
+        inbound_end = len(self._inbound)
+        if len(self._outbound) < inbound_end:
+            self._outbound += bytes(inbound_end - len(self._outbound))
+        self._outbound += pcm
+        if len(self._outbound) - len(self._inbound) > self.block_size:
+            # No caller audio is arriving; let the agent channel drive the timeline
+            self._emit(self._emitted + len(self._outbound) // BYTES_PER_SAMPLE)
+        self._track_peak()
+
+    def _tap_failed(self, channel: str, err: Exception) -> None:
+        # Recording must never break the call: count the failure and carry on
+        self.stats.tap_errors += 1
+        if self.stats.tap_errors == 1:
+            logger.warning("Recording %s skipped %s audio: %s", self.store.name, channel, err)
+
+    def _resample(self, pcm: bytes, sample_rate: int) -> bytes:
+        pcm = pcm[: len(pcm) - len(pcm) % BYTES_PER_SAMPLE]
+        if sample_rate == self.sample_rate:
+            return pcm
+        factor = sample_rate // self.sample_rate
+        if factor < 2 or sample_rate % self.sample_rate:
+            raise ValueError(
+                f"Cannot record {sample_rate} Hz audio into a {self.sample_rate} Hz recording"
+            )
+        taps = _lowpass_taps(factor)
+        if self._decimator is None or self._decimator[0] != sample_rate:
+            # Skip the filter delay so agent audio keeps its place on the timeline
+            self._decimator = (sample_rate, np.zeros(len(taps) - 1), (len(taps) - 1) // 2)
+        _, history, skip = self._decimator
+        samples = np.concatenate([history, np.frombuffer(pcm, dtype="<i2")])
+        filtered = np.convolve(samples, taps, mode="valid")[skip::factor]
+        consumed = len(samples) - len(history)
+        skip = skip - consumed if skip >= consumed else (skip - consumed) % factor
+        self._decimator = (sample_rate, samples[consumed:], skip)
+        return np.clip(np.rint(filtered), -32768, 32767).astype("<i2").tobytes()
+
+    def _emit(self, up_to: int) -> None:
+        """Interleave both channels up to sample ``up_to`` into the block buffer."""
+        count = up_to - self._emitted
+        if count <= 0:
+            return
+        size = count * BYTES_PER_SAMPLE
+        left = array("h", self._inbound[:size].ljust(size, b"\0"))
+        right = array("h", self._outbound[:size].ljust(size, b"\0"))
+        del self._inbound[:size]
+        del self._outbound[:size]
+        frames = array("h", bytes(size * CHANNELS))
+        frames[0::2] = left
+        frames[1::2] = right
+        self._emitted = up_to
+        self._encoded += frames.tobytes()
+        while len(self._encoded) >= self.block_size:
+            self._cut_block(bytes(self._encoded[: self.block_size]))
+            del self._encoded[: self.block_size]
+        self._track_peak()
+
+    def _cut_block(self, data: bytes) -> None:
+        if self._error is not None or self._queue is None:
+            self.stats.dropped_bytes += len(data)
+            return
+        try:
+            self._queue.put_nowait(data)
+        except asyncio.QueueFull:
+            # Storage is behind: drop audio rather than grow without bound
+            self.stats.dropped_bytes += len(data)
+            logger.warning(
+                "Recording %s dropped %d bytes: %d blocks awaiting upload",
+                self.store.name,
+                len(data),
+                self.max_pending_blocks,
+            )
+            return
+        self.stats.data_bytes += len(data)
+
+    def _track_peak(self) -> None:
+        self.stats.peak_buffered_bytes = max(self.stats.peak_buffered_bytes, self.buffered_bytes)
+
+    # ------------------------------------------------------------------ #
+    # Upload
+    # ------------------------------------------------------------------ #
+
+    async def _upload_loop(self) -> None:
+        while True:
+            data = await self._queue.get()
+            try:
+                if data is None:
+                    return
+                if self._error is None:
+                    await self._stage(data)
+            finally:
+                self._queue.task_done()
+
+    async def _stage(self, data: bytes) -> None:
+        block_id = _block_id(len(self._block_ids) + 1)
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                await self.store.stage_block(block_id, data)
+                self._block_ids.append(block_id)
+                self.stats.blocks_staged += 1
+                return
+            except Exception as err:
+                if attempt == self.max_attempts:
+                    self._error = err
+                    logger.error("Recording %s failed to stage block: %s", self.store.name, err)
+                    return
+                self.stats.stage_retries += 1
+                await asyncio.sleep(0.2 * 2 ** (attempt - 1))
+
+    async def close(self) -> BlobOperationResult:
+        """Flush remaining audio, stage the header and commit the block list."""
+        start = time.perf_counter()
+        container_name = getattr(self.store, "container_name", None)
+        if not self._closed:
+            self._closed = True
+            remaining = max(len(self._inbound), len(self._outbound)) // BYTES_PER_SAMPLE
+            self._emit(self._emitted + remaining)
+            if self._encoded:
+                tail = bytes(self._encoded)
+                self._encoded.clear()
+                if self.running:
+                    await self._queue.put(tail)
+                    self.stats.data_bytes += len(tail)
+                else:
+                    self.stats.dropped_bytes += len(tail)
+            if self.running:
+                await self._queue.put(None)
+                await self._task
+
+        try:
+            if self._error is not None:
+                raise self._error
+            header_id = _block_id(0)
+            header = wav_header(self.stats.data_bytes, self.sample_rate)
+            await self.store.stage_block(header_id, header)
+            metadata = {
+                **self.metadata,
+                "content_type": "audio",
+                "duration_s": f"{self.stats.data_bytes / (self.sample_rate * CHANNELS * BYTES_PER_SAMPLE):.2f}",
+            }
+            await self.store.commit([header_id, *self._block_ids], metadata)
+        except Exception as err:
+            await self.store.abort()
+            error_msg = f"Failed to commit recording '{self.store.name}': {err}"
+            logger.error(error_msg)
+            return BlobOperationResult(
+                success=False,
+                operation_type=BlobOperationType.UPLOAD,
+                blob_name=self.store.name,
+                container_name=container_name,
+                error_message=error_msg,
+                duration_ms=(time.perf_counter() - start) * 1000,
+            )
+
+        self.stats.commit_ms = (time.perf_counter() - start) * 1000
+        logger.info(
+            "Committed recording %s: %d blocks, %d bytes, commit %.1fms",
+            self.store.name,
+            len(self._block_ids) + 1,
+            WAV_HEADER_SIZE + self.stats.data_bytes,
+            self.stats.commit_ms,
+        )
+        return BlobOperationResult(
+            success=True,
+            operation_type=BlobOperationType.UPLOAD,
+            blob_name=self.store.name,
+            container_name=container_name,
+            duration_ms=self.stats.commit_ms,
+            size_bytes=WAV_HEADER_SIZE + self.stats.data_bytes,
+        )
+
+    async def abort(self) -> None:
+        """Stop recording without committing; staged blocks are discarded."""
+        self._closed = True
+        self._inbound.clear()
+        self._outbound.clear()
+        self._encoded.clear()
+        if self.running:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        await self.store.abort()
+
+
+__all__ = [
+    "AzureBlockStore",
+    "BlockStore",
+    "CallRecordingSink",
+    "FilesystemBlockStore",
+    "RecordingStats",
+    "wav_header",
+]
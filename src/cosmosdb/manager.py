@@ -217,6 +217,29 @@ class CosmosDBMongoCoreManager:
             logger.error(f"Failed to upsert document for query {query}: {e}")
             raise
 
+    @_trace_cosmosdb("bulk_write")
+    def bulk_upsert_documents(
+        self, documents: Sequence[dict[str, Any]], key: str = "_id"
+    ) -> pymongo.results.BulkWriteResult:
+        """
+        Upsert many documents in one unordered ``bulk_write`` round trip.
+        :param documents: Documents to upsert; each must contain ``key``.
+        :param key: Field used to match existing documents.
+        :return: The bulk write result.
+        :raises BulkWriteError: If some operations failed; ``details["writeErrors"]``
+            carries the index of each failed document.
+        """
+        operations = [
+            pymongo.UpdateOne({key: document[key]}, {"$set": document}, upsert=True)
+            for document in documents
+        ]
+        result = self.collection.bulk_write(operations, ordered=False)
+        logger.info(
+            f"Bulk upserted {len(operations)} documents "
+            f"(upserted={result.upserted_count}, modified={result.modified_count})"
+        )
+        return result
+
     @_trace_cosmosdb("find_one")
     def read_document(self, query: dict[str, Any]) -> dict[str, Any] | None:
         """
@@ -0,0 +1,318 @@
+"""
+Workload Executors
+==================
+
+Named, bounded thread pools per class of blocking work, so a slow backend
+dependency can only exhaust its own threads.
+
+Blocking calls used to share the event loop's default executor: a Redis or
+Cosmos slowdown parked every default worker thread and TTS synthesis queued
+behind it. Each workload class now has its own pool:
+
+- ``speech_synthesis`` - TTS synthesis and voice warm-up
+- ``speech_recognition`` - STT recognizer start/stop and warm-up
+- ``redis`` - Redis commands issued from async code
+- ``cosmos`` - Cosmos DB reads/writes and blocking tool functions
+- ``background`` - blob uploads, notifications, analytics and other deferrable I/O
+
+Every pool has a queue bound (``max_queue`` tasks waiting for a thread). Work
+is submitted as critical (in-call audio, call-path state) or non-critical
+(warm-ups, indexes, analytics). Non-critical work is shed once the queue
+reaches ``shed_queue``, critical work only at ``max_queue``; shed submissions
+raise ``ExecutorSaturatedError``. Queue wait and run time are tracked as
+quantile sketches alongside utilization and shed counts.
+
+``BoundedExecutor`` is a ``concurrent.futures.Executor``, so it can be passed
+to ``loop.run_in_executor`` anywhere the default executor was used.
+
+Usage:
+    from src.pools.executors import configure_executors, run_blocking
+
+    configure_executors({"redis": 16, "speech_synthesis": 32})
+    value = await run_blocking("redis", redis_mgr.get_value, key)
+    await run_blocking("background", upload, blob, critical=False)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+import time
+from collections.abc import Callable, Mapping
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from utils.ml_logging import get_logger
+
+from src.tools.latency_sketch import QuantileSketch
+
+logger = get_logger("pools.executors")
+
+T = TypeVar("T")
+
+SPEECH_SYNTHESIS = "speech_synthesis"
+SPEECH_RECOGNITION = "speech_recognition"
+REDIS = "redis"
+COSMOS = "cosmos"
+BACKGROUND = "background"
+
+DEFAULT_EXECUTOR_SIZES: dict[str, int] = {
+    SPEECH_SYNTHESIS: 32,
+    SPEECH_RECOGNITION: 8,
+    REDIS: 16,
+    COSMOS: 8,
+    BACKGROUND: 4,
+}
+DEFAULT_QUEUE_PER_WORKER = 8
+
+
+class ExecutorSaturatedError(RuntimeError):
+    """Raised when a submission is shed because the executor's queue is full."""
+
+    def __init__(self, name: str, queued: int, critical: bool) -> None:
+        kind = "critical" if critical else "non-critical"
+        super().__init__(f"Executor '{name}' shed {kind} work with {queued} tasks queued")
+        self.executor_name = name
+        self.queued = queued
+        self.critical = critical
+
+
+class BoundedExecutor(Executor):
+    """
+    Thread pool with a queue bound, priority shedding and wait/run metrics.
+
+    :param name: Workload class name (thread name prefix and metrics label)
+    :param max_workers: Thread count
+    :param max_queue: Waiting tasks at which critical work is shed
+        (default ``max_workers * DEFAULT_QUEUE_PER_WORKER``)
+    :param shed_queue: Waiting tasks at which non-critical work is shed
+        (default half of ``max_queue``)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_workers: int,
+        *,
+        max_queue: int | None = None,
+        shed_queue: int | None = None,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.name = name
+        self.max_workers = max_workers
+        if max_queue is None:
+            max_queue = max_workers * DEFAULT_QUEUE_PER_WORKER
+        self.max_queue = max_queue
+        self.shed_queue = shed_queue if shed_queue is not None else self.max_queue // 2
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"exec-{name}")
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self._peak_queued = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._cancelled = 0
+        self._shed_critical = 0
+        self._shed_non_critical = 0
+        self._busy_s = 0.0
+        self._started_at = time.monotonic()
+        self._wait = QuantileSketch()
+        self._run = QuantileSketch()
+
+    # ------------------------------------------------------------------ #
+    # Submission
+    # ------------------------------------------------------------------ #
+
+    def submit(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> Future[T]:
+        """Submit critical work (the ``Executor`` interface used by ``run_in_executor``)."""
+        return self.submit_work(fn, *args, critical=True, **kwargs)
+
+    def submit_work(
+        self, fn: Callable[..., T], /, *args: Any, critical: bool = True, **kwargs: Any
+    ) -> Future[T]:
+        """
+        Submit ``fn(*args, **kwargs)`` unless the queue is over the shed limit.
+
+        Raises:
+            ExecutorSaturatedError: if the work is shed
+        """
+        limit = self.max_queue if critical else self.shed_queue
+        with self._lock:
+            if self._queued >= limit:
+                if critical:
+                    self._shed_critical += 1
+                else:
+                    self._shed_non_critical += 1
+                raise ExecutorSaturatedError(self.name, self._queued, critical)
+            self._queued += 1
+            self._submitted += 1
+            self._peak_queued = max(self._peak_queued, self._queued)
+        try:
+            future = self._pool.submit(self._execute, time.perf_counter(), fn, args, kwargs)
+        except BaseException:
+            with self._lock:
+                self._queued -= 1
+            raise
+        # Work cancelled while queued never reaches _execute; release its queue slot here
+        future.add_done_callback(self._release_if_cancelled)
+        return future
+
+    def _release_if_cancelled(self, future: Future) -> None:
+        if future.cancelled():
+            with self._lock:
+                self._queued -= 1
+                self._cancelled += 1
+
+    def _execute(self, submitted: float, fn: Callable[..., T], args, kwargs) -> T:
+        started = time.perf_counter()
+        with self._lock:
+            self._queued -= 1
+            self._active += 1
+            self._wait.add(started - submitted)
+        ok = False
+        try:
+            result = fn(*args, **kwargs)
+            ok = True
+            return result
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self._active -= 1
+                self._busy_s += elapsed
+                self._run.add(elapsed)
+                if ok:
+                    self._completed += 1
+                else:
+                    self._failed += 1
+
+    async def run(
+        self, fn: Callable[..., T], /, *args: Any, critical: bool = True, **kwargs: Any
+    ) -> T:
+        """Await ``fn`` on this executor, preserving context vars like ``asyncio.to_thread``."""
+        context = contextvars.copy_context()
+        future = self.submit_work(context.run, fn, *args, critical=critical, **kwargs)
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        self._pool.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+    # ------------------------------------------------------------------ #
+    # Metrics
+    # ------------------------------------------------------------------ #
+
+    @property
+    def queued(self) -> int:
+        return self._queued
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    def snapshot(self) -> dict[str, Any]:
+        """Current load, counters and wait/run percentiles (milliseconds)."""
+        with self._lock:
+            uptime = max(time.monotonic() - self._started_at, 1e-9)
+            return {
+                "name": self.name,
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "shed_queue": self.shed_queue,
+                "active": self._active,
+                "queued": self._queued,
+                "peak_queued": self._peak_queued,
+                "utilization": round(self._active / self.max_workers, 3),
+                "busy_ratio": round(self._busy_s / (uptime * self.max_workers), 4),
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "cancelled": self._cancelled,
+                "shed_critical": self._shed_critical,
+                "shed_non_critical": self._shed_non_critical,
+                "queue_wait_ms": self._wait.summary(1000.0),
+                "run_ms": self._run.summary(1000.0),
+            }
+
+
+# --------------------------------------------------------------------------- #
+# Process-wide executors
+# --------------------------------------------------------------------------- #
+
+_EXECUTORS: dict[str, BoundedExecutor] = {}
+_EXECUTORS_LOCK = threading.Lock()
+
+
+def configure_executors(
+    sizes: Mapping[str, int] | None = None,
+    *,
+    queue_per_worker: int = DEFAULT_QUEUE_PER_WORKER,
+) -> dict[str, BoundedExecutor]:
+    """
+    (Re)create the process-wide executors with ``sizes`` overriding the defaults.
+
+    Existing executors are shut down without waiting; running tasks finish.
+    """
+    resolved = {**DEFAULT_EXECUTOR_SIZES, **(sizes or {})}
+    with _EXECUTORS_LOCK:
+        previous = list(_EXECUTORS.values())
+        _EXECUTORS.clear()
+        for name, workers in resolved.items():
+            _EXECUTORS[name] = BoundedExecutor(
+                name, workers, max_queue=workers * queue_per_worker
+            )
+        created = dict(_EXECUTORS)
+    for executor in previous:
+        executor.shutdown(wait=False)
+    logger.info("Configured executors: %s", {name: e.max_workers for name, e in created.items()})
+    return created
+
+
+def get_executor(name: str) -> BoundedExecutor:
+    """Process-wide executor for workload class ``name`` (created with defaults on first use)."""
+    executor = _EXECUTORS.get(name)
+    if executor is not None:
+        return executor
+    with _EXECUTORS_LOCK:
+        executor = _EXECUTORS.get(name)
+        if executor is None:
+            workers = DEFAULT_EXECUTOR_SIZES.get(name, DEFAULT_EXECUTOR_SIZES[BACKGROUND])
+            executor = _EXECUTORS[name] = BoundedExecutor(name, workers)
+        return executor
+
+
+async def run_blocking(
+    workload: str, fn: Callable[..., T], /, *args: Any, critical: bool = True, **kwargs: Any
+) -> T:
+    """Await blocking ``fn(*args, **kwargs)`` on the ``workload`` executor."""
+    return await get_executor(workload).run(fn, *args, critical=critical, **kwargs)
+
+
+def executor_snapshots() -> dict[str, dict[str, Any]]:
+    return {name: executor.snapshot() for name, executor in list(_EXECUTORS.items())}
+
+
+def shutdown_executors(*, wait: bool = False) -> None:
+    with _EXECUTORS_LOCK:
+        executors = list(_EXECUTORS.values())
+        _EXECUTORS.clear()
+    for executor in executors:
+        executor.shutdown(wait=wait, cancel_futures=not wait)
+
+
+__all__ = [
+    "BACKGROUND",
+    "COSMOS",
+    "DEFAULT_EXECUTOR_SIZES",
+    "REDIS",
+    "SPEECH_RECOGNITION",
+    "SPEECH_SYNTHESIS",
+    "BoundedExecutor",
+    "ExecutorSaturatedError",
+    "configure_executors",
+    "executor_snapshots",
+    "get_executor",
+    "run_blocking",
+    "shutdown_executors",
+]
@@ -8,24 +8,38 @@ Allocation Tiers:
 1. DEDICATED - Per-session cached resource (0ms latency)
 2. WARM - Pre-created resource from pool (<50ms latency)
 3. COLD - On-demand factory call (~200ms latency)
+
+Autoscaling (autoscale=True):
+The warm target follows demand instead of staying at warm_pool_size. An
+ArrivalRateEstimator smooths acquires per second (Holt level + trend), and the
+target covers the arrivals expected while one refill is in flight:
+ceil(rate * creation_time * headroom), clamped to [min_warm_size, max_warm_size].
+Every acquire wakes the refill task, so the pool is topped up as soon as it
+is drained rather than on the next warmup_interval_sec tick.
 """
 
 from __future__ import annotations
 
 import asyncio
+import math
 import time
+from collections import deque
 from collections.abc import Awaitable, Callable
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field
 from typing import Any, Generic, TypeVar
 
 from utils.ml_logging import get_logger
 
 from src.pools.on_demand_pool import AllocationTier
+from src.tools.latency_sketch import QuantileSketch
 
 logger = get_logger(__name__)
 
 T = TypeVar("T")
 
+# Acquires remembered for the recent COLD fraction
+_RECENT_TIER_WINDOW = 100
+
 
 @dataclass
 class WarmablePoolMetrics:
@@ -39,6 +53,77 @@ class WarmablePoolMetrics:
     warm_pool_size: int = 0
     warmup_cycles: int = 0
     warmup_failures: int = 0
+    warm_pool_target: int = 0
+    arrival_rate_per_s: float = 0.0
+    resource_create_ms: float = 0.0
+    refills_triggered: int = 0
+    resources_trimmed: int = 0
+    recent_cold_fraction: float = 0.0
+    acquire_latency_ms: dict[str, dict[str, float]] = field(default_factory=dict)
+
+
+class ArrivalRateEstimator:
+    """
+    Holt (level + trend) smoothing of events per second over fixed buckets.
+
+    Counts are bucketed by ``bucket_sec``; each closed bucket updates the
+    smoothed level and trend. Idle buckets count as zero, so the estimate
+    decays when traffic stops. ``rate()`` also considers the bucket in
+    progress, so a burst registers before its bucket closes.
+
+    Args:
+        bucket_sec: Bucket width in seconds.
+        alpha: Level smoothing factor (0-1, higher reacts faster).
+        beta: Trend smoothing factor (0-1).
+        clock: Monotonic clock, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        *,
+        bucket_sec: float = 1.0,
+        alpha: float = 0.5,
+        beta: float = 0.3,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if bucket_sec <= 0:
+            raise ValueError("bucket_sec must be positive")
+        self._bucket_sec = bucket_sec
+        self._alpha = alpha
+        self._beta = beta
+        self._clock = clock
+        self._bucket_start = clock()
+        self._bucket_count = 0
+        self._level = 0.0
+        self._trend = 0.0
+
+    def record(self, count: int = 1) -> None:
+        self._advance()
+        self._bucket_count += count
+
+    def rate(self, horizon_sec: float = 0.0) -> float:
+        """Expected events per second ``horizon_sec`` from now (never negative)."""
+        self._advance()
+        forecast = self._level + self._trend * (horizon_sec / self._bucket_sec)
+        elapsed = self._clock() - self._bucket_start
+        current = self._bucket_count / max(elapsed, self._bucket_sec / 4)
+        return max(forecast, current, 0.0)
+
+    def _advance(self) -> None:
+        now = self._clock()
+        closed = int((now - self._bucket_start) // self._bucket_sec)
+        if closed <= 0:
+            return
+        # The first closed bucket holds the counts; any further ones were idle
+        for i in range(min(closed, 64)):
+            observed = (self._bucket_count if i == 0 else 0) / self._bucket_sec
+            level = self._alpha * observed + (1 - self._alpha) * (self._level + self._trend)
+            self._trend = self._beta * (level - self._level) + (1 - self._beta) * self._trend
+            self._level = level
+        if closed > 64:
+            self._level = self._trend = 0.0
+        self._bucket_start += closed * self._bucket_sec
+        self._bucket_count = 0
 
 
 class WarmableResourcePool(Generic[T]):
@@ -46,7 +131,8 @@ class WarmableResourcePool(Generic[T]):
     Resource pool with optional pre-warming and session awareness.
 
     When warm_pool_size > 0, maintains a queue of pre-warmed resources for
-    low-latency allocation. Background task replenishes the pool periodically.
+    low-latency allocation. Background task replenishes the pool whenever a
+    resource is taken, and at least every warmup_interval_sec.
 
     When warm_pool_size = 0 (default), behaves like OnDemandResourcePool.
 
@@ -60,6 +146,13 @@ class WarmableResourcePool(Generic[T]):
         session_max_age_sec: Max age for cached session resources (cleanup).
         warm_fn: Optional async function to warm a resource after creation.
                  Should return True on success, False on failure.
+        close_fn: Optional async function releasing a warm resource the pool
+                  drops (shrinking to a lower target or shutting down).
+        autoscale: Size the warm pool from the predicted arrival rate.
+        min_warm_size: Autoscale floor (default warm_pool_size).
+        max_warm_size: Autoscale ceiling (default 4 * warm_pool_size, at least 1).
+        autoscale_headroom: Multiplier on the predicted arrivals per refill.
+        refill_concurrency: Resources created in parallel while refilling.
     """
 
     def __init__(
@@ -73,24 +166,48 @@ class WarmableResourcePool(Generic[T]):
         session_awareness: bool = False,
         session_max_age_sec: float = 1800.0,
         warm_fn: Callable[[T], Awaitable[bool]] | None = None,
+        close_fn: Callable[[T], Awaitable[None]] | None = None,
+        autoscale: bool = False,
+        min_warm_size: int | None = None,
+        max_warm_size: int | None = None,
+        autoscale_headroom: float = 1.5,
+        refill_concurrency: int = 1,
     ) -> None:
         self._factory = factory
         self._name = name
+        self._autoscale = autoscale
+        self._min_warm_size = warm_pool_size if min_warm_size is None else min_warm_size
+        if max_warm_size is None:
+            max_warm_size = max(4 * warm_pool_size, 1) if autoscale else warm_pool_size
+        self._max_warm_size = max(max_warm_size, self._min_warm_size)
+        self._autoscale_headroom = autoscale_headroom
+        self._refill_concurrency = max(1, refill_concurrency)
+        # Current warm target; fixed unless autoscaling
         self._warm_pool_size = warm_pool_size
         self._enable_background_warmup = enable_background_warmup
         self._warmup_interval_sec = warmup_interval_sec
         self._session_awareness = session_awareness
         self._session_max_age_sec = session_max_age_sec
         self._warm_fn = warm_fn
+        self._close_fn = close_fn
 
         # State
         self._ready = asyncio.Event()
         self._shutdown_event = asyncio.Event()
-        self._warm_queue: asyncio.Queue[T] = asyncio.Queue(maxsize=max(1, warm_pool_size))
+        self._warm_queue: asyncio.Queue[T] = asyncio.Queue(
+            maxsize=max(1, warm_pool_size, self._max_warm_size)
+        )
         self._session_cache: dict[str, tuple[T, float]] = {}  # session_id -> (resource, last_used)
         self._lock = asyncio.Lock()
-        self._metrics = WarmablePoolMetrics()
+        self._metrics = WarmablePoolMetrics(warm_pool_target=warm_pool_size)
         self._background_task: asyncio.Task[None] | None = None
+        self._refill_event = asyncio.Event()
+        self._refill_slots = asyncio.Semaphore(self._refill_concurrency)
+        self._refill_tasks: set[asyncio.Task[bool]] = set()
+        self._arrivals = ArrivalRateEstimator()
+        self._create_time_s: float | None = None  # EWMA of factory + warm_fn time
+        self._acquire_latency: dict[str, QuantileSketch] = {}
+        self._recent_tiers: deque[AllocationTier] = deque(maxlen=_RECENT_TIER_WINDOW)
 
     async def prepare(self) -> None:
         """
@@ -103,7 +220,7 @@ class WarmableResourcePool(Generic[T]):
             logger.debug(f"[{self._name}] Pre-warming {self._warm_pool_size} resources...")
             await self._fill_warm_pool()
 
-        if self._enable_background_warmup and self._warm_pool_size > 0:
+        if self._enable_background_warmup and (self._warm_pool_size > 0 or self._autoscale):
             self._background_task = asyncio.create_task(
                 self._background_warmup_loop(),
                 name=f"{self._name}-warmup",
@@ -128,12 +245,18 @@ class WarmableResourcePool(Generic[T]):
                 await asyncio.wait_for(self._background_task, timeout=2.0)
             except (TimeoutError, asyncio.CancelledError):
                 pass
+        refills = list(self._refill_tasks)
+        for task in refills:
+            task.cancel()
+        # Let in-flight refills finish unwinding so what they created ends up
+        # in the warm queue (or is closed by them) before it is drained
+        await asyncio.gather(*refills, return_exceptions=True)
 
         async with self._lock:
             # Clear warm pool
             while not self._warm_queue.empty():
                 try:
-                    self._warm_queue.get_nowait()
+                    await self._close_resource(self._warm_queue.get_nowait())
                 except asyncio.QueueEmpty:
                     break
 
@@ -151,22 +274,7 @@ class WarmableResourcePool(Generic[T]):
 
         Priority: warm pool -> cold (factory).
         """
-        self._metrics.allocations_total += 1
-
-        # Try warm pool first (non-blocking)
-        try:
-            resource = self._warm_queue.get_nowait()
-            self._metrics.allocations_warm += 1
-            self._metrics.warm_pool_size = self._warm_queue.qsize()
-            logger.debug(f"[{self._name}] Acquired WARM resource")
-            return resource
-        except asyncio.QueueEmpty:
-            pass
-
-        # Fall back to cold creation
-        resource = await self._create_warmed_resource()
-        self._metrics.allocations_cold += 1
-        logger.debug(f"[{self._name}] Acquired COLD resource")
+        resource, _ = await self._acquire_from_pool()
         return resource
 
     async def release(self, resource: T | None) -> None:
@@ -186,8 +294,8 @@ class WarmableResourcePool(Generic[T]):
             except Exception as e:
                 logger.warning(f"[{self._name}] Failed to clear session state on release: {e}")
 
-        # Try to return to warm pool if there's space
-        if self._warm_pool_size > 0:
+        # Try to return to warm pool if it is below target
+        if self._warm_queue.qsize() < self._warm_pool_size:
             try:
                 self._warm_queue.put_nowait(resource)
                 self._metrics.warm_pool_size = self._warm_queue.qsize()
@@ -206,14 +314,9 @@ class WarmableResourcePool(Generic[T]):
         Priority: session cache (DEDICATED) -> warm pool (WARM) -> factory (COLD).
         """
         if not self._session_awareness or not session_id:
-            resource = await self.acquire(timeout=timeout)
-            tier = (
-                AllocationTier.WARM
-                if self._metrics.allocations_warm > self._metrics.allocations_cold
-                else AllocationTier.COLD
-            )
-            return resource, tier
+            return await self._acquire_from_pool()
 
+        started = time.perf_counter()
         async with self._lock:
             # Check session cache first
             cached = self._session_cache.get(session_id)
@@ -224,6 +327,7 @@ class WarmableResourcePool(Generic[T]):
                     self._session_cache[session_id] = (resource, time.time())
                     self._metrics.allocations_total += 1
                     self._metrics.allocations_dedicated += 1
+                    self._record_tier(AllocationTier.DEDICATED, started)
                     logger.debug(
                         f"[{self._name}] Acquired DEDICATED resource for session {session_id[:8]}..."
                     )
@@ -233,20 +337,13 @@ class WarmableResourcePool(Generic[T]):
                     self._session_cache.pop(session_id, None)
 
         # Not in session cache - acquire from pool
-        resource = await self.acquire(timeout=timeout)
+        resource, tier = await self._acquire_from_pool()
 
         # Cache for session
         async with self._lock:
             self._session_cache[session_id] = (resource, time.time())
             self._metrics.active_sessions = len(self._session_cache)
 
-        # Determine tier based on where resource came from
-        # (acquire() already updated warm/cold metrics)
-        tier = (
-            AllocationTier.WARM
-            if self._warm_queue.qsize() < self._warm_pool_size
-            else AllocationTier.COLD
-        )
         return resource, tier
 
     async def release_for_session(self, session_id: str | None, resource: T | None = None) -> bool:
@@ -287,6 +384,13 @@ class WarmableResourcePool(Generic[T]):
 
     def snapshot(self) -> dict[str, Any]:
         """Return current pool status for diagnostics."""
+        self._metrics.arrival_rate_per_s = round(self._arrivals.rate(), 3)
+        self._metrics.acquire_latency_ms = {
+            tier: sketch.summary(1000.0) for tier, sketch in self._acquire_latency.items()
+        }
+        if self._recent_tiers:
+            cold = sum(1 for tier in self._recent_tiers if tier == AllocationTier.COLD)
+            self._metrics.recent_cold_fraction = round(cold / len(self._recent_tiers), 3)
         metrics = asdict(self._metrics)
         metrics["timestamp"] = time.time()
         return {
@@ -297,6 +401,11 @@ class WarmableResourcePool(Generic[T]):
             "session_awareness": self._session_awareness,
             "active_sessions": len(self._session_cache),
             "background_warmup": self._enable_background_warmup,
+            "autoscale": (
+                {"min": self._min_warm_size, "max": self._max_warm_size}
+                if self._autoscale
+                else None
+            ),
             "metrics": metrics,
         }
 
@@ -310,8 +419,84 @@ class WarmableResourcePool(Generic[T]):
 
     # ---------- Internal Methods ----------
 
+    async def _acquire_from_pool(self) -> tuple[T, AllocationTier]:
+        """Take a warm resource or create a cold one; wakes the refill task."""
+        started = time.perf_counter()
+        self._metrics.allocations_total += 1
+        self._arrivals.record()
+        self._refill_event.set()
+
+        # Try warm pool first (non-blocking)
+        try:
+            resource = self._warm_queue.get_nowait()
+            self._metrics.allocations_warm += 1
+            self._metrics.warm_pool_size = self._warm_queue.qsize()
+            self._record_tier(AllocationTier.WARM, started)
+            logger.debug(f"[{self._name}] Acquired WARM resource")
+            return resource, AllocationTier.WARM
+        except asyncio.QueueEmpty:
+            pass
+
+        # Fall back to cold creation
+        resource = await self._create_warmed_resource()
+        self._metrics.allocations_cold += 1
+        self._record_tier(AllocationTier.COLD, started)
+        logger.debug(f"[{self._name}] Acquired COLD resource")
+        return resource, AllocationTier.COLD
+
+    def _record_tier(self, tier: AllocationTier, started: float) -> None:
+        sketch = self._acquire_latency.get(tier.value)
+        if sketch is None:
+            sketch = self._acquire_latency[tier.value] = QuantileSketch()
+        sketch.add(time.perf_counter() - started)
+        self._recent_tiers.append(tier)
+
+    def _update_target(self) -> int:
+        """Recompute the autoscaled warm target; returns the target."""
+        if not self._autoscale:
+            return self._warm_pool_size
+        # Without a measured creation time yet, plan for one bucket of arrivals
+        lead_time = self._create_time_s if self._create_time_s is not None else 1.0
+        rate = self._arrivals.rate(horizon_sec=lead_time)
+        self._metrics.arrival_rate_per_s = round(rate, 3)
+        desired = math.ceil(rate * lead_time * self._autoscale_headroom)
+        target = min(max(desired, self._min_warm_size), self._max_warm_size)
+        if target != self._warm_pool_size:
+            logger.debug(
+                f"[{self._name}] Warm target {self._warm_pool_size} -> {target} "
+                f"(rate={rate:.2f}/s, create={lead_time * 1000:.0f}ms)"
+            )
+            self._warm_pool_size = target
+            self._metrics.warm_pool_target = target
+        return target
+
+    async def _trim_warm_pool(self) -> int:
+        """Close warm resources above the current target. Returns number dropped."""
+        trimmed: list[T] = []
+        while self._warm_queue.qsize() > self._warm_pool_size:
+            try:
+                trimmed.append(self._warm_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        if trimmed:
+            self._metrics.resources_trimmed += len(trimmed)
+            self._metrics.warm_pool_size = self._warm_queue.qsize()
+        for resource in trimmed:
+            await self._close_resource(resource)
+        return len(trimmed)
+
+    async def _close_resource(self, resource: T) -> None:
+        """Release a warm resource the pool is dropping via ``close_fn``."""
+        if self._close_fn is None:
+            return
+        try:
+            await self._close_fn(resource)
+        except Exception as e:
+            logger.warning(f"[{self._name}] Failed to close dropped resource: {e}")
+
     async def _create_warmed_resource(self) -> T:
         """Create a new resource and optionally warm it."""
+        started = time.perf_counter()
         resource = await self._factory()
 
         if self._warm_fn is not None:
@@ -320,32 +505,57 @@ class WarmableResourcePool(Generic[T]):
                 if not success:
                     logger.warning(f"[{self._name}] Warmup function returned False")
                     self._metrics.warmup_failures += 1
+            except asyncio.CancelledError:
+                # Pool is stopping: the resource never reaches the warm queue
+                await self._close_resource(resource)
+                raise
             except Exception as e:
                 logger.warning(f"[{self._name}] Warmup function failed: {e}")
                 self._metrics.warmup_failures += 1
 
+        elapsed = time.perf_counter() - started
+        if self._create_time_s is None:
+            self._create_time_s = elapsed
+        else:
+            self._create_time_s = 0.8 * self._create_time_s + 0.2 * elapsed
+        self._metrics.resource_create_ms = round(self._create_time_s * 1000, 1)
         return resource
 
-    async def _fill_warm_pool(self) -> int:
-        """Fill warm pool up to target size. Returns number of resources added."""
-        added = 0
-        target = self._warm_pool_size - self._warm_queue.qsize()
-
-        for _ in range(target):
+    async def _add_warm_resource(self) -> bool:
+        """Create one warm resource (bounded by refill_concurrency). Returns True if added."""
+        async with self._refill_slots:
             if self._shutdown_event.is_set():
-                break
+                return False
             try:
                 resource = await self._create_warmed_resource()
-                self._warm_queue.put_nowait(resource)
-                added += 1
-            except asyncio.QueueFull:
-                break
             except Exception as e:
                 logger.warning(f"[{self._name}] Failed to create warm resource: {e}")
                 self._metrics.warmup_failures += 1
+                return False
+            try:
+                self._warm_queue.put_nowait(resource)
+                return True
+            except asyncio.QueueFull:
+                await self._close_resource(resource)
+                return False
+            finally:
+                self._metrics.warm_pool_size = self._warm_queue.qsize()
 
+    async def _fill_warm_pool(self) -> int:
+        """Fill warm pool up to target size. Returns number of resources added."""
+        missing = self._warm_pool_size - self._warm_queue.qsize() - len(self._refill_tasks)
+        results = await asyncio.gather(*(self._add_warm_resource() for _ in range(missing)))
         self._metrics.warm_pool_size = self._warm_queue.qsize()
-        return added
+        return sum(results)
+
+    def _start_refills(self) -> int:
+        """Start background creation for the current deficit. Returns number started."""
+        missing = self._warm_pool_size - self._warm_queue.qsize() - len(self._refill_tasks)
+        for _ in range(max(0, missing)):
+            task = asyncio.create_task(self._add_warm_resource())
+            self._refill_tasks.add(task)
+            task.add_done_callback(self._refill_tasks.discard)
+        return max(0, missing)
 
     async def _cleanup_stale_sessions(self) -> int:
         """Remove stale session resources. Returns number removed."""
@@ -370,23 +580,41 @@ class WarmableResourcePool(Generic[T]):
         return removed
 
     async def _background_warmup_loop(self) -> None:
-        """Background task that maintains warm pool level and cleans up stale sessions."""
+        """
+        Background task that maintains warm pool level and cleans up stale sessions.
+
+        Wakes on every acquire (or after warmup_interval_sec without one),
+        retargets the pool when autoscaling and starts creating the missing
+        resources without waiting for earlier refills to finish.
+        """
         logger.debug(f"[{self._name}] Background warmup loop started")
+        last_cleanup = time.monotonic()
 
         while not self._shutdown_event.is_set():
             try:
-                await asyncio.sleep(self._warmup_interval_sec)
+                try:
+                    await asyncio.wait_for(
+                        self._refill_event.wait(), timeout=self._warmup_interval_sec
+                    )
+                    self._metrics.refills_triggered += 1
+                except TimeoutError:
+                    pass
+                self._refill_event.clear()
 
                 if self._shutdown_event.is_set():
                     break
 
-                # Refill warm pool
-                added = await self._fill_warm_pool()
-                if added > 0:
-                    logger.debug(f"[{self._name}] Added {added} resources to warm pool")
+                # Retarget, then trim or refill warm pool
+                self._update_target()
+                await self._trim_warm_pool()
+                started = self._start_refills()
+                if started > 0:
+                    logger.debug(f"[{self._name}] Refilling {started} warm resources")
 
                 # Cleanup stale sessions
-                await self._cleanup_stale_sessions()
+                if time.monotonic() - last_cleanup >= self._warmup_interval_sec:
+                    await self._cleanup_stale_sessions()
+                    last_cleanup = time.monotonic()
 
                 self._metrics.warmup_cycles += 1
 
@@ -0,0 +1,334 @@
+"""
+Worker Registry
+===============
+
+Redis registry of the worker processes in a container and of which worker
+owns each call or session, for the multi-process deployment mode.
+
+In multi-worker mode every worker process runs its own event loop, pools and
+connection manager (shared nothing) behind one public port, and the kernel
+hands each incoming connection to an arbitrary worker. State that lives only
+in process memory - call contexts, media handlers, pooled recognizers - must
+therefore be served by the worker that created it. The registry records:
+
+- ``worker:<worker_id>`` - JSON heartbeat with the worker's internal URL and
+  a status payload (pool snapshots, session counts); expires unless refreshed
+- ``workers:<host>`` - sorted set of the host's worker IDs scored by their
+  last heartbeat
+- ``worker_owner:<host>:<kind>:<key>`` - worker ID owning a call
+  (``kind="call"``) or session; claimed with ``SET NX`` by the first worker
+  that touches it and taken over when the owner stops heartbeating. Takeover
+  and release are compare-and-set Lua scripts, so concurrent takeovers of a
+  stopped owner leave exactly one winner
+
+Ownership is scoped to one host: hand-off between workers goes over loopback,
+and cross-replica delivery remains the connection manager's pub/sub bus.
+
+Usage:
+    from src.pools.worker_registry import WorkerIdentity, WorkerRegistry
+
+    identity = WorkerIdentity.from_env()      # None in single-process mode
+    registry = WorkerRegistry(redis_mgr, identity)
+    owner = await registry.claim_async("call", call_connection_id)
+    if owner.worker_id != identity.worker_id:
+        ...  # hand off to owner.internal_url
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import socket
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any
+
+from utils.ml_logging import get_logger
+
+from src.pools.executors import REDIS, run_blocking
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from src.redis.manager import AzureRedisManager
+
+logger = get_logger("pools.worker_registry")
+
+WORKER_KEY_PREFIX = "worker:"
+HOST_WORKERS_KEY_PREFIX = "workers:"
+OWNER_KEY_PREFIX = "worker_owner:"
+
+# Environment set by the worker supervisor for each child process
+WORKER_INDEX_ENV = "ARTAGENT_WORKER_INDEX"
+WORKER_INTERNAL_PORT_ENV = "ARTAGENT_WORKER_INTERNAL_PORT"
+
+DEFAULT_HEARTBEAT_TTL_S = 15.0
+DEFAULT_OWNER_TTL_S = 4 * 3600.0
+# Takeovers attempted before giving up when every new winner is also stopped
+MAX_TAKEOVER_ROUNDS = 3
+
+# Replace the claim only if it is still held by ARGV[1] (or gone); returns the owner
+_TAKEOVER_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if current == false or current == ARGV[1] then
+    redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+    return ARGV[2]
+end
+return current
+"""
+
+# Delete the claim only if it is held by ARGV[1]
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+@dataclass(frozen=True)
+class WorkerIdentity:
+    """Identity and loopback address of one worker process."""
+
+    worker_id: str
+    host: str
+    index: int
+    pid: int
+    internal_url: str
+
+    @classmethod
+    def create(cls, index: int, internal_port: int, *, host: str | None = None) -> WorkerIdentity:
+        host = host or os.getenv("HOSTNAME") or socket.gethostname()
+        pid = os.getpid()
+        return cls(
+            worker_id=f"{host}:{index}:{pid}",
+            host=host,
+            index=index,
+            pid=pid,
+            internal_url=f"http://127.0.0.1:{internal_port}",
+        )
+
+    @classmethod
+    def from_env(cls) -> WorkerIdentity | None:
+        """Identity of this process when started by the worker supervisor, else ``None``."""
+        index = os.getenv(WORKER_INDEX_ENV)
+        port = os.getenv(WORKER_INTERNAL_PORT_ENV)
+        if index is None or port is None:
+            return None
+        return cls.create(int(index), int(port))
+
+
+class WorkerRegistry:
+    """
+    Worker heartbeats and call/session ownership for one host.
+
+    :param redis_mgr: Redis manager whose client and retry policy are used
+    :param identity: This worker's identity
+    :param heartbeat_ttl_s: A worker is considered gone this long after its
+        last heartbeat; heartbeats should run at a third of this or faster
+    :param owner_ttl_s: Upper bound on how long an ownership claim lives
+    """
+
+    def __init__(
+        self,
+        redis_mgr: AzureRedisManager,
+        identity: WorkerIdentity,
+        *,
+        heartbeat_ttl_s: float = DEFAULT_HEARTBEAT_TTL_S,
+        owner_ttl_s: float = DEFAULT_OWNER_TTL_S,
+    ) -> None:
+        self._mgr = redis_mgr
+        self.identity = identity
+        self.heartbeat_ttl_s = heartbeat_ttl_s
+        self.owner_ttl_s = owner_ttl_s
+        self._task: asyncio.Task | None = None
+
+    @property
+    def worker_id(self) -> str:
+        return self.identity.worker_id
+
+    def _owner_key(self, kind: str, key: str) -> str:
+        return f"{OWNER_KEY_PREFIX}{self.identity.host}:{kind}:{key}"
+
+    def _host_key(self) -> str:
+        return f"{HOST_WORKERS_KEY_PREFIX}{self.identity.host}"
+
+    def _call(self, name: str, operation: Callable[[Any], Any]) -> Any:
+        client = self._mgr.redis_client
+        return self._mgr._execute_with_retry(name, lambda: operation(client))
+
+    # ------------------------------------------------------------------ #
+    # Workers
+    # ------------------------------------------------------------------ #
+
+    def heartbeat(self, status: dict[str, Any] | None = None, *, now: float | None = None) -> None:
+        """Publish this worker's identity and ``status``; keeps its claims valid."""
+        now = time.time() if now is None else now
+        payload = json.dumps(
+            {**asdict(self.identity), "status": status or {}, "updated_at": now}, default=str
+        )
+
+        def _operation(client):
+            pipe = client.pipeline(transaction=False)
+            pipe.set(f"{WORKER_KEY_PREFIX}{self.worker_id}", payload, ex=int(self.heartbeat_ttl_s))
+            pipe.zadd(self._host_key(), {self.worker_id: now})
+            pipe.zremrangebyscore(self._host_key(), "-inf", f"({now - self.heartbeat_ttl_s}")
+            return pipe.execute()
+
+        self._call("worker_heartbeat", _operation)
+
+    def worker_info(self, worker_id: str) -> dict[str, Any] | None:
+        raw = self._call("worker_info", lambda c: c.get(f"{WORKER_KEY_PREFIX}{worker_id}"))
+        return json.loads(raw) if raw else None
+
+    def workers(self, *, now: float | None = None) -> list[dict[str, Any]]:
+        """Heartbeats of every live worker on this host, ordered by worker index."""
+        now = time.time() if now is None else now
+        worker_ids = self._call(
+            "workers_list",
+            lambda c: c.zrangebyscore(self._host_key(), now - self.heartbeat_ttl_s, "+inf"),
+        )
+        if not worker_ids:
+            return []
+        keys = [f"{WORKER_KEY_PREFIX}{worker_id}" for worker_id in worker_ids]
+        raw = self._call("workers_info", lambda c: c.mget(keys))
+        infos = [json.loads(item) for item in raw if item]
+        return sorted(infos, key=lambda info: info.get("index", 0))
+
+    def deregister(self) -> None:
+        def _operation(client):
+            pipe = client.pipeline(transaction=False)
+            pipe.delete(f"{WORKER_KEY_PREFIX}{self.worker_id}")
+            pipe.zrem(self._host_key(), self.worker_id)
+            return pipe.execute()
+
+        self._call("worker_deregister", _operation)
+
+    # ------------------------------------------------------------------ #
+    # Ownership
+    # ------------------------------------------------------------------ #
+
+    def claim(self, kind: str, key: str) -> WorkerIdentity:
+        """
+        Return the owner of ``kind``/``key``, claiming it for this worker if unowned.
+
+        A claim held by a worker that stopped heartbeating is taken over with
+        a compare-and-set; when several workers race, the winner is returned.
+        """
+        owner_key = self._owner_key(kind, key)
+        ttl = int(self.owner_ttl_s)
+        if self._call("owner_claim", lambda c: c.set(owner_key, self.worker_id, nx=True, ex=ttl)):
+            return self.identity
+
+        current = self._call("owner_get", lambda c: c.get(owner_key))
+        for _ in range(MAX_TAKEOVER_ROUNDS):
+            if current == self.worker_id:
+                return self.identity
+            if current:
+                info = self.worker_info(current)
+                if info:
+                    return _identity_from_info(info)
+                logger.info("Taking over %s %s from stopped worker %s", kind, key, current)
+
+            expected = current or ""
+            current = self._call(
+                "owner_takeover",
+                lambda c, expected=expected: c.eval(
+                    _TAKEOVER_SCRIPT, 1, owner_key, expected, self.worker_id, ttl
+                ),
+            )
+        raise RuntimeError(f"No live owner for {kind} {key} after {MAX_TAKEOVER_ROUNDS} takeovers")
+
+    def owner(self, kind: str, key: str) -> WorkerIdentity | None:
+        """Live owner of ``kind``/``key`` without claiming it."""
+        current = self._call("owner_get", lambda c: c.get(self._owner_key(kind, key)))
+        if not current:
+            return None
+        if current == self.worker_id:
+            return self.identity
+        info = self.worker_info(current)
+        return _identity_from_info(info) if info else None
+
+    def release(self, kind: str, key: str) -> None:
+        """Drop this worker's claim on ``kind``/``key`` (no-op if another worker owns it)."""
+        owner_key = self._owner_key(kind, key)
+        self._call("owner_release", lambda c: c.eval(_RELEASE_SCRIPT, 1, owner_key, self.worker_id))
+
+    # ------------------------------------------------------------------ #
+    # Async wrappers (the Redis client is synchronous)
+    # ------------------------------------------------------------------ #
+
+    async def claim_async(self, kind: str, key: str) -> WorkerIdentity:
+        return await run_blocking(REDIS, self.claim, kind, key)
+
+    async def owner_async(self, kind: str, key: str) -> WorkerIdentity | None:
+        return await run_blocking(REDIS, self.owner, kind, key)
+
+    async def release_async(self, kind: str, key: str) -> None:
+        await run_blocking(REDIS, self.release, kind, key, critical=False)
+
+    async def workers_async(self) -> list[dict[str, Any]]:
+        return await run_blocking(REDIS, self.workers)
+
+    # ------------------------------------------------------------------ #
+    # Background heartbeat
+    # ------------------------------------------------------------------ #
+
+    async def start(
+        self,
+        status_provider: Callable[[], dict[str, Any]] | None = None,
+        *,
+        interval_s: float | None = None,
+    ) -> None:
+        """Heartbeat every ``interval_s`` (default a third of the TTL) until ``stop()``."""
+        if self._task is not None:
+            return
+        interval_s = interval_s or self.heartbeat_ttl_s / 3
+
+        async def _beat() -> None:
+            status = status_provider() if status_provider else {}
+            await run_blocking(REDIS, self.heartbeat, status)
+
+        await _beat()
+
+        async def _run() -> None:
+            while True:
+                await asyncio.sleep(interval_s)
+                try:
+                    await _beat()
+                except Exception as exc:
+                    logger.warning("Worker heartbeat failed: %s", exc)
+
+        self._task = asyncio.create_task(_run(), name="worker-heartbeat")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        try:
+            await run_blocking(REDIS, self.deregister)
+        except Exception as exc:
+            logger.debug("Worker deregistration failed: %s", exc)
+
+
+def _identity_from_info(info: dict[str, Any]) -> WorkerIdentity:
+    return WorkerIdentity(
+        worker_id=info["worker_id"],
+        host=info["host"],
+        index=int(info["index"]),
+        pid=int(info["pid"]),
+        internal_url=info["internal_url"],
+    )
+
+
+__all__ = [
+    "WORKER_INDEX_ENV",
+    "WORKER_INTERNAL_PORT_ENV",
+    "WorkerIdentity",
+    "WorkerRegistry",
+]
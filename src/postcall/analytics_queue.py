@@ -0,0 +1,342 @@
+"""
+Post-Call Analytics Queue
+=========================
+
+Batches finished-session analytics documents into bulk Cosmos DB upserts.
+
+Calls tend to end together (shift changes, campaign cut-offs). Writing one
+``upsert_document`` per session on a worker thread at that moment spikes RU
+consumption and piles up threads. ``PostCallAnalyticsQueue`` instead:
+
+- Collects documents in memory and flushes them with one unordered
+  ``bulk_write`` per batch, bounded by size (``max_batch_size``) and time
+  (``max_batch_delay_s``). A single flusher means at most one write thread.
+- Coalesces documents for the same session within a batch (last one wins).
+- Retries failed writes with jittered exponential backoff; for partial
+  failures only the failed documents are retried.
+- Spills documents to JSONL files on disk when retries are exhausted or the
+  in-memory backlog is full, and replays them once Cosmos accepts writes again.
+
+Usage:
+    from src.postcall.analytics_queue import PostCallAnalyticsQueue, set_analytics_queue
+
+    queue = PostCallAnalyticsQueue(cosmos)
+    await queue.start()
+    set_analytics_queue(queue)
+    queue.enqueue(document)
+    ...
+    await queue.stop()  # flushes what is left
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import random
+import tempfile
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pymongo.errors import BulkWriteError
+from utils.ml_logging import get_logger
+
+from src.pools.executors import COSMOS, run_blocking
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from src.cosmosdb.manager import CosmosDBMongoCoreManager
+
+logger = get_logger("postcall_analytics.queue")
+
+_STOP = object()
+
+
+def _default_spill_dir() -> str:
+    return os.path.join(tempfile.gettempdir(), "artagent-postcall-spill")
+
+
+@dataclass
+class AnalyticsQueueConfig:
+    """Batching, retry and spill settings for the post-call analytics queue."""
+
+    max_batch_size: int = 100
+    max_batch_delay_s: float = 2.0
+    max_pending: int = 5000
+    max_attempts: int = 4
+    backoff_base_s: float = 0.5
+    backoff_max_s: float = 10.0
+    spill_dir: str = field(default_factory=_default_spill_dir)
+    replay_interval_s: float = 30.0
+
+    @classmethod
+    def from_env(cls) -> AnalyticsQueueConfig:
+        """Build configuration from ``POSTCALL_*`` environment variables."""
+        return cls(
+            max_batch_size=int(os.getenv("POSTCALL_BATCH_SIZE", "100")),
+            max_batch_delay_s=float(os.getenv("POSTCALL_BATCH_DELAY_S", "2.0")),
+            max_pending=int(os.getenv("POSTCALL_MAX_PENDING", "5000")),
+            max_attempts=int(os.getenv("POSTCALL_MAX_ATTEMPTS", "4")),
+            spill_dir=os.getenv("POSTCALL_SPILL_DIR") or _default_spill_dir(),
+        )
+
+
+@dataclass
+class AnalyticsQueueStats:
+    """Counters for batching efficiency and write health."""
+
+    enqueued: int = 0
+    written: int = 0
+    batches: int = 0
+    coalesced: int = 0
+    retries: int = 0
+    spilled: int = 0
+    replayed: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for logging/telemetry."""
+        return {
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "batches": self.batches,
+            "avg_batch_size": round(self.written / self.batches, 2) if self.batches else None,
+            "coalesced": self.coalesced,
+            "retries": self.retries,
+            "spilled": self.spilled,
+            "replayed": self.replayed,
+        }
+
+
+class PostCallAnalyticsQueue:
+    """
+    Size- and time-bounded batcher for post-call analytics documents.
+
+    :param cosmos: Cosmos manager providing ``bulk_upsert_documents``
+    :param config: Batching/retry/spill settings (defaults from environment)
+    """
+
+    def __init__(
+        self,
+        cosmos: CosmosDBMongoCoreManager,
+        config: AnalyticsQueueConfig | None = None,
+    ) -> None:
+        self.cosmos = cosmos
+        self.config = config or AnalyticsQueueConfig.from_env()
+        self.stats = AnalyticsQueueStats()
+        self._queue: asyncio.Queue | None = None
+        self._task: asyncio.Task | None = None
+        self._spill_pending = False
+        self._last_replay = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """Start the flusher task; spilled documents are replayed first."""
+        if self.running:
+            return
+        self._queue = asyncio.Queue()
+        self._spill_pending = any(self._spill_files())
+        self._task = asyncio.create_task(self._run(), name="postcall-analytics-flusher")
+
+    async def stop(self) -> None:
+        """Flush everything still queued, then stop the flusher."""
+        if not self.running:
+            return
+        self._queue.put_nowait(_STOP)
+        await self._task
+        self._task = None
+
+    def enqueue(self, document: dict[str, Any]) -> None:
+        """Queue a finished-session document; spills to disk if the backlog is full."""
+        self.stats.enqueued += 1
+        if not self.running or self._queue.qsize() >= self.config.max_pending:
+            logger.warning(
+                "Post-call analytics backlog unavailable or full; spilling session %s",
+                document.get("_id"),
+            )
+            self._spill([document])
+            return
+        self._queue.put_nowait(document)
+
+    async def flush(self) -> None:
+        """Write every document queued so far (waits for the flush)."""
+        if not self.running:
+            return
+        done = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait(done)
+        await done
+
+    # ------------------------------------------------------------------ #
+    # Flusher
+    # ------------------------------------------------------------------ #
+
+    async def _run(self) -> None:
+        await self._replay_spilled()
+        stopping = False
+        while not stopping:
+            batch, waiter, stopping = await self._collect()
+            if batch:
+                await self._write(batch)
+            if waiter is not None and not waiter.done():
+                waiter.set_result(None)
+            if self._spill_pending and (
+                time.monotonic() - self._last_replay >= self.config.replay_interval_s
+            ):
+                await self._replay_spilled()
+
+    async def _collect(self) -> tuple[list[dict[str, Any]], asyncio.Future | None, bool]:
+        """Gather one batch: until size limit, batch deadline, flush or stop."""
+        loop = asyncio.get_running_loop()
+        batch: list[dict[str, Any]] = []
+        item = await self._queue.get()
+        deadline = loop.time() + self.config.max_batch_delay_s
+        while True:
+            if item is _STOP:
+                # Drain whatever is left so stop() loses nothing
+                while not self._queue.empty():
+                    queued = self._queue.get_nowait()
+                    if isinstance(queued, dict):
+                        batch.append(queued)
+                return batch, None, True
+            if isinstance(item, asyncio.Future):
+                return batch, item, False
+            batch.append(item)
+            if len(batch) >= self.config.max_batch_size:
+                return batch, None, False
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                return batch, None, False
+            try:
+                item = await asyncio.wait_for(self._queue.get(), timeout)
+            except TimeoutError:
+                return batch, None, False
+
+    async def _write(self, batch: list[dict[str, Any]]) -> None:
+        """Bulk-upsert ``batch`` in ``max_batch_size`` chunks; spill what fails."""
+        documents: dict[Any, dict[str, Any]] = {}
+        for document in batch:
+            documents[document["_id"]] = document
+        self.stats.coalesced += len(batch) - len(documents)
+        pending = list(documents.values())
+
+        size = self.config.max_batch_size
+        for start in range(0, len(pending), size):
+            failed = await self._upsert_with_retry(pending[start : start + size])
+            if failed:
+                self._spill(failed)
+
+    async def _upsert_with_retry(self, documents: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Return the documents that still failed after ``max_attempts``."""
+        pending = documents
+        for attempt in range(1, self.config.max_attempts + 1):
+            try:
+                await run_blocking(
+                    COSMOS, self.cosmos.bulk_upsert_documents, pending, critical=False
+                )
+                self.stats.written += len(pending)
+                self.stats.batches += 1
+                return []
+            except BulkWriteError as err:
+                failed_indexes = sorted(
+                    {error["index"] for error in err.details.get("writeErrors", [])}
+                )
+                self.stats.written += len(pending) - len(failed_indexes)
+                self.stats.batches += 1
+                pending = [pending[index] for index in failed_indexes]
+                logger.warning(
+                    "Post-call bulk write partially failed: %d of batch (attempt %d/%d)",
+                    len(pending),
+                    attempt,
+                    self.config.max_attempts,
+                )
+                if not pending:
+                    return []
+            except Exception as err:
+                logger.warning(
+                    "Post-call bulk write failed for %d documents (attempt %d/%d): %s",
+                    len(pending),
+                    attempt,
+                    self.config.max_attempts,
+                    err,
+                )
+            if attempt < self.config.max_attempts:
+                self.stats.retries += 1
+                ceiling = self.config.backoff_base_s * 2 ** (attempt - 1)
+                await asyncio.sleep(random.uniform(0, min(self.config.backoff_max_s, ceiling)))
+        return pending
+
+    # ------------------------------------------------------------------ #
+    # Spill to disk
+    # ------------------------------------------------------------------ #
+
+    def _spill_files(self) -> list[Path]:
+        spill_dir = Path(self.config.spill_dir)
+        if not spill_dir.is_dir():
+            return []
+        return sorted(spill_dir.glob("postcall-*.jsonl"))
+
+    def _spill(self, documents: list[dict[str, Any]]) -> None:
+        spill_dir = Path(self.config.spill_dir)
+        path = spill_dir / f"postcall-{time.time_ns()}-{uuid.uuid4().hex[:8]}.jsonl"
+        try:
+            spill_dir.mkdir(parents=True, exist_ok=True)
+            with path.open("w", encoding="utf-8") as handle:
+                for document in documents:
+                    handle.write(json.dumps(document, default=str) + "\n")
+        except OSError as err:
+            logger.error(
+                "Failed to spill %d post-call analytics documents: %s", len(documents), err
+            )
+            return
+        self.stats.spilled += len(documents)
+        self._spill_pending = True
+        logger.warning("Spilled %d post-call analytics documents to %s", len(documents), path)
+
+    async def _replay_spilled(self) -> None:
+        """Re-send spilled documents; stops at the first file that still fails."""
+        self._last_replay = time.monotonic()
+        for path in self._spill_files():
+            try:
+                lines = path.read_text(encoding="utf-8").splitlines()
+                documents = [json.loads(line) for line in lines if line.strip()]
+            except (OSError, json.JSONDecodeError) as err:
+                logger.error("Unreadable post-call spill file %s: %s", path, err)
+                continue
+            failed = await self._upsert_with_retry(documents) if documents else []
+            if failed:
+                path.write_text(
+                    "".join(json.dumps(doc, default=str) + "\n" for doc in failed),
+                    encoding="utf-8",
+                )
+                return
+            path.unlink(missing_ok=True)
+            self.stats.replayed += len(documents)
+            logger.info("Replayed %d spilled post-call analytics documents", len(documents))
+        self._spill_pending = False
+
+
+_QUEUE: PostCallAnalyticsQueue | None = None
+
+
+def get_analytics_queue() -> PostCallAnalyticsQueue | None:
+    """Return the process-wide analytics queue, if one was started."""
+    return _QUEUE
+
+
+def set_analytics_queue(queue: PostCallAnalyticsQueue | None) -> None:
+    """Register (or clear) the process-wide analytics queue."""
+    global _QUEUE
+    _QUEUE = queue
+
+
+__all__ = [
+    "AnalyticsQueueConfig",
+    "AnalyticsQueueStats",
+    "PostCallAnalyticsQueue",
+    "get_analytics_queue",
+    "set_analytics_queue",
+]
@@ -1,11 +1,13 @@
-import asyncio
 import datetime
 
 from pymongo.errors import NetworkTimeout
 from utils.ml_logging import get_logger
 
 from src.cosmosdb.manager import CosmosDBMongoCoreManager
+from src.pools.executors import COSMOS, run_blocking
+from src.postcall.analytics_queue import get_analytics_queue
 from src.stateful.state_managment import MemoManager
+from src.tools.latency_helpers import summarize_stage_stats
 
 logger = get_logger("postcall_analytics")
 
@@ -18,29 +20,36 @@ def _connectivity_hint(cosmos: CosmosDBMongoCoreManager) -> str:
     return f"nc -vz {primary_host} 10260"
 
 
-async def build_and_flush(cm: MemoManager, cosmos: CosmosDBMongoCoreManager):
+def build_analytics_document(cm: MemoManager) -> dict:
     """
-    Build analytics document from conversation manager and asynchronously upsert into
-    Cosmos DB (MongoDB API, _id = session_id). Executes the write on a worker thread to
-    avoid blocking the event loop and adds guidance when connectivity fails.
+    Build the analytics document for a finished session (``_id`` = session_id).
+
+    The latency summary comes from the running per-stage aggregates kept in the
+    session's latency bucket, so no samples are rescanned at call end. Legacy
+    ``latency_roundtrip`` data is still summarized when no aggregates exist.
     """
     session_id = cm.session_id
     histories = cm.histories
     context = cm.context.copy()
     raw_lat = context.pop("latency_roundtrip", {})
 
-    summary = {}
-    for stage, entries in raw_lat.items():
-        durations = [e.get("dur", 0.0) for e in entries if "dur" in e]
-        count = len(durations)
-        summary[stage] = {
-            "count": count,
-            "avg": sum(durations) / count if count else 0.0,
-            "min": min(durations) if count else 0.0,
-            "max": max(durations) if count else 0.0,
-        }
+    latency = context.get("latency")
+    stage_stats = latency.get("stage_stats") if isinstance(latency, dict) else None
+    if stage_stats:
+        summary = summarize_stage_stats(stage_stats)
+    else:
+        summary = {}
+        for stage, entries in raw_lat.items():
+            durations = [e.get("dur", 0.0) for e in entries if "dur" in e]
+            count = len(durations)
+            summary[stage] = {
+                "count": count,
+                "avg": sum(durations) / count if count else 0.0,
+                "min": min(durations) if count else 0.0,
+                "max": max(durations) if count else 0.0,
+            }
 
-    doc = {
+    return {
         "_id": session_id,
         "session_id": session_id,
         "timestamp": datetime.datetime.utcnow().replace(microsecond=0).isoformat() + "Z",
@@ -50,8 +59,29 @@ async def build_and_flush(cm: MemoManager, cosmos: CosmosDBMongoCoreManager):
         "agents": list(histories.keys()),
     }
 
+
+async def build_and_flush(cm: MemoManager, cosmos: CosmosDBMongoCoreManager):
+    """
+    Build analytics document from conversation manager and persist it to Cosmos DB
+    (MongoDB API, _id = session_id).
+
+    When the post-call analytics queue is running for ``cosmos`` the document is
+    queued for a batched bulk write. Otherwise the upsert runs on a worker thread to
+    avoid blocking the event loop, with guidance when connectivity fails.
+    """
+    doc = build_analytics_document(cm)
+    session_id = doc["_id"]
+
+    queue = get_analytics_queue()
+    if queue is not None and queue.running and queue.cosmos is cosmos:
+        queue.enqueue(doc)
+        logger.info(f"Analytics document queued for session {session_id}")
+        return
+
     try:
-        await asyncio.to_thread(cosmos.upsert_document, document=doc, query={"_id": session_id})
+        await run_blocking(
+            COSMOS, cosmos.upsert_document, document=doc, query={"_id": session_id}
+        )
         logger.info(f"Analytics document upserted for session {session_id}")
     except NetworkTimeout as err:
         hint = _connectivity_hint(cosmos)
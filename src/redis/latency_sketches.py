@@ -0,0 +1,188 @@
+"""
+Fleet Latency Sketches
+======================
+
+Publishes this replica's per-stage latency sketches to Redis and merges the
+sketches of every live replica into fleet-wide percentiles.
+
+Each replica periodically overwrites its own hash with its cumulative
+process sketches (``src.tools.latency_sketch.process_sketches()``):
+
+- ``latency_sketches:replica:<instance_id>`` - hash of stage -> sketch JSON,
+  expiring ``ttl_s`` after the last publish
+- ``latency_sketches:replicas`` - sorted set of instance IDs scored by their
+  last publish time
+
+Reading the fleet view costs two round trips (the replica set, then one
+pipelined ``HGETALL`` per live replica) and a bucket-count merge per stage,
+independent of how many samples were recorded. Replicas that stopped
+publishing drop out of the view after ``ttl_s``.
+
+Usage:
+    from src.redis.latency_sketches import LatencySketchStore
+    from src.tools.latency_sketch import process_sketches
+
+    store = LatencySketchStore(redis_mgr)
+    await store.start(process_sketches(), interval_s=30)
+    fleet = await store.fleet_async()   # {stage: QuantileSketch}
+    await store.stop()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import socket
+import time
+from typing import TYPE_CHECKING, Any
+
+from utils.ml_logging import get_logger
+
+from src.pools.executors import REDIS, run_blocking
+from src.tools.latency_sketch import QuantileSketch, StageSketches
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from src.redis.manager import AzureRedisManager
+
+logger = get_logger("redis.latency_sketches")
+
+REPLICAS_KEY = "latency_sketches:replicas"
+REPLICA_KEY_PREFIX = "latency_sketches:replica:"
+DEFAULT_TTL_S = 300.0
+
+
+def replica_key(instance_id: str) -> str:
+    return f"{REPLICA_KEY_PREFIX}{instance_id}"
+
+
+def default_instance_id() -> str:
+    return f"{os.getenv('HOSTNAME') or socket.gethostname()}:{os.getpid()}"
+
+
+class LatencySketchStore:
+    """
+    Redis store of per-replica stage sketches.
+
+    :param redis_mgr: Redis manager whose client and retry policy are used
+    :param instance_id: Replica identity (defaults to ``<hostname>:<pid>``)
+    :param ttl_s: How long a replica's sketches count after its last publish
+    """
+
+    def __init__(
+        self,
+        redis_mgr: AzureRedisManager,
+        *,
+        instance_id: str | None = None,
+        ttl_s: float = DEFAULT_TTL_S,
+    ) -> None:
+        self._mgr = redis_mgr
+        self.instance_id = instance_id or default_instance_id()
+        self.ttl_s = ttl_s
+        self._task: asyncio.Task | None = None
+        self._sketches: StageSketches | None = None
+
+    def _pipeline_execute(self, name: str, build) -> list[Any]:
+        def _operation():
+            with self._mgr._redis_span(f"Redis.{name}", op="PIPELINE"):
+                pipe = self._mgr.redis_client.pipeline(transaction=False)
+                build(pipe)
+                return pipe.execute()
+
+        return self._mgr._execute_with_retry(name, _operation)
+
+    def publish(self, stages: dict[str, dict[str, Any]], *, now: float | None = None) -> None:
+        """Replace this replica's published sketches with ``stages`` (stage -> sketch state)."""
+        if not stages:
+            return
+        now = time.time() if now is None else now
+        key = replica_key(self.instance_id)
+        fields = {
+            stage: json.dumps(state, separators=(",", ":")) for stage, state in stages.items()
+        }
+
+        def build(pipe):
+            pipe.hset(key, mapping=fields)
+            pipe.expire(key, int(self.ttl_s))
+            pipe.zadd(REPLICAS_KEY, {self.instance_id: now})
+            pipe.zremrangebyscore(REPLICAS_KEY, "-inf", f"({now - self.ttl_s}")
+
+        self._pipeline_execute("latency_sketches_publish", build)
+
+    def fleet(self, *, now: float | None = None) -> dict[str, QuantileSketch]:
+        """Merge the sketches of every replica that published within ``ttl_s``."""
+        now = time.time() if now is None else now
+        client = self._mgr.redis_client
+        replicas = self._mgr._execute_with_retry(
+            "latency_sketches_replicas",
+            lambda: client.zrangebyscore(REPLICAS_KEY, now - self.ttl_s, "+inf"),
+        )
+        if not replicas:
+            return {}
+
+        def build(pipe):
+            for instance_id in replicas:
+                pipe.hgetall(replica_key(instance_id))
+
+        merged: dict[str, QuantileSketch] = {}
+        for published in self._pipeline_execute("latency_sketches_fleet", build):
+            for stage, raw in (published or {}).items():
+                try:
+                    sketch = QuantileSketch.from_dict(json.loads(raw))
+                    if stage in merged:
+                        merged[stage].merge(sketch)
+                    else:
+                        merged[stage] = sketch
+                except (ValueError, TypeError, KeyError) as exc:
+                    logger.warning("Skipping unreadable latency sketch %s: %s", stage, exc)
+        return merged
+
+    async def publish_async(self, stages: dict[str, dict[str, Any]]) -> None:
+        await run_blocking(REDIS, self.publish, stages, critical=False)
+
+    async def fleet_async(self) -> dict[str, QuantileSketch]:
+        return await run_blocking(REDIS, self.fleet)
+
+    # ------------------------------------------------------------------ #
+    # Background publishing
+    # ------------------------------------------------------------------ #
+
+    async def start(self, sketches: StageSketches, *, interval_s: float) -> None:
+        """Publish ``sketches`` every ``interval_s`` seconds until ``stop()``."""
+        if self._task is not None:
+            return
+        self._sketches = sketches
+        self._task = asyncio.create_task(self._run(interval_s), name="latency-sketch-publisher")
+
+    async def stop(self) -> None:
+        """Stop publishing after one final publish."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        await self._publish_snapshot()
+
+    async def _run(self, interval_s: float) -> None:
+        while True:
+            await asyncio.sleep(interval_s)
+            await self._publish_snapshot()
+
+    async def _publish_snapshot(self) -> None:
+        if self._sketches is None:
+            return
+        try:
+            await self.publish_async(self._sketches.snapshot())
+        except Exception as exc:
+            logger.warning("Failed to publish latency sketches: %s", exc)
+
+
+__all__ = [
+    "DEFAULT_TTL_S",
+    "LatencySketchStore",
+    "REPLICAS_KEY",
+    "replica_key",
+]
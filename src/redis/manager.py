@@ -21,6 +21,8 @@ from utils.ml_logging import get_logger
 
 import redis
 from src.enums.monitoring import PeerService, SpanAttr
+from src.pools.executors import REDIS, get_executor
+from src.redis.session_index import SessionIndex
 
 T = TypeVar("T")
 
@@ -40,13 +42,21 @@ class AzureRedisManager:
             self.logger.error("Redis connection check failed: %s", e)
             return False
 
+    @property
+    def session_index(self) -> SessionIndex:
+        """Sorted-set index of sessions used for listing without keyspace scans."""
+        index = self.__dict__.get("_session_index")
+        if index is None:
+            index = self._session_index = SessionIndex(self)
+        return index
+
     def __init__(
         self,
         host: str | None = None,
         access_key: str | None = None,
         port: int | None = None,
         db: int = 0,
-        ssl: bool = True,
+        ssl: bool | None = None,
         credential: object | None = None,  # For DefaultAzureCredential
         user_name: str | None = None,
         scope: str | None = None,
@@ -74,6 +84,8 @@ class AzureRedisManager:
                 self.logger.warning("REDIS_PORT not set, defaulting to 10000")
 
         self.db = db
+        if ssl is None:
+            ssl = os.getenv("REDIS_SSL", "true").lower() in {"1", "true", "yes", "on"}
         self.ssl = ssl
         self.tracer = trace.get_tracer(__name__)
         use_cluster_env = os.getenv("REDIS_USE_CLUSTER") or os.getenv("REDIS_CLUSTER_MODE")
@@ -118,7 +130,7 @@ class AzureRedisManager:
 
             # Validate connection with health check
             loop = asyncio.get_event_loop()
-            ping_result = await loop.run_in_executor(None, self._health_check)
+            ping_result = await loop.run_in_executor(get_executor(REDIS), self._health_check)
 
             if ping_result:
                 self.logger.debug("✅ Redis connection validated successfully")
@@ -354,7 +366,9 @@ class AzureRedisManager:
 
     async def publish_event_async(self, stream_key: str, event_data: dict[str, Any]) -> str:
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.publish_event, stream_key, event_data)
+        return await loop.run_in_executor(
+            get_executor(REDIS), self.publish_event, stream_key, event_data
+        )
 
     async def read_events_blocking_async(
         self,
@@ -364,6 +378,8 @@ class AzureRedisManager:
         count: int = 1,
     ) -> list[dict[str, Any]] | None:
         loop = asyncio.get_event_loop()
+        # Long-polling reads park a thread for up to block_ms; keep them off the
+        # bounded Redis executor so they cannot starve short commands.
         return await loop.run_in_executor(
             None, self.read_events_blocking, stream_key, last_id, block_ms, count
         )
@@ -414,7 +430,7 @@ class AzureRedisManager:
         """Async helper for publishing to a Redis channel."""
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(
-            None,
+            get_executor(REDIS),
             self.publish_channel,
             channel,
             message,
@@ -470,7 +486,9 @@ class AzureRedisManager:
         """Async version using thread pool executor."""
         try:
             loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(None, self.store_session_data, session_id, data)
+            return await loop.run_in_executor(
+                get_executor(REDIS), self.store_session_data, session_id, data
+            )
         except asyncio.CancelledError:
             self.logger.debug(f"store_session_data_async cancelled for session {session_id}")
             # Don't log as warning - cancellation is normal during shutdown
@@ -483,7 +501,9 @@ class AzureRedisManager:
         """Async version of get_session_data using thread pool executor."""
         try:
             loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(None, self.get_session_data, session_id)
+            return await loop.run_in_executor(
+                get_executor(REDIS), self.get_session_data, session_id
+            )
         except asyncio.CancelledError:
             self.logger.debug(f"get_session_data_async cancelled for session {session_id}")
             raise
@@ -496,7 +516,7 @@ class AzureRedisManager:
         try:
             loop = asyncio.get_event_loop()
             return await loop.run_in_executor(
-                None, self.update_session_field, session_id, field, value
+                get_executor(REDIS), self.update_session_field, session_id, field, value
             )
         except asyncio.CancelledError:
             self.logger.debug(f"update_session_field_async cancelled for session {session_id}")
@@ -509,7 +529,7 @@ class AzureRedisManager:
         """Async version of delete_session using thread pool executor."""
         try:
             loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(None, self.delete_session, session_id)
+            return await loop.run_in_executor(get_executor(REDIS), self.delete_session, session_id)
         except asyncio.CancelledError:
             self.logger.debug(f"delete_session_async cancelled for session {session_id}")
             raise
@@ -521,7 +541,7 @@ class AzureRedisManager:
         """Async version of get_value using thread pool executor."""
         try:
             loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(None, self.get_value, key)
+            return await loop.run_in_executor(get_executor(REDIS), self.get_value, key)
         except asyncio.CancelledError:
             self.logger.debug(f"get_value_async cancelled for key {key}")
             raise
@@ -533,7 +553,9 @@ class AzureRedisManager:
         """Async version of set_value using thread pool executor."""
         try:
             loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(None, self.set_value, key, value, ttl_seconds)
+            return await loop.run_in_executor(
+                get_executor(REDIS), self.set_value, key, value, ttl_seconds
+            )
         except asyncio.CancelledError:
             self.logger.debug(f"set_value_async cancelled for key {key}")
             raise
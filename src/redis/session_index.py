@@ -0,0 +1,480 @@
+"""
+Session Index
+=============
+
+Maintained index of sessions for listing and metrics without keyspace scans.
+
+Listing sessions used to ``SCAN`` the whole keyspace for ``session:*`` keys and
+parse every session blob, so its cost grew with the total number of Redis keys.
+The index keeps two structures up to date as sessions are persisted:
+
+- ``session_index:by_activity`` - sorted set of session IDs scored by last
+  activity (epoch seconds)
+- ``session_index:summary:<session_id>`` - hash with the session summary
+  (``summarize_session`` output), each field JSON-encoded
+
+Reads page through the sorted set and fetch the summaries in one pipeline, so
+listing costs two round trips regardless of keyspace size. Summaries expire
+after ``retention_s``; sorted-set members older than that are trimmed on write
+and members whose summary has expired are dropped on read.
+
+Usage:
+    from src.redis.session_index import summarize_session
+
+    index = redis_mgr.session_index
+    index.record(session_id, summarize_session(session_id, corememory, histories))
+    page = await index.page_async(limit=50)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from utils.ml_logging import get_logger
+
+from src.pools.executors import REDIS, run_blocking
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from src.redis.manager import AzureRedisManager
+
+logger = get_logger("redis.session_index")
+
+INDEX_KEY = "session_index:by_activity"
+SUMMARY_KEY_PREFIX = "session_index:summary:"
+# Set once sessions persisted before the index existed have been indexed
+BACKFILL_MARKER_KEY = "session_index:backfilled"
+ACTIVE_WINDOW_S = 3600.0
+DEFAULT_RETENTION_S = float(os.getenv("SESSION_INDEX_RETENTION_S", str(7 * 24 * 3600)))
+
+
+def summary_key(session_id: str) -> str:
+    return f"{SUMMARY_KEY_PREFIX}{session_id}"
+
+
+def _loads(value: Any) -> Any:
+    if isinstance(value, str):
+        return json.loads(value)
+    return value
+
+
+# ---------------------------------------------------------------------------
+# Summary extraction
+# ---------------------------------------------------------------------------
+
+
+def _agent(name: str, is_active: bool, is_custom: bool, tools: list[str]) -> dict[str, Any]:
+    return {
+        "name": name,
+        "is_active": is_active,
+        "is_custom": is_custom,
+        "tools": tools,
+        "voice": {},
+        "model": {},
+    }
+
+
+def _scenario(name: str, is_active: bool, config: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "name": name,
+        "is_active": is_active,
+        "agents": config.get("agents", []),
+        "handoffs": config.get("handoffs", []),
+    }
+
+
+def _summarize_agents(core_memory: dict[str, Any]) -> dict[str, Any]:
+    agents_list: list[dict[str, Any]] = []
+    agents_count = 0
+    scenario_agents_count = 0
+    active_count = 0
+
+    # Method 1: session_scenario_config lists the scenario's agents
+    session_scenario_config = core_memory.get("session_scenario_config", {})
+    if session_scenario_config and isinstance(session_scenario_config, dict):
+        agents_in_scenario = session_scenario_config.get("agents", [])
+        if agents_in_scenario:
+            agents_count = scenario_agents_count = len(agents_in_scenario)
+            active_agent_name = (
+                core_memory.get("active_agent")
+                or core_memory.get("current_agent")
+                or session_scenario_config.get("start_agent")
+            )
+            for agent_name in agents_in_scenario:
+                is_active = agent_name == active_agent_name
+                if is_active:
+                    active_count = 1
+                agents_list.append(_agent(agent_name, is_active, True, []))
+
+    # Method 2: agents of the active scenario in session_scenarios_all
+    if not agents_count:
+        session_scenarios = core_memory.get("session_scenarios_all", {})
+        active_scenario_name = core_memory.get("active_scenario_name")
+        if session_scenarios and active_scenario_name:
+            active_scenario = session_scenarios.get(active_scenario_name, {})
+            agents_in_scenario = active_scenario.get("agents", []) if active_scenario else []
+            if agents_in_scenario:
+                agents_count = scenario_agents_count = len(agents_in_scenario)
+                active_agent_name = core_memory.get("active_agent") or active_scenario.get(
+                    "start_agent"
+                )
+                for agent_name in agents_in_scenario:
+                    is_active = agent_name == active_agent_name
+                    if is_active:
+                        active_count = 1
+                    agents_list.append(_agent(agent_name, is_active, True, []))
+
+    # Method 3: agent_registry structure
+    if not agents_count:
+        agent_registry = core_memory.get("agent_registry", {})
+        if agent_registry and isinstance(agent_registry, dict):
+            agents_data = agent_registry.get("agents", {})
+            active_agent = agent_registry.get("active_agent")
+            for name, agent_config in agents_data.items():
+                is_active = name == active_agent
+                is_scenario_agent = (
+                    agent_config.get("has_overrides", False)
+                    or agent_config.get("source", "") != "base"
+                )
+                if is_active:
+                    active_count += 1
+                if is_scenario_agent:
+                    scenario_agents_count += 1
+                tools = agent_config.get("tool_names_override", []) or []
+                agents_list.append(_agent(name, is_active, is_scenario_agent, tools))
+            agents_count = len(agents_data)
+
+    return {
+        "agents": agents_list,
+        "agents_count": agents_count,
+        "active_agents_count": active_count,
+        "scenario_agents_count": scenario_agents_count,
+        "has_scenario_agents": scenario_agents_count > 0,
+    }
+
+
+def _summarize_scenarios(core_memory: dict[str, Any]) -> dict[str, Any]:
+    scenarios_list: list[dict[str, Any]] = []
+    scenarios_count = 0
+    custom_scenarios_count = 0
+    active_scenario_name = core_memory.get("active_scenario_name")
+
+    session_scenarios = core_memory.get("session_scenarios_all", {})
+    if session_scenarios and isinstance(session_scenarios, dict):
+        scenarios_count = custom_scenarios_count = len(session_scenarios)
+        for name, scenario_config in session_scenarios.items():
+            if isinstance(scenario_config, dict):
+                scenarios_list.append(
+                    _scenario(name, name == active_scenario_name, scenario_config)
+                )
+    else:
+        scenario_registry = core_memory.get("scenario_registry", {})
+        if scenario_registry and isinstance(scenario_registry, dict):
+            scenarios_data = scenario_registry.get("scenarios", {})
+            active_scenario = scenario_registry.get("active_scenario")
+            scenarios_count = len(scenarios_data)
+            for name, scenario_config in scenarios_data.items():
+                if scenario_config.get("is_custom", True):
+                    custom_scenarios_count += 1
+                scenarios_list.append(_scenario(name, name == active_scenario, scenario_config))
+
+    # Only the active session scenario is known
+    if not scenarios_count:
+        session_scenario_config = core_memory.get("session_scenario_config", {})
+        if session_scenario_config and isinstance(session_scenario_config, dict):
+            scenario_name = session_scenario_config.get("name")
+            if scenario_name:
+                scenarios_count = custom_scenarios_count = 1
+                scenarios_list.append(_scenario(scenario_name, True, session_scenario_config))
+
+    return {
+        "scenarios": scenarios_list,
+        "scenarios_count": scenarios_count,
+        "custom_scenarios_count": custom_scenarios_count,
+        "has_custom_scenarios": custom_scenarios_count > 0,
+    }
+
+
+def summarize_session(
+    session_id: str,
+    corememory: dict[str, Any] | str | None,
+    chat_history: dict[str, Any] | list | str | None,
+    *,
+    now: float | None = None,
+) -> dict[str, Any]:
+    """
+    Build the listing summary for a session from its core memory and history.
+
+    Accepts either decoded objects (from a live ``MemoManager``) or the JSON
+    strings stored in the session hash. ``created_at`` is ``None`` when the
+    session does not record it; ``last_activity`` falls back to ``now``.
+
+    Raises:
+        json.JSONDecodeError / TypeError: if a JSON string field is malformed
+    """
+    now = time.time() if now is None else now
+    summary: dict[str, Any] = {
+        "session_id": session_id,
+        "created_at": None,
+        "last_activity": now,
+        "turn_count": 0,
+        "streaming_mode": None,
+        "user_email": None,
+        "profile_name": None,
+        "profile_type": None,
+        "agents_count": 0,
+        "scenarios_count": 0,
+        "active_agents_count": 0,
+        "scenario_agents_count": 0,
+        "custom_scenarios_count": 0,
+        "agents": [],
+        "scenarios": [],
+        "has_scenario_agents": False,
+        "has_custom_scenarios": False,
+    }
+
+    core_memory = _loads(corememory)
+    if isinstance(core_memory, dict):
+        session_info = core_memory.get("session_info", {})
+        summary.update(
+            {
+                "created_at": session_info.get("created_at"),
+                "last_activity": session_info.get("last_activity", now),
+                "streaming_mode": session_info.get("streaming_mode"),
+                "user_email": session_info.get("user_email"),
+            }
+        )
+
+        profile_data = (
+            core_memory.get("session_profile", {})
+            or core_memory.get("profile", {})
+            or core_memory.get("user_profile", {})
+        )
+        if profile_data:
+            summary["profile_name"] = (
+                profile_data.get("display_name")
+                or profile_data.get("name")
+                or profile_data.get("profile_name")
+                or profile_data.get("caller_name")
+            )
+            summary["profile_type"] = (
+                profile_data.get("profile_type")
+                or profile_data.get("industry")
+                or profile_data.get("scenario_type")
+            )
+        if not summary["user_email"]:
+            summary["user_email"] = (
+                core_memory.get("user_email")
+                or core_memory.get("caller_email")
+                or profile_data.get("email")
+            )
+
+        summary.update(_summarize_agents(core_memory))
+        summary.update(_summarize_scenarios(core_memory))
+
+    history = _loads(chat_history)
+    total_messages = 0
+    latest_timestamp = None
+    if isinstance(history, dict):
+        for agent_messages in history.values():
+            if isinstance(agent_messages, list):
+                total_messages += len(agent_messages)
+                for msg in agent_messages:
+                    if isinstance(msg, dict):
+                        msg_timestamp = msg.get("timestamp")
+                        if msg_timestamp and (
+                            latest_timestamp is None or msg_timestamp > latest_timestamp
+                        ):
+                            latest_timestamp = msg_timestamp
+    elif isinstance(history, list):
+        total_messages = len(history)
+        if history and isinstance(history[-1], dict) and "timestamp" in history[-1]:
+            latest_timestamp = history[-1]["timestamp"]
+    summary["turn_count"] = total_messages
+    if latest_timestamp:
+        summary["last_activity"] = latest_timestamp
+
+    return summary
+
+
+# ---------------------------------------------------------------------------
+# Index
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class SessionPage:
+    """One page of indexed sessions, newest activity first."""
+
+    sessions: list[dict[str, Any]] = field(default_factory=list)
+    total: int = 0
+    active: int = 0
+
+
+class SessionIndex:
+    """
+    Sorted-set session index maintained alongside ``session:*`` hashes.
+
+    :param redis_mgr: Redis manager whose client and retry policy are used
+    :param retention_s: How long sessions stay listed after their last activity
+    """
+
+    def __init__(
+        self,
+        redis_mgr: AzureRedisManager,
+        *,
+        retention_s: float = DEFAULT_RETENTION_S,
+    ) -> None:
+        self._mgr = redis_mgr
+        self.retention_s = retention_s
+
+    def _pipeline_execute(self, name: str, build) -> list[Any]:
+        def _operation():
+            with self._mgr._redis_span(f"Redis.{name}", op="PIPELINE"):
+                pipe = self._mgr.redis_client.pipeline(transaction=False)
+                build(pipe)
+                return pipe.execute()
+
+        return self._mgr._execute_with_retry(name, _operation)
+
+    # ------------------------------------------------------------------ #
+    # Writes
+    # ------------------------------------------------------------------ #
+
+    def record(self, session_id: str, summary: dict[str, Any]) -> None:
+        """Upsert a session summary and move it to its last-activity position."""
+        now = time.time()
+        fields = {
+            key: json.dumps(value, default=str)
+            for key, value in summary.items()
+            if not (key == "created_at" and value is None)
+        }
+        score = float(summary.get("last_activity") or now)
+        key = summary_key(session_id)
+        ttl = int(self.retention_s)
+
+        def build(pipe):
+            pipe.hset(key, mapping=fields)
+            pipe.hsetnx(key, "created_at", json.dumps(summary.get("created_at") or now))
+            pipe.expire(key, ttl)
+            pipe.zadd(INDEX_KEY, {session_id: score})
+            pipe.zremrangebyscore(INDEX_KEY, "-inf", f"({now - self.retention_s}")
+
+        self._pipeline_execute("SESSION_INDEX_RECORD", build)
+
+    def mark_ended(self, session_id: str, ended_at: float | None = None) -> None:
+        """Record that a session's call or connection has ended."""
+        ended_at = time.time() if ended_at is None else ended_at
+        key = summary_key(session_id)
+
+        def build(pipe):
+            pipe.hset(key, mapping={"ended_at": json.dumps(ended_at)})
+            pipe.expire(key, int(self.retention_s))
+            pipe.zadd(INDEX_KEY, {session_id: ended_at}, gt=True)
+
+        self._pipeline_execute("SESSION_INDEX_END", build)
+
+    def remove(self, session_id: str) -> None:
+        """Drop a session from the index (e.g. when it is deleted)."""
+
+        def build(pipe):
+            pipe.zrem(INDEX_KEY, session_id)
+            pipe.delete(summary_key(session_id))
+
+        self._pipeline_execute("SESSION_INDEX_REMOVE", build)
+
+    # ------------------------------------------------------------------ #
+    # Reads
+    # ------------------------------------------------------------------ #
+
+    def page(
+        self,
+        offset: int = 0,
+        limit: int = 50,
+        *,
+        active_only: bool = False,
+        now: float | None = None,
+    ) -> SessionPage:
+        """Return summaries for one page of sessions, most recent activity first."""
+        now = time.time() if now is None else now
+        active_since = now - ACTIVE_WINDOW_S
+
+        def build_range(pipe):
+            if active_only:
+                pipe.zrevrangebyscore(INDEX_KEY, "+inf", active_since, start=offset, num=limit)
+            else:
+                pipe.zrevrange(INDEX_KEY, offset, offset + limit - 1)
+            pipe.zcard(INDEX_KEY)
+            pipe.zcount(INDEX_KEY, active_since, "+inf")
+
+        session_ids, total, active = self._pipeline_execute("SESSION_INDEX_RANGE", build_range)
+        if not session_ids:
+            return SessionPage(total=total, active=active)
+
+        def build_fetch(pipe):
+            for session_id in session_ids:
+                pipe.hgetall(summary_key(session_id))
+
+        raw_summaries = self._pipeline_execute("SESSION_INDEX_FETCH", build_fetch)
+
+        sessions = []
+        stale = []
+        for session_id, raw in zip(session_ids, raw_summaries, strict=True):
+            if not raw:
+                stale.append(session_id)
+                continue
+            try:
+                sessions.append({name: json.loads(value) for name, value in raw.items()})
+            except (json.JSONDecodeError, TypeError) as err:
+                logger.warning("Malformed session index summary for %s: %s", session_id, err)
+        if stale:
+            # Summary expired or was deleted without going through the index
+            self._pipeline_execute("SESSION_INDEX_PRUNE", lambda pipe: pipe.zrem(INDEX_KEY, *stale))
+            total -= len(stale)
+        return SessionPage(sessions=sessions, total=total, active=active)
+
+    def count(self, since: float | None = None) -> int:
+        """Number of indexed sessions, optionally only those active since ``since``."""
+
+        def _operation():
+            with self._mgr._redis_span("Redis.ZCOUNT"):
+                if since is None:
+                    return self._mgr.redis_client.zcard(INDEX_KEY)
+                return self._mgr.redis_client.zcount(INDEX_KEY, since, "+inf")
+
+        return self._mgr._execute_with_retry("ZCOUNT", _operation)
+
+    # ------------------------------------------------------------------ #
+    # Async wrappers (Redis client is synchronous)
+    # ------------------------------------------------------------------ #
+
+    async def record_async(self, session_id: str, summary: dict[str, Any]) -> None:
+        await run_blocking(REDIS, self.record, session_id, summary, critical=False)
+
+    async def mark_ended_async(self, session_id: str, ended_at: float | None = None) -> None:
+        await run_blocking(REDIS, self.mark_ended, session_id, ended_at, critical=False)
+
+    async def remove_async(self, session_id: str) -> None:
+        await run_blocking(REDIS, self.remove, session_id, critical=False)
+
+    async def page_async(
+        self, offset: int = 0, limit: int = 50, *, active_only: bool = False
+    ) -> SessionPage:
+        return await run_blocking(REDIS, self.page, offset, limit, active_only=active_only)
+
+    async def count_async(self, since: float | None = None) -> int:
+        return await run_blocking(REDIS, self.count, since)
+
+
+__all__ = [
+    "ACTIVE_WINDOW_S",
+    "BACKFILL_MARKER_KEY",
+    "INDEX_KEY",
+    "SessionIndex",
+    "SessionPage",
+    "summarize_session",
+    "summary_key",
+]
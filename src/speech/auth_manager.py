@@ -3,40 +3,92 @@
 Provides a shared token manager that wraps the repo's credential helper and
 applies Azure AD tokens to Speech SDK configurations with proper refresh and
 thread-safety. This centralises AAD token handling for both TTS and STT flows.
+
+Token lifecycle:
+- ``get_token`` serves the cached token without locking while it is outside
+  the expiry skew; only a caller that finds it (nearly) expired fetches inline.
+- ``start()`` runs a background task that refreshes ``refresh_ahead_s``
+  before expiry (minus random jitter so workers do not refresh in lockstep),
+  retrying with backoff on failure.
+- Speech objects register a listener with ``subscribe``; each refresh pushes
+  the new token into live configs, synthesizers and recognizers.
+- ``snapshot()`` reports refresh counts, fetch latency and refresh lag (how
+  late a refresh ran relative to its schedule).
+
+Usage:
+    manager = get_speech_token_manager()
+    await manager.start()
+    manager.apply_to_config(speech_config)
+    manager.subscribe(synthesizer.on_token_refreshed)
 """
 
 from __future__ import annotations
 
+import asyncio
 import os
+import random
 import threading
 import time
+import weakref
+from collections.abc import Callable
 from functools import lru_cache
+from typing import Any
 
 import azure.cognitiveservices.speech as speechsdk
 from azure.core.credentials import AccessToken, TokenCredential
 from utils.azure_auth import get_credential
 from utils.ml_logging import get_logger
 
+from src.pools.executors import BACKGROUND, run_blocking
+from src.tools.latency_sketch import QuantileSketch
+
 logger = get_logger(__name__)
 
 # Speech service scope for Azure AD tokens
 _SPEECH_SCOPE = "https://cognitiveservices.azure.com/.default"
 # Refresh the cached token a little before it actually expires
 _REFRESH_SKEW_SECONDS = 120
+# Background refresh runs this long before expiry, minus up to the jitter
+_REFRESH_AHEAD_SECONDS = 600
+_REFRESH_JITTER_SECONDS = 60
+_RETRY_BACKOFF_SECONDS = (2.0, 5.0, 15.0, 30.0)
+
+TokenListener = Callable[[str], None]
 
 
 class SpeechTokenManager:
-    """Caches Azure AD tokens and applies them to Speech SDK configs."""
+    """Caches and proactively refreshes Azure AD tokens and applies them to Speech SDK configs."""
 
-    def __init__(self, credential: TokenCredential, resource_id: str) -> None:
+    def __init__(
+        self,
+        credential: TokenCredential,
+        resource_id: str,
+        *,
+        refresh_ahead_s: float = _REFRESH_AHEAD_SECONDS,
+        jitter_s: float = _REFRESH_JITTER_SECONDS,
+    ) -> None:
         if not resource_id:
             raise ValueError("AZURE_SPEECH_RESOURCE_ID is required for Azure AD authentication")
         self._credential = credential
         self._resource_id = resource_id
+        self._refresh_ahead_s = refresh_ahead_s
+        self._jitter_s = jitter_s
         self._token_lock = threading.Lock()
         self._cached_token: AccessToken | None = None
         self._warmed: bool = False
 
+        self._listeners: list[Callable[[], TokenListener | None]] = []
+        self._listeners_lock = threading.Lock()
+        self._task: asyncio.Task[None] | None = None
+
+        self._metrics_lock = threading.Lock()
+        self._fetches = {"background": 0, "inline": 0, "forced": 0}
+        self._failures = 0
+        self._listener_errors = 0
+        self._fetch_latency = QuantileSketch()
+        self._refresh_lag = QuantileSketch()
+        self._next_refresh_at: float | None = None
+
     @property
     def resource_id(self) -> str:
         return self._resource_id
@@ -46,23 +98,57 @@ class SpeechTokenManager:
         """Return True if token has been pre-fetched."""
         return self._warmed
 
+    @property
+    def background_refresh_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @staticmethod
+    def _is_fresh(token: AccessToken | None, now: float) -> bool:
+        return token is not None and now < token.expires_on - _REFRESH_SKEW_SECONDS
+
     def _needs_refresh(self) -> bool:
-        if not self._cached_token:
-            return True
-        expiry_buffer = self._cached_token.expires_on - _REFRESH_SKEW_SECONDS
-        return time.time() >= expiry_buffer
+        return not self._is_fresh(self._cached_token, time.time())
 
     def get_token(self, force_refresh: bool = False) -> AccessToken:
         """Return a valid Azure AD token, refreshing if required."""
+        token = self._cached_token
+        if not force_refresh and self._is_fresh(token, time.time()):
+            return token  # hot path: no lock, no credential call
+
+        fetched = None
         with self._token_lock:
+            # Another thread may have refreshed while this one waited
             if force_refresh or self._needs_refresh():
-                logger.debug("Fetching new Azure Speech AAD token")
-                token = self._credential.get_token(_SPEECH_SCOPE)
-                self._cached_token = token
+                fetched = self._fetch("forced" if force_refresh else "inline")
             token = self._cached_token
-            if token is None:
-                raise RuntimeError("Failed to obtain Azure Speech token")
-            return token
+        if token is None:
+            raise RuntimeError("Failed to obtain Azure Speech token")
+        if fetched is not None:
+            self._notify(fetched.token)
+        return token
+
+    def refresh(self) -> AccessToken:
+        """Fetch a new token now and push it to subscribers (used by the background task)."""
+        with self._token_lock:
+            token = self._fetch("background")
+        self._notify(token.token)
+        return token
+
+    def _fetch(self, reason: str) -> AccessToken:
+        """Fetch from the credential into the cache. Caller holds ``_token_lock``."""
+        logger.debug("Fetching new Azure Speech AAD token (%s)", reason)
+        started = time.perf_counter()
+        try:
+            token = self._credential.get_token(_SPEECH_SCOPE)
+        except Exception:
+            with self._metrics_lock:
+                self._failures += 1
+            raise
+        with self._metrics_lock:
+            self._fetches[reason] += 1
+            self._fetch_latency.add(time.perf_counter() - started)
+        self._cached_token = token
+        return token
 
     def warm_token(self) -> bool:
         """
@@ -87,6 +173,8 @@ class SpeechTokenManager:
     ) -> None:
         """Attach the latest AAD token to the provided speech configuration."""
         token = self.get_token(force_refresh=force_refresh)
+        if getattr(speech_config, "authorization_token", None) == token.token:
+            return  # already current; skip the native property writes
         speech_config.authorization_token = token.token
         try:
             speech_config.set_property_by_name("SpeechServiceConnection_AuthorizationType", "aad")
@@ -100,6 +188,117 @@ class SpeechTokenManager:
         except Exception as exc:
             logger.warning("Failed to set SpeechServiceConnection_AzureResourceId: %s", exc)
 
+    # ------------------------------------------------------------------ #
+    # Token listeners
+    # ------------------------------------------------------------------ #
+
+    def subscribe(self, listener: TokenListener) -> None:
+        """
+        Call ``listener(token)`` after every refresh.
+
+        Bound methods are held weakly, so pooled speech objects stop receiving
+        tokens once they are garbage collected.
+        """
+        ref: Callable[[], TokenListener | None]
+        if hasattr(listener, "__self__"):
+            ref = weakref.WeakMethod(listener)
+        else:
+            ref = lambda: listener  # noqa: E731
+        with self._listeners_lock:
+            self._listeners.append(ref)
+
+    def _notify(self, token: str) -> None:
+        with self._listeners_lock:
+            self._listeners = [ref for ref in self._listeners if ref() is not None]
+            listeners = [ref() for ref in self._listeners]
+        for listener in listeners:
+            if listener is None:
+                continue
+            try:
+                listener(token)
+            except Exception as exc:
+                with self._metrics_lock:
+                    self._listener_errors += 1
+                logger.debug("Speech token listener failed: %s", exc)
+
+    # ------------------------------------------------------------------ #
+    # Background refresh
+    # ------------------------------------------------------------------ #
+
+    def _refresh_due(self, token: AccessToken) -> float:
+        jitter = random.uniform(0, self._jitter_s) if self._jitter_s > 0 else 0.0
+        now = time.time()
+        # Tokens shorter-lived than refresh_ahead_s are refreshed at half-life
+        return max(token.expires_on - self._refresh_ahead_s - jitter, (now + token.expires_on) / 2)
+
+    async def start(self) -> None:
+        """Fetch a token if none is cached and keep refreshing it until ``stop()``."""
+        if self._task is not None:
+            return
+        if self._cached_token is None:
+            self._warmed = await run_blocking(BACKGROUND, self.warm_token)
+
+        async def _run() -> None:
+            attempt = 0
+            due = self._refresh_due(self._cached_token) if self._cached_token else time.time()
+            scheduled = due
+            while True:
+                self._next_refresh_at = due
+                await asyncio.sleep(max(0.0, due - time.time()))
+                try:
+                    await run_blocking(BACKGROUND, self.refresh)
+                except Exception as exc:
+                    delay = _RETRY_BACKOFF_SECONDS[min(attempt, len(_RETRY_BACKOFF_SECONDS) - 1)]
+                    attempt += 1
+                    logger.warning(
+                        "Speech token refresh failed (attempt %d, retry in %.0fs): %s",
+                        attempt,
+                        delay,
+                        exc,
+                    )
+                    due = time.time() + delay
+                    continue
+                with self._metrics_lock:
+                    self._refresh_lag.add(max(0.0, time.time() - scheduled))
+                attempt = 0
+                self._warmed = True
+                due = scheduled = self._refresh_due(self._cached_token)
+
+        self._task = asyncio.create_task(_run(), name="speech-token-refresh")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self._next_refresh_at = None
+
+    def snapshot(self) -> dict[str, Any]:
+        """Refresh counters, fetch latency and refresh lag (milliseconds)."""
+        now = time.time()
+        token = self._cached_token
+        with self._listeners_lock:
+            listeners = sum(1 for ref in self._listeners if ref() is not None)
+        with self._metrics_lock:
+            return {
+                "warmed": self._warmed,
+                "background_refresh": self.background_refresh_running,
+                "expires_in_s": round(token.expires_on - now, 1) if token else None,
+                "next_refresh_in_s": (
+                    round(self._next_refresh_at - now, 1) if self._next_refresh_at else None
+                ),
+                "fetches": dict(self._fetches),
+                "failures": self._failures,
+                "listeners": listeners,
+                "listener_errors": self._listener_errors,
+                "fetch_ms": self._fetch_latency.summary(1000.0),
+                "refresh_lag_ms": self._refresh_lag.summary(1000.0),
+            }
+
 
 @lru_cache(maxsize=1)
 def get_speech_token_manager() -> SpeechTokenManager:
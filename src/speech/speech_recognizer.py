@@ -421,7 +421,10 @@ class StreamingSpeechRecognizerFromBytes:
             # Set the authorization token
             try:
                 token_manager = get_speech_token_manager()
-                token_manager.apply_to_config(speech_config, force_refresh=True)
+                token_manager.apply_to_config(speech_config)
+                if self._token_manager is None:
+                    # Receive proactive refreshes instead of fetching when recognition starts
+                    token_manager.subscribe(self._on_token_refreshed)
                 self._token_manager = token_manager
                 logger.debug("Successfully applied Azure AD token to SpeechConfig")
             except Exception as e:
@@ -502,6 +505,17 @@ class StreamingSpeechRecognizerFromBytes:
 
         self._token_manager.apply_to_config(self.cfg, force_refresh=force_refresh)
 
+    def _on_token_refreshed(self, token: str) -> None:
+        """Token manager listener: adopt a refreshed AAD token, including on a live recognizer."""
+        if self.cfg is not None:
+            self.cfg.authorization_token = token
+        recognizer = self.speech_recognizer
+        if recognizer is not None:
+            try:
+                recognizer.authorization_token = token
+            except Exception as e:
+                logger.debug("Failed to update live recognizer token: %s", e)
+
     def restart_recognition_after_auth_refresh(self) -> bool:
         """Restart speech recognition after authentication refresh.
 
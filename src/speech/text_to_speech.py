@@ -10,7 +10,9 @@ import asyncio
 import html
 import os
 import re
+import threading
 import time
+from collections import OrderedDict
 from collections.abc import Callable
 
 import azure.cognitiveservices.speech as speechsdk
@@ -34,6 +36,19 @@ logger = get_logger(__name__)
 
 _SENTENCE_END = re.compile(r"([.!?；？！。]+|\n)")
 
+# Raw PCM output formats used by synthesize_to_pcm, keyed by sample rate
+_PCM_OUTPUT_FORMATS = {
+    16000: speechsdk.SpeechSynthesisOutputFormat.Raw16Khz16BitMonoPcm,
+    24000: speechsdk.SpeechSynthesisOutputFormat.Raw24Khz16BitMonoPcm,
+    48000: speechsdk.SpeechSynthesisOutputFormat.Raw48Khz16BitMonoPcm,
+}
+_PCM_MAX_ATTEMPTS = 4
+_PCM_RETRY_DELAY_S = 0.1
+
+
+class SynthesisCancelledError(Exception):
+    """Raised when an in-flight synthesis is stopped by cancel_synthesis()."""
+
 
 def split_sentences(text: str) -> list[str]:
     """Split text into sentences while preserving delimiters for natural speech synthesis.
@@ -478,6 +493,9 @@ class SpeechSynthesizer:
     # Limit concurrent server-side TTS synth requests to avoid SDK/service hiccups
     _synth_semaphore = asyncio.Semaphore(4)
 
+    # Maximum cached native synthesizers per wrapper (one per voice/format in use)
+    _NATIVE_CACHE_SIZE = 4
+
     def __init__(
         self,
         key: str = None,
@@ -625,6 +643,19 @@ class SpeechSynthesizer:
         # Only create it when actually needed for speaker playback
         self._speaker = None
 
+        # Native synthesizers reused across sentences, keyed by (voice, output format)
+        self._native_lock = threading.RLock()
+        self._native_synthesizers: OrderedDict = OrderedDict()
+        self._native_connections: dict = {}
+        self._native_token: str | None = None
+        self._native_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+        # In-flight native syntheses (for SDK-level cancellation on barge-in)
+        self._active_syntheses: dict[int, tuple[speechsdk.SpeechSynthesizer, float]] = {}
+        self._cancelled_syntheses: set[int] = set()
+        self._synthesis_seq = 0
+        self._cancel_stats = {"cancelled": 0, "cancelled_ms": 0.0}
+
         # Create base speech config for other operations
         self.cfg = None
         try:
@@ -841,7 +872,10 @@ class SpeechSynthesizer:
 
             try:
                 token_manager = get_speech_token_manager()
-                token_manager.apply_to_config(speech_config, force_refresh=True)
+                token_manager.apply_to_config(speech_config)
+                if self._token_manager is None:
+                    # Receive proactive refreshes instead of fetching on the synthesis path
+                    token_manager.subscribe(self._on_token_refreshed)
                 self._token_manager = token_manager
                 logger.debug("Successfully applied Azure AD token to SpeechConfig")
             except Exception as e:
@@ -873,6 +907,7 @@ class SpeechSynthesizer:
             logger.info(f"Refreshing authentication for call {self.call_connection_id}")
             if self.key:
                 self.cfg = self._create_speech_config()
+                self.reset_native_synthesizers()
             else:
                 self._ensure_auth_token(force_refresh=True)
                 self._speaker = None  # force re-creation with new token
@@ -927,6 +962,7 @@ class SpeechSynthesizer:
             raise RuntimeError("Speech configuration unavailable for token refresh")
 
         self._token_manager.apply_to_config(self.cfg, force_refresh=force_refresh)
+        self._push_auth_token()
 
     def _create_speaker_synthesizer(self):
         """Create audio output synthesizer with intelligent playback mode handling.
@@ -1304,13 +1340,52 @@ class SpeechSynthesizer:
                 self._session_span = None
 
     def stop_speaking(self) -> None:
-        """Stop current playback (if any)."""
+        """Stop current playback (if any) and any in-flight in-memory synthesis."""
         if self._speaker:
             try:
                 logger.info("[🛑] Stopping speech synthesis...")
                 self._speaker.stop_speaking_async()
             except Exception as e:
                 logger.warning(f"Could not stop speech synthesis: {e}")
+        self.cancel_synthesis()
+
+    def cancel_synthesis(self) -> float:
+        """Stop in-flight native syntheses started by synthesize_to_pcm.
+
+        Calls ``stop_speaking_async`` on each active native synthesizer so the
+        executor thread blocked in ``speak_ssml_async(...).get()`` returns
+        promptly and the Speech service stops producing audio nobody will hear.
+
+        Returns:
+            Milliseconds of synthesis already spent on the cancelled requests.
+        """
+        now = time.perf_counter()
+        with self._native_lock:
+            active = list(self._active_syntheses.items())
+            self._cancelled_syntheses.update(seq for seq, _ in active)
+
+        wasted_ms = 0.0
+        for _seq, (synthesizer, started_at) in active:
+            wasted_ms += (now - started_at) * 1000
+            try:
+                synthesizer.stop_speaking_async()
+            except Exception as e:
+                logger.debug("stop_speaking_async failed: %s", e)
+
+        if active:
+            with self._native_lock:
+                self._cancel_stats["cancelled"] += len(active)
+                self._cancel_stats["cancelled_ms"] += wasted_ms
+            logger.debug(
+                "Cancelled %d in-flight synthesis request(s) after %.1fms", len(active), wasted_ms
+            )
+        return wasted_ms
+
+    @property
+    def cancellation_stats(self) -> dict[str, float]:
+        """Counters for syntheses stopped by cancel_synthesis."""
+        with self._native_lock:
+            return dict(self._cancel_stats)
 
     def synthesize_speech(
         self, text: str, voice: str = None, style: str = None, rate: str = None
@@ -1817,17 +1892,11 @@ class SpeechSynthesizer:
             # Synthesize minimal audio - a single period with minimal text
             # This establishes the WebSocket connection and caches auth
             self._ensure_auth_token()
+            self.cfg.speech_synthesis_language = self.language
 
-            speech_config = self.cfg
-            speech_config.speech_synthesis_language = self.language
-            speech_config.speech_synthesis_voice_name = self.voice
-            speech_config.set_speech_synthesis_output_format(
-                speechsdk.SpeechSynthesisOutputFormat.Raw16Khz16BitMonoPcm
-            )
-
-            # Use memory synthesis (no audio hardware needed)
-            synthesizer = speechsdk.SpeechSynthesizer(
-                speech_config=speech_config, audio_config=None
+            # Warm the cached native synthesizer so the first real sentence reuses it
+            synthesizer = self._get_native_synthesizer(
+                self.voice, speechsdk.SpeechSynthesisOutputFormat.Raw16Khz16BitMonoPcm
             )
 
             # Synthesize minimal text - just a period/dot
@@ -1845,26 +1914,10 @@ class SpeechSynthesizer:
             return False
 
     ## Cleaned up methods
-    def synthesize_to_pcm(
-        self,
-        text: str,
-        voice: str = None,
-        sample_rate: int = 16000,
-        style: str = None,
-        rate: str = None,
-    ) -> bytes:
-        """
-        Synthesize text to PCM bytes with consistent voice parameter support.
-
-        Args:
-            text: Text to synthesize
-            voice: Voice name (defaults to self.voice)
-            sample_rate: Sample rate (16000, 24000, or 48000)
-            style: Voice style
-            rate: Speech rate
-        """
-        voice = voice or self.voice
-
+    def _build_pcm_ssml(
+        self, text: str, voice: str, style: str | None, rate: str | None
+    ) -> str:
+        """Build SSML for PCM synthesis with default chat style and +3% rate."""
         if style is None:
             style_to_apply = "chat"
         else:
@@ -1879,18 +1932,6 @@ class SpeechSynthesizer:
             if not rate_to_apply:
                 rate_to_apply = None
 
-        self._ensure_auth_token()
-
-        speech_config = self.cfg
-        speech_config.speech_synthesis_voice_name = voice
-        speech_config.set_speech_synthesis_output_format(
-            {
-                16000: speechsdk.SpeechSynthesisOutputFormat.Raw16Khz16BitMonoPcm,
-                24000: speechsdk.SpeechSynthesisOutputFormat.Raw24Khz16BitMonoPcm,
-                48000: speechsdk.SpeechSynthesisOutputFormat.Raw48Khz16BitMonoPcm,
-            }[sample_rate]
-        )
-
         # Build SSML with consistent style support
         sanitized_text = self._sanitize(text)
         inner_content = sanitized_text
@@ -1905,83 +1946,265 @@ class SpeechSynthesizer:
                 f'<mstts:express-as style="{style_to_apply}">{inner_content}</mstts:express-as>'
             )
 
-        ssml = f"""<speak version="1.0" xmlns="http://www.w3.org/2001/10/synthesis" xmlns:mstts="https://www.w3.org/2001/mstts" xml:lang="en-US">
+        return f"""<speak version="1.0" xmlns="http://www.w3.org/2001/10/synthesis" xmlns:mstts="https://www.w3.org/2001/mstts" xml:lang="en-US">
     <voice name="{voice}">
         {inner_content}
     </voice>
 </speak>"""
 
-        max_attempts = 4
-        retry_delay = 0.1
-        last_result = None
-        last_error_details = ""
+    def _get_native_synthesizer(
+        self, voice: str, output_format: speechsdk.SpeechSynthesisOutputFormat
+    ) -> speechsdk.SpeechSynthesizer:
+        """Return a cached native synthesizer for (voice, output format).
+
+        The Speech SDK copies the config when a synthesizer is constructed, so a
+        separate native instance is kept per voice/format. Each one pre-opens its
+        service connection so later sentences skip object construction and the
+        WebSocket handshake. The cache is LRU-bounded by ``_NATIVE_CACHE_SIZE``.
+        """
+        key = (voice, output_format)
+        with self._native_lock:
+            synthesizer = self._native_synthesizers.get(key)
+            if synthesizer is not None:
+                self._native_synthesizers.move_to_end(key)
+                self._native_stats["hits"] += 1
+                return synthesizer
+
+            self._native_stats["misses"] += 1
+            speech_config = self.cfg
+            speech_config.speech_synthesis_voice_name = voice
+            speech_config.set_speech_synthesis_output_format(output_format)
+            synthesizer = speechsdk.SpeechSynthesizer(speech_config=speech_config, audio_config=None)
+
+            connection = None
+            try:
+                connection = speechsdk.Connection.from_speech_synthesizer(synthesizer)
+                connection.open(True)
+            except Exception as e:
+                logger.debug("Could not pre-open TTS connection (voice=%s): %s", voice, e)
+
+            self._native_synthesizers[key] = synthesizer
+            self._native_connections[key] = connection
+            while len(self._native_synthesizers) > self._NATIVE_CACHE_SIZE:
+                old_key, _ = self._native_synthesizers.popitem(last=False)
+                self._close_native_connection(self._native_connections.pop(old_key, None))
+                self._native_stats["evictions"] += 1
+            return synthesizer
+
+    def _evict_native_synthesizer(
+        self, voice: str, output_format: speechsdk.SpeechSynthesisOutputFormat
+    ) -> None:
+        """Drop a cached native synthesizer (e.g. after a failed synthesis)."""
+        key = (voice, output_format)
+        with self._native_lock:
+            self._native_synthesizers.pop(key, None)
+            self._close_native_connection(self._native_connections.pop(key, None))
+
+    def reset_native_synthesizers(self) -> None:
+        """Close all cached native synthesizers (credentials changed or shutdown)."""
+        with self._native_lock:
+            connections = list(self._native_connections.values())
+            self._native_synthesizers.clear()
+            self._native_connections.clear()
+        for connection in connections:
+            self._close_native_connection(connection)
+
+    @staticmethod
+    def _close_native_connection(connection) -> None:
+        if connection is None:
+            return
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    def _on_token_refreshed(self, token: str) -> None:
+        """Token manager listener: adopt a proactively refreshed AAD token."""
+        if self.cfg is None:
+            return
+        self.cfg.authorization_token = token
+        self._push_auth_token()
+
+    def _push_auth_token(self) -> None:
+        """Propagate the current AAD token to cached native synthesizers."""
+        token = getattr(self.cfg, "authorization_token", None) if self.cfg else None
+        if not token or token == self._native_token:
+            return
+        with self._native_lock:
+            for synthesizer in self._native_synthesizers.values():
+                try:
+                    synthesizer.authorization_token = token
+                except Exception as e:
+                    logger.debug("Failed to update cached synthesizer token: %s", e)
+            self._native_token = token
+
+    @property
+    def native_synthesizer_stats(self) -> dict[str, int]:
+        """Cache counters for the per-(voice, format) native synthesizers."""
+        with self._native_lock:
+            return {**self._native_stats, "cached": len(self._native_synthesizers)}
 
-        for attempt in range(max_attempts):
-            synthesizer = speechsdk.SpeechSynthesizer(speech_config=self.cfg, audio_config=None)
+    def _synthesize_pcm_attempt(
+        self,
+        ssml: str,
+        voice: str,
+        sample_rate: int,
+        text: str,
+        attempt: int,
+    ) -> tuple[bytes | None, bool, object]:
+        """Run one PCM synthesis attempt on the cached native synthesizer.
 
+        Returns:
+            (audio, retry, last_reason). ``audio`` is set on success; ``retry``
+            tells the caller whether another attempt is worthwhile.
+        """
+        output_format = _PCM_OUTPUT_FORMATS[sample_rate]
+        self._ensure_auth_token()
+        synthesizer = self._get_native_synthesizer(voice, output_format)
+
+        with self._native_lock:
+            self._synthesis_seq += 1
+            seq = self._synthesis_seq
+            self._active_syntheses[seq] = (synthesizer, time.perf_counter())
+        try:
             result = synthesizer.speak_ssml_async(ssml).get()
-            last_result = result
+        finally:
+            with self._native_lock:
+                self._active_syntheses.pop(seq, None)
+                cancelled = seq in self._cancelled_syntheses
+                self._cancelled_syntheses.discard(seq)
+
+        if cancelled:
+            raise SynthesisCancelledError("TTS synthesis cancelled")
+
+        # Check for 401 authentication error and retry with refresh if needed
+        if self._is_authentication_error(result):
+            error_details = getattr(result.cancellation_details, "error_details", "")
+            logger.warning(
+                "Authentication error detected in PCM synthesis (attempt=%s): %s",
+                attempt + 1,
+                error_details,
+            )
+            self._evict_native_synthesizer(voice, output_format)
+            if self.refresh_authentication():
+                logger.info("Retrying PCM synthesis with refreshed authentication")
+                return None, True, result.reason
+
+            logger.error("Failed to refresh authentication for PCM synthesis")
+            return None, False, result.reason
+
+        if result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
+            if attempt:
+                logger.info("PCM synthesis succeeded on retry attempt %s", attempt + 1)
+            return result.audio_data, False, result.reason  # raw PCM bytes
+
+        # A failed synthesis may leave the connection unusable; rebuild next time
+        self._evict_native_synthesizer(voice, output_format)
+
+        if result.reason == speechsdk.ResultReason.Canceled:
+            cancellation = result.cancellation_details
+            logger.warning(
+                "PCM synthesis canceled (attempt=%s): reason=%s error=%s (voice=%s, text_preview=%s)",
+                attempt + 1,
+                getattr(cancellation, "reason", "unknown"),
+                getattr(cancellation, "error_details", ""),
+                voice,
+                (text[:60] + "...") if len(text) > 60 else text,
+            )
+        else:
+            logger.warning(
+                "PCM synthesis returned reason=%s (attempt=%s, voice=%s)",
+                result.reason,
+                attempt + 1,
+                voice,
+            )
+        return None, True, result.reason
 
-            # Check for 401 authentication error and retry with refresh if needed
-            if self._is_authentication_error(result):
-                error_details = getattr(result.cancellation_details, "error_details", "")
-                logger.warning(
-                    "Authentication error detected in PCM synthesis (attempt=%s): %s",
-                    attempt + 1,
-                    error_details,
-                )
+    def synthesize_to_pcm(
+        self,
+        text: str,
+        voice: str = None,
+        sample_rate: int = 16000,
+        style: str = None,
+        rate: str = None,
+    ) -> bytes:
+        """
+        Synthesize text to PCM bytes with consistent voice parameter support.
 
-                if self.refresh_authentication():
-                    logger.info("Retrying PCM synthesis with refreshed authentication")
-                    continue
+        Blocking variant for callers already running in a worker thread. Prefer
+        ``synthesize_to_pcm_async`` on the event loop: it backs off between
+        retries without holding the executor thread.
 
-                logger.error("Failed to refresh authentication for PCM synthesis")
-                break
+        Args:
+            text: Text to synthesize
+            voice: Voice name (defaults to self.voice)
+            sample_rate: Sample rate (16000, 24000, or 48000)
+            style: Voice style
+            rate: Speech rate
+        """
+        voice = voice or self.voice
+        ssml = self._build_pcm_ssml(text, voice, style, rate)
+        last_reason = None
 
-            if result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
-                if attempt:
-                    logger.info("PCM synthesis succeeded on retry attempt %s", attempt + 1)
-                return result.audio_data  # raw PCM bytes
-
-            if result.reason == speechsdk.ResultReason.Canceled:
-                cancellation = result.cancellation_details
-                error_details = getattr(cancellation, "error_details", "")
-                last_error_details = error_details or "canceled"
-                logger.warning(
-                    "PCM synthesis canceled (attempt=%s): reason=%s error=%s (voice=%s, text_preview=%s)",
-                    attempt + 1,
-                    getattr(cancellation, "reason", "unknown"),
-                    error_details,
-                    voice,
-                    (text[:60] + "...") if len(text) > 60 else text,
-                )
+        for attempt in range(_PCM_MAX_ATTEMPTS):
+            audio, retry, last_reason = self._synthesize_pcm_attempt(
+                ssml, voice, sample_rate, text, attempt
+            )
+            if audio is not None:
+                return audio
+            if not retry or attempt == _PCM_MAX_ATTEMPTS - 1:
+                break
+            time.sleep(_PCM_RETRY_DELAY_S * (attempt + 1))
 
-                if (
-                    attempt < max_attempts - 1
-                    and getattr(cancellation, "reason", None) == speechsdk.CancellationReason.Error
-                    and error_details
-                    and "Codec decoding is not started within 2s" in error_details
-                ):
-                    time.sleep(retry_delay * (attempt + 1))
-                    continue
-            else:
-                last_error_details = str(result.reason)
-                logger.warning(
-                    "PCM synthesis returned reason=%s (attempt=%s, voice=%s)",
-                    result.reason,
-                    attempt + 1,
-                    voice,
-                )
+        raise RuntimeError(f"TTS failed: {last_reason or 'unknown error'}")
 
-            if attempt < max_attempts - 1:
-                time.sleep(retry_delay * (attempt + 1))
-                continue
+    async def synthesize_to_pcm_async(
+        self,
+        text: str,
+        voice: str = None,
+        sample_rate: int = 16000,
+        style: str = None,
+        rate: str = None,
+        *,
+        executor=None,
+    ) -> bytes:
+        """
+        Synthesize text to PCM bytes from the event loop.
 
-            break
+        Each attempt runs on ``executor`` (default loop executor when None);
+        the retry back-off is an ``asyncio.sleep`` so the worker thread is
+        returned to the pool between attempts. Cancelling the awaiting task
+        stops the native synthesis via ``cancel_synthesis``.
+        """
+        voice = voice or self.voice
+        ssml = self._build_pcm_ssml(text, voice, style, rate)
+        loop = asyncio.get_running_loop()
+        last_reason = None
+
+        for attempt in range(_PCM_MAX_ATTEMPTS):
+            future = loop.run_in_executor(
+                executor,
+                self._synthesize_pcm_attempt,
+                ssml,
+                voice,
+                sample_rate,
+                text,
+                attempt,
+            )
+            try:
+                audio, retry, last_reason = await future
+            except asyncio.CancelledError:
+                # Task cancellation cannot interrupt the worker thread; stop the
+                # native synthesis so the thread is released right away.
+                self.cancel_synthesis()
+                raise
+            if audio is not None:
+                return audio
+            if not retry or attempt == _PCM_MAX_ATTEMPTS - 1:
+                break
+            await asyncio.sleep(_PCM_RETRY_DELAY_S * (attempt + 1))
 
-        if last_result and last_result.reason:
-            raise RuntimeError(f"TTS failed: {last_result.reason}")
-        raise RuntimeError(f"TTS failed: {last_error_details or 'unknown error'}")
+        raise RuntimeError(f"TTS failed: {last_reason or 'unknown error'}")
 
     @staticmethod
     def split_pcm_to_base64_frames(pcm_bytes: bytes, sample_rate: int = 16000) -> list[str]:
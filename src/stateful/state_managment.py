@@ -52,8 +52,10 @@ from src.agenticmemory.types import ChatHistory, CoreMemory
 from src.agenticmemory.utils import LatencyTracker
 
 # TODO Fix this area
+from src.pools.executors import REDIS, get_executor, run_blocking
 from src.redis.manager import AzureRedisManager
-from src.tools.latency_helpers import PersistentLatency, StageSample
+from src.redis.session_index import summarize_session
+from src.tools.latency_helpers import PersistentLatency, StageSample, append_run_sample
 
 logger = get_logger("src.stateful.state_managment")
 
@@ -381,6 +383,7 @@ class MemoManager:
         redis_mgr.store_session_data(key, self.to_redis_dict())
         if ttl_seconds:
             redis_mgr.redis_client.expire(key, ttl_seconds)
+        self._index_session(redis_mgr)
         logger.info(
             f"Persisted session {self.session_id} – "
             f"histories per agent: {[f'{a}: {len(h)}' for a, h in self.histories.items()]}, ctx_keys={list(self.context.keys())}"
@@ -427,9 +430,12 @@ class MemoManager:
         try:
             key = self.build_redis_key(self.session_id)
             await redis_mgr.store_session_data_async(key, self.to_redis_dict())
+            loop = asyncio.get_event_loop()
             if ttl_seconds:
-                loop = asyncio.get_event_loop()
-                await loop.run_in_executor(None, redis_mgr.redis_client.expire, key, ttl_seconds)
+                await loop.run_in_executor(
+                    get_executor(REDIS), redis_mgr.redis_client.expire, key, ttl_seconds
+                )
+            await run_blocking(REDIS, self._index_session, redis_mgr, critical=False)
             logger.info(
                 f"Persisted session {self.session_id} async – "
                 f"histories per agent: {[f'{a}: {len(h)}' for a, h in self.histories.items()]}, ctx_keys={list(self.context.keys())}"
@@ -442,6 +448,14 @@ class MemoManager:
             logger.error(f"Error persisting session {self.session_id} to Redis: {e}")
             # Don't re-raise non-cancellation errors to avoid crashing the caller
 
+    def _index_session(self, redis_mgr: AzureRedisManager) -> None:
+        """Refresh this session's entry in the session index (best effort)."""
+        try:
+            summary = summarize_session(self.session_id, self.context, self.histories)
+            redis_mgr.session_index.record(self.session_id, summary)
+        except Exception as e:
+            logger.warning(f"Failed to update session index for {self.session_id}: {e}")
+
     async def persist_background(
         self,
         redis_mgr: AzureRedisManager | None = None,
@@ -850,25 +864,10 @@ class MemoManager:
         # compute and append to CoreMemory["latency"] to preserve behavior
         bucket = self.corememory.get("latency", {"runs": {}, "order": []})
         run_id = bucket.get("current_run_id") or "legacy"
-        sample = StageSample(stage=stage, start=start_t, end=end_t, dur=end_t - start_t)
-        # append
-        runs = bucket.setdefault("runs", {})
-        run = runs.setdefault(
-            run_id,
-            {"run_id": run_id, "label": "legacy", "created_at": start_t, "samples": []},
-        )
-        run["samples"].append(
-            {
-                "stage": sample.stage,
-                "start": sample.start,
-                "end": sample.end,
-                "dur": sample.dur,
-                "meta": {},
-            }
+        sample = StageSample(
+            stage=stage, start=start_t, end=end_t, dur=end_t - start_t, meta={}
         )
-        order = bucket.setdefault("order", [])
-        if run_id not in order:
-            order.append(run_id)
+        append_run_sample(bucket, run_id, sample, label="legacy", created_at=start_t)
         self.corememory.set("latency", bucket)
 
     def latency_summary(self) -> dict[str, dict[str, float]]:
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-import math
 from collections import defaultdict
-from collections.abc import Iterable
 from typing import Any
 
+from src.tools.latency_helpers import summarize_stage_stats
+from src.tools.latency_sketch import QuantileSketch
+
 Number = float
 
+AGENT_STAGES = ("auth_agent", "general_agent", "claim_agent")
+
 
 def compute_latency_statistics(
     payload: dict[str, Any],
@@ -15,15 +18,21 @@ def compute_latency_statistics(
 ) -> dict[str, Any]:
     """
     Ingest a latency payload shaped like the example you posted and produce:
-      - per-stage stats (count, sum, avg, min, max, p50, p90, p95)
+      - per-stage stats (count, sum, avg, min, max, p50, p90, p95, p99)
       - per-agent stats (auth/general/claim stages)
       - per-voice stats for tts:synthesis
       - per-run summaries (totals + maxima)
       - SLA rollups against optional thresholds
       - front-end friendly bar chart series
 
+    Percentiles come from quantile sketches (1% relative error), so no sample
+    list is sorted. When the payload carries running ``stage_stats`` they are
+    used for the per-stage and per-agent stats, and runs trimmed to their own
+    ``stage_stats`` are summarized from those.
+
     Args:
-        payload: Dict with keys like 'runs', 'order', optionally 'current_run_id'.
+        payload: Dict with keys like 'runs', 'order', optionally 'current_run_id'
+                 and 'stage_stats'.
         stage_thresholds: Optional thresholds (seconds) per stage to flag breaches.
                           e.g. {'tts': 1.5, 'greeting_ttfb': 2.0, 'auth_agent': 8.0}
 
@@ -32,38 +41,13 @@ def compute_latency_statistics(
     """
 
     # ---------------- helpers ----------------
-    def _percentiles(values: list[Number], ps: Iterable[Number]) -> dict[str, Number]:
-        if not values:
-            return {f"p{int(p)}": 0.0 for p in ps}
-        xs = sorted(values)
-        n = len(xs)
-        out: dict[str, Number] = {}
-        for p in ps:
-            if n == 1:
-                out[f"p{int(p)}"] = xs[0]
-                continue
-            k = (p / 100.0) * (n - 1)
-            f = math.floor(k)
-            c = math.ceil(k)
-            if f == c:
-                val = xs[int(k)]
-            else:
-                val = xs[f] + (xs[c] - xs[f]) * (k - f)
-            out[f"p{int(p)}"] = float(val)
-        return out
-
-    def _agg(values: list[Number]) -> dict[str, Number]:
-        if not values:
+    def _agg(sketch: QuantileSketch | None) -> dict[str, Number]:
+        if sketch is None or not sketch.count:
             return dict(count=0, total=0.0, avg=0.0, min=0.0, max=0.0, p50=0.0, p90=0.0, p95=0.0)
-        total = float(sum(values))
-        return {
-            "count": len(values),
-            "total": total,
-            "avg": total / len(values),
-            "min": float(min(values)),
-            "max": float(max(values)),
-            **_percentiles(values, [50, 90, 95]),
-        }
+        return sketch.summary()
+
+    def _stat(stats: dict[str, Any], stage: str, key: str) -> Number:
+        return float(stats.get(stage, {}).get(key, 0.0))
 
     def _pct(num: int, den: int) -> float:
         return 0.0 if den <= 0 else (100.0 * num / den)
@@ -72,10 +56,12 @@ def compute_latency_statistics(
     runs: dict[str, Any] = payload.get("runs", {}) or {}
     order: list[str] = payload.get("order") or list(runs.keys())
     stage_thresholds = stage_thresholds or {"tts": 1.5, "greeting_ttfb": 2.0}
+    # Running aggregates (see latency_helpers.record_stage_stat) cover every sample,
+    # including runs evicted or trimmed to their per-run stage_stats
+    session_stats: dict[str, Any] = payload.get("stage_stats") or {}
 
-    per_stage: dict[str, list[Number]] = defaultdict(list)
-    per_agent_stage: dict[str, list[Number]] = defaultdict(list)
-    per_voice_synth: dict[str, list[Number]] = defaultdict(list)
+    per_stage: dict[str, QuantileSketch] = defaultdict(QuantileSketch)
+    per_voice_synth: dict[str, QuantileSketch] = defaultdict(QuantileSketch)
 
     per_run_summary: list[dict[str, Any]] = []
     threshold_breaches: dict[str, list[dict[str, Any]]] = defaultdict(list)
@@ -83,6 +69,38 @@ def compute_latency_statistics(
     for run_id in order:
         r = runs.get(run_id) or {}
         samples = r.get("samples", []) or []
+        run_stats = r.get("stage_stats") or {}
+
+        if not samples and run_stats:
+            # Trimmed run: only its per-stage aggregates remain
+            for stage, acc in run_stats.items():
+                if stage in stage_thresholds and acc["max"] > float(stage_thresholds[stage]):
+                    threshold_breaches[stage].append(
+                        {
+                            "run_id": run_id,
+                            "duration": float(acc["max"]),
+                            "threshold": float(stage_thresholds[stage]),
+                        }
+                    )
+            per_run_summary.append(
+                {
+                    "run_id": run_id,
+                    "tts": {
+                        "segments": int(_stat(run_stats, "tts", "count")),
+                        "sum": _stat(run_stats, "tts", "total"),
+                        "max_single": _stat(run_stats, "tts", "max"),
+                    },
+                    "synthesis_sum": _stat(run_stats, "tts:synthesis", "total"),
+                    "send_frames_sum": _stat(run_stats, "tts:send_frames", "total"),
+                    "greeting_ttfb": _stat(run_stats, "greeting_ttfb", "max"),
+                    "agent_times": {
+                        stage: _stat(run_stats, stage, "total")
+                        for stage in AGENT_STAGES
+                        if stage in run_stats
+                    },
+                }
+            )
+            continue
 
         tts_segments: list[Number] = []
         synth_segments: list[Number] = []
@@ -94,10 +112,10 @@ def compute_latency_statistics(
         for s in samples:
             stage = s.get("stage")
             dur = float(s.get("dur", 0.0) or 0.0)
-            per_stage[stage].append(dur)
+            if not session_stats:
+                per_stage[stage].add(dur)
 
-            if stage in ("auth_agent", "general_agent", "claim_agent"):
-                per_agent_stage[stage].append(dur)
+            if stage in AGENT_STAGES:
                 agent_times[stage] = agent_times.get(stage, 0.0) + dur
 
             if stage == "tts":
@@ -107,7 +125,7 @@ def compute_latency_statistics(
                 meta = s.get("meta") or {}
                 voice = meta.get("voice")
                 if voice:
-                    per_voice_synth[voice].append(dur)
+                    per_voice_synth[voice].add(dur)
             elif stage == "tts:send_frames":
                 send_segments.append(dur)
             elif stage == "greeting_ttfb":
@@ -139,9 +157,17 @@ def compute_latency_statistics(
         )
 
     # --------------- aggregates ----------------
-    stage_stats = {stage: _agg(vals) for stage, vals in per_stage.items()}
-    agent_stats = {agent: _agg(vals) for agent, vals in per_agent_stage.items()}
-    voice_stats = {voice: _agg(vals) for voice, vals in per_voice_synth.items()}
+    if session_stats:
+        stage_stats = {
+            stage: _agg(QuantileSketch.from_dict(acc["sketch"]))
+            if acc.get("sketch")
+            else summarize_stage_stats({stage: acc})[stage]
+            for stage, acc in session_stats.items()
+        }
+    else:
+        stage_stats = {stage: _agg(sketch) for stage, sketch in per_stage.items()}
+    agent_stats = {agent: stage_stats[agent] for agent in AGENT_STAGES if agent in stage_stats}
+    voice_stats = {voice: _agg(sketch) for voice, sketch in per_voice_synth.items()}
 
     # SLA rollups (examples)
     n_runs = len(per_run_summary)
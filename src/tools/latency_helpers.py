@@ -8,11 +8,15 @@ from typing import Any
 
 from utils.ml_logging import get_logger
 
+from src.tools.latency_sketch import QuantileSketch, process_sketches
+
 logger = get_logger("tools.latency_helpers")
 
 # Limits to keep Redis payloads bounded (tweak via env)
 MAX_RUNS = int(os.getenv("LAT_MAX_RUNS", "200"))
 MAX_SAMPLES_PER_RUN = int(os.getenv("LAT_MAX_SAMPLES_PER_RUN", "200"))
+# Runs older than the most recent N keep only their per-stage aggregates
+MAX_DETAILED_RUNS = int(os.getenv("LAT_MAX_DETAILED_RUNS", "20"))
 
 
 @dataclass
@@ -33,6 +37,96 @@ class RunRecord:
 
 
 _CORE_KEY = "latency"  # lives under CoreMemory["latency"]
+_STATS_KEY = "stage_stats"  # running per-stage aggregates inside the latency bucket
+
+
+def _fold_stage_stat(
+    stats: dict[str, Any], stage: str, dur: float, *, sketch: bool = True
+) -> None:
+    acc = stats.get(stage)
+    if acc is None:
+        acc = stats[stage] = {"count": 0, "total": 0.0, "min": dur, "max": dur}
+    acc["count"] += 1
+    acc["total"] += dur
+    if dur < acc["min"]:
+        acc["min"] = dur
+    if dur > acc["max"]:
+        acc["max"] = dur
+    if sketch:
+        QuantileSketch.from_dict(acc.setdefault("sketch", {})).add(dur)
+
+
+def record_stage_stat(bucket: dict[str, Any], stage: str, dur: float) -> None:
+    """
+    Fold one sample into the bucket's running per-stage aggregates.
+
+    Kept alongside the raw samples so session summaries (and the post-call
+    analytics document) never rescan every run. Aggregates cover every sample
+    ever recorded, including runs later evicted by ``MAX_RUNS``, and carry a
+    quantile sketch for percentiles. The sample also feeds the process-wide
+    sketches (``process_sketches()``).
+    """
+    _fold_stage_stat(bucket.setdefault(_STATS_KEY, {}), stage, dur)
+    process_sketches().record(stage, dur)
+
+
+def summarize_stage_stats(stats: dict[str, dict[str, Any]]) -> dict[str, dict[str, float]]:
+    """
+    Expand running aggregates to ``{stage: {count, avg, min, max, total}}``.
+
+    Stages recorded with a sketch also report ``p50``/``p90``/``p95``/``p99``.
+    """
+    out: dict[str, dict[str, float]] = {}
+    for stage, acc in stats.items():
+        out[stage] = {
+            "count": acc["count"],
+            "avg": acc["total"] / acc["count"] if acc["count"] else 0.0,
+            "min": acc["min"],
+            "max": acc["max"],
+            "total": acc["total"],
+        }
+        if acc.get("sketch"):
+            sketch = QuantileSketch.from_dict(acc["sketch"])
+            out[stage].update({k: v for k, v in sketch.summary().items() if k[0] == "p"})
+    return out
+
+
+def append_run_sample(
+    bucket: dict[str, Any],
+    run_id: str,
+    sample: StageSample,
+    *,
+    label: str = "turn",
+    created_at: float | None = None,
+) -> None:
+    """
+    Append ``sample`` to run ``run_id`` of a latency bucket.
+
+    Updates the session aggregates and the run's own ``stage_stats`` (no
+    sketch), caps the run's raw samples at ``MAX_SAMPLES_PER_RUN`` and creates
+    the run if it does not exist yet.
+    """
+    runs = bucket.setdefault("runs", {})
+    run = runs.get(run_id)
+    if not run:
+        # create missing run bucket if someone forgot begin_run()
+        run = runs[run_id] = asdict(
+            RunRecord(
+                run_id=run_id,
+                label=label,
+                created_at=_now() if created_at is None else created_at,
+                samples=[],
+            )
+        )
+        bucket.setdefault("order", []).append(run_id)
+
+    samples: list[dict[str, Any]] = run.setdefault("samples", [])
+    samples.append(asdict(sample))
+    record_stage_stat(bucket, sample.stage, sample.dur)
+    _fold_stage_stat(run.setdefault(_STATS_KEY, {}), sample.stage, sample.dur, sketch=False)
+    # cap samples to avoid unbounded growth
+    if len(samples) > MAX_SAMPLES_PER_RUN:
+        del samples[0 : len(samples) - MAX_SAMPLES_PER_RUN]
 
 
 def _now() -> float:
@@ -55,11 +149,15 @@ class PersistentLatency:
            "samples": [
               {"stage": "stt", "start": ..., "end": ..., "dur": ..., "meta": {...}},
               ...
-           ]
+           ],                       # emptied once MAX_DETAILED_RUNS newer runs exist
+           "stage_stats": {"stt": {"count": ..., "total": ..., "min": ..., "max": ...}}
          },
          ...
       },
-      "order": ["abc123", "def456", ...]  # recency list to enforce MAX_RUNS
+      "order": ["abc123", "def456", ...],  # recency list to enforce MAX_RUNS
+      "stage_stats": {                     # whole session, incl. evicted runs
+         "stt": {"count": ..., "total": ..., "min": ..., "max": ..., "sketch": {...}}
+      }
     }
     """
 
@@ -84,6 +182,11 @@ class PersistentLatency:
         while len(lat["order"]) > MAX_RUNS:
             oldest = lat["order"].pop(0)
             lat["runs"].pop(oldest, None)
+        # older runs keep their per-stage aggregates only
+        if len(lat["order"]) > MAX_DETAILED_RUNS:
+            settled = lat["runs"].get(lat["order"][-MAX_DETAILED_RUNS - 1])
+            if settled and settled.get(_STATS_KEY):
+                settled["samples"] = []
         self._set_bucket(lat)
         return rid
 
@@ -135,6 +238,8 @@ class PersistentLatency:
         Returns { stage: {count, avg, min, max, total} }
         """
         lat = self._get_bucket()
+        if lat.get(_STATS_KEY):
+            return summarize_stage_stats(lat[_STATS_KEY])
         out: dict[str, dict[str, float]] = {}
         for rid in lat.get("order", []):
             for s in lat["runs"].get(rid, {}).get("samples", []):
@@ -160,6 +265,8 @@ class PersistentLatency:
         out: dict[str, dict[str, float]] = {}
         if not run:
             return out
+        if run.get(_STATS_KEY):
+            return summarize_stage_stats(run[_STATS_KEY])
         for s in run.get("samples", []):
             d = s["dur"]
             st = s["stage"]
@@ -177,18 +284,7 @@ class PersistentLatency:
     # ---------- helpers ----------
     def _append_sample(self, run_id: str, sample: StageSample) -> None:
         lat = self._get_bucket()
-        run = lat.setdefault("runs", {}).get(run_id)
-        if not run:
-            # create missing run bucket if someone forgot begin_run()
-            run = asdict(RunRecord(run_id=run_id, label="turn", created_at=_now(), samples=[]))
-            lat.setdefault("runs", {})[run_id] = run
-            lat.setdefault("order", []).append(run_id)
-
-        samples: list[dict[str, Any]] = run["samples"]
-        samples.append(asdict(sample))
-        # cap samples to avoid unbounded growth
-        if len(samples) > MAX_SAMPLES_PER_RUN:
-            del samples[0 : len(samples) - MAX_SAMPLES_PER_RUN]
+        append_run_sample(lat, run_id, sample)
         self._set_bucket(lat)
 
     def _get_bucket(self) -> dict[str, Any]:
@@ -0,0 +1,294 @@
+"""
+Latency Sketch
+==============
+
+Mergeable, fixed-size quantile sketches for stage latencies.
+
+``QuantileSketch`` is a DDSketch-style log-bucketed histogram: a value ``v``
+is counted in bucket ``ceil(log(v) / log(gamma))`` with
+``gamma = (1 + a) / (1 - a)``, so every quantile is answered within relative
+error ``a`` (1% by default). Its size depends on the spread of the values,
+not on how many were added, and sketches with the same accuracy merge by
+adding bucket counts - per-session and per-replica sketches combine into
+fleet-wide percentiles without shipping raw samples.
+
+The sketch state is a plain JSON-ready dict mutated in place, so it can live
+inside a session's core memory and round-trip through Redis unchanged::
+
+    {"a": 0.01, "n": 42, "s": 12.6, "lo": 0.08, "hi": 1.9, "z": 0,
+     "b": {"-118": 3, "-117": 5, ...}}
+
+``StageSketches`` keeps one sketch per stage; ``process_sketches()`` is the
+process-wide instance that every recorded stage sample also feeds.
+
+Usage:
+    from src.tools.latency_sketch import QuantileSketch, merge_sketches
+
+    sketch = QuantileSketch()
+    for dur in durations:
+        sketch.add(dur)
+    p50, p95, p99 = sketch.quantiles((0.5, 0.95, 0.99))
+
+    fleet = merge_sketches([replica_a_state, replica_b_state])
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from collections.abc import Iterable
+from typing import Any
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+DEFAULT_MAX_BINS = 1024
+SUMMARY_QUANTILES = (0.5, 0.9, 0.95, 0.99)
+
+# Values at or below this are counted in the zero bucket (log is undefined)
+_MIN_INDEXABLE = 1e-9
+
+
+class QuantileSketch:
+    """
+    Relative-error quantile sketch over positive values.
+
+    :param relative_accuracy: Maximum relative error of quantile estimates
+    :param max_bins: Bucket cap; when exceeded the lowest buckets are folded
+        together, trading accuracy on the fastest samples for bounded size
+    :param state: Existing sketch state to wrap (mutated in place)
+    """
+
+    __slots__ = ("state", "max_bins", "_gamma", "_log_gamma")
+
+    def __init__(
+        self,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+        *,
+        max_bins: int = DEFAULT_MAX_BINS,
+        state: dict[str, Any] | None = None,
+    ) -> None:
+        if state is None:
+            if not 0.0 < relative_accuracy < 1.0:
+                raise ValueError("relative_accuracy must be between 0 and 1")
+            state = {}
+        state.setdefault("a", relative_accuracy)
+        state.setdefault("n", 0)
+        state.setdefault("s", 0.0)
+        state.setdefault("lo", None)
+        state.setdefault("hi", None)
+        state.setdefault("z", 0)
+        state.setdefault("b", {})
+        self.state = state
+        self.max_bins = max_bins
+        alpha = state["a"]
+        self._gamma = (1.0 + alpha) / (1.0 - alpha)
+        self._log_gamma = math.log(self._gamma)
+
+    @classmethod
+    def from_dict(
+        cls, state: dict[str, Any], *, max_bins: int = DEFAULT_MAX_BINS
+    ) -> QuantileSketch:
+        """Wrap a serialized sketch state without copying it."""
+        return cls(max_bins=max_bins, state=state)
+
+    def to_dict(self) -> dict[str, Any]:
+        return self.state
+
+    def copy(self) -> QuantileSketch:
+        return QuantileSketch(
+            max_bins=self.max_bins,
+            state={**self.state, "b": dict(self.state["b"])},
+        )
+
+    # ------------------------------------------------------------------ #
+    # Aggregates
+    # ------------------------------------------------------------------ #
+
+    @property
+    def relative_accuracy(self) -> float:
+        return self.state["a"]
+
+    @property
+    def count(self) -> int:
+        return self.state["n"]
+
+    @property
+    def total(self) -> float:
+        return self.state["s"]
+
+    @property
+    def min(self) -> float:
+        return self.state["lo"] if self.state["lo"] is not None else 0.0
+
+    @property
+    def max(self) -> float:
+        return self.state["hi"] if self.state["hi"] is not None else 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.state["s"] / self.state["n"] if self.state["n"] else 0.0
+
+    # ------------------------------------------------------------------ #
+    # Updates
+    # ------------------------------------------------------------------ #
+
+    def add(self, value: float, count: int = 1) -> None:
+        state = self.state
+        state["n"] += count
+        state["s"] += value * count
+        if state["lo"] is None or value < state["lo"]:
+            state["lo"] = value
+        if state["hi"] is None or value > state["hi"]:
+            state["hi"] = value
+        if value <= _MIN_INDEXABLE:
+            state["z"] += count
+            return
+        key = str(math.ceil(math.log(value) / self._log_gamma))
+        bins = state["b"]
+        bins[key] = bins.get(key, 0) + count
+        if len(bins) > self.max_bins:
+            self._collapse()
+
+    def merge(self, other: QuantileSketch) -> QuantileSketch:
+        """
+        Fold ``other`` into this sketch and return ``self``.
+
+        Raises:
+            ValueError: if the sketches were built with different accuracies
+        """
+        if not math.isclose(self.relative_accuracy, other.relative_accuracy):
+            raise ValueError(
+                f"Cannot merge sketches with accuracy {self.relative_accuracy} "
+                f"and {other.relative_accuracy}"
+            )
+        theirs = other.state
+        if not theirs["n"]:
+            return self
+        state = self.state
+        state["n"] += theirs["n"]
+        state["s"] += theirs["s"]
+        state["z"] += theirs["z"]
+        if state["lo"] is None or theirs["lo"] < state["lo"]:
+            state["lo"] = theirs["lo"]
+        if state["hi"] is None or theirs["hi"] > state["hi"]:
+            state["hi"] = theirs["hi"]
+        bins = state["b"]
+        for key, count in theirs["b"].items():
+            bins[key] = bins.get(key, 0) + count
+        if len(bins) > self.max_bins:
+            self._collapse()
+        return self
+
+    def _collapse(self) -> None:
+        bins = self.state["b"]
+        ordered = sorted(bins, key=int)
+        excess = ordered[: len(ordered) - self.max_bins + 1]
+        folded = sum(bins.pop(key) for key in excess)
+        floor = ordered[len(excess)]
+        bins[floor] += folded
+
+    # ------------------------------------------------------------------ #
+    # Queries
+    # ------------------------------------------------------------------ #
+
+    def quantile(self, q: float) -> float:
+        """Estimate the ``q`` quantile (0..1); 0.0 for an empty sketch."""
+        return self.quantiles((q,))[0]
+
+    def quantiles(self, qs: Iterable[float]) -> list[float]:
+        """Estimate several quantiles in one pass over the buckets."""
+        state = self.state
+        qs = list(qs)
+        if not state["n"] or not qs:
+            return [0.0] * len(qs)
+        ranks = sorted(
+            (min(max(q, 0.0), 1.0) * (state["n"] - 1), i) for i, q in enumerate(qs)
+        )
+        out = [self.max] * len(qs)
+        pending = iter(ranks)
+        rank, slot = next(pending)
+        seen = state["z"]
+        try:
+            while rank < seen:
+                out[slot] = self.min
+                rank, slot = next(pending)
+            bins = state["b"]
+            for index in sorted(map(int, bins)):
+                seen += bins[str(index)]
+                if seen <= rank:
+                    continue
+                estimate = 2.0 * self._gamma**index / (self._gamma + 1.0)
+                estimate = min(max(estimate, self.min), self.max)
+                while rank < seen:
+                    out[slot] = estimate
+                    rank, slot = next(pending)
+        except StopIteration:
+            pass
+        return out
+
+    def summary(self, scale: float = 1.0) -> dict[str, float]:
+        """``{count, avg, min, max, total, p50, p90, p95, p99}``, values times ``scale``."""
+        out: dict[str, float] = {
+            "count": self.count,
+            "avg": self.mean * scale,
+            "min": self.min * scale,
+            "max": self.max * scale,
+            "total": self.total * scale,
+        }
+        for q, value in zip(SUMMARY_QUANTILES, self.quantiles(SUMMARY_QUANTILES), strict=True):
+            out[f"p{round(q * 100)}"] = value * scale
+        return out
+
+
+def merge_sketches(states: Iterable[dict[str, Any]]) -> QuantileSketch:
+    """Merge serialized sketches into a new sketch; the inputs are not modified."""
+    merged: QuantileSketch | None = None
+    for state in states:
+        sketch = QuantileSketch.from_dict(state)
+        merged = sketch.copy() if merged is None else merged.merge(sketch)
+    return merged if merged is not None else QuantileSketch()
+
+
+class StageSketches:
+    """Thread-safe per-stage sketches (stage samples are recorded from worker threads too)."""
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY) -> None:
+        self.relative_accuracy = relative_accuracy
+        self._lock = threading.Lock()
+        self._sketches: dict[str, QuantileSketch] = {}
+
+    def record(self, stage: str, value: float) -> None:
+        with self._lock:
+            sketch = self._sketches.get(stage)
+            if sketch is None:
+                sketch = self._sketches[stage] = QuantileSketch(self.relative_accuracy)
+            sketch.add(value)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Copy of every stage's serialized sketch."""
+        with self._lock:
+            return {stage: sketch.copy().to_dict() for stage, sketch in self._sketches.items()}
+
+    def summary(self, scale: float = 1.0) -> dict[str, dict[str, float]]:
+        with self._lock:
+            return {stage: sketch.summary(scale) for stage, sketch in self._sketches.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._sketches.clear()
+
+
+_PROCESS_SKETCHES = StageSketches()
+
+
+def process_sketches() -> StageSketches:
+    """Per-stage sketches of every sample recorded in this process."""
+    return _PROCESS_SKETCHES
+
+
+__all__ = [
+    "DEFAULT_RELATIVE_ACCURACY",
+    "QuantileSketch",
+    "StageSketches",
+    "merge_sketches",
+    "process_sketches",
+]
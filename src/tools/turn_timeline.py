@@ -0,0 +1,311 @@
+"""
+Turn Timeline
+=============
+
+One monotonic timeline per conversational turn, stitched across the
+components that each see only part of it:
+
+- ``vad_end``          caller stopped speaking (media handler endpointer)
+- ``stt_final``        recognizer delivered the final transcript
+- ``llm_request``      chat completion request issued
+- ``llm_first_token``  first streamed token received
+- ``first_sentence``   first sentence handed to TTS
+- ``tts_first_byte``   first synthesized audio available
+- ``first_frame_sent`` first audio frame written to the transport
+- ``last_frame_sent``  last audio frame written to the transport
+- ``barge_in``         caller interrupted the response
+
+Components mark stages by session id on the process-wide registry
+(``turn_timelines()``); a mark is a ``perf_counter`` read and a dict insert,
+and marks for sessions without an open timeline are ignored. The first mark
+of a stage wins except ``last_frame_sent``, which moves with every played
+sentence. The end of speech is held until the transcript arrives, since the
+endpointer may see several pauses in one utterance.
+
+A turn is finished when the next turn begins or the session closes. Each
+stage's segment (time since the previous stage reached in this turn, in
+``STAGES`` order) and the caller-perceived ``response`` time (end of speech
+to first frame sent) are recorded as ``turn.<stage>`` samples: into the
+session's latency bucket when the timeline has a ``MemoManager``, and always
+into ``process_sketches()``, so fleet-wide stage percentiles come from the
+existing sketch publishing. The last ``TURN_TIMELINE_MAX_TURNS`` waterfalls
+are kept in core memory under ``turn_timeline`` for the per-session endpoint.
+
+Set ``TURN_TIMELINE_ENABLED=false`` to turn every mark into a no-op.
+
+Usage:
+    from src.tools.turn_timeline import STT_FINAL, turn_timelines
+
+    timelines = turn_timelines()
+    timelines.open(session_id, memory_manager=cm)
+    timelines.begin_turn(session_id, turn_number)   # marks stt_final
+    timelines.mark(session_id, LLM_FIRST_TOKEN)
+    timelines.close(session_id)
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any
+
+from utils.ml_logging import get_logger
+
+from src.tools.latency_helpers import record_stage_stat
+from src.tools.latency_sketch import process_sketches
+
+logger = get_logger("tools.turn_timeline")
+
+TURN_TIMELINE_ENABLED = os.getenv("TURN_TIMELINE_ENABLED", "true").lower() in {
+    "1",
+    "true",
+    "yes",
+    "on",
+}
+# Completed turns kept per session (in memory and in core memory)
+TURN_TIMELINE_MAX_TURNS = int(os.getenv("TURN_TIMELINE_MAX_TURNS", "50"))
+# Open sessions tracked per process; the least recently opened is dropped beyond this
+TURN_TIMELINE_MAX_SESSIONS = int(os.getenv("TURN_TIMELINE_MAX_SESSIONS", "2000"))
+
+VAD_END = "vad_end"
+STT_FINAL = "stt_final"
+LLM_REQUEST = "llm_request"
+LLM_FIRST_TOKEN = "llm_first_token"
+FIRST_SENTENCE = "first_sentence"
+TTS_FIRST_BYTE = "tts_first_byte"
+FIRST_FRAME_SENT = "first_frame_sent"
+LAST_FRAME_SENT = "last_frame_sent"
+BARGE_IN = "barge_in"
+
+STAGES = (
+    VAD_END,
+    STT_FINAL,
+    LLM_REQUEST,
+    LLM_FIRST_TOKEN,
+    FIRST_SENTENCE,
+    TTS_FIRST_BYTE,
+    FIRST_FRAME_SENT,
+    LAST_FRAME_SENT,
+    BARGE_IN,
+)
+RESPONSE = "response"
+STAGE_PREFIX = "turn."
+CORE_KEY = "turn_timeline"
+
+_STAGE_ORDER = {stage: index for index, stage in enumerate(STAGES)}
+_LATEST_WINS = frozenset({LAST_FRAME_SENT})
+
+
+class TurnTimeline:
+    """Monotonic stage timestamps (``perf_counter`` seconds) for one turn."""
+
+    __slots__ = ("turn", "marks")
+
+    def __init__(self, turn: int) -> None:
+        self.turn = turn
+        self.marks: dict[str, float] = {}
+
+    def mark(self, stage: str, at: float | None = None) -> None:
+        if stage not in _STAGE_ORDER:
+            raise ValueError(f"Unknown turn stage: {stage}")
+        at = time.perf_counter() if at is None else at
+        if stage in _LATEST_WINS:
+            self.marks[stage] = at
+        else:
+            self.marks.setdefault(stage, at)
+
+    def segments(self) -> dict[str, float]:
+        """
+        Seconds spent reaching each stage from the previous stage reached.
+
+        Segments are taken in ``STAGES`` order so a stage's samples stay
+        comparable across turns. The caller-perceived ``response`` time runs
+        from end of speech (or the transcript, without endpointing) to the
+        first frame sent. Negative gaps - a stage reported out of order - are
+        skipped rather than recorded.
+        """
+        out: dict[str, float] = {}
+        previous: float | None = None
+        for stage in STAGES:
+            at = self.marks.get(stage)
+            if at is None:
+                continue
+            if previous is not None and at >= previous:
+                out[stage] = at - previous
+            previous = at
+        start = self.marks.get(VAD_END, self.marks.get(STT_FINAL))
+        first_frame = self.marks.get(FIRST_FRAME_SENT)
+        if start is not None and first_frame is not None and first_frame >= start:
+            out[RESPONSE] = first_frame - start
+        return out
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        JSON-ready waterfall: stage offsets in ms from the turn's first mark.
+
+        ``started_at`` is the wall-clock time of that first mark.
+        """
+        if not self.marks:
+            return {"turn": self.turn, "started_at": None, "stages": {}, "segments": {}}
+        origin = min(self.marks.values())
+        ordered = sorted(self.marks.items(), key=lambda item: (item[1], _STAGE_ORDER[item[0]]))
+        return {
+            "turn": self.turn,
+            "started_at": round(time.time() - (time.perf_counter() - origin), 3),
+            "stages": {stage: round((at - origin) * 1000, 1) for stage, at in ordered},
+            "segments": {stage: round(dur * 1000, 1) for stage, dur in self.segments().items()},
+        }
+
+
+class SessionTimeline:
+    """The open turn, the pending end of speech and recent finished turns of one session."""
+
+    def __init__(self, session_id: str, memory_manager: Any = None) -> None:
+        self.session_id = session_id
+        self.memory_manager = memory_manager
+        self.current: TurnTimeline | None = None
+        self.completed: deque[dict[str, Any]] = deque(maxlen=TURN_TIMELINE_MAX_TURNS)
+        self._pending_vad_end: float | None = None
+        self._lock = threading.Lock()
+        if memory_manager is not None:
+            # Resumed sessions keep the waterfalls already persisted
+            try:
+                self.completed.extend(memory_manager.get_context(CORE_KEY) or [])
+            except Exception:
+                pass
+
+    def mark(self, stage: str, at: float | None = None) -> None:
+        at = time.perf_counter() if at is None else at
+        if stage == VAD_END:
+            # Adopted by the next turn; later pauses in the same utterance replace it
+            self._pending_vad_end = at
+            return
+        current = self.current
+        if current is not None:
+            current.mark(stage, at)
+
+    def begin_turn(self, turn: int, at: float | None = None) -> None:
+        """Finish the open turn and start ``turn`` at its final transcript."""
+        at = time.perf_counter() if at is None else at
+        timeline = TurnTimeline(turn)
+        timeline.mark(STT_FINAL, at)
+        vad_end = self._pending_vad_end
+        if vad_end is not None and vad_end <= at:
+            timeline.mark(VAD_END, vad_end)
+        self._pending_vad_end = None
+        with self._lock:
+            finished, self.current = self.current, timeline
+        if finished is not None:
+            self._finish(finished)
+
+    def close(self) -> bool:
+        """Finish the open turn; True when there was one."""
+        with self._lock:
+            finished, self.current = self.current, None
+        if finished is None:
+            return False
+        self._finish(finished)
+        return True
+
+    def waterfall(self, *, include_current: bool = True) -> list[dict[str, Any]]:
+        turns = list(self.completed)
+        current = self.current
+        if include_current and current is not None:
+            turns.append({**current.to_dict(), "in_progress": True})
+        return turns
+
+    def _finish(self, timeline: TurnTimeline) -> None:
+        segments = timeline.segments()
+        self.completed.append(timeline.to_dict())
+        cm = self.memory_manager
+        if cm is None:
+            for stage, dur in segments.items():
+                process_sketches().record(STAGE_PREFIX + stage, dur)
+            return
+        try:
+            bucket = cm.get_context("latency") or {"runs": {}, "order": []}
+            for stage, dur in segments.items():
+                record_stage_stat(bucket, STAGE_PREFIX + stage, dur)
+            cm.set_context("latency", bucket)
+            cm.set_context(CORE_KEY, list(self.completed))
+        except Exception as e:
+            logger.debug("[%s] Turn timeline persist failed: %s", self.session_id[-8:], e)
+
+
+class TurnTimelines:
+    """Process-wide registry of open session timelines."""
+
+    def __init__(self, max_sessions: int = TURN_TIMELINE_MAX_SESSIONS) -> None:
+        self.max_sessions = max_sessions
+        self._sessions: OrderedDict[str, SessionTimeline] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def open(self, session_id: str, *, memory_manager: Any = None) -> SessionTimeline | None:
+        if not TURN_TIMELINE_ENABLED or not session_id:
+            return None
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None:
+                session = self._sessions[session_id] = SessionTimeline(session_id, memory_manager)
+                while len(self._sessions) > self.max_sessions:
+                    self._sessions.popitem(last=False)
+            elif memory_manager is not None:
+                session.memory_manager = memory_manager
+            return session
+
+    def get(self, session_id: str | None) -> SessionTimeline | None:
+        if not session_id:
+            return None
+        return self._sessions.get(session_id)
+
+    def mark(self, session_id: str | None, stage: str, at: float | None = None) -> None:
+        session = self.get(session_id)
+        if session is not None:
+            session.mark(stage, at)
+
+    def begin_turn(self, session_id: str | None, turn: int, at: float | None = None) -> None:
+        session = self.get(session_id)
+        if session is not None:
+            session.begin_turn(turn, at)
+
+    def close(self, session_id: str | None) -> bool:
+        """Stop tracking the session; True when an open turn was finished."""
+        if not session_id:
+            return False
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+        return session.close() if session is not None else False
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+
+_TURN_TIMELINES = TurnTimelines()
+
+
+def turn_timelines() -> TurnTimelines:
+    """Timelines of the sessions open in this process."""
+    return _TURN_TIMELINES
+
+
+__all__ = [
+    "BARGE_IN",
+    "CORE_KEY",
+    "FIRST_FRAME_SENT",
+    "FIRST_SENTENCE",
+    "LAST_FRAME_SENT",
+    "LLM_FIRST_TOKEN",
+    "LLM_REQUEST",
+    "RESPONSE",
+    "STAGES",
+    "STAGE_PREFIX",
+    "STT_FINAL",
+    "SessionTimeline",
+    "TTS_FIRST_BYTE",
+    "TurnTimeline",
+    "TurnTimelines",
+    "VAD_END",
+    "turn_timelines",
+]
@@ -35,6 +35,21 @@ if "config" not in sys.modules:
     config_mock.TTS_END = ["."]
     config_mock.DTMF_VALIDATION_ENABLED = False
     config_mock.ENABLE_ACS_CALL_RECORDING = False
+    config_mock.ENABLE_STREAMING_CALL_RECORDING = False
+    config_mock.STREAMING_RECORDING_BLOCK_KB = 4096
+    config_mock.LATENCY_SKETCH_PUBLISH_INTERVAL_S = 30.0
+    config_mock.WARM_POOL_AUTOSCALE = True
+    config_mock.WARM_POOL_MAX_SIZE = 12
+    config_mock.WARM_POOL_AUTOSCALE_HEADROOM = 1.5
+    config_mock.WARM_POOL_REFILL_CONCURRENCY = 4
+    config_mock.EXECUTOR_SPEECH_SYNTHESIS_WORKERS = 32
+    config_mock.EXECUTOR_SPEECH_RECOGNITION_WORKERS = 8
+    config_mock.EXECUTOR_REDIS_WORKERS = 16
+    config_mock.EXECUTOR_COSMOS_WORKERS = 8
+    config_mock.EXECUTOR_BACKGROUND_WORKERS = 4
+    config_mock.EXECUTOR_QUEUE_PER_WORKER = 8
+    config_mock.WORKER_PROCESSES = 1
+    config_mock.WORKER_INTERNAL_BASE_PORT = 18080
     # ACS settings
     config_mock.ACS_CALL_CALLBACK_PATH = "/api/v1/calls/callback"
     config_mock.ACS_CONNECTION_STRING = "test-connection-string"
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Endpointing Benchmark
+
+Compares the legacy fixed-RMS barge-in check against the adaptive
+EnergyEndpointer on the recorded clips in ``tests/load/audio_cache``.
+
+Each clip is padded with a noise-only lead-in (where the agent would be
+speaking and any speech start is a false barge-in) and a trailing pause, then
+mixed with white noise at several levels and scaled to simulate quiet callers.
+
+Reported per condition:
+- false_barge_ins: speech starts detected before the true onset
+- missed: clips where no start was detected after the onset
+- start_delay_ms: p50/max delay from true onset to detection
+- end_delay_ms: p50 delay from true end of speech to the end event
+
+Usage:
+    python -m tests.load.endpointing_benchmark
+    python -m tests.load.endpointing_benchmark --noise 0 200 600 --gain 1.0 0.2
+"""
+
+import argparse
+import json
+import statistics
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from apps.artagent.backend.voice.shared.endpointing import (
+    EndpointerConfig,
+    EndpointEventType,
+    EnergyEndpointer,
+)
+
+AUDIO_CACHE = Path(__file__).parent / "audio_cache"
+FIXED_RMS_THRESHOLD = 300.0  # RMS_SILENCE_THRESHOLD in media_handler.py
+CHUNK_MS = 20
+LEAD_IN_MS = 2000
+TRAIL_MS = 1500
+ONSET_RMS = 100.0  # Clean-signal level that marks ground-truth speech
+
+
+def load_clips() -> list[tuple[str, int, np.ndarray]]:
+    """Load (label, sample_rate, samples) for each cached clip."""
+    clips = []
+    for meta_path in sorted(AUDIO_CACHE.glob("*.json")):
+        meta = json.loads(meta_path.read_text())
+        pcm_path = AUDIO_CACHE / meta["filename"]
+        if not pcm_path.exists():
+            continue
+        samples = np.fromfile(pcm_path, dtype="<i2").astype(np.float64)
+        clips.append((meta.get("label", pcm_path.stem), int(meta["sample_rate"]), samples))
+    return clips
+
+
+def ground_truth(samples: np.ndarray, sample_rate: int) -> tuple[float, float]:
+    """Return (onset_ms, offset_ms) of speech in a clean clip."""
+    frame = sample_rate * CHUNK_MS // 1000
+    usable = len(samples) // frame * frame
+    energies = np.sqrt(np.mean(samples[:usable].reshape(-1, frame) ** 2, axis=1))
+    active = np.flatnonzero(energies >= ONSET_RMS)
+    if not len(active):
+        return 0.0, 0.0
+    return float(active[0] * CHUNK_MS), float((active[-1] + 1) * CHUNK_MS)
+
+
+def build_signal(
+    samples: np.ndarray, sample_rate: int, noise_rms: float, gain: float, rng: np.random.Generator
+) -> bytes:
+    """Pad, scale and add noise; return PCM16LE bytes."""
+    lead = np.zeros(sample_rate * LEAD_IN_MS // 1000)
+    trail = np.zeros(sample_rate * TRAIL_MS // 1000)
+    signal = np.concatenate([lead, samples * gain, trail])
+    if noise_rms:
+        signal = signal + rng.normal(0.0, noise_rms, len(signal))
+    return np.clip(signal, -32768, 32767).astype("<i2").tobytes()
+
+
+def run_fixed(pcm: bytes, sample_rate: int) -> list[float]:
+    """Legacy behaviour: every chunk above the fixed threshold is a barge-in trigger."""
+    chunk_bytes = sample_rate * CHUNK_MS // 1000 * 2
+    starts = []
+    speaking = False
+    for i in range(0, len(pcm) - chunk_bytes + 1, chunk_bytes):
+        chunk = np.frombuffer(pcm[i : i + chunk_bytes], dtype="<i2").astype(np.float64)
+        loud = float(np.sqrt(np.mean(chunk**2))) > FIXED_RMS_THRESHOLD
+        if loud and not speaking:
+            starts.append(i / chunk_bytes * CHUNK_MS)
+        speaking = loud
+    return starts
+
+
+def run_adaptive(
+    pcm: bytes, sample_rate: int
+) -> tuple[list[float], list[tuple[float, float]]]:
+    """Return (start detection times, (end boundary, end detection) pairs)."""
+    endpointer = EnergyEndpointer(EndpointerConfig(sample_rate=sample_rate))
+    chunk_bytes = sample_rate * CHUNK_MS // 1000 * 2
+    starts: list[float] = []
+    ends: list[tuple[float, float]] = []
+    for i in range(0, len(pcm), chunk_bytes):
+        for event in endpointer.process(pcm[i : i + chunk_bytes]):
+            if event.type is EndpointEventType.SPEECH_START:
+                starts.append(event.detected_ms)
+            else:
+                ends.append((event.stream_ms, event.detected_ms))
+    return starts, ends
+
+
+def evaluate(noise_rms: float, gain: float, seed: int = 7) -> dict[str, Any]:
+    """Evaluate both detectors on all clips for one condition."""
+    rng = np.random.default_rng(seed)
+    result: dict[str, Any] = {"noise_rms": noise_rms, "gain": gain}
+    fixed = {"false_barge_ins": 0, "missed": 0, "delays": []}
+    adaptive = {"false_barge_ins": 0, "missed": 0, "delays": [], "end_delays": []}
+
+    for _label, sample_rate, samples in load_clips():
+        onset, offset = ground_truth(samples, sample_rate)
+        onset += LEAD_IN_MS
+        offset += LEAD_IN_MS
+        pcm = build_signal(samples, sample_rate, noise_rms, gain, rng)
+
+        for stats, starts in (
+            (fixed, run_fixed(pcm, sample_rate)),
+            (adaptive, run_adaptive(pcm, sample_rate)[0]),
+        ):
+            stats["false_barge_ins"] += sum(1 for t in starts if t < onset)
+            hits = [t for t in starts if t >= onset]
+            if hits:
+                stats["delays"].append(hits[0] - onset)
+            else:
+                stats["missed"] += 1
+
+        _, ends = run_adaptive(pcm, sample_rate)
+        if ends:
+            adaptive["end_delays"].append(ends[-1][1] - offset)
+
+    for name, stats in (("fixed", fixed), ("adaptive", adaptive)):
+        delays = stats.pop("delays")
+        stats["start_delay_ms_p50"] = statistics.median(delays) if delays else None
+        stats["start_delay_ms_max"] = max(delays) if delays else None
+        end_delays = stats.pop("end_delays", None)
+        if end_delays is not None:
+            stats["end_delay_ms_p50"] = statistics.median(end_delays) if end_delays else None
+        result[name] = stats
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Endpointing benchmark on cached clips")
+    parser.add_argument("--noise", type=float, nargs="+", default=[0.0, 150.0, 400.0, 800.0])
+    parser.add_argument("--gain", type=float, nargs="+", default=[1.0, 0.2])
+    parser.add_argument("--json", action="store_true", help="Print raw JSON results")
+    args = parser.parse_args()
+
+    results = [evaluate(n, g) for n in args.noise for g in args.gain]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'noise':>6} {'gain':>5} | {'detector':<9} {'false':>5} {'missed':>6} "
+          f"{'p50 ms':>7} {'max ms':>7} {'end p50':>8}")
+    for r in results:
+        for name in ("fixed", "adaptive"):
+            s = r[name]
+            print(
+                f"{r['noise_rms']:>6.0f} {r['gain']:>5.2f} | {name:<9} "
+                f"{s['false_barge_ins']:>5} {s['missed']:>6} "
+                f"{_fmt(s['start_delay_ms_p50']):>7} {_fmt(s['start_delay_ms_max']):>7} "
+                f"{_fmt(s.get('end_delay_ms_p50')):>8}"
+            )
+
+
+def _fmt(value: float | None) -> str:
+    return "-" if value is None else f"{value:.0f}"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Executor Isolation Benchmark
+
+Measures TTS synthesis latency while Redis slows down, with all blocking work
+on one shared thread pool (the loop's default executor) versus the bounded
+per-workload executors (``src/pools/executors.py``).
+
+Simulated calls request a synthesis every ``--tts-interval-ms`` (each holds a
+thread for ``--tts-ms``) while the app issues Redis commands at
+``--redis-rps``, each stalled for ``--redis-ms`` to model a degraded cache.
+Sleeps stand in for the blocking SDK calls, so the numbers reflect thread
+availability rather than CPU.
+
+Usage:
+    python -m tests.load.executor_isolation_benchmark
+    python -m tests.load.executor_isolation_benchmark --calls 40 --redis-ms 500 --json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from src.pools.executors import (
+    REDIS,
+    SPEECH_SYNTHESIS,
+    ExecutorSaturatedError,
+    configure_executors,
+    get_executor,
+    shutdown_executors,
+)
+from src.tools.latency_sketch import QuantileSketch
+
+
+async def _load(
+    tts_executor, redis_executor, args: argparse.Namespace
+) -> tuple[QuantileSketch, int]:
+    loop = asyncio.get_running_loop()
+    tts = QuantileSketch()
+    shed = 0
+    deadline = loop.time() + args.seconds
+
+    async def call(offset: float) -> None:
+        await asyncio.sleep(offset)
+        while loop.time() < deadline:
+            start = time.perf_counter()
+            await loop.run_in_executor(tts_executor, time.sleep, args.tts_ms / 1000)
+            tts.add(time.perf_counter() - start)
+            await asyncio.sleep(args.tts_interval_ms / 1000)
+
+    async def redis_traffic() -> None:
+        nonlocal shed
+        pending = []
+        while loop.time() < deadline:
+            try:
+                pending.append(
+                    loop.run_in_executor(redis_executor, time.sleep, args.redis_ms / 1000)
+                )
+            except ExecutorSaturatedError:
+                shed += 1
+            await asyncio.sleep(1 / args.redis_rps)
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    spacing = args.tts_interval_ms / 1000 / args.calls
+    await asyncio.gather(redis_traffic(), *(call(i * spacing) for i in range(args.calls)))
+    return tts, shed
+
+
+def run(mode: str, args: argparse.Namespace) -> dict[str, Any]:
+    if mode == "shared":
+        shared = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) + 4))
+        tts_executor = redis_executor = shared
+    else:
+        configure_executors({SPEECH_SYNTHESIS: args.tts_workers, REDIS: args.redis_workers})
+        tts_executor, redis_executor = get_executor(SPEECH_SYNTHESIS), get_executor(REDIS)
+    try:
+        tts, shed = asyncio.run(_load(tts_executor, redis_executor, args))
+    finally:
+        if mode == "shared":
+            shared.shutdown(wait=True)
+        else:
+            shutdown_executors(wait=True)
+    p50, p95, p99 = tts.quantiles((0.5, 0.95, 0.99))
+    return {
+        "mode": mode,
+        "syntheses": tts.count,
+        "tts_p50_ms": round(p50 * 1000, 1),
+        "tts_p95_ms": round(p95 * 1000, 1),
+        "tts_p99_ms": round(p99 * 1000, 1),
+        "redis_shed": shed,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="TTS latency under Redis slowdown")
+    parser.add_argument("--calls", type=int, default=20, help="Concurrent simulated calls")
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--tts-ms", type=float, default=40.0, help="Thread time per synthesis")
+    parser.add_argument("--tts-interval-ms", type=float, default=200.0)
+    parser.add_argument("--redis-rps", type=float, default=200.0)
+    parser.add_argument("--redis-ms", type=float, default=300.0, help="Stalled Redis latency")
+    parser.add_argument("--tts-workers", type=int, default=32)
+    parser.add_argument("--redis-workers", type=int, default=16)
+    parser.add_argument("--json", action="store_true", help="Print raw JSON results")
+    args = parser.parse_args()
+
+    results = [run(mode, args) for mode in ("shared", "isolated")]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'mode':<9} {'syntheses':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'shed':>6}")
+    for r in results:
+        print(
+            f"{r['mode']:<9} {r['syntheses']:>9} {r['tts_p50_ms']:>8.1f} "
+            f"{r['tts_p95_ms']:>8.1f} {r['tts_p99_ms']:>8.1f} {r['redis_shed']:>6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
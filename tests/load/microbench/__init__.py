@@ -0,0 +1,6 @@
+"""
+Hot-path microbenchmarks.
+
+See ``runner`` for the timing method and ``benches`` for the suite; run with
+``python -m tests.load.microbench``.
+"""
@@ -0,0 +1,112 @@
+"""
+Microbenchmark CLI
+
+Usage:
+    python -m tests.load.microbench run --save baseline
+    python -m tests.load.microbench compare baseline --threshold 0.10
+    python -m tests.load.microbench compare baseline after-change --json
+    python -m tests.load.microbench list
+"""
+
+import argparse
+import json
+import logging
+import sys
+from fnmatch import fnmatch
+
+from tests.load.microbench.runner import (
+    compare,
+    load_results,
+    registered,
+    run_benchmarks,
+    save_results,
+)
+
+
+def _print_result(name: str, result: dict) -> None:
+    print(
+        f"{name:<36} {result['median_us']:>11.2f} {result['min_us']:>11.2f} "
+        f"{result['stdev_us']:>9.2f} {result['loops']:>8}",
+        flush=True,
+    )
+
+
+def _run(args: argparse.Namespace) -> dict:
+    if not args.json:
+        print(f"{'benchmark':<36} {'median us':>11} {'min us':>11} {'stdev':>9} {'loops':>8}")
+    return run_benchmarks(
+        args.filter,
+        repeat=args.repeat,
+        min_time=args.min_time,
+        progress=None if args.json else _print_result,
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Hot-path microbenchmarks")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = sub.add_parser("run", help="Run benchmarks and optionally save the results")
+    compare_parser = sub.add_parser("compare", help="Flag regressions against a baseline")
+    compare_parser.add_argument("baseline", help="Label or path of the saved baseline")
+    compare_parser.add_argument(
+        "current", nargs="?", help="Label or path to compare (default: run now)"
+    )
+    compare_parser.add_argument(
+        "--threshold", type=float, default=0.10, help="Allowed median slowdown (0.10 = 10%%)"
+    )
+    for p in (run_parser, compare_parser):
+        p.add_argument("--filter", default="*", help="Glob over benchmark names")
+        p.add_argument("--repeat", type=int, default=7, help="Samples per benchmark")
+        p.add_argument("--min-time", type=float, default=0.1, help="Seconds per sample")
+        p.add_argument("--save", metavar="LABEL", help="Save this run under a label or path")
+        p.add_argument("--json", action="store_true", help="Print raw JSON results")
+    sub.add_parser("list", help="List benchmarks")
+    args = parser.parse_args()
+
+    # Console logging would dominate per-turn timings; formatters are benchmarked directly
+    logging.disable(logging.INFO)
+
+    if args.command == "list":
+        for bench in registered():
+            print(f"{bench.name:<36} {bench.description}")
+        return 0
+
+    if args.command == "compare" and args.current:
+        current = load_results(args.current)
+    else:
+        current = _run(args)
+        if args.save:
+            print(f"Saved {save_results(current, args.save)}", file=sys.stderr)
+
+    if args.command == "run":
+        if args.json:
+            print(json.dumps(current, indent=2))
+        return 0
+
+    baseline = load_results(args.baseline)
+    baseline["benchmarks"] = {
+        name: result
+        for name, result in baseline.get("benchmarks", {}).items()
+        if fnmatch(name, args.filter)
+    }
+    rows = compare(baseline, current, threshold=args.threshold)
+    regressed = [row for row in rows if row["status"] == "regressed"]
+    if args.json:
+        print(json.dumps({"threshold": args.threshold, "rows": rows}, indent=2))
+    else:
+        print(f"\n{'benchmark':<36} {'baseline us':>12} {'current us':>12} {'change':>8}  status")
+        for row in rows:
+            if row["change"] is None:
+                print(f"{row['name']:<36} {'-':>12} {'-':>12} {'-':>8}  {row['status']}")
+                continue
+            print(
+                f"{row['name']:<36} {row['baseline_us']:>12.2f} {row['current_us']:>12.2f} "
+                f"{row['change']:>+8.1%}  {row['status']}"
+            )
+        print(f"\n{len(regressed)} regression(s) above {args.threshold:.0%}")
+    return 1 if regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,310 @@
+"""
+Hot-Path Microbenchmarks
+========================
+
+Per-frame paths run 50 times per second of call audio; per-turn paths run
+once or a few times per caller utterance. Per-frame benchmarks time a batch
+of 50 recorded frames (one second of audio) and report the cost per frame.
+
+Speech SDK, WebSocket and cascade collaborators are replaced by inert
+objects so only this repo's code is timed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from itertools import cycle
+from typing import Any
+
+from tests.load.microbench import fixtures
+from tests.load.microbench.runner import benchmark
+
+FRAME_BATCH = 50
+SCRUB_CORPUS = 100
+
+
+def _frame_batches(source: tuple) -> cycle:
+    """Consecutive 50-item windows so each call sees different frames."""
+    return cycle(
+        [source[i : i + FRAME_BATCH] for i in range(0, len(source) - FRAME_BATCH + 1, FRAME_BATCH)]
+    )
+
+
+class _InertCascade:
+    speech_sdk_thread = None
+
+    def write_audio(self, audio: bytes) -> None:
+        pass
+
+
+@benchmark("media.handle_media_message", ops=FRAME_BATCH)
+def bench_handle_media_message():
+    """ACS AudioData parse, base64 decode and endpointing per frame."""
+    from apps.artagent.backend.api.v1.handlers.media_handler import (
+        MediaHandler,
+        MediaHandlerConfig,
+        TransportType,
+    )
+    from src.stateful.state_managment import MemoManager
+
+    config = MediaHandlerConfig(
+        websocket=None,
+        session_id="microbench",
+        transport=TransportType.ACS,
+        call_connection_id="microbench",
+    )
+    handler = MediaHandler(config, MemoManager(session_id="microbench"), app_state=None)
+    handler.speech_cascade = _InertCascade()
+    batches = _frame_batches(fixtures.acs_messages())
+    loop = asyncio.new_event_loop()
+
+    async def feed(batch: tuple[str, ...]) -> None:
+        for message in batch:
+            await handler.handle_media_message(message)
+
+    try:
+        yield lambda: loop.run_until_complete(feed(next(batches)))
+    finally:
+        loop.close()
+
+
+@benchmark("media.pcm16le_rms", ops=FRAME_BATCH)
+def bench_pcm16le_rms():
+    """RMS of one 20 ms PCM16 frame."""
+    from apps.artagent.backend.api.v1.handlers.media_handler import pcm16le_rms
+
+    batches = _frame_batches(fixtures.recorded_frames())
+    return lambda: [pcm16le_rms(frame) for frame in next(batches)]
+
+
+@benchmark("tts.split_pcm_to_base64_frames")
+def bench_split_pcm_to_base64_frames():
+    """Split one synthesized sentence into base64 20 ms frames."""
+    from src.speech.text_to_speech import SpeechSynthesizer
+
+    pcm = fixtures.tts_pcm()
+    return lambda: SpeechSynthesizer.split_pcm_to_base64_frames(pcm, 16000)
+
+
+@benchmark("voicelive.resample_audio")
+def bench_resample_audio():
+    """Resample a 100 ms VoiceLive delta from 24 kHz to 16 kHz and base64 it."""
+    from apps.artagent.backend.voice.voicelive.handler import VoiceLiveSDKHandler
+
+    handler = VoiceLiveSDKHandler.__new__(VoiceLiveSDKHandler)
+    handler._acs_sample_rate = 16000
+    chunk = fixtures.voicelive_chunk()
+    return lambda: handler._resample_audio(chunk)
+
+
+@benchmark("memo.to_redis_dict")
+def bench_to_redis_dict():
+    """Serialize a session with a 100-turn history for Redis."""
+    manager = fixtures.memo_manager()
+    return manager.to_redis_dict
+
+
+@benchmark("cascade.build_messages")
+def bench_build_messages():
+    """Assemble the LLM request for turn 101 (prompt, budgeted history, user text)."""
+    from apps.artagent.backend.voice.shared.base import OrchestratorContext
+    from apps.artagent.backend.voice.speech_cascade.orchestrator import (
+        CascadeConfig,
+        CascadeOrchestratorAdapter,
+    )
+
+    adapter = CascadeOrchestratorAdapter(
+        config=CascadeConfig(start_agent=fixtures.BENCH_AGENT, session_id=None),
+        agents=dict(fixtures.agents()),
+    )
+    agent = adapter.agents[adapter._active_agent]
+    context = OrchestratorContext(
+        session_id="microbench",
+        user_text="Can you check whether my roadside assistance is included?",
+        conversation_history=fixtures.conversation_history(),
+        metadata=fixtures.prompt_context(),
+    )
+    return lambda: adapter._build_messages(context, agent)
+
+
+@benchmark("agent.render_prompt")
+def bench_render_prompt():
+    """Render one agent's prompt template (cycling through every agent YAML)."""
+    agents = cycle(fixtures.agents().values())
+    context = fixtures.prompt_context()
+    return lambda: next(agents).render_prompt(context)
+
+
+@benchmark("logging.json_formatter", ops=10)
+def bench_json_formatter():
+    """Format a log record with session attributes and PII scrubbing."""
+    from utils.ml_logging import JsonFormatter
+
+    formatter = JsonFormatter()
+    records = [
+        logging.makeLogRecord(
+            {
+                "name": "api.v1.media",
+                "levelno": logging.INFO,
+                "levelname": "INFO",
+                "msg": "[%s] Turn %d complete for caller %s (%s)",
+                "args": ("microbench", turn, "Alice Brown", "alice@example.com"),
+                "session_id": "microbench",
+                "call_connection_id": "call-microbench",
+                "agent_name": fixtures.BENCH_AGENT,
+                "operation_name": "cascade.turn",
+            }
+        )
+        for turn in range(10)
+    ]
+    return lambda: [formatter.format(record) for record in records]
+
+
+def _log_records_bench(logger_name: str, queued: bool):
+    """Setup shared by the synchronous and queued JSON logging benchmarks."""
+    import os
+
+    from utils.ml_logging import DroppingLogQueue, JsonFormatter, LogQueueHandler, TraceLogFilter
+
+    sink = open(os.devnull, "w")
+    stream_handler = logging.StreamHandler(sink)
+    stream_handler.setFormatter(JsonFormatter())
+    # Unbounded and undrained: times only the caller's side of the hand-off, without
+    # the log thread competing for the GIL (it runs while the event loop awaits I/O)
+    log_queue = DroppingLogQueue(0)
+    handler = LogQueueHandler([stream_handler], log_queue) if queued else stream_handler
+    logger = logging.getLogger(logger_name)
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addFilter(TraceLogFilter())
+    logger.addHandler(handler)
+    extra = {"session_id": "microbench", "agent_name": fixtures.BENCH_AGENT}
+    # The CLI disables INFO so repo logging stays off the console; only this logger runs here
+    disabled = logging.root.manager.disable
+    logging.disable(logging.NOTSET)
+
+    def log_turns() -> None:
+        for turn in range(10):
+            logger.info(
+                "[%s] Turn %d complete for caller %s (%s)",
+                "microbench",
+                turn,
+                "Alice Brown",
+                "alice@example.com",
+                extra=extra,
+            )
+
+    try:
+        yield log_turns
+    finally:
+        logging.disable(disabled)
+        logger.removeHandler(handler)
+        log_queue.queue.clear()
+        sink.close()
+
+
+@benchmark("logging.sync_json_log", ops=10)
+def bench_sync_json_log():
+    """One logger.info call formatted as JSON (with PII scrubbing) on the caller."""
+    yield from _log_records_bench("microbench.sync", queued=False)
+
+
+@benchmark("logging.queued_json_log", ops=10)
+def bench_queued_json_log():
+    """One logger.info call enqueued for the background log thread (JSON formatted there)."""
+    yield from _log_records_bench("microbench.queued", queued=True)
+
+
+def _scrub_bench(corpus: tuple[str, ...], *, sequential: bool = False, cache_size: int = 0):
+    """Scrub a corpus with the default patterns; confirms both paths redact identically."""
+    from utils.pii_filter import PIIScrubber, PIIScrubberConfig
+
+    corpus = corpus[:SCRUB_CORPUS]
+    scrubber = PIIScrubber(PIIScrubberConfig(cache_size=cache_size))
+    scrubbed = [scrubber.scrub_string(text) for text in corpus]
+    if scrubbed != [scrubber._scrub_sequential(text) for text in corpus]:
+        raise AssertionError("Staged scrubbing diverged from applying each pattern in turn")
+    scrub = scrubber._scrub_sequential if sequential else scrubber.scrub_string
+    return lambda: [scrub(text) for text in corpus]
+
+
+@benchmark("pii.scrub_transcripts", ops=SCRUB_CORPUS)
+def bench_scrub_transcripts():
+    """Scrub transcript and tool messages (uncached; clean text rejected before redaction)."""
+    return _scrub_bench(fixtures.transcripts())
+
+
+@benchmark("pii.scrub_transcripts_sequential", ops=SCRUB_CORPUS)
+def bench_scrub_transcripts_sequential():
+    """Scrub transcript and tool messages by applying every pattern in turn."""
+    return _scrub_bench(fixtures.transcripts(), sequential=True)
+
+
+@benchmark("pii.scrub_log_lines", ops=SCRUB_CORPUS)
+def bench_scrub_log_lines():
+    """Scrub rendered log messages (uncached)."""
+    return _scrub_bench(fixtures.log_lines())
+
+
+@benchmark("pii.scrub_log_lines_sequential", ops=SCRUB_CORPUS)
+def bench_scrub_log_lines_sequential():
+    """Scrub rendered log messages by applying every pattern in turn."""
+    return _scrub_bench(fixtures.log_lines(), sequential=True)
+
+
+@benchmark("pii.scrub_transcripts_cached", ops=SCRUB_CORPUS)
+def bench_scrub_transcripts_cached():
+    """Scrub transcript and tool messages again (served from the result cache)."""
+    return _scrub_bench(fixtures.transcripts(), cache_size=4096)
+
+
+class _CountingWebSocket:
+    def __init__(self) -> None:
+        from fastapi.websockets import WebSocketState
+
+        self.client_state = self.application_state = WebSocketState.CONNECTED
+        self.sent = 0
+        self.target = 0
+        self.drained: asyncio.Event | None = None
+
+    async def send_text(self, text: str) -> None:
+        self.sent += 1
+        if self.drained is not None and self.sent >= self.target:
+            self.drained.set()
+
+
+@benchmark("connection.envelope_send", ops=FRAME_BATCH)
+def bench_envelope_send():
+    """Build a streaming envelope and send it through a connection's queue."""
+    from apps.artagent.backend.src.ws_helpers.envelopes import make_assistant_streaming_envelope
+    from src.pools.connection_manager import ConnectionMeta, _Connection
+
+    loop = asyncio.new_event_loop()
+    ws = _CountingWebSocket()
+    connection: Any = None
+
+    async def open_connection() -> None:
+        nonlocal connection
+        meta = ConnectionMeta(connection_id="microbench", client_type="conversation")
+        connection = _Connection(ws, meta)
+
+    loop.run_until_complete(open_connection())
+    chunks = [f"Sentence fragment {i} of the streamed reply." for i in range(FRAME_BATCH)]
+
+    async def send_batch() -> None:
+        ws.drained = asyncio.Event()
+        ws.target = ws.sent + len(chunks)
+        for chunk in chunks:
+            await connection.send_json(
+                make_assistant_streaming_envelope(
+                    chunk, session_id="microbench", call_id="call-microbench"
+                )
+            )
+        await ws.drained.wait()
+
+    try:
+        yield lambda: loop.run_until_complete(send_batch())
+    finally:
+        loop.run_until_complete(connection.close())
+        loop.close()
@@ -0,0 +1,221 @@
+"""
+Microbenchmark Fixtures
+=======================
+
+Realistic inputs for the hot-path benchmarks, built once per process:
+
+- ``recorded_frames``: 20 ms PCM frames cut from ``tests/load/audio_cache``
+- ``acs_messages``: those frames as ACS ``AudioData`` JSON (silent frames flagged)
+- ``conversation_history``: a 100-turn history with periodic tool calls,
+  in the JSON-in-content form the cascade stores in ``MemoManager``
+- ``memo_manager``: a ``MemoManager`` holding that history and core memory
+- ``agents``: every agent YAML under ``registries/agentstore``
+- ``prompt_context``: the runtime context the cascade renders prompts with,
+  built from the demo caller profile in ``session_loader``
+- ``transcripts``/``log_lines``: text the PII scrubber sees on every turn
+"""
+
+from __future__ import annotations
+
+import json
+from functools import lru_cache
+from typing import Any
+
+from tests.load.offline.acs_client import audio_data_message
+from tests.load.offline.fake_speech import AUDIO_CACHE, FRAME_BYTES, is_speech_frame
+from tests.load.offline.mock_aoai import REPLIES
+
+HISTORY_TURNS = 100
+TOOL_CALL_EVERY = 5
+BENCH_AGENT = "Concierge"
+
+
+@lru_cache(maxsize=1)
+def _clips() -> tuple[tuple[bytes, str], ...]:
+    clips = []
+    for pcm in sorted(AUDIO_CACHE.glob("*.pcm")):
+        meta = json.loads(pcm.with_suffix(".json").read_text())
+        clips.append((pcm.read_bytes(), meta.get("text", "")))
+    if not clips:
+        raise RuntimeError(f"No cached PCM in {AUDIO_CACHE}; see tests/load/README.md")
+    return tuple(clips)
+
+
+@lru_cache(maxsize=1)
+def recorded_frames() -> tuple[bytes, ...]:
+    """Every full 20 ms frame of every cached clip, in call order."""
+    frames = []
+    for pcm, _ in _clips():
+        frames.extend(
+            pcm[i : i + FRAME_BYTES] for i in range(0, len(pcm) - FRAME_BYTES + 1, FRAME_BYTES)
+        )
+    return tuple(frames)
+
+
+@lru_cache(maxsize=1)
+def acs_messages() -> tuple[str, ...]:
+    """``recorded_frames`` as ACS AudioData messages; quiet frames are sent as silent."""
+    messages = []
+    for frame in recorded_frames():
+        message = json.loads(audio_data_message(frame, "8:acs:bench"))
+        if not is_speech_frame(frame):
+            message["audioData"]["silent"] = True
+        messages.append(json.dumps(message))
+    return tuple(messages)
+
+
+def tts_pcm() -> bytes:
+    """The longest cached clip, standing in for one synthesized sentence."""
+    return max((pcm for pcm, _ in _clips()), key=len)
+
+
+@lru_cache(maxsize=1)
+def voicelive_chunk() -> bytes:
+    """100 ms of 24 kHz PCM, the size of a typical VoiceLive audio delta."""
+    import numpy as np
+
+    source = np.frombuffer(tts_pcm(), dtype=np.int16)
+    upsampled = np.interp(
+        np.linspace(0, len(source) - 1, len(source) * 3 // 2),
+        np.arange(len(source)),
+        source.astype(np.float32),
+    ).astype(np.int16)
+    return upsampled[:2400].tobytes()
+
+
+def _tool_messages(turn: int) -> list[dict[str, Any]]:
+    call_id = f"call_{turn:03d}"
+    tool_call = {
+        "role": "assistant",
+        "content": None,
+        "tool_calls": [
+            {
+                "id": call_id,
+                "type": "function",
+                "function": {
+                    "name": "lookup_policy",
+                    "arguments": json.dumps({"policy_id": f"POL-{turn:05d}"}),
+                },
+            }
+        ],
+    }
+    tool_result = {
+        "role": "tool",
+        "tool_call_id": call_id,
+        "content": json.dumps(
+            {"policy_id": f"POL-{turn:05d}", "status": "active", "deductible": 500}
+        ),
+    }
+    return [
+        {"role": "assistant", "content": json.dumps(tool_call)},
+        {"role": "tool", "content": json.dumps(tool_result)},
+    ]
+
+
+@lru_cache(maxsize=1)
+def _history() -> tuple[dict[str, Any], ...]:
+    texts = [text for _, text in _clips() if text]
+    history: list[dict[str, Any]] = []
+    for turn in range(HISTORY_TURNS):
+        history.append({"role": "user", "content": texts[turn % len(texts)]})
+        if turn % TOOL_CALL_EVERY == TOOL_CALL_EVERY - 1:
+            history.extend(_tool_messages(turn))
+        history.append({"role": "assistant", "content": REPLIES[turn % len(REPLIES)]})
+    return tuple(history)
+
+
+def conversation_history() -> list[dict[str, Any]]:
+    """A fresh copy of the 100-turn history (callers may mutate it)."""
+    return [dict(message) for message in _history()]
+
+
+def transcripts() -> tuple[str, ...]:
+    """Every message of the 100-turn history as the scrubber sees it."""
+    return tuple(message["content"] for message in _history() if message["content"])
+
+
+@lru_cache(maxsize=1)
+def log_lines() -> tuple[str, ...]:
+    """Rendered log messages shaped like the media, cascade and tool logs of a call."""
+    templates = (
+        "[{sid}] Turn {turn} complete in {ms} ms (agent={agent})",
+        "[{sid}] STT final received: {text}",
+        "[{sid}] Barge-in detected after {ms} ms of playback",
+        "Tool lookup_policy returned for POL-{turn:05d}: status=active",
+        "[{sid}] Sending {frames} audio frames to call {call}",
+        "[{sid}] Callback for caller +1 (312) 555-{turn:04d} queued",
+        "Profile loaded for alice.brown{turn}@example.com in {ms} ms",
+        "WebSocket closed for session {sid} code=1000",
+    )
+    texts = [text for _, text in _clips() if text]
+    lines = []
+    for turn in range(HISTORY_TURNS):
+        lines.append(
+            templates[turn % len(templates)].format(
+                sid=f"{turn:08x}",
+                turn=turn,
+                ms=120 + turn * 7 % 900,
+                agent=BENCH_AGENT,
+                text=texts[turn % len(texts)],
+                frames=50 + turn % 10,
+                call=f"call-{turn:04d}",
+            )
+        )
+    return tuple(lines)
+
+
+def prompt_context() -> dict[str, Any]:
+    """Prompt variables shaped like ``CascadeOrchestratorAdapter._build_session_context``."""
+    import copy
+
+    from apps.artagent.backend.src.services.session_loader import _MOCK_PROFILES
+
+    profile = copy.deepcopy(_MOCK_PROFILES[0])
+    profile["customer_intelligence"]["fraud_context"] = {"risk_profile": "Standard"}
+    return {
+        "session_profile": profile,
+        "caller_name": profile["full_name"],
+        "client_id": profile["client_id"],
+        "customer_intelligence": profile["customer_intelligence"],
+        "institution_name": profile["institution_name"],
+        "active_agent": BENCH_AGENT,
+        "previous_agent": "AuthAgent",
+        "visited_agents": ["AuthAgent", BENCH_AGENT],
+        "handoff_context": {"topic": "coverage question", "customer_goal": "check roadside"},
+    }
+
+
+def memo_manager():
+    """A ``MemoManager`` with the 100-turn history and typical core memory."""
+    from src.stateful.state_managment import MemoManager
+
+    manager = MemoManager(session_id="microbench")
+    for message in _history():
+        manager.append_to_history(BENCH_AGENT, message["role"], message["content"] or "")
+    for key, value in prompt_context().items():
+        manager.set_context(key, value)
+    manager.set_context("active_agent", BENCH_AGENT)
+    return manager
+
+
+@lru_cache(maxsize=1)
+def agents() -> dict[str, Any]:
+    from apps.artagent.backend.registries.agentstore.loader import discover_agents
+
+    return discover_agents()
+
+
+__all__ = [
+    "BENCH_AGENT",
+    "HISTORY_TURNS",
+    "acs_messages",
+    "agents",
+    "conversation_history",
+    "log_lines",
+    "memo_manager",
+    "prompt_context",
+    "recorded_frames",
+    "transcripts",
+    "tts_pcm",
+    "voicelive_chunk",
+]
@@ -0,0 +1,232 @@
+"""
+Microbenchmark Runner
+=====================
+
+Minimal pyperf-style timing for the per-frame and per-turn hot paths, with
+no dependency beyond the standard library.
+
+Each benchmark is a setup function registered with ``@benchmark``; setup
+builds its fixtures once and returns the callable to time (or yields it, to
+run teardown code such as closing an event loop afterwards). The runner warms
+the callable up, calibrates the loop count so one sample takes at least
+``min_time`` seconds, then takes ``repeat`` samples with the garbage
+collector paused (as ``timeit`` does). Results are per operation: a callable
+that processes a batch declares ``ops`` so a 50-frame batch reports the
+per-frame cost.
+
+Results are saved as JSON next to the machine metadata they were measured on;
+``compare`` flags any benchmark whose median slowed down by more than the
+threshold against a saved baseline.
+
+Usage:
+    @benchmark("pcm16le_rms", ops=50)
+    def bench_rms():
+        frames = recorded_frames()[:50]
+        return lambda: [pcm16le_rms(frame) for frame in frames]
+
+    results = run_benchmarks(repeat=7, min_time=0.1)
+    rows = compare(load_results(baseline), results, threshold=0.10)
+"""
+
+from __future__ import annotations
+
+import gc
+import inspect
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Any
+
+RESULTS_DIR = Path(__file__).resolve().parents[1] / "results" / "microbench"
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    setup: Callable[..., Any]
+    ops: int = 1
+    description: str = ""
+
+
+_REGISTRY: dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, *, ops: int = 1) -> Callable:
+    """Register a setup function returning the callable to time."""
+
+    def decorator(setup: Callable[..., Any]) -> Callable:
+        if name in _REGISTRY:
+            raise ValueError(f"Duplicate benchmark name: {name}")
+        doc = (setup.__doc__ or "").strip().splitlines()
+        _REGISTRY[name] = Benchmark(name, setup, ops, doc[0] if doc else "")
+        return setup
+
+    return decorator
+
+
+def registered(pattern: str = "*") -> list[Benchmark]:
+    # Importing the module registers the suite
+    from tests.load.microbench import benches  # noqa: F401
+
+    return [bench for name, bench in sorted(_REGISTRY.items()) if fnmatch(name, pattern)]
+
+
+def _sample(fn: Callable[[], object], loops: int) -> float:
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        started = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        return time.perf_counter() - started
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def measure(bench: Benchmark, *, repeat: int = 7, min_time: float = 0.1) -> dict[str, Any]:
+    """Time one benchmark; all figures are microseconds per operation."""
+    if inspect.isgeneratorfunction(bench.setup):
+        setup = bench.setup()
+        try:
+            return _measure(next(setup), bench.ops, repeat, min_time)
+        finally:
+            setup.close()
+    return _measure(bench.setup(), bench.ops, repeat, min_time)
+
+
+def _measure(fn: Callable[[], object], ops: int, repeat: int, min_time: float) -> dict[str, Any]:
+    fn()  # warm caches, lazy imports and the history window
+    loops = 1
+    while True:
+        elapsed = _sample(fn, loops)
+        if elapsed >= min_time or loops >= 1_000_000:
+            break
+        # Aim slightly past min_time; at most 10x growth per step
+        loops = min(loops * 10, max(loops + 1, int(loops * min_time * 1.2 / max(elapsed, 1e-9))))
+    samples = [_sample(fn, loops) / loops / ops * 1e6 for _ in range(max(repeat, 1))]
+    return {
+        "median_us": round(statistics.median(samples), 3),
+        "min_us": round(min(samples), 3),
+        "stdev_us": round(statistics.stdev(samples), 3) if len(samples) > 1 else 0.0,
+        "loops": loops,
+        "repeat": len(samples),
+        "ops": ops,
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(
+    pattern: str = "*",
+    *,
+    repeat: int = 7,
+    min_time: float = 0.1,
+    progress: Callable[[str, dict[str, Any]], None] | None = None,
+) -> dict[str, Any]:
+    """Run every registered benchmark matching ``pattern``."""
+    results: dict[str, Any] = {}
+    for bench in registered(pattern):
+        results[bench.name] = measure(bench, repeat=repeat, min_time=min_time)
+        if progress:
+            progress(bench.name, results[bench.name])
+    return {
+        "meta": {
+            "created_at": datetime.now(UTC).isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "processor": platform.processor(),
+        },
+        "benchmarks": results,
+    }
+
+
+def results_path(label: str) -> Path:
+    """A label without a suffix resolves to ``tests/load/results/microbench/<label>.json``."""
+    path = Path(label)
+    return path if path.suffix == ".json" else RESULTS_DIR / f"{label}.json"
+
+
+def save_results(results: dict[str, Any], label: str) -> Path:
+    path = results_path(label)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(results, indent=2) + "\n")
+    return path
+
+
+def load_results(label: str) -> dict[str, Any]:
+    return json.loads(results_path(label).read_text())
+
+
+def compare(
+    baseline: dict[str, Any], current: dict[str, Any], *, threshold: float = 0.10
+) -> list[dict[str, Any]]:
+    """
+    Compare medians benchmark by benchmark.
+
+    A benchmark regresses when its median is more than ``threshold`` (a
+    fraction) slower than the baseline and improves when it is more than
+    ``threshold`` faster. Benchmarks present on one side only are reported
+    as ``new`` or ``missing``.
+    """
+    before = baseline.get("benchmarks", {})
+    after = current.get("benchmarks", {})
+    rows = []
+    for name in sorted(before.keys() | after.keys()):
+        if name not in before or name not in after:
+            status = "new" if name not in before else "missing"
+            rows.append({"name": name, "status": status, "change": None})
+            continue
+        old, new = before[name]["median_us"], after[name]["median_us"]
+        change = (new - old) / old if old > 0 else 0.0
+        if change > threshold:
+            status = "regressed"
+        elif change < -threshold:
+            status = "improved"
+        else:
+            status = "ok"
+        rows.append(
+            {
+                "name": name,
+                "status": status,
+                "baseline_us": old,
+                "current_us": new,
+                "change": round(change, 4),
+            }
+        )
+    return rows
+
+
+__all__ = [
+    "Benchmark",
+    "RESULTS_DIR",
+    "benchmark",
+    "compare",
+    "load_results",
+    "measure",
+    "registered",
+    "results_path",
+    "run_benchmarks",
+    "save_results",
+]
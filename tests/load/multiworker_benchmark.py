@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Multi-Worker Media Throughput Benchmark
+
+Measures how much per-frame media work one process can sustain and how that
+scales when calls are spread across worker processes (``WORKER_PROCESSES``,
+see ``apps/artagent/backend/workers.py``). Each simulated call sends 20 ms ACS
+media messages (JSON with base64 PCM); every frame is parsed, decoded and
+reduced to an energy value for voice activity detection, the CPU-bound part
+of the media loop that a single event loop serializes under the GIL.
+
+Calls are pinned to one worker each, as session-affine routing does, so the
+workers share nothing. Reports frames per second and how many concurrent
+calls each configuration keeps in real time (50 frames/s per call).
+
+Usage:
+    python -m tests.load.multiworker_benchmark
+    python -m tests.load.multiworker_benchmark --workers 1 2 4 --calls 64 --seconds 5 --json
+"""
+
+import argparse
+import base64
+import json
+import math
+import multiprocessing
+import random
+import time
+from array import array
+from typing import Any
+
+FRAME_MS = 20
+SAMPLE_RATE = 16_000
+FRAMES_PER_CALL_SECOND = 1000 // FRAME_MS
+
+
+def _media_message(rng: random.Random) -> str:
+    samples = array("h", (rng.randint(-3000, 3000) for _ in range(SAMPLE_RATE * FRAME_MS // 1000)))
+    return json.dumps(
+        {
+            "kind": "AudioData",
+            "audioData": {
+                "data": base64.b64encode(samples.tobytes()).decode("ascii"),
+                "timestamp": "2025-01-01T00:00:00.000Z",
+                "silent": False,
+            },
+        }
+    )
+
+
+def _process_frame(message: str) -> float:
+    payload = json.loads(message)
+    pcm = array("h", base64.b64decode(payload["audioData"]["data"]))
+    return math.sqrt(sum(s * s for s in pcm) / len(pcm))
+
+
+def _serve_calls(calls: int, frames_per_call: int, seed: int) -> int:
+    """One worker: interleave frames of its pinned calls, as its media loop would."""
+    rng = random.Random(seed)
+    messages = [_media_message(rng) for _ in range(16)]
+    processed = 0
+    for frame in range(frames_per_call):
+        for call in range(calls):
+            _process_frame(messages[(frame + call) % len(messages)])
+            processed += 1
+    return processed
+
+
+def run(workers: int, calls: int, seconds: float) -> dict[str, Any]:
+    frames_per_call = int(seconds * FRAMES_PER_CALL_SECOND)
+    shares = [calls // workers + (1 if i < calls % workers else 0) for i in range(workers)]
+    ctx = multiprocessing.get_context("spawn")
+    with ctx.Pool(workers) as pool:
+        pool.map(abs, range(workers))  # start every worker before timing
+        start = time.perf_counter()
+        processed = sum(
+            pool.starmap(_serve_calls, [(share, frames_per_call, i) for i, share in enumerate(shares)])
+        )
+        elapsed = time.perf_counter() - start
+    frames_per_s = processed / elapsed
+    return {
+        "workers": workers,
+        "calls": calls,
+        "frames": processed,
+        "elapsed_s": round(elapsed, 2),
+        "frames_per_s": round(frames_per_s),
+        "realtime_calls": int(frames_per_s / FRAMES_PER_CALL_SECOND),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-frame media throughput vs worker processes")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--calls", type=int, default=64, help="Concurrent simulated calls")
+    parser.add_argument("--seconds", type=float, default=3.0, help="Call audio per call")
+    parser.add_argument("--json", action="store_true", help="Print raw JSON results")
+    args = parser.parse_args()
+
+    results = [run(workers, args.calls, args.seconds) for workers in args.workers]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    baseline = results[0]["frames_per_s"]
+    print(f"{'workers':>8} {'frames/s':>10} {'speedup':>8} {'realtime calls':>15}")
+    for r in results:
+        print(
+            f"{r['workers']:>8} {r['frames_per_s']:>10} "
+            f"{r['frames_per_s'] / baseline:>7.2f}x {r['realtime_calls']:>15}"
+        )
+
+
+if __name__ == "__main__":
+    main()
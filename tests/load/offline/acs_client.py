@@ -0,0 +1,215 @@
+"""
+Synthetic ACS Media Client
+==========================
+
+Plays the part of Azure Communication Services on the media WebSocket
+(``/api/v1/media/stream``): sends ``AudioMetadata``, then replays cached
+16 kHz PCM turns as 20 ms ``AudioData`` frames paced in real time, with
+silence frames between turns as a live call would.
+
+Each turn records the time from the caller's last speech frame to the first
+``AudioData`` frame the backend sends back. This includes the recognizer's
+end-of-speech silence timeout, exactly as a caller would experience it. The
+next turn starts once the response has been quiet for ``quiet_ms``.
+
+Usage:
+    call = SyntheticAcsCall("ws://127.0.0.1:8010/api/v1/media/stream", pcm_turns)
+    result = await call.run()
+    print(result.turn_latencies_ms)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import bisect
+import json
+import time
+import uuid
+from dataclasses import dataclass, field
+
+import websockets
+
+from tests.load.offline.fake_speech import FRAME_BYTES, FRAME_MS, SAMPLE_RATE, is_speech_frame
+
+SILENCE_FRAME = bytes(FRAME_BYTES)
+
+
+def pcm_frames(pcm: bytes) -> tuple[list[bytes], int]:
+    """Split PCM into 20 ms frames (last one zero-padded); returns frames and last speech index."""
+    frames = [
+        pcm[i : i + FRAME_BYTES].ljust(FRAME_BYTES, b"\x00")
+        for i in range(0, len(pcm), FRAME_BYTES)
+    ]
+    last_speech = max((i for i, frame in enumerate(frames) if is_speech_frame(frame)), default=-1)
+    return frames, last_speech
+
+
+def audio_metadata_message() -> str:
+    return json.dumps(
+        {
+            "kind": "AudioMetadata",
+            "audioMetadata": {
+                "subscriptionId": str(uuid.uuid4()),
+                "encoding": "PCM",
+                "sampleRate": SAMPLE_RATE,
+                "channels": 1,
+                "length": FRAME_BYTES,
+            },
+        }
+    )
+
+
+def audio_data_message(frame: bytes, participant: str) -> str:
+    return json.dumps(
+        {
+            "kind": "AudioData",
+            "audioData": {
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "participantRawID": participant,
+                "data": base64.b64encode(frame).decode("ascii"),
+                "length": len(frame),
+                "silent": frame == SILENCE_FRAME,
+            },
+        }
+    )
+
+
+def is_audio_message(raw: str | bytes) -> bool:
+    """True for outbound ``AudioData`` frames (the backend capitalizes ``Kind``)."""
+    if isinstance(raw, bytes):
+        return bool(raw)
+    try:
+        message = json.loads(raw)
+    except ValueError:
+        return False
+    if not isinstance(message, dict):
+        return False
+    kind = message.get("kind") or message.get("Kind")
+    return kind == "AudioData"
+
+
+@dataclass
+class TurnResult:
+    turn: int
+    first_audio_ms: float | None  # None when the backend never answered
+    response_audio_frames: int = 0
+
+
+@dataclass
+class CallResult:
+    call_id: str
+    connect_ms: float = 0.0
+    greeting_ms: float | None = None
+    turns: list[TurnResult] = field(default_factory=list)
+    error: str | None = None
+
+    @property
+    def turn_latencies_ms(self) -> list[float]:
+        return [t.first_audio_ms for t in self.turns if t.first_audio_ms is not None]
+
+    @property
+    def timeouts(self) -> int:
+        return sum(1 for t in self.turns if t.first_audio_ms is None)
+
+
+class SyntheticAcsCall:
+    """One caller: connect, wait out the greeting, then replay each PCM turn."""
+
+    def __init__(
+        self,
+        url: str,
+        turns: list[bytes],
+        *,
+        response_timeout_s: float = 10.0,
+        quiet_ms: float = 600.0,
+        call_id: str | None = None,
+    ) -> None:
+        self.url = url
+        self.turns = turns
+        self.response_timeout_s = response_timeout_s
+        self.quiet_ms = quiet_ms
+        self.call_id = call_id or f"offline-{uuid.uuid4().hex[:12]}"
+        self._audio_times: list[float] = []  # loop time of every AudioData received
+
+    async def _reader(self, ws) -> None:
+        loop = asyncio.get_running_loop()
+        async for raw in ws:
+            if is_audio_message(raw):
+                self._audio_times.append(loop.time())
+
+    async def _stream(self, ws, frames: list[bytes], start: float) -> None:
+        """Send ``frames`` on a 20 ms grid anchored at ``start`` (loop time)."""
+        loop = asyncio.get_running_loop()
+        for i, frame in enumerate(frames):
+            delay = start + i * FRAME_MS / 1000 - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await ws.send(audio_data_message(frame, self.call_id))
+
+    async def _await_response(self, ws, since: float, timeout_s: float) -> float | None:
+        """Stream silence until audio arrives after ``since`` and then goes quiet."""
+        loop = asyncio.get_running_loop()
+        deadline = since + timeout_s
+        tick = loop.time()
+        while True:
+            now = loop.time()
+            times = self._audio_times
+            first = bisect.bisect_left(times, since)
+            if first < len(times):
+                if now - times[-1] >= self.quiet_ms / 1000 or now >= deadline + timeout_s:
+                    return times[first]
+            elif now >= deadline:
+                return None
+            await self._stream(ws, [SILENCE_FRAME], tick)
+            tick += FRAME_MS / 1000
+
+    async def run(self) -> CallResult:
+        result = CallResult(call_id=self.call_id)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        try:
+            async with websockets.connect(
+                f"{self.url}?call_connection_id={self.call_id}", max_size=None, open_timeout=15
+            ) as ws:
+                result.connect_ms = (loop.time() - started) * 1000
+                reader = asyncio.create_task(self._reader(ws))
+                try:
+                    await ws.send(audio_metadata_message())
+                    connected = loop.time()
+                    greeting = await self._await_response(ws, connected, self.response_timeout_s)
+                    if greeting is not None:
+                        result.greeting_ms = (greeting - connected) * 1000
+                    for index, pcm in enumerate(self.turns, start=1):
+                        frames, last_speech = pcm_frames(pcm)
+                        turn_start = loop.time()
+                        await self._stream(ws, frames, turn_start)
+                        speech_end = turn_start + (last_speech + 1) * FRAME_MS / 1000
+                        first_audio = await self._await_response(
+                            ws, speech_end, self.response_timeout_s
+                        )
+                        latency = None if first_audio is None else first_audio - speech_end
+                        received = bisect.bisect_left(self._audio_times, speech_end)
+                        result.turns.append(
+                            TurnResult(
+                                turn=index,
+                                first_audio_ms=None if latency is None else latency * 1000,
+                                response_audio_frames=len(self._audio_times) - received,
+                            )
+                        )
+                finally:
+                    reader.cancel()
+        except Exception as exc:  # noqa: BLE001 - recorded per call, the run continues
+            result.error = f"{type(exc).__name__}: {exc}"
+        return result
+
+
+__all__ = [
+    "CallResult",
+    "SyntheticAcsCall",
+    "TurnResult",
+    "audio_data_message",
+    "audio_metadata_message",
+    "is_audio_message",
+    "pcm_frames",
+]
@@ -0,0 +1,311 @@
+"""
+Deterministic Speech Stand-ins
+==============================
+
+Drop-in replacements for ``StreamingSpeechRecognizerFromBytes`` and
+``SpeechSynthesizer`` that never reach Azure Speech, for offline load runs.
+
+``FakeSpeechRecognizer`` segments incoming 16 kHz PCM with a cheap energy
+detector: an utterance starts on the first loud 20 ms frame and ends after
+``vad_silence_timeout_ms`` of quiet frames. Partials are emitted every
+``PARTIAL_INTERVAL_MS`` of speech and the final ``final_latency_ms`` after the
+utterance ends. The transcript is looked up by a fingerprint of the first
+speech frames, registered from ``tests/load/audio_cache`` (the sidecar text,
+split across segments in proportion to their length), so replaying a cached
+PCM file always yields the same text.
+
+``FakeSpeechSynthesizer`` returns silence-level PCM whose length follows the
+text (``WORDS_PER_SECOND``) after sleeping ``first_byte_ms`` plus the audio
+length divided by ``realtime_factor``.
+
+Latencies come from environment variables so the backend child process of
+the harness can be tuned without code changes:
+``FAKE_STT_FINAL_LATENCY_MS``, ``FAKE_TTS_FIRST_BYTE_MS``, ``FAKE_TTS_REALTIME_FACTOR``.
+
+Usage:
+    from tests.load.offline.fake_speech import install_fake_speech
+
+    install_fake_speech()  # before the app lifespan builds the speech pools
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from array import array
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+SAMPLE_RATE = 16_000
+FRAME_BYTES = SAMPLE_RATE * 2 * 20 // 1000  # 20 ms of 16-bit mono PCM
+FRAME_MS = 20
+SPEECH_THRESHOLD = 200  # mean |sample| over every 4th sample
+FINGERPRINT_FRAMES = 4
+PARTIAL_INTERVAL_MS = 400
+WORDS_PER_SECOND = 2.5
+FALLBACK_TRANSCRIPT = "I have a question about my account"
+AUDIO_CACHE = Path(__file__).resolve().parent.parent / "audio_cache"
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def is_speech_frame(frame: bytes) -> bool:
+    samples = array("h", frame[: len(frame) - len(frame) % 2])[::4]
+    return bool(samples) and sum(map(abs, samples)) / len(samples) > SPEECH_THRESHOLD
+
+
+class _Segmenter:
+    """Frame-level utterance detector shared by live recognition and registration."""
+
+    def __init__(self, silence_timeout_ms: int) -> None:
+        self._silence_frames = max(1, silence_timeout_ms // FRAME_MS)
+        self._buffer = bytearray()
+        self.in_speech = False
+        self.speech_frames = 0
+        self.quiet_frames = 0
+        self.head = bytearray()
+
+    def feed(self, data: bytes) -> list[tuple[str, int]]:
+        """Returns ``("start"|"speech"|"end", speech_frames)`` events for complete frames."""
+        self._buffer.extend(data)
+        events: list[tuple[str, int]] = []
+        while len(self._buffer) >= FRAME_BYTES:
+            frame = bytes(self._buffer[:FRAME_BYTES])
+            del self._buffer[:FRAME_BYTES]
+            loud = is_speech_frame(frame)
+            if not self.in_speech:
+                if loud:
+                    self.in_speech = True
+                    self.speech_frames, self.quiet_frames = 1, 0
+                    self.head = bytearray(frame)
+                    events.append(("start", 1))
+                continue
+            self.speech_frames += 1
+            if len(self.head) < FINGERPRINT_FRAMES * FRAME_BYTES:
+                self.head.extend(frame)
+            self.quiet_frames = 0 if loud else self.quiet_frames + 1
+            if self.quiet_frames >= self._silence_frames:
+                self.in_speech = False
+                events.append(("end", self.speech_frames - self.quiet_frames))
+            else:
+                events.append(("speech", self.speech_frames))
+        return events
+
+    def fingerprint(self) -> str:
+        return hashlib.sha1(bytes(self.head)).hexdigest()[:16]
+
+
+_REGISTRY: dict[int, dict[str, str]] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+def load_transcripts(silence_timeout_ms: int, audio_dir: Path = AUDIO_CACHE) -> dict[str, str]:
+    """Fingerprint -> transcript for every segment of every cached PCM file."""
+    with _REGISTRY_LOCK:
+        cached = _REGISTRY.get(silence_timeout_ms)
+        if cached is not None:
+            return cached
+        registry: dict[str, str] = {}
+        for sidecar in sorted(audio_dir.glob("*.json")):
+            meta = json.loads(sidecar.read_text())
+            pcm = sidecar.with_suffix(".pcm")
+            if not pcm.exists() or not meta.get("text"):
+                continue
+            data = pcm.read_bytes() + bytes(FRAME_BYTES * (silence_timeout_ms // FRAME_MS + 1))
+            segmenter = _Segmenter(silence_timeout_ms)
+            segments: list[tuple[str, int]] = []
+            fingerprint = ""
+            for kind, frames in segmenter.feed(data):
+                if kind == "start":
+                    fingerprint = ""
+                elif kind == "speech" and frames == FINGERPRINT_FRAMES:
+                    fingerprint = segmenter.fingerprint()
+                elif kind == "end":
+                    segments.append((fingerprint or segmenter.fingerprint(), frames))
+            words = meta["text"].split()
+            total = sum(frames for _, frames in segments) or 1
+            start = 0
+            for i, (fingerprint, frames) in enumerate(segments):
+                if i == len(segments) - 1:
+                    end = len(words)
+                else:
+                    end = start + round(len(words) * frames / total)
+                registry[fingerprint] = " ".join(words[start:end]) or words[-1]
+                start = end
+        _REGISTRY[silence_timeout_ms] = registry
+        return registry
+
+
+class FakeSpeechRecognizer:
+    """Stand-in for ``StreamingSpeechRecognizerFromBytes`` with deterministic transcripts."""
+
+    def __init__(
+        self,
+        *,
+        vad_silence_timeout_ms: int = 800,
+        candidate_languages: Iterable[str] | None = None,
+        final_latency_ms: float | None = None,
+        **_: object,
+    ) -> None:
+        self.vad_silence_timeout_ms = vad_silence_timeout_ms
+        self.language = next(iter(candidate_languages or ["en-US"]), "en-US")
+        self.final_latency_ms = (
+            final_latency_ms
+            if final_latency_ms is not None
+            else _env_float("FAKE_STT_FINAL_LATENCY_MS", 150.0)
+        )
+        self.is_ready = True
+        self.push_stream = None
+        self.partial_callback: Callable[..., None] | None = None
+        self.final_callback: Callable[..., None] | None = None
+        self.cancel_callback: Callable[..., None] | None = None
+        self._transcripts = load_transcripts(vad_silence_timeout_ms)
+        self._segmenter = _Segmenter(vad_silence_timeout_ms)
+        self._fingerprint = ""
+        self._running = False
+        self._lock = threading.Lock()
+        self.utterances = 0
+
+    # Interface used by the speech cascade -----------------------------------
+
+    def set_partial_result_callback(self, callback: Callable[..., None]) -> None:
+        self.partial_callback = callback
+
+    def set_final_result_callback(self, callback: Callable[..., None]) -> None:
+        self.final_callback = callback
+
+    def set_cancel_callback(self, callback: Callable[..., None]) -> None:
+        self.cancel_callback = callback
+
+    def create_push_stream(self) -> None:
+        self.push_stream = object()
+
+    def prepare_stream(self) -> None:
+        self.create_push_stream()
+
+    def prepare_start(self) -> None:
+        self.create_push_stream()
+
+    def warm_connection(self) -> bool:
+        return True
+
+    def add_phrases(self, phrases: Iterable[str]) -> None:
+        pass
+
+    def clear_session_state(self) -> None:
+        with self._lock:
+            self._segmenter = _Segmenter(self.vad_silence_timeout_ms)
+            self._fingerprint = ""
+
+    def start(self) -> None:
+        self._running = True
+
+    def stop(self) -> None:
+        self._running = False
+
+    def write_bytes(self, audio_chunk: bytes) -> None:
+        if not self._running:
+            return
+        partials: list[str] = []
+        finals: list[str] = []
+        with self._lock:
+            for kind, frames in self._segmenter.feed(audio_chunk):
+                if kind == "start":
+                    self._fingerprint = ""
+                    continue
+                if kind == "speech" and frames == FINGERPRINT_FRAMES:
+                    self._fingerprint = self._segmenter.fingerprint()
+                fingerprint = self._fingerprint or self._segmenter.fingerprint()
+                text = self._transcripts.get(fingerprint, FALLBACK_TRANSCRIPT)
+                if kind == "end":
+                    finals.append(text)
+                elif frames % (PARTIAL_INTERVAL_MS // FRAME_MS) == 0:
+                    spoken = max(1, int(frames * FRAME_MS / 1000 * WORDS_PER_SECOND))
+                    partials.append(" ".join(text.split()[:spoken]))
+        for text in partials:
+            if self.partial_callback:
+                self.partial_callback(text, self.language, None)
+        for text in finals:
+            self.utterances += 1
+            timer = threading.Timer(self.final_latency_ms / 1000, self._emit_final, (text,))
+            timer.daemon = True
+            timer.start()
+
+    def _emit_final(self, text: str) -> None:
+        if self._running and self.final_callback:
+            self.final_callback(text, self.language, None)
+
+
+class FakeSpeechSynthesizer:
+    """Stand-in for ``SpeechSynthesizer`` returning PCM sized to the text."""
+
+    def __init__(
+        self,
+        *,
+        voice: str | None = None,
+        first_byte_ms: float | None = None,
+        realtime_factor: float | None = None,
+        **_: object,
+    ) -> None:
+        self.voice = voice
+        self.key = "offline"
+        self.region = "offline"
+        self.is_ready = True
+        self.first_byte_ms = (
+            first_byte_ms
+            if first_byte_ms is not None
+            else _env_float("FAKE_TTS_FIRST_BYTE_MS", 80.0)
+        )
+        self.realtime_factor = (
+            realtime_factor
+            if realtime_factor is not None
+            else _env_float("FAKE_TTS_REALTIME_FACTOR", 20.0)
+        )
+        self.syntheses = 0
+
+    def warm_connection(self) -> bool:
+        return True
+
+    def clear_session_state(self) -> None:
+        pass
+
+    def stop_speaking(self) -> None:
+        pass
+
+    def synthesize_to_pcm(
+        self,
+        text: str,
+        voice: str | None = None,
+        sample_rate: int = SAMPLE_RATE,
+        style: str | None = None,
+        rate: str | None = None,
+    ) -> bytes:
+        audio_s = max(len(text.split()), 1) / WORDS_PER_SECOND
+        time.sleep((self.first_byte_ms + audio_s * 1000 / self.realtime_factor) / 1000)
+        self.syntheses += 1
+        return b"\x01\x00\xff\xff" * int(audio_s * sample_rate / 2)
+
+
+def install_fake_speech() -> None:
+    """Make the backend's speech pool factories build the fakes."""
+    import apps.artagent.backend.main as backend_main
+
+    backend_main.SpeechSynthesizer = FakeSpeechSynthesizer
+    backend_main.StreamingSpeechRecognizerFromBytes = FakeSpeechRecognizer
+
+
+__all__ = [
+    "FakeSpeechRecognizer",
+    "FakeSpeechSynthesizer",
+    "install_fake_speech",
+    "is_speech_frame",
+    "load_transcripts",
+]
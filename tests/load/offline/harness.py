@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Offline End-to-End Load Harness
+
+Drives the real backend (media WebSocket, speech pools, cascade orchestrator,
+Redis session state) with every cloud dependency replaced by a local
+stand-in, so capacity can be measured on a laptop or CI runner at zero
+service cost:
+
+- STT / TTS: ``fake_speech`` (deterministic transcripts, configurable latency)
+- Azure OpenAI: ``mock_aoai`` (streaming SSE, configurable TTFT and token rate)
+- ACS: ``acs_client`` (replays ``tests/load/audio_cache`` PCM in real time)
+
+For each concurrency level a fresh backend child is started, ``--calls``
+callers run ``--turns`` turns each, and the harness reports turn latency
+percentiles (caller end of speech to first response audio, including the
+recognizer's silence timeout), the backend's per-stage latency percentiles
+(``/api/v1/metrics/latency``) and backend CPU seconds per call. Capacity is
+the highest level whose turn p95 stays within ``--slo-ms`` with at most 1%
+of turns unanswered.
+
+Redis must be reachable (``--redis-host``/``--redis-port``) with a password
+(``--redis-password``), e.g. ``docker run -p 6379:6379 redis:7 --requirepass offline``.
+Cosmos is pointed at an unreachable local URI; the backend tolerates that.
+
+Usage:
+    python -m tests.load.offline.harness
+    python -m tests.load.offline.harness --levels 5 10 20 40 --turns 3 --ttft-ms 400 --json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import httpx
+from src.tools.latency_sketch import QuantileSketch
+
+from tests.load.offline.acs_client import CallResult, SyntheticAcsCall
+from tests.load.offline.fake_speech import AUDIO_CACHE
+
+try:
+    import psutil
+except ImportError:  # CPU per call is reported as None without it
+    psutil = None
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SLO_TIMEOUT_FRACTION = 0.01
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _load_turns(limit: int) -> list[bytes]:
+    files = sorted(AUDIO_CACHE.glob("*.pcm"))
+    if not files:
+        raise SystemExit(f"No cached PCM in {AUDIO_CACHE}; see tests/load/README.md")
+    return [path.read_bytes() for path in files[: max(limit, 1)]]
+
+
+def _backend_env(args: argparse.Namespace, aoai_port: int) -> dict[str, str]:
+    env = dict(os.environ)
+    env.update(
+        {
+            "AZURE_OPENAI_ENDPOINT": f"http://127.0.0.1:{aoai_port}",
+            "AZURE_OPENAI_KEY": "offline",
+            "AZURE_OPENAI_CHAT_DEPLOYMENT_ID": env.get("AZURE_OPENAI_CHAT_DEPLOYMENT_ID", "mock"),
+            "AZURE_SPEECH_KEY": "offline",
+            "AZURE_SPEECH_REGION": "offline",
+            "AZURE_COSMOS_CONNECTION_STRING": (
+                "mongodb://127.0.0.1:1/?serverSelectionTimeoutMS=500"
+            ),
+            "REDIS_HOST": args.redis_host,
+            "REDIS_PORT": str(args.redis_port),
+            "REDIS_ACCESS_KEY": args.redis_password,
+            "REDIS_SSL": "false",
+            "ACS_STREAMING_MODE": "media",
+            "DISABLE_CLOUD_TELEMETRY": "true",
+            "FAKE_STT_FINAL_LATENCY_MS": str(args.stt_ms),
+            "FAKE_TTS_FIRST_BYTE_MS": str(args.tts_first_byte_ms),
+            "FAKE_TTS_REALTIME_FACTOR": str(args.tts_realtime_factor),
+        }
+    )
+    if args.silence_ms is not None:
+        env["SILENCE_DURATION_MS"] = str(args.silence_ms)
+    for name in ("AZURE_SPEECH_RESOURCE_ID", "APPLICATIONINSIGHTS_CONNECTION_STRING"):
+        env.pop(name, None)
+    return env
+
+
+def _spawn(module: str, port: int, extra: list[str], env: dict[str, str]) -> subprocess.Popen:
+    return subprocess.Popen(
+        [sys.executable, "-m", module, "--port", str(port), *extra],
+        cwd=REPO_ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+async def _wait_healthy(url: str, proc: subprocess.Popen, timeout_s: float) -> None:
+    deadline = time.monotonic() + timeout_s
+    async with httpx.AsyncClient(timeout=2.0) as client:
+        while time.monotonic() < deadline:
+            if proc.poll() is not None:
+                raise RuntimeError(f"{url} exited with code {proc.returncode} during startup")
+            try:
+                if (await client.get(url)).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.25)
+    raise RuntimeError(f"{url} not healthy after {timeout_s:.0f}s")
+
+
+def _stop(proc: subprocess.Popen) -> None:
+    proc.terminate()
+    try:
+        proc.wait(timeout=15)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+
+
+def _cpu_seconds(proc: subprocess.Popen) -> float | None:
+    if psutil is None:
+        return None
+    times = psutil.Process(proc.pid).cpu_times()
+    return times.user + times.system
+
+
+async def _run_level(
+    calls: int, args: argparse.Namespace, aoai_port: int, turns: list[bytes]
+) -> dict[str, Any]:
+    port = _free_port()
+    base = f"http://127.0.0.1:{port}"
+    backend = _spawn("tests.load.offline.serve", port, [], _backend_env(args, aoai_port))
+    try:
+        await _wait_healthy(f"{base}/api/v1/health", backend, args.startup_timeout_s)
+        cpu_before = _cpu_seconds(backend)
+        started = time.perf_counter()
+
+        async def caller(index: int) -> CallResult:
+            await asyncio.sleep(index * args.ramp_s / max(calls, 1))
+            script = [turns[(index + t) % len(turns)] for t in range(args.turns)]
+            return await SyntheticAcsCall(
+                f"ws://127.0.0.1:{port}/api/v1/media/stream",
+                script,
+                response_timeout_s=args.response_timeout_s,
+            ).run()
+
+        results = await asyncio.gather(*(caller(i) for i in range(calls)))
+        wall_s = time.perf_counter() - started
+        cpu_after = _cpu_seconds(backend)
+        async with httpx.AsyncClient(timeout=5.0) as client:
+            stages = (await client.get(f"{base}/api/v1/metrics/latency")).json()["stages"]
+    finally:
+        _stop(backend)
+
+    latency = QuantileSketch()
+    for result in results:
+        for value in result.turn_latencies_ms:
+            latency.add(value)
+    total_turns = sum(len(r.turns) for r in results) + sum(
+        args.turns for r in results if r.error and not r.turns
+    )
+    unanswered = total_turns - latency.count
+    p50, p95, p99 = latency.quantiles((0.5, 0.95, 0.99)) if latency.count else (0.0, 0.0, 0.0)
+    cpu_s = cpu_after - cpu_before if cpu_before is not None and cpu_after is not None else None
+    return {
+        "calls": calls,
+        "turns": total_turns,
+        "unanswered": unanswered,
+        "errors": sorted({r.error for r in results if r.error}),
+        "turn_p50_ms": round(p50, 1),
+        "turn_p95_ms": round(p95, 1),
+        "turn_p99_ms": round(p99, 1),
+        "wall_s": round(wall_s, 1),
+        "cpu_s_per_call": round(cpu_s / calls, 3) if cpu_s is not None else None,
+        "cpu_cores": round(cpu_s / wall_s, 2) if cpu_s is not None else None,
+        "stages": {
+            stage: {key: summary[key] for key in ("count", "p50", "p95", "p99")}
+            for stage, summary in sorted(stages.items())
+        },
+    }
+
+
+def _within_slo(level: dict[str, Any], slo_ms: float) -> bool:
+    answered = level["turns"] - level["unanswered"]
+    return (
+        answered > 0
+        and level["turn_p95_ms"] <= slo_ms
+        and level["unanswered"] <= SLO_TIMEOUT_FRACTION * level["turns"]
+    )
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    turns = _load_turns(args.max_clips)
+    aoai_port = _free_port()
+    mock = _spawn(
+        "tests.load.offline.mock_aoai",
+        aoai_port,
+        ["--ttft-ms", str(args.ttft_ms), "--tokens-per-s", str(args.tokens_per_s)],
+        dict(os.environ),
+    )
+    levels: list[dict[str, Any]] = []
+    try:
+        await _wait_healthy(f"http://127.0.0.1:{aoai_port}/health", mock, 30)
+        for calls in args.levels:
+            level = await _run_level(calls, args, aoai_port, turns)
+            levels.append(level)
+            if args.stop_on_breach and not _within_slo(level, args.slo_ms):
+                break
+    finally:
+        _stop(mock)
+    passing = [level["calls"] for level in levels if _within_slo(level, args.slo_ms)]
+    return {"slo_ms": args.slo_ms, "capacity_calls": max(passing, default=0), "levels": levels}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Offline end-to-end call capacity")
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 5, 10, 20])
+    parser.add_argument("--turns", type=int, default=2, help="Turns per call")
+    parser.add_argument("--max-clips", type=int, default=8, help="Cached PCM clips to rotate")
+    parser.add_argument("--ramp-s", type=float, default=2.0, help="Spread call starts over")
+    parser.add_argument("--slo-ms", type=float, default=2500.0, help="Turn p95 budget")
+    parser.add_argument("--stop-on-breach", action="store_true", help="Stop at first SLO miss")
+    parser.add_argument("--ttft-ms", type=float, default=300.0, help="Mock AOAI first token")
+    parser.add_argument("--tokens-per-s", type=float, default=60.0, help="Mock AOAI rate")
+    parser.add_argument("--stt-ms", type=float, default=150.0, help="Fake STT final latency")
+    parser.add_argument("--tts-first-byte-ms", type=float, default=80.0)
+    parser.add_argument("--tts-realtime-factor", type=float, default=20.0)
+    parser.add_argument("--silence-ms", type=int, default=None, help="Override VAD silence")
+    parser.add_argument("--response-timeout-s", type=float, default=10.0)
+    parser.add_argument("--startup-timeout-s", type=float, default=60.0)
+    parser.add_argument("--redis-host", default="127.0.0.1")
+    parser.add_argument("--redis-port", type=int, default=6379)
+    parser.add_argument("--redis-password", default="offline")
+    parser.add_argument("--json", action="store_true", help="Print raw JSON results")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(
+        f"{'calls':>6} {'turns':>6} {'miss':>5} {'p50 ms':>8} {'p95 ms':>8} "
+        f"{'p99 ms':>8} {'cpu s/call':>11} {'cores':>6}"
+    )
+    for level in report["levels"]:
+        cpu = level["cpu_s_per_call"]
+        cores = level["cpu_cores"]
+        print(
+            f"{level['calls']:>6} {level['turns']:>6} {level['unanswered']:>5} "
+            f"{level['turn_p50_ms']:>8.1f} {level['turn_p95_ms']:>8.1f} "
+            f"{level['turn_p99_ms']:>8.1f} {cpu if cpu is not None else '-':>11} "
+            f"{cores if cores is not None else '-':>6}"
+        )
+        for error in level["errors"]:
+            print(f"       error: {error}")
+    if report["levels"]:
+        last = report["levels"][-1]
+        print(f"\nStage latency at {last['calls']} calls (ms):")
+        for stage, summary in last["stages"].items():
+            print(
+                f"  {stage:<32} n={summary['count']:<6} p50={summary['p50']:<8} "
+                f"p95={summary['p95']:<8} p99={summary['p99']}"
+            )
+    print(f"\nCapacity within p95 <= {report['slo_ms']:.0f} ms: {report['capacity_calls']} calls")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+Local Azure OpenAI Mock
+=======================
+
+Streaming chat-completions endpoint compatible with the ``openai`` client's
+``AzureOpenAI`` for offline load runs. Every request is answered with a
+deterministic assistant reply, streamed as SSE chunks after ``ttft_ms`` and
+then at ``tokens_per_s`` (one word per chunk), ending with ``data: [DONE]``.
+Non-streaming requests get the whole reply after the same total delay.
+
+Tool calls are never returned, so every turn is a single model round trip;
+the reply is picked from ``REPLIES`` by a hash of the last user message so a
+replayed conversation always produces the same text.
+
+Usage:
+    python -m tests.load.offline.mock_aoai --port 8099 --ttft-ms 300 --tokens-per-s 60
+
+    AZURE_OPENAI_ENDPOINT=http://127.0.0.1:8099 AZURE_OPENAI_KEY=offline ...
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import json
+import time
+import uuid
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import Any
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+REPLIES = (
+    "Thanks for calling. I can help with that. Let me pull up your policy details now.",
+    "Your current plan covers collision and comprehensive damage with a five hundred "
+    "dollar deductible. Is there anything specific you would like me to check?",
+    "I understand. If you are in an accident, call us first and we will open a claim "
+    "and arrange a tow if you need one.",
+    "Your account balance is up to date and your next payment is due on the first of the month.",
+    "You are welcome. Is there anything else I can help you with today?",
+)
+
+
+@dataclass
+class MockSettings:
+    ttft_ms: float = 300.0
+    tokens_per_s: float = 60.0
+    max_words: int = 0  # 0 keeps the full reply
+
+
+def _reply_for(messages: list[dict[str, Any]], max_words: int) -> str:
+    last_user = next(
+        (str(m.get("content") or "") for m in reversed(messages) if m.get("role") == "user"),
+        "",
+    )
+    index = int(hashlib.sha1(last_user.encode()).hexdigest(), 16) % len(REPLIES)
+    words = REPLIES[index].split()
+    return " ".join(words[:max_words] if max_words > 0 else words)
+
+
+def _chunk(completion_id: str, model: str, delta: dict[str, Any], finish: str | None) -> str:
+    payload = {
+        "id": completion_id,
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish}],
+    }
+    return f"data: {json.dumps(payload)}\n\n"
+
+
+def create_app(settings: MockSettings | None = None) -> FastAPI:
+    """Build the mock app; ``app.state.requests`` counts completions served."""
+    settings = settings or MockSettings()
+    app = FastAPI(title="Offline AOAI mock")
+    app.state.settings = settings
+    app.state.requests = 0
+
+    async def completions(request: Request, deployment: str) -> Any:
+        body = await request.json()
+        app.state.requests += 1
+        reply = _reply_for(body.get("messages") or [], settings.max_words)
+        words = reply.split(" ")
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+        model = body.get("model") or deployment
+        interval = 1 / settings.tokens_per_s if settings.tokens_per_s > 0 else 0.0
+
+        if not body.get("stream"):
+            await asyncio.sleep(settings.ttft_ms / 1000 + interval * len(words))
+            return JSONResponse(
+                {
+                    "id": completion_id,
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": model,
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {"role": "assistant", "content": reply},
+                            "finish_reason": "stop",
+                        }
+                    ],
+                    "usage": {
+                        "prompt_tokens": 0,
+                        "completion_tokens": len(words),
+                        "total_tokens": len(words),
+                    },
+                }
+            )
+
+        async def stream() -> AsyncIterator[str]:
+            await asyncio.sleep(settings.ttft_ms / 1000)
+            yield _chunk(completion_id, model, {"role": "assistant", "content": ""}, None)
+            for i, word in enumerate(words):
+                if i:
+                    await asyncio.sleep(interval)
+                delta = {"content": word if i == 0 else f" {word}"}
+                yield _chunk(completion_id, model, delta, None)
+            yield _chunk(completion_id, model, {}, "stop")
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(stream(), media_type="text/event-stream")
+
+    @app.post("/openai/deployments/{deployment}/chat/completions")
+    async def deployment_completions(deployment: str, request: Request) -> Any:
+        return await completions(request, deployment)
+
+    @app.post("/openai/v1/chat/completions")
+    async def v1_completions(request: Request) -> Any:
+        return await completions(request, "mock")
+
+    @app.get("/health")
+    async def health() -> dict[str, Any]:
+        return {"status": "ok", "requests": app.state.requests}
+
+    return app
+
+
+def main() -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Streaming Azure OpenAI chat-completions mock")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--ttft-ms", type=float, default=300.0, help="Time to first token")
+    parser.add_argument("--tokens-per-s", type=float, default=60.0, help="Streaming rate")
+    parser.add_argument("--max-words", type=int, default=0, help="Truncate replies (0 = full)")
+    args = parser.parse_args()
+    settings = MockSettings(args.ttft_ms, args.tokens_per_s, args.max_words)
+    uvicorn.run(create_app(settings), host=args.host, port=args.port, log_level="warning")
+
+
+__all__ = ["MockSettings", "REPLIES", "create_app"]
+
+
+if __name__ == "__main__":
+    main()
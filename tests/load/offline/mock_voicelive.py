@@ -0,0 +1,138 @@
+"""
+Local VoiceLive Mock
+====================
+
+WebSocket stand-in for the VoiceLive realtime endpoint, enough to drive
+``azure.ai.voicelive.aio.VoiceLiveConnection`` offline. Client events are
+handled strictly in arrival order, as the service does:
+
+- ``session.update``           answered with ``session.updated`` after ``session_update_ms``
+- ``conversation.item.create`` answered with ``conversation.item.created`` after ``item_ms``
+- ``response.create``          answered with ``response.created``, one
+  ``response.audio.delta`` after ``first_audio_ms`` and ``response.done``
+
+Because items are ingested one at a time, the time from an agent switch to
+the first audio delta grows with the number of items injected before the
+response, which is what the history injection benchmark measures. Every
+received item is kept in ``MockVoiceLive.items``.
+
+Usage:
+    python -m tests.load.offline.mock_voicelive --port 8098 --item-ms 5 --first-audio-ms 200
+
+    from tests.load.offline.mock_voicelive import MockVoiceLive, MockVoiceLiveSettings
+
+    mock = MockVoiceLive(MockVoiceLiveSettings(item_ms=2))
+    async with mock.serve() as url:
+        ...  # aiohttp ws_connect(url) -> VoiceLiveConnection(session, ws)
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import contextlib
+import json
+import uuid
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from typing import Any
+
+import websockets
+
+# 20 ms of 24 kHz PCM16 silence
+_AUDIO_DELTA = base64.b64encode(bytes(960)).decode()
+
+
+@dataclass
+class MockVoiceLiveSettings:
+    item_ms: float = 5.0
+    session_update_ms: float = 20.0
+    first_audio_ms: float = 200.0
+
+
+@dataclass
+class MockVoiceLive:
+    """In-process VoiceLive stand-in; one instance may serve several connections."""
+
+    settings: MockVoiceLiveSettings = field(default_factory=MockVoiceLiveSettings)
+    items: list[dict[str, Any]] = field(default_factory=list)
+    item_bytes: int = 0
+    responses: int = 0
+
+    def reset(self) -> None:
+        self.items.clear()
+        self.item_bytes = 0
+        self.responses = 0
+
+    async def handle(self, ws: Any) -> None:
+        """Serve one client connection until it closes."""
+        settings = self.settings
+        await self._send(ws, "session.created", session={"id": f"sess_{uuid.uuid4().hex[:12]}"})
+        async for raw in ws:
+            event = json.loads(raw)
+            kind = event.get("type")
+            if kind == "session.update":
+                await asyncio.sleep(settings.session_update_ms / 1000)
+                await self._send(ws, "session.updated", session=event.get("session") or {})
+            elif kind == "conversation.item.create":
+                await asyncio.sleep(settings.item_ms / 1000)
+                item = dict(event.get("item") or {})
+                item.setdefault("id", f"item_{uuid.uuid4().hex[:12]}")
+                self.items.append(item)
+                self.item_bytes += len(raw)
+                await self._send(ws, "conversation.item.created", item=item)
+            elif kind == "response.create":
+                self.responses += 1
+                response_id = f"resp_{uuid.uuid4().hex[:12]}"
+                response = {"id": response_id, "object": "realtime.response", "output": []}
+                await self._send(ws, "response.created", response=response)
+                await asyncio.sleep(settings.first_audio_ms / 1000)
+                await self._send(
+                    ws,
+                    "response.audio.delta",
+                    response_id=response_id,
+                    item_id=f"item_{uuid.uuid4().hex[:12]}",
+                    output_index=0,
+                    content_index=0,
+                    delta=_AUDIO_DELTA,
+                )
+                await self._send(ws, "response.done", response={**response, "status": "completed"})
+
+    @staticmethod
+    async def _send(ws: Any, kind: str, **payload: Any) -> None:
+        await ws.send(
+            json.dumps({"type": kind, "event_id": f"evt_{uuid.uuid4().hex[:12]}", **payload})
+        )
+
+    @contextlib.asynccontextmanager
+    async def serve(self, host: str = "127.0.0.1", port: int = 0) -> AsyncIterator[str]:
+        """Listen on ``host:port`` (0 picks a free port) and yield the ws:// URL."""
+        async with websockets.serve(self.handle, host, port) as server:
+            bound = server.sockets[0].getsockname()[1]
+            yield f"ws://{host}:{bound}/voice-live/realtime"
+
+
+async def _serve_forever(mock: MockVoiceLive, host: str, port: int) -> None:
+    async with mock.serve(host, port) as url:
+        print(f"VoiceLive mock listening on {url}")
+        await asyncio.Future()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="VoiceLive realtime WebSocket mock")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8098)
+    parser.add_argument("--item-ms", type=float, default=5.0, help="Ingest time per item")
+    parser.add_argument("--session-update-ms", type=float, default=20.0)
+    parser.add_argument("--first-audio-ms", type=float, default=200.0, help="Response to audio")
+    args = parser.parse_args()
+    settings = MockVoiceLiveSettings(args.item_ms, args.session_update_ms, args.first_audio_ms)
+    asyncio.run(_serve_forever(MockVoiceLive(settings), args.host, args.port))
+
+
+__all__ = ["MockVoiceLive", "MockVoiceLiveSettings"]
+
+
+if __name__ == "__main__":
+    main()
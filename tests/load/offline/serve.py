@@ -0,0 +1,38 @@
+"""
+Offline Backend Entry Point
+===========================
+
+Runs the real backend app (``apps.artagent.backend.main:app``) with the
+deterministic speech stand-ins installed, so the speech pools, the cascade
+orchestrator, Redis session state and the media WebSocket all run for real
+while STT and TTS cost no network round trips. The harness starts this as a
+child process with the environment pointing AOAI at the local mock.
+
+Usage:
+    python -m tests.load.offline.serve --port 8010
+"""
+
+from __future__ import annotations
+
+import argparse
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Backend with offline speech stand-ins")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8010)
+    parser.add_argument("--log-level", default="warning")
+    args = parser.parse_args()
+
+    import uvicorn
+
+    from tests.load.offline.fake_speech import install_fake_speech
+
+    install_fake_speech()
+    from apps.artagent.backend.main import app
+
+    uvicorn.run(app, host=args.host, port=args.port, log_level=args.log_level, ws="websockets")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Post-Call Analytics Write Benchmark
+
+Simulates a shift change: N sessions end within a short burst and each
+persists its analytics document. Writes go through the real
+``CosmosDBMongoCoreManager`` against a local in-process Mongo stand-in whose
+collection charges a per-request overhead plus a per-KB write cost and blocks
+for a fixed round-trip latency.
+
+Modes:
+- per_session: legacy ``build_and_flush`` (one upsert per session on a thread)
+- batched: PostCallAnalyticsQueue (bulk_write in size/time-bounded batches)
+
+Reported per mode:
+- round_trips: requests sent to the stand-in
+- request_units / ru_per_session: simulated RU charge
+- peak_threads: maximum concurrent write threads observed
+- wall_ms: time until every document is persisted
+
+Usage:
+    python -m tests.load.postcall_bulk_benchmark
+    python -m tests.load.postcall_bulk_benchmark --sessions 500 --rtt-ms 15 --json
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import tempfile
+import threading
+import time
+from typing import Any
+
+from src.cosmosdb.manager import CosmosDBMongoCoreManager
+from src.postcall import push
+from src.postcall.analytics_queue import (
+    AnalyticsQueueConfig,
+    PostCallAnalyticsQueue,
+    set_analytics_queue,
+)
+from src.tools.latency_helpers import record_stage_stat
+
+# Simulated request charge: fixed cost per round trip plus a cost per KB written
+RU_PER_REQUEST = 5.0
+RU_PER_KB = 1.0
+
+
+class _Result:
+    def __init__(self, upserted: int = 0, modified: int = 0):
+        self.upserted_id = None
+        self.upserted_count = upserted
+        self.modified_count = modified
+
+
+class LocalMongoCollection:
+    """Thread-safe in-memory collection with latency and a request-charge model."""
+
+    name = "analytics"
+
+    def __init__(self, rtt_ms: float):
+        self.rtt_ms = rtt_ms
+        self.documents: dict[str, dict[str, Any]] = {}
+        self.round_trips = 0
+        self.request_units = 0.0
+        self.active = 0
+        self.peak_active = 0
+        self._lock = threading.Lock()
+
+    def _charge(self, documents: list[dict[str, Any]]) -> None:
+        size_kb = sum(len(json.dumps(doc, default=str)) for doc in documents) / 1024
+        with self._lock:
+            self.round_trips += 1
+            self.request_units += RU_PER_REQUEST + RU_PER_KB * size_kb
+            self.active += 1
+            self.peak_active = max(self.peak_active, self.active)
+        time.sleep(self.rtt_ms / 1000)
+        with self._lock:
+            self.active -= 1
+            for doc in documents:
+                self.documents[doc["_id"]] = doc
+
+    def update_one(self, query, update, upsert=False):
+        self._charge([update["$set"]])
+        return _Result(upserted=1)
+
+    def bulk_write(self, operations, ordered=True):
+        self._charge([op._doc["$set"] for op in operations])
+        return _Result(upserted=len(operations))
+
+
+class _Memo:
+    def __init__(self, index: int):
+        self.session_id = f"session-{index}"
+        self.histories = {
+            "Concierge": [
+                {"role": "user", "content": f"turn {t} " + "words " * 20} for t in range(6)
+            ]
+        }
+        bucket: dict[str, Any] = {"runs": {}, "order": []}
+        for _ in range(12):
+            record_stage_stat(bucket, "tts", random.uniform(0.1, 0.4))
+            record_stage_stat(bucket, "llm", random.uniform(0.3, 1.2))
+        self.context = {"latency": bucket, "caller_name": "Test Caller"}
+
+
+def _manager(collection: LocalMongoCollection) -> CosmosDBMongoCoreManager:
+    manager = CosmosDBMongoCoreManager.__new__(CosmosDBMongoCoreManager)
+    manager.collection = collection
+    manager.cluster_host = "localhost"
+    return manager
+
+
+async def run_mode(mode: str, sessions: int, rtt_ms: float, burst_s: float) -> dict[str, Any]:
+    collection = LocalMongoCollection(rtt_ms)
+    cosmos = _manager(collection)
+    queue = None
+    if mode == "batched":
+        queue = PostCallAnalyticsQueue(
+            cosmos,
+            AnalyticsQueueConfig(
+                max_batch_size=100,
+                max_batch_delay_s=0.25,
+                spill_dir=tempfile.mkdtemp(prefix="postcall-bench-"),
+            ),
+        )
+        await queue.start()
+        set_analytics_queue(queue)
+
+    async def end_call(index: int) -> None:
+        await asyncio.sleep(random.uniform(0, burst_s))
+        await push.build_and_flush(_Memo(index), cosmos)
+
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(*(end_call(i) for i in range(sessions)))
+        if queue is not None:
+            await queue.stop()
+    finally:
+        set_analytics_queue(None)
+    wall_ms = (time.perf_counter() - start) * 1000
+
+    assert len(collection.documents) == sessions
+    return {
+        "mode": mode,
+        "sessions": sessions,
+        "round_trips": collection.round_trips,
+        "request_units": round(collection.request_units, 1),
+        "ru_per_session": round(collection.request_units / sessions, 2),
+        "peak_threads": collection.peak_active,
+        "wall_ms": round(wall_ms, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Post-call analytics write cost")
+    parser.add_argument("--sessions", type=int, default=300)
+    parser.add_argument("--rtt-ms", type=float, default=10.0)
+    parser.add_argument("--burst-s", type=float, default=1.0, help="Window in which calls end")
+    parser.add_argument("--json", action="store_true", help="Print raw JSON results")
+    args = parser.parse_args()
+
+    results = [
+        asyncio.run(run_mode(mode, args.sessions, args.rtt_ms, args.burst_s))
+        for mode in ("per_session", "batched")
+    ]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'mode':<12} {'trips':>6} {'RU':>9} {'RU/sess':>8} {'threads':>8} {'wall ms':>8}")
+    for r in results:
+        print(
+            f"{r['mode']:<12} {r['round_trips']:>6} {r['request_units']:>9.1f} "
+            f"{r['ru_per_session']:>8.2f} {r['peak_threads']:>8} {r['wall_ms']:>8.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Call Recording Upload Benchmark
+
+Replays a call's audio (caller frames plus agent TTS bursts) into two
+recorders backed by a filesystem block store that adds a per-request latency
+and a per-MB transfer time, standing in for Blob Storage/Azurite.
+
+Modes:
+- buffered: accumulate the whole call, then upload it at hangup
+  (what ``save_wav_to_blob`` / ``stream_wav_to_blob`` do today)
+- streaming: CallRecordingSink staging blocks during the call
+
+Reported per mode:
+- hangup_ms: time from hangup until the recording is committed
+- peak_buffer_kb: largest amount of audio held in memory
+- requests: storage requests issued
+
+Usage:
+    python -m tests.load.recording_upload_benchmark
+    python -m tests.load.recording_upload_benchmark --minutes 10 --mb-per-s 20 --json
+"""
+
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+from array import array
+from pathlib import Path
+from typing import Any
+
+from src.blob.recording_sink import CallRecordingSink, FilesystemBlockStore, wav_header
+
+SAMPLE_RATE = 16000
+FRAME_MS = 20
+
+
+class LatentBlockStore(FilesystemBlockStore):
+    """Filesystem block store that models request latency and bandwidth."""
+
+    def __init__(self, path: Path, rtt_ms: float, mb_per_s: float):
+        super().__init__(path)
+        self.rtt_ms = rtt_ms
+        self.mb_per_s = mb_per_s
+        self.requests = 0
+
+    async def _transfer(self, size: int) -> None:
+        self.requests += 1
+        await asyncio.sleep(self.rtt_ms / 1000 + size / (self.mb_per_s * 1024 * 1024))
+
+    async def stage_block(self, block_id: str, data: bytes) -> None:
+        await self._transfer(len(data))
+        await super().stage_block(block_id, data)
+
+    async def commit(self, block_ids: list[str], metadata: dict[str, str]) -> None:
+        await self._transfer(0)
+        await super().commit(block_ids, metadata)
+
+
+def _frames(seconds: float) -> list[tuple[bytes, bytes | None]]:
+    """Caller frames, each optionally paired with an agent TTS burst."""
+    frame = array("h", [500] * (SAMPLE_RATE * FRAME_MS // 1000)).tobytes()
+    speech = array("h", [-500] * SAMPLE_RATE * 3).tobytes()  # 3s utterance
+    count = int(seconds * 1000 / FRAME_MS)
+    return [(frame, speech if i % 500 == 0 else None) for i in range(count)]
+
+
+async def run_mode(mode: str, args: argparse.Namespace, root: Path) -> dict[str, Any]:
+    store = LatentBlockStore(root / f"{mode}.wav", args.rtt_ms, args.mb_per_s)
+    frames = _frames(args.minutes * 60)
+    # Replay faster than real time, yielding every 200ms of audio so background
+    # uploads make progress the way they would during a live call
+    yield_every = 10
+    pause_s = yield_every * FRAME_MS / 1000 / args.speedup
+
+    if mode == "streaming":
+        sink = CallRecordingSink(store, sample_rate=SAMPLE_RATE, block_size=args.block_kb * 1024)
+        await sink.start()
+        for i, (caller, agent) in enumerate(frames):
+            sink.write_inbound(caller)
+            if agent:
+                sink.write_outbound(agent)
+            if i % yield_every == 0:
+                await asyncio.sleep(pause_s)
+        start = time.perf_counter()
+        result = await sink.close()
+        hangup_ms = (time.perf_counter() - start) * 1000
+        assert result.success and sink.stats.dropped_bytes == 0
+        peak = sink.stats.peak_buffered_bytes
+    else:
+        buffer = bytearray()
+        for i, (caller, _agent) in enumerate(frames):
+            buffer += caller + caller  # Same stereo size as the sink produces
+            if i % yield_every == 0:
+                await asyncio.sleep(pause_s)
+        peak = len(buffer)
+        start = time.perf_counter()
+        data = wav_header(len(buffer), SAMPLE_RATE) + bytes(buffer)
+        await store.stage_block("full", data)
+        await store.commit(["full"], {})
+        hangup_ms = (time.perf_counter() - start) * 1000
+
+    return {
+        "mode": mode,
+        "minutes": args.minutes,
+        "hangup_ms": round(hangup_ms, 1),
+        "peak_buffer_kb": round(peak / 1024, 1),
+        "requests": store.requests,
+    }
+
+
+async def run(args: argparse.Namespace) -> list[dict[str, Any]]:
+    with tempfile.TemporaryDirectory(prefix="recording-bench-") as tmp:
+        return [await run_mode(mode, args, Path(tmp)) for mode in ("buffered", "streaming")]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Call recording upload latency and memory")
+    parser.add_argument("--minutes", type=float, default=5.0, help="Recorded call length")
+    parser.add_argument("--rtt-ms", type=float, default=30.0, help="Per-request latency")
+    parser.add_argument("--mb-per-s", type=float, default=10.0, help="Upload bandwidth")
+    parser.add_argument("--block-kb", type=int, default=1024)
+    parser.add_argument("--speedup", type=float, default=50.0, help="Replay speed vs real time")
+    parser.add_argument("--json", action="store_true", help="Print raw JSON results")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'mode':<10} {'hangup ms':>10} {'peak KB':>9} {'requests':>9}")
+    for r in results:
+        print(
+            f"{r['mode']:<10} {r['hangup_ms']:>10.1f} "
+            f"{r['peak_buffer_kb']:>9.1f} {r['requests']:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
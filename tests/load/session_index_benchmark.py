@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Session Listing Benchmark
+
+Compares listing one page of sessions by scanning the keyspace (the previous
+``GET /api/v1/sessions`` path) with paging through the session index
+(``src/redis/session_index.py``). Both run against an in-memory Redis stand-in
+that counts network round trips; the reported latency is
+``round_trips * rtt_ms`` plus the measured CPU time.
+
+The keyspace mixes session hashes with unrelated keys, so the scan path pays
+for every key in Redis while the index path only pays for the page.
+
+Usage:
+    python -m tests.load.session_index_benchmark
+    python -m tests.load.session_index_benchmark --keys 10000 100000 --rtt-ms 1 --json
+"""
+
+import argparse
+import fnmatch
+import json
+import time
+from typing import Any
+
+from apps.artagent.backend.api.v1.endpoints import sessions as sessions_endpoint
+from opentelemetry import trace
+from src.redis.manager import AzureRedisManager
+from src.redis.session_index import summarize_session
+from utils.ml_logging import get_logger
+
+
+class CountingRedis:
+    """In-memory Redis subset that counts round trips (SCAN pages, commands, pipelines)."""
+
+    def __init__(self):
+        self.kv: dict[str, Any] = {}
+        self.zsets: dict[str, dict[str, float]] = {}
+        self._sorted: dict[str, list[str]] = {}
+        self.round_trips = 0
+
+    def _trip(self) -> None:
+        self.round_trips += 1
+
+    # -- commands --------------------------------------------------------
+    def hset(self, key, field=None, value=None, mapping=None, _trip=True):
+        if _trip:
+            self._trip()
+        self.kv.setdefault(key, {}).update(mapping or {field: value})
+
+    def hsetnx(self, key, field, value):
+        self.kv.setdefault(key, {}).setdefault(field, value)
+
+    def hgetall(self, key, _trip=True):
+        if _trip:
+            self._trip()
+        return dict(self.kv.get(key, {}))
+
+    def get(self, key):
+        self._trip()
+        return self.kv.get(key)
+
+    def set(self, key, value, ex=None):
+        self._trip()
+        self.kv[key] = value
+
+    def expire(self, key, ttl):
+        return True
+
+    def scan_iter(self, match=None, count=10):
+        keys = list(self.kv)
+        for start in range(0, len(keys), count):
+            self._trip()
+            yield from (k for k in keys[start : start + count] if fnmatch.fnmatch(k, match))
+
+    def zadd(self, key, mapping, gt=False):
+        self.zsets.setdefault(key, {}).update(mapping)
+        self._sorted.pop(key, None)
+
+    def zremrangebyscore(self, key, low, high):
+        return 0
+
+    def zcard(self, key):
+        return len(self.zsets.get(key, {}))
+
+    def zcount(self, key, low, high):
+        low = float(low)
+        return sum(1 for score in self.zsets.get(key, {}).values() if score >= low)
+
+    def zrevrange(self, key, start, end):
+        if key not in self._sorted:
+            zset = self.zsets.get(key, {})
+            self._sorted[key] = sorted(zset, key=zset.__getitem__, reverse=True)
+        return self._sorted[key][start : end + 1]
+
+    def pipeline(self, transaction=True):
+        return _Pipeline(self)
+
+
+class _Pipeline:
+    def __init__(self, client: CountingRedis):
+        self._client = client
+        self._calls: list[tuple[str, tuple, dict]] = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self._calls.append((name, args, kwargs))
+
+        return queue
+
+    def execute(self):
+        self._client._trip()
+        results = []
+        for name, args, kwargs in self._calls:
+            if name in ("hset", "hgetall"):
+                kwargs = {**kwargs, "_trip": False}
+            results.append(getattr(self._client, name)(*args, **kwargs))
+        return results
+
+
+def _manager(client: CountingRedis) -> AzureRedisManager:
+    manager = AzureRedisManager.__new__(AzureRedisManager)
+    manager.redis_client = client
+    manager.logger = get_logger("bench.session_index")
+    manager.tracer = trace.get_tracer(__name__)
+    manager.host = "localhost"
+    manager.port = 6379
+    return manager
+
+
+def _populate(client: CountingRedis, manager: AzureRedisManager, keys: int, ratio: float) -> int:
+    now = time.time()
+    sessions = int(keys * ratio)
+    for i in range(keys):
+        if i < sessions:
+            corememory = {
+                "session_info": {"last_activity": now - i},
+                "session_profile": {"display_name": f"Caller {i}"},
+            }
+            history = {"Concierge": [{"role": "user", "content": "hi"}] * 4}
+            client.hset(
+                f"session:session_{i}",
+                mapping={"corememory": json.dumps(corememory), "chat_history": json.dumps(history)},
+                _trip=False,
+            )
+            summary = summarize_session(f"session_{i}", corememory, history, now=now)
+            manager.session_index.record(f"session_{i}", summary)
+        else:
+            client.kv[f"cache:item:{i}"] = "x"
+    return sessions
+
+
+def _list_by_scan(manager: AzureRedisManager, limit: int) -> int:
+    keys = sessions_endpoint._scan_session_keys(manager)
+    listed = 0
+    for session_key in keys[:limit]:
+        data = manager.get_session_data(session_key)
+        if data and sessions_endpoint._session_metadata(
+            summarize_session(session_key[8:], data["corememory"], data["chat_history"])
+        ):
+            listed += 1
+    return listed
+
+
+def _list_by_index(manager: AzureRedisManager, limit: int) -> int:
+    page = manager.session_index.page(0, limit)
+    return sum(1 for summary in page.sessions if sessions_endpoint._session_metadata(summary))
+
+
+def run(keys: int, ratio: float, limit: int, rtt_ms: float) -> list[dict[str, Any]]:
+    client = CountingRedis()
+    manager = _manager(client)
+    sessions = _populate(client, manager, keys, ratio)
+
+    results = []
+    for mode, lister in (("scan", _list_by_scan), ("index", _list_by_index)):
+        client.round_trips = 0
+        start = time.perf_counter()
+        listed = lister(manager, limit)
+        cpu_ms = (time.perf_counter() - start) * 1000
+        results.append(
+            {
+                "mode": mode,
+                "keys": keys,
+                "sessions": sessions,
+                "listed": listed,
+                "round_trips": client.round_trips,
+                "cpu_ms": round(cpu_ms, 1),
+                "est_latency_ms": round(client.round_trips * rtt_ms + cpu_ms, 1),
+            }
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Session listing: keyspace scan vs index")
+    parser.add_argument("--keys", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--session-ratio", type=float, default=0.2, help="Share of session keys")
+    parser.add_argument("--limit", type=int, default=50, help="Page size")
+    parser.add_argument("--rtt-ms", type=float, default=1.0, help="Redis round-trip time")
+    parser.add_argument("--json", action="store_true", help="Print raw JSON results")
+    args = parser.parse_args()
+
+    results = [
+        row
+        for keys in args.keys
+        for row in run(keys, args.session_ratio, args.limit, args.rtt_ms)
+    ]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'keys':>8} {'mode':<6} {'trips':>7} {'cpu ms':>8} {'est ms':>9}")
+    for r in results:
+        print(
+            f"{r['keys']:>8} {r['mode']:<6} {r['round_trips']:>7} "
+            f"{r['cpu_ms']:>8.1f} {r['est_latency_ms']:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Tool Event-Loop Lag Benchmark
+
+Measures how much the insurance tools stall the event loop when Cosmos reads
+are slow. A 5ms ticker runs alongside N concurrent simulated sessions, each
+calling the policy, claims and subrogation tools against a blocking fake Cosmos
+manager with configurable read latency.
+
+Modes:
+- inline: the legacy pattern, ``read_document`` called directly on the loop
+- repository: reads through InsuranceRepository (shared Cosmos executor + cache)
+
+Reported per mode:
+- loop_lag_ms p50/p99/max: ticker delay beyond its 5ms sleep
+- stalls: ticks delayed by more than 20ms (audio frames would be late)
+- wall_ms: time to complete all sessions
+- cosmos_reads: reads issued to the fake manager
+
+Usage:
+    python -m tests.load.tool_loop_lag_benchmark
+    python -m tests.load.tool_loop_lag_benchmark --sessions 20 --read-ms 150 --json
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Any
+
+from apps.artagent.backend.registries.toolstore.insurance import policy, subro
+from apps.artagent.backend.registries.toolstore.insurance.repository import (
+    InsuranceRepository,
+    set_insurance_repository,
+)
+from utils.session_context import session_context
+
+TICK_MS = 5.0
+STALL_MS = 20.0
+
+
+def _user_doc(client_id: str) -> dict[str, Any]:
+    return {
+        "_id": client_id,
+        "demo_metadata": {
+            "policies": [{"policy_number": f"POL-{client_id}", "policy_type": "auto"}],
+            "claims": [{"claim_number": f"CLM-{client_id}", "status": "open"}],
+        },
+    }
+
+
+class FakeCosmos:
+    """Blocking manager with a fixed read latency."""
+
+    def __init__(self, read_ms: float) -> None:
+        self.read_ms = read_ms
+        self.reads = 0
+
+    def read_document(self, query: dict[str, Any]) -> dict[str, Any]:
+        self.reads += 1
+        time.sleep(self.read_ms / 1000)
+        if "_id" in query:
+            return _user_doc(str(query["_id"]))
+        # By-number query: "^CLM\\-CLT\\-3$" -> "CLT-3"
+        pattern = next(iter(query.values()))["$regex"]
+        number = pattern.strip("^$").replace("\\", "")
+        return _user_doc(number.split("-", 1)[1])
+
+
+class InlineRepository(InsuranceRepository):
+    """Legacy behaviour: synchronous reads on the event loop, no cache."""
+
+    async def _read(self, key, query):  # type: ignore[override]
+        return self._get_manager().read_document(query)
+
+
+async def _session(index: int) -> None:
+    client_id = f"CLT-{index}"
+    async with session_context(session_id=f"bench-{index}"):
+        await policy.list_user_policies({"client_id": client_id})
+        await policy.get_claims_summary({"client_id": client_id})
+        await policy.check_coverage({"client_id": client_id, "coverage_type": "collision"})
+        await subro.get_claim_summary({"claim_number": f"CLM-{client_id}"})
+
+
+async def run_mode(mode: str, sessions: int, read_ms: float) -> dict[str, Any]:
+    cosmos = FakeCosmos(read_ms)
+    repo_cls = InlineRepository if mode == "inline" else InsuranceRepository
+    repository = repo_cls(manager=cosmos, timeout_s=max(2.0, read_ms / 250))
+    set_insurance_repository(repository)
+
+    lags: list[float] = []
+    done = asyncio.Event()
+
+    async def ticker() -> None:
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(TICK_MS / 1000)
+            lags.append(max(0.0, (time.perf_counter() - start) * 1000 - TICK_MS))
+
+    tick = asyncio.create_task(ticker())
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(*(_session(i) for i in range(sessions)))
+    finally:
+        wall_ms = (time.perf_counter() - start) * 1000
+        done.set()
+        await tick
+        set_insurance_repository(None)
+
+    lags.sort()
+    return {
+        "mode": mode,
+        "sessions": sessions,
+        "read_ms": read_ms,
+        "loop_lag_ms_p50": round(statistics.median(lags), 2) if lags else 0.0,
+        "loop_lag_ms_p99": round(lags[int(len(lags) * 0.99) - 1], 2) if lags else 0.0,
+        "loop_lag_ms_max": round(lags[-1], 2) if lags else 0.0,
+        "stalls": sum(1 for lag in lags if lag > STALL_MS),
+        "wall_ms": round(wall_ms, 1),
+        "cosmos_reads": cosmos.reads,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Event-loop lag caused by insurance tools")
+    parser.add_argument("--sessions", type=int, default=10)
+    parser.add_argument("--read-ms", type=float, default=100.0)
+    parser.add_argument("--json", action="store_true", help="Print raw JSON results")
+    args = parser.parse_args()
+
+    results = [
+        asyncio.run(run_mode(mode, args.sessions, args.read_ms))
+        for mode in ("inline", "repository")
+    ]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'mode':<11} {'p50 ms':>7} {'p99 ms':>7} {'max ms':>7} {'stalls':>6} "
+          f"{'wall ms':>8} {'reads':>6}")
+    for r in results:
+        print(
+            f"{r['mode']:<11} {r['loop_lag_ms_p50']:>7.1f} {r['loop_lag_ms_p99']:>7.1f} "
+            f"{r['loop_lag_ms_max']:>7.1f} {r['stalls']:>6} {r['wall_ms']:>8.0f} "
+            f"{r['cosmos_reads']:>6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
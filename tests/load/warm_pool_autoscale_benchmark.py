@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Warm Pool Autoscale Benchmark
+
+Replays a simulated call-arrival trace against ``WarmableResourcePool``
+(``src/pools/warmable_pool.py``) and reports how many acquires fell through
+to the COLD tier, overall and during bursts.
+
+The trace alternates quiet phases (``--quiet-rate`` calls/s) with bursts
+(``--burst-rate`` calls/s); arrivals are Poisson with a fixed seed so every
+mode sees the same trace. Each resource takes ``--create-ms`` to create and
+warm, standing in for a Speech SDK connection. Calls keep their resource, as
+sessions do. Modes:
+
+- ``interval`` - fixed warm size, refilled on a fixed interval (previous behavior)
+- ``event``    - fixed warm size, refilled as soon as a resource is taken
+- ``adaptive`` - event refill plus a warm size driven by the predicted arrival rate
+
+Usage:
+    python -m tests.load.warm_pool_autoscale_benchmark
+    python -m tests.load.warm_pool_autoscale_benchmark --burst-rate 12 --create-ms 500 --json
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from typing import Any
+
+from src.pools.on_demand_pool import AllocationTier
+from src.pools.warmable_pool import WarmableResourcePool
+from src.tools.latency_sketch import QuantileSketch
+
+MODES = ("interval", "event", "adaptive")
+
+
+def arrival_trace(args: argparse.Namespace) -> list[tuple[float, bool]]:
+    """``(offset_s, in_burst)`` per call: quiet, burst, quiet, burst, ..."""
+    rng = random.Random(args.seed)
+    trace: list[tuple[float, bool]] = []
+    start = 0.0
+    for cycle in range(args.cycles * 2):
+        in_burst = cycle % 2 == 1
+        rate = args.burst_rate if in_burst else args.quiet_rate
+        end = start + args.phase_s
+        t = start + rng.expovariate(rate)
+        while t < end:
+            trace.append((t, in_burst))
+            t += rng.expovariate(rate)
+        start = end
+    return trace
+
+
+async def _replay(mode: str, args: argparse.Namespace) -> dict[str, Any]:
+    async def factory() -> object:
+        await asyncio.sleep(args.create_ms / 1000)
+        return object()
+
+    pool = WarmableResourcePool(
+        factory=factory,
+        name=f"bench-{mode}",
+        warm_pool_size=args.warm_size,
+        enable_background_warmup=mode != "interval",
+        warmup_interval_sec=args.interval_s,
+        autoscale=mode == "adaptive",
+        max_warm_size=args.max_size if mode == "adaptive" else None,
+        refill_concurrency=args.refill_concurrency,
+    )
+    await pool.prepare()
+
+    async def interval_refill() -> None:
+        while True:
+            await asyncio.sleep(args.interval_s)
+            await pool._fill_warm_pool()
+
+    refiller = asyncio.create_task(interval_refill()) if mode == "interval" else None
+    latency = QuantileSketch()
+    tiers: list[tuple[AllocationTier, bool]] = []
+    loop = asyncio.get_running_loop()
+    origin = loop.time()
+
+    async def call(offset: float, in_burst: bool) -> None:
+        await asyncio.sleep(max(0.0, origin + offset - loop.time()))
+        started = time.perf_counter()
+        _, tier = await pool.acquire_for_session(None)
+        latency.add(time.perf_counter() - started)
+        tiers.append((tier, in_burst))
+
+    await asyncio.gather(*(call(offset, burst) for offset, burst in arrival_trace(args)))
+    final_target = pool.snapshot()["metrics"]["warm_pool_target"]
+    if refiller:
+        refiller.cancel()
+    await pool.shutdown()
+
+    burst = [tier for tier, in_burst in tiers if in_burst]
+    cold = sum(1 for tier, _ in tiers if tier == AllocationTier.COLD)
+    burst_cold = sum(1 for tier in burst if tier == AllocationTier.COLD)
+    p50, p95 = latency.quantiles((0.5, 0.95))
+    return {
+        "mode": mode,
+        "calls": len(tiers),
+        "cold_fraction": round(cold / max(len(tiers), 1), 3),
+        "burst_cold_fraction": round(burst_cold / max(len(burst), 1), 3),
+        "acquire_p50_ms": round(p50 * 1000, 1),
+        "acquire_p95_ms": round(p95 * 1000, 1),
+        "final_target": final_target,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="COLD-tier fraction under bursty arrivals")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--cycles", type=int, default=2, help="Quiet + burst phase pairs")
+    parser.add_argument("--phase-s", type=float, default=5.0, help="Seconds per phase")
+    parser.add_argument("--quiet-rate", type=float, default=0.5, help="Calls/s between bursts")
+    parser.add_argument("--burst-rate", type=float, default=8.0, help="Calls/s during bursts")
+    parser.add_argument("--create-ms", type=float, default=300.0, help="Resource create + warm")
+    parser.add_argument("--warm-size", type=int, default=3, help="Fixed size / autoscale floor")
+    parser.add_argument("--max-size", type=int, default=12, help="Autoscale ceiling")
+    parser.add_argument("--interval-s", type=float, default=30.0, help="Refill interval")
+    parser.add_argument("--refill-concurrency", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", action="store_true", help="Print raw JSON results")
+    args = parser.parse_args()
+
+    results = [asyncio.run(_replay(mode, args)) for mode in args.modes]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(
+        f"{'mode':<9} {'calls':>6} {'cold':>6} {'burst cold':>11} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'target':>7}"
+    )
+    for r in results:
+        print(
+            f"{r['mode']:<9} {r['calls']:>6} {r['cold_fraction']:>6.1%} "
+            f"{r['burst_cold_fraction']:>11.1%} {r['acquire_p50_ms']:>8.1f} "
+            f"{r['acquire_p95_ms']:>8.1f} {r['final_target']:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+Tests for the adaptive energy endpointer.
+
+Tests cover:
+- Speech start/end on a recorded clip from tests/load/audio_cache
+- Noise floor tracking (no false starts on stationary noise)
+- Minimum speech duration (short bursts rejected)
+- Hangover (short pauses do not end speech)
+- Arbitrary chunk sizes and transport-flagged silence
+- Browser media handler endpoints 16 kHz mic audio in real time
+"""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from apps.artagent.backend.api.v1.handlers.media_handler import (
+    SILENCE_GAP_MS,
+    MediaHandler,
+    MediaHandlerConfig,
+    TransportType,
+)
+from apps.artagent.backend.voice.shared.endpointing import (
+    EndpointerConfig,
+    EndpointEventType,
+    EnergyEndpointer,
+)
+
+SAMPLE_RATE = 16000
+CLIP = Path(__file__).parent / "load" / "audio_cache" / "quick-question-turn-1-of-1_cda6f7b969.pcm"
+
+
+def _pcm(samples: np.ndarray) -> bytes:
+    return np.clip(samples, -32768, 32767).astype("<i2").tobytes()
+
+
+def _silence(ms: int) -> np.ndarray:
+    return np.zeros(SAMPLE_RATE * ms // 1000)
+
+
+def _tone(ms: int, amplitude: float) -> np.ndarray:
+    t = np.arange(SAMPLE_RATE * ms // 1000) / SAMPLE_RATE
+    return amplitude * np.sin(2 * np.pi * 220 * t)
+
+
+def _feed(endpointer: EnergyEndpointer, pcm: bytes, chunk: int = 640) -> list:
+    events = []
+    for i in range(0, len(pcm), chunk):
+        events.extend(endpointer.process(pcm[i : i + chunk]))
+    return events
+
+
+def test_detects_speech_in_recorded_clip():
+    clip = np.fromfile(CLIP, dtype="<i2").astype(np.float64)
+    pcm = _pcm(np.concatenate([_silence(1000), clip, _silence(1000)]))
+
+    events = _feed(EnergyEndpointer(), pcm)
+
+    assert [e.type for e in events] == [
+        EndpointEventType.SPEECH_START,
+        EndpointEventType.SPEECH_END,
+    ]
+    start, end = events
+    assert 1000 <= start.stream_ms < 1300
+    assert start.delay_ms <= 100
+    assert end.stream_ms < 1000 + len(clip) / SAMPLE_RATE * 1000 + 100
+
+
+def test_noise_floor_adapts_to_stationary_noise():
+    rng = np.random.default_rng(0)
+    noise = rng.normal(0, 400, SAMPLE_RATE * 3)
+    endpointer = EnergyEndpointer()
+
+    events = _feed(endpointer, _pcm(noise))
+
+    assert events == []
+    assert endpointer.noise_floor > 300
+    assert endpointer.start_threshold > 900
+
+
+def test_speech_detected_over_noise_floor():
+    rng = np.random.default_rng(1)
+    signal = np.concatenate([_silence(1500), _tone(600, 4000), _silence(1000)])
+    signal += rng.normal(0, 400, len(signal))
+
+    events = _feed(EnergyEndpointer(), _pcm(signal))
+
+    assert [e.type for e in events] == [
+        EndpointEventType.SPEECH_START,
+        EndpointEventType.SPEECH_END,
+    ]
+
+
+def test_short_burst_is_rejected():
+    endpointer = EnergyEndpointer(EndpointerConfig(min_speech_ms=60))
+    signal = np.concatenate([_silence(500), _tone(20, 5000), _silence(500)])
+
+    events = _feed(endpointer, _pcm(signal))
+
+    assert events == []
+    assert endpointer.stats.rejected_bursts == 1
+
+
+def test_hangover_bridges_short_pauses():
+    endpointer = EnergyEndpointer(EndpointerConfig(hangover_ms=300))
+    signal = np.concatenate(
+        [_silence(500), _tone(300, 3000), _silence(200), _tone(300, 3000), _silence(500)]
+    )
+
+    events = _feed(endpointer, _pcm(signal))
+
+    assert [e.type for e in events] == [
+        EndpointEventType.SPEECH_START,
+        EndpointEventType.SPEECH_END,
+    ]
+
+
+@pytest.mark.parametrize("chunk", [2, 333, 640, 4096])
+def test_chunk_size_does_not_change_events(chunk):
+    signal = _pcm(np.concatenate([_silence(500), _tone(400, 3000), _silence(800)]))
+
+    reference = [(e.type, e.stream_ms) for e in _feed(EnergyEndpointer(), signal)]
+    events = [(e.type, e.stream_ms) for e in _feed(EnergyEndpointer(), signal, chunk=chunk)]
+
+    assert events == reference
+
+
+def test_transport_silence_ends_speech():
+    endpointer = EnergyEndpointer(EndpointerConfig(hangover_ms=200))
+    _feed(endpointer, _pcm(np.concatenate([_silence(400), _tone(200, 3000)])))
+    assert endpointer.in_speech
+
+    events = endpointer.process_silence(300)
+
+    assert [e.type for e in events] == [EndpointEventType.SPEECH_END]
+    assert not endpointer.in_speech
+
+
+def test_browser_handler_hangover_matches_real_time():
+    config = MediaHandlerConfig(
+        websocket=MagicMock(), session_id="session-browser", transport=TransportType.BROWSER
+    )
+    handler = MediaHandler(config, MagicMock(), MagicMock())
+    frame_ms = 20
+    speech = _pcm(np.concatenate([_silence(500), _tone(400, 3000)]))
+    frame_bytes = SAMPLE_RATE * frame_ms // 1000 * 2
+    for i in range(0, len(speech), frame_bytes):
+        handler._process_endpointing(speech[i : i + frame_bytes])
+
+    silence = _pcm(_silence(frame_ms))
+    silent_ms = 0
+    while handler._last_speech_end is None and silent_ms < 2000:
+        handler._process_endpointing(silence)
+        silent_ms += frame_ms
+
+    # 16 kHz mic frames are timed as 16 kHz: speech ends after the configured hangover
+    end = handler._last_speech_end
+    assert end is not None
+    assert abs(end.stream_ms - 900) <= 2 * frame_ms
+    assert SILENCE_GAP_MS <= silent_ms <= SILENCE_GAP_MS + 3 * frame_ms
@@ -0,0 +1,137 @@
+"""
+Tests for bounded workload executors.
+
+Tests cover:
+- Non-critical work is shed before critical work as the queue fills
+- A saturated executor does not delay work on another workload class
+- Work cancelled while queued releases its queue slot
+- Queue wait is measured and context variables reach the worker thread
+- Executors are configured per workload class and exposed as snapshots
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+
+import pytest
+from src.pools import executors
+from src.pools.executors import (
+    BoundedExecutor,
+    ExecutorSaturatedError,
+    configure_executors,
+    executor_snapshots,
+    get_executor,
+    run_blocking,
+    shutdown_executors,
+)
+
+
+@pytest.fixture
+def blocked():
+    release = threading.Event()
+    yield release
+    release.set()
+
+
+def test_non_critical_work_shed_first(blocked):
+    executor = BoundedExecutor("test", 1, max_queue=4, shed_queue=2)
+    executor.submit_work(blocked.wait)  # occupies the only thread
+    time.sleep(0.05)
+    for _ in range(2):
+        executor.submit_work(blocked.wait, critical=False)
+
+    with pytest.raises(ExecutorSaturatedError):
+        executor.submit_work(blocked.wait, critical=False)
+    executor.submit(blocked.wait)  # critical work is still admitted
+    executor.submit(blocked.wait)
+    with pytest.raises(ExecutorSaturatedError) as exc_info:
+        executor.submit(blocked.wait)
+
+    snapshot = executor.snapshot()
+    assert exc_info.value.critical is True
+    assert snapshot["queued"] == 4
+    assert snapshot["shed_non_critical"] == 1
+    assert snapshot["shed_critical"] == 1
+    blocked.set()
+    executor.shutdown(wait=True)
+    assert executor.snapshot()["completed"] == 5
+
+
+async def test_cancelled_queued_work_releases_queue_slots(blocked):
+    executor = BoundedExecutor("test", 1, max_queue=3)
+    loop = asyncio.get_running_loop()
+    running = loop.run_in_executor(executor, blocked.wait)
+    await asyncio.sleep(0.05)
+    queued = [loop.run_in_executor(executor, blocked.wait) for _ in range(3)]
+    with pytest.raises(ExecutorSaturatedError):
+        executor.submit(blocked.wait)
+
+    for task in queued:  # e.g. barge-in or a wait_for timeout
+        task.cancel()
+    await asyncio.sleep(0.05)
+    blocked.set()
+    await running
+
+    assert executor.snapshot()["queued"] == 0
+    assert executor.snapshot()["cancelled"] == 3
+    assert await loop.run_in_executor(executor, lambda: "ok") == "ok"
+
+    executor.submit(time.sleep, 0.1)
+    await asyncio.sleep(0.02)
+    pending = [executor.submit(time.sleep, 0) for _ in range(3)]
+    executor.shutdown(wait=True, cancel_futures=True)
+    assert all(future.cancelled() for future in pending)
+    assert executor.snapshot()["queued"] == 0
+    assert executor.snapshot()["cancelled"] == 6
+
+
+async def test_saturated_workload_does_not_delay_others(blocked):
+    configure_executors({"redis": 2, "speech_synthesis": 2})
+    try:
+        loop = asyncio.get_running_loop()
+        stalled = [
+            loop.run_in_executor(get_executor("redis"), blocked.wait) for _ in range(8)
+        ]
+
+        start = time.perf_counter()
+        result = await asyncio.wait_for(run_blocking("speech_synthesis", lambda: b"pcm"), 1.0)
+        elapsed = time.perf_counter() - start
+
+        assert result == b"pcm"
+        assert elapsed < 0.5
+        assert executor_snapshots()["redis"]["queued"] == 6
+        blocked.set()
+        await asyncio.gather(*stalled)
+    finally:
+        shutdown_executors()
+
+
+async def test_run_tracks_wait_and_preserves_context():
+    executor = BoundedExecutor("ctx", 1)
+    var = contextvars.ContextVar("var", default=None)
+    var.set("call-1")
+
+    values = await asyncio.gather(*(executor.run(var.get) for _ in range(3)))
+    await executor.run(time.sleep, 0.01)
+
+    snapshot = executor.snapshot()
+    assert values == ["call-1"] * 3
+    assert snapshot["completed"] == 4
+    assert snapshot["queue_wait_ms"]["count"] == 4
+    assert snapshot["run_ms"]["max"] >= 10
+    executor.shutdown()
+
+
+def test_configure_sets_sizes_and_queue_bounds():
+    try:
+        created = configure_executors({"cosmos": 3}, queue_per_worker=5)
+
+        assert set(created) == set(executors.DEFAULT_EXECUTOR_SIZES)
+        assert get_executor("cosmos").max_workers == 3
+        assert get_executor("cosmos").max_queue == 15
+        assert get_executor("cosmos").shed_queue == 7
+        assert get_executor("redis").max_workers == executors.DEFAULT_EXECUTOR_SIZES["redis"]
+    finally:
+        shutdown_executors()
+    assert executor_snapshots() == {}
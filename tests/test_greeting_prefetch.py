@@ -0,0 +1,157 @@
+"""
+Tests for greeting synthesis overlapped with call setup.
+
+Tests cover:
+- Prefetched audio is used only when text and voice match; otherwise playback synthesizes
+- Unclaimed prefetches expire and are cancelled
+- Answering an inbound call synthesizes the greeting in parallel and binds it to the call
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from apps.artagent.backend.api.v1.handlers import acs_call_lifecycle
+from apps.artagent.backend.api.v1.handlers.acs_call_lifecycle import ACSLifecycleHandler
+from apps.artagent.backend.registries.agentstore.base import UnifiedAgent, VoiceConfig
+from apps.artagent.backend.voice.speech_cascade import greeting_prefetch
+from apps.artagent.backend.voice.speech_cascade.greeting_prefetch import (
+    GreetingAudio,
+    GreetingPrefetcher,
+)
+from apps.artagent.backend.voice.speech_cascade.tts import SAMPLE_RATE_ACS, TTSPlayback
+from src.enums.stream_modes import StreamMode
+
+VOICE = ("en-US-AvaNeural", "chat", "+0%")
+
+
+class _Synth:
+    is_ready = True
+
+    def __init__(self, delay_s: float = 0.0):
+        self.delay_s = delay_s
+        self.calls: list[str] = []
+
+    def synthesize_to_pcm(self, **kwargs):
+        raise AssertionError("async synthesis expected")
+
+    async def synthesize_to_pcm_async(self, *, text, voice, sample_rate, style, rate, executor):
+        self.calls.append(text)
+        await asyncio.sleep(self.delay_s)
+        return f"{voice}|{text}".encode()
+
+
+class _Pool:
+    def __init__(self, synth: _Synth):
+        self.synth = synth
+        self.acquired = 0
+        self.session_acquired = 0
+
+    async def acquire(self, timeout=None):
+        self.acquired += 1
+        return self.synth
+
+    async def release(self, resource):
+        pass
+
+    async def acquire_for_session(self, session_id):
+        self.session_acquired += 1
+        return self.synth, "warm"
+
+
+def _app_state(synth: _Synth):
+    agent = UnifiedAgent(
+        name="Concierge",
+        greeting="Hi, this is {{ agent_name }}.",
+        voice=VoiceConfig(name=VOICE[0], style=VOICE[1], rate=VOICE[2]),
+    )
+    return SimpleNamespace(
+        unified_agents={"Concierge": agent},
+        start_agent="Concierge",
+        tts_pool=_Pool(synth),
+        speech_executor=None,
+    )
+
+
+def _playback(app_state) -> TTSPlayback:
+    playback = TTSPlayback(None, app_state, "session-greet")
+    playback.set_active_agent("Concierge")
+    playback._stream_to_acs = AsyncMock(return_value=True)
+    return playback
+
+
+async def test_prefetched_audio_used_only_when_it_matches():
+    prefetcher = GreetingPrefetcher(enabled=True)
+
+    async def ready():
+        return GreetingAudio("Hi, this is Concierge.", *VOICE, SAMPLE_RATE_ACS, b"prefetched")
+
+    app_state = _app_state(_Synth())
+    playback = _playback(app_state)
+    prefetcher.bind("call-1", prefetcher.start(ready))
+
+    prefetch = prefetcher.take("call-1")
+    assert await playback.play_to_acs("Hi, this is Concierge.", prefetched=prefetch)
+    assert playback._stream_to_acs.await_args.args[0] == b"prefetched"
+    assert app_state.tts_pool.session_acquired == 0
+    assert prefetcher.take("call-1") is None
+
+    # Context changed after the prefetch: synthesize the new greeting instead
+    prefetcher.bind("call-2", prefetcher.start(ready))
+    stale = prefetcher.take("call-2")
+    assert await playback.play_to_acs("Welcome back, Ada.", prefetched=stale)
+    assert playback._stream_to_acs.await_args.args[0] == b"en-US-AvaNeural|Welcome back, Ada."
+    assert app_state.tts_pool.session_acquired == 1
+    assert prefetcher.stats()["outcomes"] == {"hit": 1, "stale": 1}
+
+
+async def test_unclaimed_prefetches_expire():
+    prefetcher = GreetingPrefetcher(enabled=True, ttl_s=0.01, max_pending=1)
+
+    async def never():
+        await asyncio.sleep(10)
+
+    first = prefetcher.start(never)
+    prefetcher.bind("call-1", first)
+    await asyncio.sleep(0.02)
+    prefetcher.bind("call-2", prefetcher.start(never))
+    await asyncio.sleep(0)
+
+    assert first.task.cancelled()
+    assert prefetcher.take("call-1") is None
+    assert prefetcher.stats()["expired"] == 1
+
+    prefetcher.discard("call-2")
+    assert prefetcher.stats()["pending"] == 0
+    assert GreetingPrefetcher(enabled=False).start(never) is None
+
+
+async def test_inbound_answer_overlaps_greeting_synthesis(monkeypatch):
+    prefetcher = GreetingPrefetcher(enabled=True)
+    monkeypatch.setattr(greeting_prefetch, "_prefetcher", prefetcher)
+    monkeypatch.setattr(acs_call_lifecycle, "ACS_STREAMING_MODE", StreamMode.MEDIA)
+    synth = _Synth(delay_s=0.2)
+    app_state = _app_state(synth)
+
+    async def answer_incoming_call(**kwargs):
+        await asyncio.sleep(0.2)
+        return SimpleNamespace(call_connection_id="call-in")
+
+    acs_caller = SimpleNamespace(answer_incoming_call=answer_incoming_call)
+    event = {"from": {"rawId": "4:+15550100"}, "incomingCallContext": "ctx"}
+
+    started = time.perf_counter()
+    await ACSLifecycleHandler()._handle_incoming_call(
+        event, acs_caller, span=MagicMock(), app_state=app_state
+    )
+    prefetch = prefetcher.take("call-in")
+    playback = _playback(app_state)
+    assert await playback.play_to_acs("Hi, this is Concierge.", prefetched=prefetch)
+    elapsed = time.perf_counter() - started
+
+    # Answer and synthesis ran side by side rather than one after the other
+    assert elapsed < 0.35
+    assert synth.calls == ["Hi, this is Concierge."]
+    assert prefetch.outcome == "hit"
+    assert app_state.tts_pool.session_acquired == 0
@@ -0,0 +1,127 @@
+"""
+Tests for the token-budgeted conversation history window.
+
+Tests cover:
+- Incremental decode (only new messages decoded; replaced threads rebuilt)
+- JSON-encoded tool calls and results expanded
+- Budget trimming evicts whole oldest turns and keeps pinned turns
+- Extractive summary of evicted turns
+- Incremental cross-agent context with deduplication
+"""
+
+import json
+
+from apps.artagent.backend.voice.shared.history_window import (
+    HistoryWindow,
+    HistoryWindowConfig,
+    TokenCounter,
+)
+
+
+def _turns(count: int, words: int = 40) -> list[dict[str, str]]:
+    history = []
+    for i in range(count):
+        history.append({"role": "user", "content": f"question {i} " + "word " * words})
+        history.append({"role": "assistant", "content": f"answer {i} " + "reply " * words})
+    return history
+
+
+def test_token_counter_counts_words_and_punctuation():
+    counter = TokenCounter()
+    assert counter.count("") == 0
+    assert counter.count("Hello, world!") >= 3
+    assert counter.count("word " * 100) > counter.count("word " * 10)
+
+
+def test_only_new_messages_are_decoded():
+    window = HistoryWindow(HistoryWindowConfig(max_tokens=100_000))
+    history = _turns(3)
+
+    assert len(window.build("agent", history)) == 6
+    history.append({"role": "user", "content": "one more"})
+    assert len(window.build("agent", history)) == 7
+
+    assert window.stats.decoded == 7
+    assert window.stats.rebuilds == 0
+
+
+def test_replaced_history_is_rebuilt():
+    window = HistoryWindow(HistoryWindowConfig(max_tokens=100_000))
+    window.build("agent", _turns(3))
+
+    replaced = _turns(2)
+    assert window.build("agent", replaced)[0] is replaced[0]
+    assert window.stats.rebuilds == 1
+
+
+def test_json_tool_messages_are_expanded():
+    window = HistoryWindow(HistoryWindowConfig(max_tokens=100_000))
+    tool_call = {
+        "role": "assistant",
+        "content": None,
+        "tool_calls": [{"id": "c1", "type": "function", "function": {"name": "f"}}],
+    }
+    tool_result = {"role": "tool", "tool_call_id": "c1", "content": "{}"}
+    history = [
+        {"role": "user", "content": "check my balance"},
+        {"role": "assistant", "content": json.dumps(tool_call)},
+        {"role": "tool", "content": json.dumps(tool_result)},
+        {"role": "assistant", "content": "{not json"},
+    ]
+
+    messages = window.build("agent", history)
+
+    assert messages[1] == tool_call
+    assert messages[2] == tool_result
+    assert messages[3]["content"] == "{not json"
+
+
+def test_budget_evicts_oldest_whole_turns_and_keeps_pinned():
+    config = HistoryWindowConfig(max_tokens=400, pinned_turns=2, summarize_evicted=False)
+    window = HistoryWindow(config)
+    history = _turns(10)
+
+    messages = window.build("agent", history, system_tokens=50)
+
+    assert messages[0]["role"] == "user"
+    assert messages[-1] is history[-1]
+    assert window.stats.history_tokens <= 350
+    assert window.stats.evicted_turns > 0
+
+    # Pinned turns survive even when they alone exceed the budget
+    messages = window.build("agent", history, system_tokens=10_000)
+    assert len(messages) == 4
+
+
+def test_evicted_turns_are_summarized():
+    config = HistoryWindowConfig(max_tokens=600, pinned_turns=1, summary_max_tokens=120)
+    window = HistoryWindow(config)
+
+    messages = window.build("agent", _turns(10))
+
+    assert messages[0]["role"] == "system"
+    assert "Earlier in this call" in messages[0]["content"]
+    assert messages[1]["role"] == "user"
+    assert window.counter.count(messages[0]["content"]) <= 140
+
+
+def test_cross_agent_context_is_incremental_and_deduplicated():
+    window = HistoryWindow()
+    histories = {
+        "Concierge": [
+            {"role": "user", "content": "I want to check my claim status"},
+            {"role": "user", "content": "hi"},
+            {"role": "assistant", "content": "Sure"},
+        ],
+        "Claims": [{"role": "user", "content": "I want to check my claim status"}],
+        "Auth": [{"role": "user", "content": "Welcome back to the line please"}],
+    }
+
+    context = window.cross_agent_context(histories, "Billing")
+    assert [m["content"] for m in context] == ["I want to check my claim status"]
+
+    histories["Concierge"].append({"role": "user", "content": "Also update my address"})
+    context = window.cross_agent_context(histories, "Concierge")
+    assert [m["content"] for m in context] == ["I want to check my claim status"]
+    context = window.cross_agent_context(histories, "Billing")
+    assert len(context) == 2
@@ -0,0 +1,153 @@
+"""
+Tests for the async insurance data repository.
+
+Tests cover:
+- Slow Cosmos reads do not stall the event loop
+- Policy and claims lookups in one session share a single document fetch
+- Concurrent identical lookups are coalesced
+- Read timeouts fall back to session profile data
+- Subrogation claim lookups go through the repository
+"""
+
+import asyncio
+import time
+
+import pytest
+from apps.artagent.backend.registries.toolstore.insurance import policy, subro
+from apps.artagent.backend.registries.toolstore.insurance.repository import (
+    InsuranceRepository,
+    set_insurance_repository,
+)
+from utils.session_context import session_context
+
+USER_DOC = {
+    "_id": "CLT-001",
+    "demo_metadata": {
+        "policies": [{"policy_number": "POL-A-1", "policy_type": "auto", "status": "active"}],
+        "claims": [{"claim_number": "CLM-9", "policy_number": "POL-A-1", "status": "open"}],
+    },
+}
+
+
+class SlowCosmos:
+    """Blocking stand-in for CosmosDBMongoCoreManager."""
+
+    def __init__(self, delay_s: float = 0.2):
+        self.delay_s = delay_s
+        self.queries: list[dict] = []
+
+    def read_document(self, query):
+        self.queries.append(query)
+        time.sleep(self.delay_s)
+        return USER_DOC
+
+
+@pytest.fixture
+def cosmos():
+    return SlowCosmos()
+
+
+@pytest.fixture
+def repo(cosmos):
+    repository = InsuranceRepository(manager=cosmos, timeout_s=2.0)
+    set_insurance_repository(repository)
+    yield repository
+    set_insurance_repository(None)
+
+
+async def _max_loop_lag_ms(coro) -> tuple[object, float]:
+    """Run ``coro`` while a 5ms ticker measures event-loop lag."""
+    lags: list[float] = []
+    done = asyncio.Event()
+
+    async def ticker():
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(0.005)
+            lags.append((time.perf_counter() - start) * 1000 - 5)
+
+    tick = asyncio.create_task(ticker())
+    try:
+        result = await coro
+    finally:
+        done.set()
+        await tick
+    return result, max(lags, default=0.0)
+
+
+@pytest.mark.asyncio
+async def test_slow_reads_do_not_stall_event_loop(repo):
+    async with session_context(session_id="s1"):
+        result, lag_ms = await _max_loop_lag_ms(
+            policy.list_user_policies({"client_id": "CLT-001"})
+        )
+
+    assert result["success"] is True
+    assert lag_ms < 100  # A blocking read would stall for the full 200ms
+
+
+@pytest.mark.asyncio
+async def test_policy_and_claims_share_one_fetch(repo, cosmos):
+    async with session_context(session_id="s1"):
+        policies = await policy.list_user_policies({"client_id": "CLT-001"})
+        claims = await policy.get_claims_summary({"client_id": "CLT-001"})
+        details = await policy.get_policy_details({"policy_number": "POL-A-1"})
+
+    assert policies["success"] and claims["total_claims"] == 1
+    assert details["policy_number"] == "POL-A-1"
+    # One by-client read; the by-number read is a different query
+    assert [q for q in cosmos.queries if q == {"_id": "CLT-001"}] == [{"_id": "CLT-001"}]
+    assert repo.stats.cache_hits >= 1
+
+
+@pytest.mark.asyncio
+async def test_sessions_do_not_share_cache(repo, cosmos):
+    async with session_context(session_id="s1"):
+        await repo.get_user_policies("CLT-001")
+    async with session_context(session_id="s2"):
+        await repo.get_user_policies("CLT-001")
+
+    assert len(cosmos.queries) == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_are_coalesced(repo, cosmos):
+    async with session_context(session_id="s1"):
+        results = await asyncio.gather(
+            repo.get_user_policies("CLT-001"), repo.get_user_claims("CLT-001")
+        )
+
+    assert results[0] and results[1]
+    assert len(cosmos.queries) == 1
+    assert repo.stats.coalesced == 1
+
+
+@pytest.mark.asyncio
+async def test_timeout_falls_back_to_profile(cosmos):
+    cosmos.delay_s = 0.5
+    repository = InsuranceRepository(manager=cosmos, timeout_s=0.05)
+    set_insurance_repository(repository)
+    profile = {
+        "client_id": "CLT-001",
+        "demo_metadata": {"policies": [{"policy_number": "PROFILE-1", "status": "active"}]},
+    }
+    try:
+        result = await policy.list_user_policies({"_session_profile": profile})
+    finally:
+        set_insurance_repository(None)
+
+    assert result["success"] is True
+    assert repository.stats.timeouts == 1
+    assert "PROFILE-1" in str(result)
+
+
+@pytest.mark.asyncio
+async def test_subro_claim_lookup_uses_repository(repo, cosmos):
+    async with session_context(session_id="s1"):
+        result, lag_ms = await _max_loop_lag_ms(
+            subro.get_claim_summary({"claim_number": "clm-9"})
+        )
+
+    assert result.get("success") is not False
+    assert lag_ms < 100
+    assert "demo_metadata.claims.claim_number" in cosmos.queries[0]
@@ -0,0 +1,195 @@
+"""
+Tests for mergeable latency quantile sketches.
+
+Tests cover:
+- Quantiles stay within the sketch's relative accuracy
+- Merged sketches equal a sketch built from all samples, and survive JSON
+- Bucket count stays bounded on wide value ranges
+- Session aggregates carry sketches; old runs keep aggregates instead of samples
+- Replica sketches published to Redis merge into a fleet view
+- The session metrics endpoint reads percentiles from the aggregates
+"""
+
+import json
+import random
+import time
+
+import pytest
+from apps.artagent.backend.api.v1.endpoints import metrics as metrics_endpoint
+from opentelemetry import trace
+from src.redis.latency_sketches import LatencySketchStore
+from src.redis.manager import AzureRedisManager
+from src.tools import latency_helpers
+from src.tools.latency_helpers import PersistentLatency, StageSample, record_stage_stat
+from src.tools.latency_sketch import QuantileSketch, merge_sketches
+from utils.ml_logging import get_logger
+
+
+def _exact(values, q):
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+def _sketch(values, **kwargs):
+    sketch = QuantileSketch(**kwargs)
+    for value in values:
+        sketch.add(value)
+    return sketch
+
+
+@pytest.fixture
+def samples():
+    rng = random.Random(7)
+    return [rng.lognormvariate(-1.0, 0.9) for _ in range(20_000)]
+
+
+def test_quantiles_within_relative_accuracy(samples):
+    sketch = _sketch(samples, relative_accuracy=0.01)
+
+    for q in (0.5, 0.9, 0.95, 0.99):
+        assert sketch.quantile(q) == pytest.approx(_exact(samples, q), rel=0.02)
+    assert sketch.count == len(samples)
+    assert sketch.min == min(samples) and sketch.max == max(samples)
+
+
+def test_merge_matches_single_sketch_and_round_trips_json(samples):
+    whole = _sketch(samples)
+    halves = [_sketch(samples[:5000]), _sketch(samples[5000:])]
+    wire = [json.loads(json.dumps(half.to_dict())) for half in halves]
+
+    merged = merge_sketches(wire)
+
+    assert merged.to_dict()["b"] == whole.to_dict()["b"]
+    assert merged.count == whole.count
+    assert merged.quantile(0.99) == whole.quantile(0.99)
+    assert wire[0]["n"] == 5000  # inputs untouched
+
+
+def test_merge_rejects_different_accuracy():
+    with pytest.raises(ValueError):
+        _sketch([1.0], relative_accuracy=0.01).merge(_sketch([1.0], relative_accuracy=0.05))
+
+
+def test_bins_bounded_and_tail_preserved():
+    values = [10 ** (i / 100) for i in range(-600, 300)]  # 1us .. 1000s
+    sketch = _sketch(values, max_bins=64)
+
+    assert len(sketch.to_dict()["b"]) <= 64
+    assert sketch.quantile(0.99) == pytest.approx(_exact(values, 0.99), rel=0.02)
+
+
+def test_session_aggregates_report_percentiles():
+    bucket = {"runs": {}, "order": []}
+    for i in range(1, 101):
+        record_stage_stat(bucket, "stt", i / 100)
+
+    summary = latency_helpers.summarize_stage_stats(bucket["stage_stats"])["stt"]
+
+    assert summary["count"] == 100
+    assert summary["p50"] == pytest.approx(0.5, rel=0.03)
+    assert summary["p95"] == pytest.approx(0.95, rel=0.02)
+
+
+class _Memo:
+    def __init__(self):
+        self.context = {}
+
+    def get_context(self, key, default=None):
+        return self.context.get(key, default)
+
+    def set_context(self, key, value):
+        self.context[key] = value
+
+
+def test_old_runs_keep_aggregates_only(monkeypatch):
+    monkeypatch.setattr(latency_helpers, "MAX_DETAILED_RUNS", 2)
+    memo = _Memo()
+    store = PersistentLatency(memo)
+    run_ids = []
+    for _ in range(5):
+        run_ids.append(store.begin_run())
+        for dur in (0.1, 0.3):
+            store._append_sample(run_ids[-1], StageSample("tts", 0.0, dur, dur))
+
+    runs = memo.context["latency"]["runs"]
+
+    assert [len(runs[rid]["samples"]) for rid in run_ids] == [0, 0, 0, 2, 2]
+    assert store.run_summary(run_ids[0])["tts"]["max"] == 0.3
+    assert store.session_summary()["tts"]["count"] == 10
+
+
+class FakeRedis:
+    def __init__(self):
+        self.hashes: dict[str, dict] = {}
+        self.zset: dict[str, float] = {}
+
+    def hset(self, key, mapping):
+        self.hashes.setdefault(key, {}).update(mapping)
+
+    def expire(self, key, ttl):
+        return True
+
+    def zadd(self, key, mapping):
+        self.zset.update(mapping)
+
+    def zremrangebyscore(self, key, low, high):
+        cutoff = float(str(high).lstrip("("))
+        self.zset = {k: v for k, v in self.zset.items() if v >= cutoff}
+
+    def zrangebyscore(self, key, low, high):
+        return [k for k, v in self.zset.items() if v >= float(low)]
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self._client = client
+        self._calls = []
+
+    def __getattr__(self, name):
+        return lambda *a, **kw: self._calls.append((name, a, kw))
+
+    def execute(self):
+        return [getattr(self._client, name)(*a, **kw) for name, a, kw in self._calls]
+
+
+def _manager(client) -> AzureRedisManager:
+    manager = AzureRedisManager.__new__(AzureRedisManager)
+    manager.redis_client = client
+    manager.logger = get_logger("tests.latency_sketch")
+    manager.tracer = trace.get_tracer(__name__)
+    manager.host = "localhost"
+    manager.port = 6379
+    return manager
+
+
+def test_fleet_view_merges_live_replicas(samples):
+    manager = _manager(FakeRedis())
+    now = time.time()
+    for i, chunk in enumerate((samples[:10_000], samples[10_000:])):
+        store = LatencySketchStore(manager, instance_id=f"replica-{i}", ttl_s=60)
+        store.publish({"tts": _sketch(chunk).to_dict()}, now=now)
+    stale = LatencySketchStore(manager, instance_id="gone", ttl_s=60)
+    stale.publish({"tts": _sketch([100.0] * 1000).to_dict()}, now=now - 600)
+
+    fleet = LatencySketchStore(manager, ttl_s=60).fleet(now=now)
+
+    assert fleet["tts"].count == len(samples)
+    assert fleet["tts"].quantile(0.95) == pytest.approx(_exact(samples, 0.95), rel=0.02)
+
+
+def test_session_endpoint_uses_aggregate_sketch():
+    bucket = {"runs": {}, "order": []}
+    for i in range(1, 201):
+        record_stage_stat(bucket, "llm", i / 1000)
+
+    stats = metrics_endpoint._get_aggregate_latency_stats(bucket["stage_stats"]["llm"])
+
+    assert stats.count == 200
+    assert stats.avg_ms == pytest.approx(100.5)
+    assert stats.p99_ms == pytest.approx(198, rel=0.02)
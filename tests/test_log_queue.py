@@ -0,0 +1,103 @@
+"""
+Tests for the queue-based logging pipeline.
+
+Tests cover:
+- A full queue evicts DEBUG records first and never blocks
+- Queued records carry the rendered message and reach handlers on the log thread
+- JSON logs include allowlisted correlation attributes
+"""
+
+import json
+import logging
+import threading
+
+import pytest
+from utils import ml_logging
+from utils.ml_logging import DroppingLogQueue, JsonFormatter, LogQueueHandler
+
+
+def _item(levelno: int, msg: str = "m"):
+    record = logging.makeLogRecord(
+        {"levelno": levelno, "levelname": logging.getLevelName(levelno), "msg": msg}
+    )
+    return (), record, None
+
+
+def _levels(log_queue: DroppingLogQueue) -> list[int]:
+    return [item[1].levelno for item in log_queue.queue]
+
+
+def test_full_queue_drops_debug_first():
+    log_queue = DroppingLogQueue(3)
+    for levelno in (logging.DEBUG, logging.INFO, logging.DEBUG):
+        log_queue.put_nowait(_item(levelno))
+
+    log_queue.put_nowait(_item(logging.DEBUG))  # nothing less severe to evict
+    log_queue.put_nowait(_item(logging.INFO))  # evicts the oldest DEBUG
+    assert _levels(log_queue) == [logging.INFO, logging.DEBUG, logging.INFO]
+
+    log_queue.put_nowait(_item(logging.ERROR))  # evicts the remaining DEBUG
+    log_queue.put_nowait(_item(logging.WARNING))  # then the oldest INFO
+    log_queue.put_nowait(_item(logging.INFO))  # dropped
+    assert _levels(log_queue) == [logging.INFO, logging.ERROR, logging.WARNING]
+    assert log_queue.dropped == {"DEBUG": 3, "INFO": 2}
+
+    while not log_queue.empty():
+        log_queue.get_nowait()
+        log_queue.task_done()
+    log_queue.join()  # evictions keep task accounting balanced
+
+
+class _Collect(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records: list[tuple[str, str, str]] = []
+
+    def emit(self, record):
+        self.records.append((record.msg, self.format(record), threading.current_thread().name))
+
+
+def test_queued_records_are_rendered_and_handled_on_log_thread():
+    collect = _Collect()
+    collect.setLevel(logging.INFO)
+    logger = logging.getLogger("tests.log_queue")
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    handler = LogQueueHandler([collect])
+    logger.addHandler(handler)
+    try:
+        payload = {"turn": 1}
+        logger.info("state %s", payload)
+        payload["turn"] = 2  # mutated after the call returns
+        logger.debug("below the target's level")
+        ml_logging.stop_log_queue()  # drains the queue
+    finally:
+        logger.removeHandler(handler)
+        ml_logging.start_log_queue()
+
+    assert [msg for msg, _, _ in collect.records] == ["state {'turn': 1}"]
+    assert collect.records[0][2] != threading.current_thread().name
+    assert ml_logging.log_queue_stats()["queued"] == 0
+
+
+@pytest.mark.parametrize("scrub", [True, False])
+def test_json_formatter_includes_allowlisted_attributes(scrub):
+    record = logging.makeLogRecord(
+        {
+            "name": "tests",
+            "levelno": logging.INFO,
+            "levelname": "INFO",
+            "msg": "hello",
+            "session_id": "s-1",
+            "agent_name": "Concierge",
+            "call_note": "reach me at alice@example.com",
+            "unrelated": "skipped",
+        }
+    )
+
+    payload = json.loads(JsonFormatter(enable_pii_scrubbing=scrub).format(record))
+
+    assert payload["session_id"] == "s-1"
+    assert payload["agent_name"] == "Concierge"
+    assert "unrelated" not in payload
+    assert ("alice@example.com" in payload["call_note"]) is not scrub
@@ -0,0 +1,80 @@
+"""
+Tests for the hot-path microbenchmark suite.
+
+Tests cover:
+- Every registered benchmark builds its fixtures and runs
+- Generator setups are torn down after measuring
+- Comparison flags regressions and improvements beyond the threshold
+- Results round-trip through labels and paths
+"""
+
+import logging
+
+import pytest
+
+from tests.load.microbench import runner
+from tests.load.microbench.runner import Benchmark, compare, measure, registered
+
+
+@pytest.fixture
+def quiet_logging():
+    logging.disable(logging.INFO)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+def test_every_benchmark_runs(quiet_logging):
+    benches = registered()
+    assert len(benches) >= 9
+    for bench in benches:
+        result = measure(bench, repeat=1, min_time=0.0)
+        assert result["median_us"] > 0, bench.name
+
+
+def test_generator_setup_is_torn_down():
+    events = []
+
+    def setup():
+        events.append("setup")
+        try:
+            yield lambda: events.append("call")
+        finally:
+            events.append("teardown")
+
+    result = measure(Benchmark("gen", setup, ops=2), repeat=3, min_time=0.0)
+
+    assert events[0] == "setup" and events[-1] == "teardown"
+    assert events.count("call") >= 5  # warmup, calibration, samples
+    assert result["ops"] == 2 and result["repeat"] == 3
+
+
+def test_compare_flags_changes_beyond_threshold():
+    def results(**medians):
+        return {"benchmarks": {name: {"median_us": us} for name, us in medians.items()}}
+
+    rows = compare(
+        results(steady=100.0, slower=100.0, faster=100.0, dropped=5.0),
+        results(steady=105.0, slower=125.0, faster=80.0, added=1.0),
+        threshold=0.10,
+    )
+
+    status = {row["name"]: row["status"] for row in rows}
+    assert status == {
+        "added": "new",
+        "dropped": "missing",
+        "faster": "improved",
+        "slower": "regressed",
+        "steady": "ok",
+    }
+    assert next(row for row in rows if row["name"] == "slower")["change"] == 0.25
+
+
+def test_results_round_trip(tmp_path, monkeypatch):
+    monkeypatch.setattr(runner, "RESULTS_DIR", tmp_path)
+    results = {"meta": {}, "benchmarks": {"a": {"median_us": 1.5}}}
+
+    assert runner.save_results(results, "baseline") == tmp_path / "baseline.json"
+    assert runner.load_results("baseline") == results
+    explicit = tmp_path / "elsewhere" / "run.json"
+    runner.save_results(results, str(explicit))
+    assert runner.load_results(str(explicit)) == results
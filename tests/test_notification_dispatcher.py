@@ -0,0 +1,299 @@
+"""
+Tests for the shared ACS notification dispatcher.
+
+Tests cover:
+- Background bursts run on a fixed set of threads
+- Identical SMS queued together are merged into one request
+- Transport errors and throttled SMS recipients are retried, once per attempt
+- An accepted email is not resent when polling its status fails
+- Sends never block the caller's event loop on dispatcher startup
+- Backpressure rejects background sends when the backlog is full
+- SmsService reuses one SmsClient across sends
+"""
+
+import asyncio
+import importlib
+import threading
+import time
+
+import pytest
+from azure.core.exceptions import HttpResponseError, ServiceResponseError
+from src.acs.notification_dispatcher import (
+    NotificationDispatcher,
+    set_notification_dispatcher,
+)
+from src.acs.sms_service import SmsService
+
+# ``src.acs`` re-exports an ``sms_service`` instance that shadows the module name
+sms_module = importlib.import_module("src.acs.sms_service")
+
+
+class FakePoller:
+    def __init__(self, message_id: str, error: Exception | None = None):
+        self.message_id = message_id
+        self.error = error
+
+    def result(self):
+        if self.error is not None:
+            raise self.error
+        return self
+
+
+class FakeEmailService:
+    def __init__(
+        self, fail_times: int = 0, delay_s: float = 0.0, poll_error: Exception | None = None
+    ):
+        self.fail_times = fail_times
+        self.delay_s = delay_s
+        self.poll_error = poll_error
+        self.calls = 0
+        self.threads: set[str] = set()
+
+    def begin_email(self, email_address, subject, plain_text_body, html_body=None):
+        self.calls += 1
+        self.threads.add(threading.current_thread().name)
+        time.sleep(self.delay_s)
+        if self.calls <= self.fail_times:
+            raise ConnectionError("transient")
+        return FakePoller(f"m-{self.calls}", self.poll_error)
+
+    def complete_email(self, poller, email_address):
+        return {"success": True, "message_id": poller.result().message_id}
+
+
+class FakeSmsService:
+    def __init__(self, throttled: set[str] | None = None):
+        self.throttled = set(throttled or ())
+        self.requests: list[list[str]] = []
+
+    def deliver_sms(self, to_phone_numbers, message, enable_delivery_report=True, tag=None):
+        self.requests.append(list(to_phone_numbers))
+        sent, failed = [], []
+        for number in to_phone_numbers:
+            ok = number not in self.throttled
+            self.throttled.discard(number)  # Succeeds on the next attempt
+            entry = {
+                "to": number,
+                "message_id": f"id-{number}" if ok else None,
+                "http_status_code": 202 if ok else 429,
+                "successful": ok,
+                "error_message": None if ok else "throttled",
+            }
+            (sent if ok else failed).append(entry)
+        return {"success": not failed, "sent_messages": sent, "failed_messages": failed}
+
+
+@pytest.fixture
+def dispatcher():
+    instance = NotificationDispatcher(
+        workers=2, queue_size=64, backoff_base_s=0.001, sms_batch_window_s=0.02
+    )
+    yield instance
+    instance.shutdown()
+
+
+def test_background_burst_uses_fixed_threads(dispatcher):
+    service = FakeEmailService(delay_s=0.005)
+    results: list[dict] = []
+    done = threading.Event()
+
+    def on_result(result):
+        results.append(result)
+        if len(results) == 40:
+            done.set()
+
+    baseline = threading.active_count()
+    for i in range(40):
+        dispatcher.send_email_background(service, f"u{i}@example.com", "s", "b", callback=on_result)
+
+    assert done.wait(5)
+    assert all(result["success"] for result in results)
+    # One dispatcher thread plus at most ``workers`` executor threads
+    assert threading.active_count() <= baseline + 1 + dispatcher.workers
+    assert len(service.threads) <= dispatcher.workers
+
+
+@pytest.mark.asyncio
+async def test_identical_sms_are_batched(dispatcher):
+    service = FakeSmsService()
+
+    numbers = [f"+1555000{i:04d}" for i in range(10)]
+
+    results = await asyncio.gather(
+        *(dispatcher.send_sms(service, [number], "Your code is 1234") for number in numbers)
+    )
+
+    assert len(service.requests) == 1
+    assert len(service.requests[0]) == 10
+    for i, result in enumerate(results):
+        assert result["success"] is True
+        assert [m["to"] for m in result["sent_messages"]] == [numbers[i]]
+    assert dispatcher.stats.sms_batches == 1
+
+
+@pytest.mark.asyncio
+async def test_sms_batch_size_is_respected(dispatcher):
+    dispatcher.sms_batch_size = 3
+    service = FakeSmsService()
+
+    await asyncio.gather(*(dispatcher.send_sms(service, [f"+1{i}"], "hello") for i in range(7)))
+
+    assert [len(request) for request in service.requests] == [3, 3, 1]
+
+
+@pytest.mark.asyncio
+async def test_transport_errors_are_retried(dispatcher):
+    service = FakeEmailService(fail_times=2)
+
+    result = await dispatcher.send_email(service, "a@example.com", "s", "b")
+
+    assert result["success"] is True
+    assert service.calls == 3
+    assert dispatcher.stats.retries == 2
+
+
+@pytest.mark.asyncio
+async def test_email_gives_up_after_max_attempts(dispatcher):
+    service = FakeEmailService(fail_times=10)
+
+    result = await dispatcher.send_email(service, "a@example.com", "s", "b")
+
+    assert result["success"] is False
+    assert "Azure Email error" in result["error"]
+    assert service.calls == dispatcher.max_attempts
+
+
+@pytest.mark.asyncio
+async def test_email_not_resent_when_status_poll_fails(dispatcher):
+    service = FakeEmailService(poll_error=ServiceResponseError("read timed out"))
+
+    result = await dispatcher.send_email(service, "a@example.com", "s", "b")
+
+    assert result["success"] is False
+    assert service.calls == 1
+    assert dispatcher.stats.retries == 0
+
+
+@pytest.mark.asyncio
+async def test_rejected_email_is_not_retried(dispatcher):
+    service = FakeEmailService()
+    calls = []
+
+    def bad_request(*args):
+        calls.append(args)
+        error = HttpResponseError("invalid recipient")
+        error.status_code = 400
+        raise error
+
+    service.begin_email = bad_request
+
+    result = await dispatcher.send_email(service, "a@example.com", "s", "b")
+
+    assert result["success"] is False
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_only_throttled_sms_recipients_are_retried(dispatcher):
+    service = FakeSmsService(throttled={"+12"})
+
+    result = await dispatcher.send_sms(service, ["+11", "+12"], "hello")
+
+    assert result["success"] is True
+    assert service.requests == [["+11", "+12"], ["+12"]]
+
+
+@pytest.mark.asyncio
+async def test_sms_transport_errors_share_one_retry_budget(dispatcher):
+    service = FakeSmsService()
+    attempts: list[list[str]] = []
+
+    def always_fails(to_phone_numbers, *args):
+        attempts.append(list(to_phone_numbers))
+        raise ConnectionError("transient")
+
+    service.deliver_sms = always_fails
+
+    result = await dispatcher.send_sms(service, ["+11"], "hello")
+
+    assert result["success"] is False
+    assert len(attempts) == dispatcher.max_attempts
+
+
+@pytest.mark.asyncio
+async def test_send_does_not_wait_for_dispatcher_thread(monkeypatch, dispatcher):
+    started = threading.Event()
+    run = dispatcher._run
+
+    def slow_run(loop):
+        started.wait(1)
+        run(loop)
+
+    monkeypatch.setattr(dispatcher, "_run", slow_run)
+    send = asyncio.ensure_future(dispatcher.send_sms(FakeSmsService(), ["+11"], "hello"))
+    await asyncio.sleep(0.05)  # the event loop keeps running meanwhile
+    assert not send.done()
+    started.set()
+
+    assert (await send)["success"] is True
+
+
+def test_background_send_rejected_when_backlog_full():
+    dispatcher = NotificationDispatcher(workers=1, queue_size=2)
+    service = FakeEmailService(delay_s=0.2)
+    rejected = threading.Event()
+    try:
+        futures = [
+            dispatcher.send_email_background(service, f"u{i}@example.com", "s", "b")
+            for i in range(2)
+        ]
+        overflow = dispatcher.send_email_background(
+            service,
+            "late@example.com",
+            "s",
+            "b",
+            callback=lambda result: rejected.set(),
+        )
+
+        assert rejected.wait(2)
+        assert overflow.result(1)["error"] == "Azure Email error: Notification queue full"
+        assert all(future.result(2)["success"] for future in futures)
+        assert dispatcher.stats.rejected == 1
+    finally:
+        dispatcher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_sms_service_reuses_client(monkeypatch, dispatcher):
+    created = []
+
+    class FakeResponse:
+        def __init__(self, to):
+            self.to = to
+            self.message_id = "id"
+            self.http_status_code = 202
+            self.successful = True
+
+    class FakeSmsClient:
+        @classmethod
+        def from_connection_string(cls, connection_string):
+            created.append(connection_string)
+            return cls()
+
+        def send(self, from_, to, message, enable_delivery_report, tag):
+            return [FakeResponse(number) for number in to]
+
+    monkeypatch.setattr(sms_module, "SmsClient", FakeSmsClient)
+    monkeypatch.setattr(sms_module, "AZURE_SMS_AVAILABLE", True)
+    monkeypatch.setenv("AZURE_COMMUNICATION_SMS_CONNECTION_STRING", "endpoint=x")
+    monkeypatch.setenv("AZURE_SMS_FROM_PHONE_NUMBER", "+10000000000")
+    set_notification_dispatcher(dispatcher)
+    try:
+        service = SmsService()
+        first = await service.send_sms("+15550001", "one")
+        second = await service.send_sms(["+15550002"], "two")
+    finally:
+        set_notification_dispatcher(None)
+
+    assert first["success"] and second["success"]
+    assert created == ["endpoint=x"]
@@ -0,0 +1,127 @@
+"""
+Tests for the offline load harness stand-ins.
+
+Tests cover:
+- The fake recognizer replays a cached clip into its registered transcript
+- The AOAI mock streams a chat completion the openai client can consume
+- The synthetic ACS caller measures end of speech to first response audio
+"""
+
+import asyncio
+import base64
+import json
+import time
+from array import array
+
+import httpx
+import pytest
+import websockets
+from openai import AsyncAzureOpenAI
+
+from tests.load.offline.acs_client import SyntheticAcsCall, is_audio_message, pcm_frames
+from tests.load.offline.fake_speech import (
+    AUDIO_CACHE,
+    FRAME_BYTES,
+    FakeSpeechRecognizer,
+    FakeSpeechSynthesizer,
+    load_transcripts,
+)
+from tests.load.offline.mock_aoai import REPLIES, MockSettings, create_app
+
+
+def _tone(ms: int) -> bytes:
+    return array("h", [3000, -3000] * (16 * ms // 2)).tobytes()
+
+
+def test_fake_recognizer_replays_cached_transcript():
+    clip = sorted(AUDIO_CACHE.glob("*.pcm"))[0]
+    expected = json.loads(clip.with_suffix(".json").read_text())["text"]
+    assert expected in load_transcripts(300).values()
+
+    recognizer = FakeSpeechRecognizer(vad_silence_timeout_ms=300, final_latency_ms=0)
+    partials, finals = [], []
+    recognizer.set_partial_result_callback(lambda text, lang, speaker: partials.append(text))
+    recognizer.set_final_result_callback(lambda text, lang, speaker=None: finals.append(text))
+    recognizer.start()
+    audio = clip.read_bytes() + bytes(FRAME_BYTES * 20)
+    for offset in range(0, len(audio), FRAME_BYTES):
+        recognizer.write_bytes(audio[offset : offset + FRAME_BYTES])
+    time.sleep(0.05)
+
+    assert " ".join(finals) == expected
+    assert partials and expected.startswith(partials[0])
+
+
+def test_fake_synthesizer_sizes_audio_to_text():
+    synth = FakeSpeechSynthesizer(first_byte_ms=0, realtime_factor=1000)
+    short = synth.synthesize_to_pcm("Hello there")
+    long = synth.synthesize_to_pcm("Hello there, how can I help you with your policy today")
+    assert 0 < len(short) < len(long)
+    assert synth.syntheses == 2
+
+
+async def test_mock_aoai_streams_chat_completion():
+    app = create_app(MockSettings(ttft_ms=0, tokens_per_s=0))
+    client = AsyncAzureOpenAI(
+        azure_endpoint="http://mock",
+        api_key="offline",
+        api_version="2025-01-01-preview",
+        http_client=httpx.AsyncClient(transport=httpx.ASGITransport(app=app)),
+    )
+    stream = await client.chat.completions.create(
+        model="gpt-4o",
+        messages=[{"role": "user", "content": "What does my plan cover?"}],
+        stream=True,
+    )
+    text = "".join([chunk.choices[0].delta.content or "" async for chunk in stream])
+
+    assert text in REPLIES
+    assert app.state.requests == 1
+
+
+def test_pcm_frames_and_audio_message_casing():
+    frames, last_speech = pcm_frames(_tone(100) + bytes(FRAME_BYTES * 3 + 10))
+    assert all(len(frame) == FRAME_BYTES for frame in frames)
+    assert (len(frames), last_speech) == (9, 4)
+    assert is_audio_message(json.dumps({"Kind": "AudioData", "AudioData": {"data": ""}}))
+    assert not is_audio_message(json.dumps({"kind": "StopAudio"}))
+
+
+async def test_synthetic_call_measures_response_latency():
+    reply_delay_s = 0.1
+
+    async def backend(ws):
+        loop = asyncio.get_running_loop()
+        recognizer = FakeSpeechRecognizer(vad_silence_timeout_ms=100, final_latency_ms=0)
+
+        def on_final(text, lang, speaker=None):
+            loop.call_soon_threadsafe(loop.call_later, reply_delay_s, send_audio)
+
+        def send_audio():
+            payload = {"Kind": "AudioData", "AudioData": {"data": base64.b64encode(b"x").decode()}}
+            asyncio.ensure_future(ws.send(json.dumps(payload)))
+
+        recognizer.set_final_result_callback(on_final)
+        recognizer.start()
+        send_audio()  # greeting
+        async for raw in ws:
+            message = json.loads(raw)
+            if message["kind"] == "AudioData":
+                recognizer.write_bytes(base64.b64decode(message["audioData"]["data"]))
+
+    async with websockets.serve(backend, "127.0.0.1", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        call = SyntheticAcsCall(
+            f"ws://127.0.0.1:{port}/api/v1/media/stream",
+            [_tone(200), _tone(200)],
+            response_timeout_s=2.0,
+            quiet_ms=100,
+        )
+        result = await call.run()
+
+    assert result.error is None
+    assert result.greeting_ms is not None
+    assert len(result.turn_latencies_ms) == 2
+    # silence timeout + reply delay, plus frame pacing slack
+    for latency in result.turn_latencies_ms:
+        assert latency == pytest.approx(200, abs=150)
@@ -0,0 +1,106 @@
+"""
+Tests for the PII scrubbing engine.
+
+Tests cover:
+- Staged rejection redacts exactly as applying each pattern in turn
+- Custom patterns join the detector or, with groups, disable it
+- Repeated strings are served from the result cache
+- Nested dicts and lists are scrubbed by key and value
+"""
+
+import re
+
+import pytest
+from utils.pii_filter import PIIScrubber, PIIScrubberConfig
+
+SAMPLES = [
+    "I'm calling about my auto insurance policy",
+    "Turn 12 complete in 812 ms (agent=Concierge)",
+    "Call me back at +1 (312) 555-0147 or 312.555.0147",
+    "My social is 123-45-6789 and my card is 4111 1111 1111 1111",
+    "Send it to john.doe@example.org please",
+    "john.555-123-4567@example.com",
+    "Connected from 10.0.0.1 and fe80:0:0:0:202:b3ff:fe1e:8329",
+    "Policy POL-00012 renewed on 2024-05-01T10:00:00Z",
+    "",
+]
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        PIIScrubberConfig(cache_size=0),
+        PIIScrubberConfig(scrub_ip_addresses=True, cache_size=0),
+        PIIScrubberConfig(scrub_emails=False, scrub_phone_numbers=False, cache_size=0),
+        PIIScrubberConfig(custom_patterns=[(re.compile(r"POL-\d+"), "[POLICY]")], cache_size=0),
+    ],
+)
+def test_staged_scrubbing_matches_sequential_patterns(config):
+    scrubber = PIIScrubber(config)
+
+    for text in SAMPLES:
+        assert scrubber.scrub_string(text) == scrubber._scrub_sequential(text), text
+
+
+def test_clean_text_and_custom_patterns():
+    scrubber = PIIScrubber(PIIScrubberConfig(cache_size=0))
+    clean = "I'm calling about my auto insurance policy"
+    assert scrubber.scrub_string(clean) is clean
+    assert scrubber.scrub_string("Call 312-555-0147") == "Call[PHONE_REDACTED]"
+    assert scrubber.scrub_string("john.555-123-4567@example.com") == (
+        "john[PHONE_REDACTED]@example.com"
+    )
+
+    custom = PIIScrubber(
+        PIIScrubberConfig(custom_patterns=[(re.compile(r"POL-\d+"), "[POLICY]")], cache_size=0)
+    )
+    assert custom._prefilter is None and custom._detector is not None
+    assert custom.scrub_string("Policy POL-00012") == "Policy [POLICY]"
+
+    grouped = PIIScrubber(
+        PIIScrubberConfig(custom_patterns=[(re.compile(r"(acct)-(\d+)"), r"\1-***")])
+    )
+    assert grouped._detector is None
+    assert grouped.scrub_string("acct-991") == "acct-***"
+
+
+def test_repeated_strings_are_cached():
+    scrubber = PIIScrubber(PIIScrubberConfig(cache_size=2))
+    text = "Call me at 312-555-0147"
+
+    assert scrubber.scrub_string(text) == "Call me at[PHONE_REDACTED]"
+    assert scrubber.scrub_string(text) == "Call me at[PHONE_REDACTED]"
+    assert scrubber._scrub_cached.cache_info().hits == 1
+
+    long_text = text + " " * 2000
+    scrubber.scrub_string(long_text)
+    assert scrubber._scrub_cached.cache_info().currsize == 1
+    assert PIIScrubber(PIIScrubberConfig(cache_size=0))._scrub_cached is None
+
+
+def test_nested_values_are_scrubbed_by_key_and_value():
+    scrubber = PIIScrubber(PIIScrubberConfig(cache_size=0))
+    payload = {
+        "profile": {"phone.number": 3125550147, "note": "email alice@example.com"},
+        "history": [{"content": "my ssn is 123-45-6789"}, ("ok", 42)],
+        "api_key": {"value": "sk-123"},
+        "turn": 3,
+    }
+
+    scrubbed = scrubber.scrub_dict(payload)
+
+    assert scrubbed == {
+        "profile": {"phone.number": "[REDACTED]", "note": "email [EMAIL_REDACTED]"},
+        "history": [{"content": "my ssn is [SSN_REDACTED]"}, ("ok", 42)],
+        "api_key": "[REDACTED]",
+        "turn": 3,
+    }
+    assert payload["profile"]["note"] == "email alice@example.com"
+    assert scrubber.scrub_value(["call 312-555-0147"]) == ["call[PHONE_REDACTED]"]
+
+    deep: dict = {}
+    node = deep
+    for _ in range(20):
+        node["child"] = {}
+        node = node["child"]
+    assert "[REDACTED]" in repr(scrubber.scrub_value(deep))
@@ -0,0 +1,184 @@
+"""
+Tests for the batched post-call analytics pipeline.
+
+Tests cover:
+- Size- and time-bounded batching into bulk upserts
+- Same-session documents coalesced within a batch
+- Partial bulk failures retry only the failed documents
+- Exhausted retries spill to disk and are replayed later
+- build_and_flush routes through the queue and uses incremental latency stats
+"""
+
+import asyncio
+
+import pytest
+from pymongo.errors import BulkWriteError
+from src.postcall import push
+from src.postcall.analytics_queue import (
+    AnalyticsQueueConfig,
+    PostCallAnalyticsQueue,
+    set_analytics_queue,
+)
+from src.tools.latency_helpers import record_stage_stat
+
+
+class FakeCosmos:
+    """Records bulk upserts; can fail whole batches or specific documents."""
+
+    def __init__(self):
+        self.batches: list[list[str]] = []
+        self.fail_batches = 0
+        self.fail_ids: set[str] = set()
+        self.upserts: list[str] = []
+
+    def bulk_upsert_documents(self, documents, key="_id"):
+        if self.fail_batches:
+            self.fail_batches -= 1
+            raise ConnectionError("cosmos unavailable")
+        ids = [document[key] for document in documents]
+        failed = [i for i, doc_id in enumerate(ids) if doc_id in self.fail_ids]
+        self.fail_ids.clear()
+        self.batches.append([doc_id for i, doc_id in enumerate(ids) if i not in failed])
+        if failed:
+            errors = [{"index": i, "code": 16500, "errmsg": "throttled"} for i in failed]
+            raise BulkWriteError({"writeErrors": errors})
+
+    def upsert_document(self, document, query):
+        self.upserts.append(document["_id"])
+
+
+def _config(tmp_path, **overrides):
+    values = dict(
+        max_batch_size=10,
+        max_batch_delay_s=0.05,
+        backoff_base_s=0.001,
+        spill_dir=str(tmp_path / "spill"),
+    )
+    values.update(overrides)
+    return AnalyticsQueueConfig(**values)
+
+
+def _doc(session_id: str, **extra) -> dict:
+    return {"_id": session_id, "session_id": session_id, **extra}
+
+
+@pytest.fixture
+async def started(tmp_path):
+    cosmos = FakeCosmos()
+    queue = PostCallAnalyticsQueue(cosmos, _config(tmp_path))
+    await queue.start()
+    yield queue, cosmos
+    await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_documents_flush_in_size_bounded_batches(started):
+    queue, cosmos = started
+
+    for i in range(25):
+        queue.enqueue(_doc(f"s{i}"))
+    await queue.flush()
+
+    assert [len(batch) for batch in cosmos.batches] == [10, 10, 5]
+    assert queue.stats.written == 25
+
+
+@pytest.mark.asyncio
+async def test_partial_batch_flushes_after_delay(started):
+    queue, cosmos = started
+
+    queue.enqueue(_doc("s1"))
+    await asyncio.sleep(0.15)
+
+    assert cosmos.batches == [["s1"]]
+
+
+@pytest.mark.asyncio
+async def test_same_session_is_coalesced(started):
+    queue, cosmos = started
+
+    queue.enqueue(_doc("s1", version=1))
+    queue.enqueue(_doc("s1", version=2))
+    await queue.flush()
+
+    assert cosmos.batches == [["s1"]]
+    assert queue.stats.coalesced == 1
+
+
+@pytest.mark.asyncio
+async def test_partial_failure_retries_only_failed_documents(started):
+    queue, cosmos = started
+    cosmos.fail_ids = {"s2"}
+
+    for i in range(3):
+        queue.enqueue(_doc(f"s{i}"))
+    await queue.flush()
+
+    assert cosmos.batches == [["s0", "s1"], ["s2"]]
+    assert queue.stats.written == 3
+    assert queue.stats.retries == 1
+
+
+@pytest.mark.asyncio
+async def test_exhausted_retries_spill_and_replay(tmp_path):
+    cosmos = FakeCosmos()
+    cosmos.fail_batches = 10
+    queue = PostCallAnalyticsQueue(cosmos, _config(tmp_path, max_attempts=2))
+    await queue.start()
+    queue.enqueue(_doc("s1"))
+    queue.enqueue(_doc("s2"))
+    await queue.stop()
+
+    assert queue.stats.spilled == 2
+    assert len(list((tmp_path / "spill").glob("*.jsonl"))) == 1
+
+    # Cosmos is back: a new queue replays the spill on start
+    cosmos.fail_batches = 0
+    replay = PostCallAnalyticsQueue(cosmos, _config(tmp_path))
+    await replay.start()
+    await replay.stop()
+
+    assert cosmos.batches == [["s1", "s2"]]
+    assert replay.stats.replayed == 2
+    assert list((tmp_path / "spill").glob("*.jsonl")) == []
+
+
+@pytest.mark.asyncio
+async def test_full_backlog_spills_to_disk(tmp_path):
+    queue = PostCallAnalyticsQueue(FakeCosmos(), _config(tmp_path, max_pending=0))
+    await queue.start()
+    try:
+        queue.enqueue(_doc("s1"))
+    finally:
+        await queue.stop()
+
+    assert queue.stats.spilled == 1
+
+
+class _Memo:
+    def __init__(self, session_id: str, context: dict):
+        self.session_id = session_id
+        self.histories = {"Concierge": [{"role": "user", "content": "hi"}]}
+        self.context = context
+
+
+@pytest.mark.asyncio
+async def test_build_and_flush_enqueues_with_incremental_summary(started):
+    queue, cosmos = started
+    bucket = {"runs": {}, "order": []}
+    for dur in (0.2, 0.4):
+        record_stage_stat(bucket, "tts", dur)
+
+    set_analytics_queue(queue)
+    try:
+        await push.build_and_flush(_Memo("s1", {"latency": bucket}), cosmos)
+        await queue.flush()
+    finally:
+        set_analytics_queue(None)
+
+    assert cosmos.upserts == []
+    assert cosmos.batches == [["s1"]]
+    summary = push.build_analytics_document(_Memo("s1", {"latency": bucket}))["latency_summary"]
+    assert summary["tts"]["count"] == 2
+    assert summary["tts"]["avg"] == pytest.approx(0.3)
+    assert summary["tts"]["max"] == 0.4
@@ -0,0 +1,198 @@
+"""
+Tests for the streaming call recording sink.
+
+Tests cover:
+- Blocks are staged while the call is running, not at hangup
+- Committed file is a valid stereo WAV with caller/agent on separate channels
+- Agent audio is aligned to the caller timeline and decimated to the recording rate
+- Decimation filters out content above the recording's Nyquist frequency
+- Memory stays bounded when storage falls behind
+- Staging failures fail the recording without raising on the audio path
+- Audio tap errors are counted instead of raised into playback
+"""
+
+import asyncio
+import wave
+from array import array
+
+import numpy as np
+import pytest
+from src.blob.recording_sink import CallRecordingSink, FilesystemBlockStore
+
+
+def _tone(value: int, samples: int) -> bytes:
+    return array("h", [value] * samples).tobytes()
+
+
+def _channels(path) -> tuple[array, array]:
+    with wave.open(str(path), "rb") as wav:
+        assert wav.getnchannels() == 2
+        assert wav.getsampwidth() == 2
+        frames = array("h", wav.readframes(wav.getnframes()))
+    return frames[0::2], frames[1::2]
+
+
+class SlowStore(FilesystemBlockStore):
+    """Filesystem store whose staging blocks until released."""
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.release = asyncio.Event()
+
+    async def stage_block(self, block_id, data):
+        await self.release.wait()
+        await super().stage_block(block_id, data)
+
+
+class FlakyStore(FilesystemBlockStore):
+    def __init__(self, path, failures: int):
+        super().__init__(path)
+        self.failures = failures
+
+    async def stage_block(self, block_id, data):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("storage unavailable")
+        await super().stage_block(block_id, data)
+
+
+@pytest.mark.asyncio
+async def test_blocks_are_staged_during_the_call(tmp_path):
+    path = tmp_path / "call.wav"
+    sink = CallRecordingSink(FilesystemBlockStore(path), sample_rate=8000, block_size=4000)
+    await sink.start()
+
+    for _ in range(10):
+        sink.write_inbound(_tone(100, 800))  # 100ms per frame
+        await asyncio.sleep(0.01)
+
+    assert sink.stats.blocks_staged >= 2
+    assert not path.exists()
+
+    result = await sink.close()
+
+    assert result.success
+    assert result.size_bytes == path.stat().st_size == 44 + 10 * 800 * 4
+    assert not (tmp_path / "call.wav.blocks").exists()
+
+
+@pytest.mark.asyncio
+async def test_recording_aligns_agent_audio_on_caller_timeline(tmp_path):
+    path = tmp_path / "call.wav"
+    sink = CallRecordingSink(FilesystemBlockStore(path), sample_rate=8000, block_size=1000)
+    await sink.start()
+
+    sink.write_inbound(_tone(1000, 400))
+    sink.write_inbound_silence(50)  # 400 silent samples
+    # Agent audio at twice the recording rate starts at the caller position
+    sink.write_outbound(_tone(-2000, 800), sample_rate=16000)
+    sink.write_inbound(_tone(1000, 400))
+    result = await sink.close()
+
+    assert result.success
+    left, right = _channels(path)
+    assert len(left) == 1200
+    assert list(left[:400]) == [1000] * 400
+    assert list(left[400:800]) == [0] * 400
+    assert list(right[:800]) == [0] * 800
+    # Steady agent audio survives the anti-aliasing filter; only its edges ramp
+    assert all(abs(sample + 2000) <= 2 for sample in right[840:1160])
+
+
+@pytest.mark.asyncio
+async def test_decimation_does_not_alias(tmp_path):
+    path = tmp_path / "call.wav"
+    sink = CallRecordingSink(FilesystemBlockStore(path), sample_rate=16000, block_size=64000)
+    await sink.start()
+
+    # 10 kHz is above the 8 kHz Nyquist of the recording; plain 48k->16k
+    # decimation folds it to 6 kHz at full amplitude
+    t = np.arange(48000) / 48000
+    tone = (8000 * np.sin(2 * np.pi * 10000 * t)).astype("<i2").tobytes()
+    for i in range(0, len(tone), 1920):  # 20ms TTS chunks
+        sink.write_outbound(tone[i : i + 1920], sample_rate=48000)
+    in_band = (8000 * np.sin(2 * np.pi * 1000 * t)).astype("<i2").tobytes()
+    sink.write_outbound(in_band, sample_rate=48000)
+    result = await sink.close()
+
+    assert result.success
+    _, right = _channels(path)
+    aliased = np.asarray(right[1000:15000], dtype=float)
+    passed = np.asarray(right[17000:31000], dtype=float)
+    assert np.sqrt(np.mean(aliased**2)) < 8000 / np.sqrt(2) * 0.01
+    assert np.sqrt(np.mean(passed**2)) > 8000 / np.sqrt(2) * 0.95
+
+
+@pytest.mark.asyncio
+async def test_memory_is_bounded_when_storage_stalls(tmp_path):
+    store = SlowStore(tmp_path / "call.wav")
+    sink = CallRecordingSink(store, sample_rate=8000, block_size=4000, max_pending_blocks=2)
+    await sink.start()
+
+    for _ in range(100):
+        sink.write_inbound(_tone(1, 800))
+    await asyncio.sleep(0)
+
+    assert sink.stats.dropped_bytes > 0
+    # In-flight block, queued blocks and the partial block being filled
+    assert sink.stats.peak_buffered_bytes <= (2 + 2) * 4000
+
+    store.release.set()
+    result = await sink.close()
+    assert result.success
+
+
+@pytest.mark.asyncio
+async def test_transient_stage_failure_is_retried(tmp_path, monkeypatch):
+    monkeypatch.setattr(asyncio, "sleep", _no_sleep(asyncio.sleep))
+    path = tmp_path / "call.wav"
+    sink = CallRecordingSink(FlakyStore(path, failures=1), sample_rate=8000, block_size=4000)
+    await sink.start()
+
+    sink.write_inbound(_tone(7, 2000))
+    result = await sink.close()
+
+    assert result.success
+    assert sink.stats.stage_retries == 1
+    left, _ = _channels(path)
+    assert list(left) == [7] * 2000
+
+
+@pytest.mark.asyncio
+async def test_persistent_stage_failure_fails_the_recording(tmp_path, monkeypatch):
+    monkeypatch.setattr(asyncio, "sleep", _no_sleep(asyncio.sleep))
+    path = tmp_path / "call.wav"
+    sink = CallRecordingSink(FlakyStore(path, failures=100), sample_rate=8000, block_size=4000)
+    await sink.start()
+
+    sink.write_inbound(_tone(7, 4000))  # Keeps writing after the failure
+    result = await sink.close()
+
+    assert result.success is False
+    assert "storage unavailable" in result.error_message
+    assert not path.exists()
+
+
+@pytest.mark.asyncio
+async def test_tap_errors_do_not_raise(tmp_path):
+    path = tmp_path / "call.wav"
+    sink = CallRecordingSink(FilesystemBlockStore(path), sample_rate=16000, block_size=4000)
+    await sink.start()
+
+    sink.write_inbound(_tone(5, 160))
+    sink.write_outbound(_tone(9, 441), sample_rate=44100)  # Not a multiple of 16 kHz
+    sink.write_inbound(_tone(5, 160))
+    result = await sink.close()
+
+    assert result.success
+    assert sink.stats.tap_errors == 1
+    left, right = _channels(path)
+    assert list(left) == [5] * 320
+    assert list(right) == [0] * 320
+
+
+def _no_sleep(real_sleep):
+    async def fast_sleep(delay, *args, **kwargs):
+        return await real_sleep(0)
+
+    return fast_sleep
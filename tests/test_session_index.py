@@ -0,0 +1,242 @@
+"""
+Tests for the Redis session index.
+
+Tests cover:
+- Pages come back newest-activity first with total/active counts
+- Offset paging and the active-only filter read from the sorted set
+- Summaries whose hash expired are pruned on read
+- created_at survives later updates; ended sessions are reported inactive
+- MemoManager persistence keeps the index current
+- Listing backfills the index once from a keyspace scan, then stops scanning
+"""
+
+import fnmatch
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+from apps.artagent.backend.api.v1.endpoints import sessions as sessions_endpoint
+from opentelemetry import trace
+from src.redis.manager import AzureRedisManager
+from src.redis.session_index import INDEX_KEY, summarize_session, summary_key
+from src.stateful.state_managment import MemoManager
+from utils.ml_logging import get_logger
+
+
+class FakeRedis:
+    """Minimal in-memory Redis covering the commands the session index uses."""
+
+    def __init__(self):
+        self.data: dict[str, object] = {}
+        self.scans = 0
+
+    # -- hashes / strings ------------------------------------------------
+    def hset(self, key, field=None, value=None, mapping=None):
+        entry = self.data.setdefault(key, {})
+        entry.update(mapping or {field: value})
+        return 1
+
+    def hsetnx(self, key, field, value):
+        entry = self.data.setdefault(key, {})
+        if field in entry:
+            return 0
+        entry[field] = value
+        return 1
+
+    def hgetall(self, key):
+        return dict(self.data.get(key, {}))
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+        return True
+
+    def expire(self, key, ttl):
+        return key in self.data
+
+    def delete(self, *keys):
+        return sum(1 for key in keys if self.data.pop(key, None) is not None)
+
+    def exists(self, key):
+        return int(key in self.data)
+
+    def scan_iter(self, match=None, count=None):
+        self.scans += 1
+        return [key for key in list(self.data) if fnmatch.fnmatch(key, match)]
+
+    # -- sorted sets -----------------------------------------------------
+    def _zset(self, key):
+        return self.data.setdefault(key, {})
+
+    @staticmethod
+    def _bound(value, default):
+        if value in ("-inf", "+inf"):
+            return default, False
+        text = str(value)
+        if text.startswith("("):
+            return float(text[1:]), True
+        return float(text), False
+
+    def _in_range(self, score, low, high):
+        lo, lo_open = self._bound(low, float("-inf"))
+        hi, hi_open = self._bound(high, float("inf"))
+        return (score > lo if lo_open else score >= lo) and (score < hi if hi_open else score <= hi)
+
+    def zadd(self, key, mapping, gt=False):
+        zset = self._zset(key)
+        for member, score in mapping.items():
+            if not gt or member not in zset or score > zset[member]:
+                zset[member] = score
+        return len(mapping)
+
+    def zrem(self, key, *members):
+        zset = self._zset(key)
+        return sum(1 for member in members if zset.pop(member, None) is not None)
+
+    def zcard(self, key):
+        return len(self._zset(key))
+
+    def zcount(self, key, low, high):
+        return sum(1 for score in self._zset(key).values() if self._in_range(score, low, high))
+
+    def zremrangebyscore(self, key, low, high):
+        zset = self._zset(key)
+        doomed = [m for m, score in zset.items() if self._in_range(score, low, high)]
+        return self.zrem(key, *doomed) if doomed else 0
+
+    def _desc(self, key):
+        return [m for m, _ in sorted(self._zset(key).items(), key=lambda kv: -kv[1])]
+
+    def zrevrange(self, key, start, end):
+        return self._desc(key)[start : end + 1]
+
+    def zrevrangebyscore(self, key, high, low, start=0, num=None):
+        zset = self._zset(key)
+        members = [m for m in self._desc(key) if self._in_range(zset[m], low, high)]
+        return members[start : start + num if num is not None else None]
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self._client = client
+        self._calls = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self._calls.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    def execute(self):
+        return [getattr(self._client, name)(*a, **kw) for name, a, kw in self._calls]
+
+
+def _manager(client: FakeRedis) -> AzureRedisManager:
+    manager = AzureRedisManager.__new__(AzureRedisManager)
+    manager.redis_client = client
+    manager.logger = get_logger("tests.session_index")
+    manager.tracer = trace.get_tracer(__name__)
+    manager.host = "localhost"
+    manager.port = 6379
+    return manager
+
+
+def _summary(session_id: str, last_activity: float, **extra) -> dict:
+    return {**summarize_session(session_id, None, None, now=last_activity), **extra}
+
+
+@pytest.fixture
+def redis_mgr():
+    return _manager(FakeRedis())
+
+
+def test_page_orders_by_last_activity(redis_mgr):
+    now = time.time()
+    index = redis_mgr.session_index
+    index.record("session_old", _summary("session_old", now - 7200))
+    index.record("session_new", _summary("session_new", now - 10))
+    index.record("session_mid", _summary("session_mid", now - 60))
+
+    page = index.page(limit=10)
+
+    assert [s["session_id"] for s in page.sessions] == ["session_new", "session_mid", "session_old"]
+    assert page.total == 3
+    assert page.active == 2
+
+
+def test_offset_paging_and_active_filter(redis_mgr):
+    now = time.time()
+    index = redis_mgr.session_index
+    for i in range(5):
+        index.record(f"s{i}", _summary(f"s{i}", now - i * 1000))
+
+    assert [s["session_id"] for s in index.page(2, 2).sessions] == ["s2", "s3"]
+    active = index.page(0, 10, active_only=True)
+    assert [s["session_id"] for s in active.sessions] == ["s0", "s1", "s2", "s3"]
+
+
+def test_expired_summary_is_pruned_on_read(redis_mgr):
+    index = redis_mgr.session_index
+    index.record("gone", _summary("gone", time.time()))
+    redis_mgr.redis_client.delete(summary_key("gone"))  # TTL elapsed
+
+    page = index.page()
+
+    assert page.sessions == [] and page.total == 0
+    assert redis_mgr.redis_client.zcard(INDEX_KEY) == 0
+
+
+def test_created_at_kept_and_ended_session_inactive(redis_mgr):
+    now = time.time()
+    index = redis_mgr.session_index
+    index.record("s1", _summary("s1", now - 30))
+    created_at = index.page().sessions[0]["created_at"]
+    index.record("s1", _summary("s1", now - 5))
+    index.mark_ended("s1", ended_at=now)
+
+    summary = index.page().sessions[0]
+    metadata = sessions_endpoint._session_metadata(summary)
+
+    assert summary["created_at"] == created_at
+    assert metadata.connection_status == "inactive"
+
+
+def test_memo_manager_persist_updates_index(redis_mgr):
+    mm = MemoManager(session_id="session_abc")
+    mm.set_corememory("session_profile", {"display_name": "Ada", "industry": "banking"})
+    mm.append_to_history("Concierge", "user", "hello")
+
+    mm.persist_to_redis(redis_mgr)
+
+    summary = redis_mgr.session_index.page().sessions[0]
+    assert summary["session_id"] == "session_abc"
+    assert summary["profile_name"] == "Ada"
+    assert summary["turn_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_listing_backfills_once_then_uses_index(redis_mgr):
+    client = redis_mgr.redis_client
+    client.hset(
+        "session:session_legacy",
+        mapping={
+            "corememory": json.dumps({"session_info": {"last_activity": time.time()}}),
+            "chat_history": json.dumps({"Concierge": [{"role": "user", "content": "hi"}]}),
+        },
+    )
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(redis=redis_mgr)))
+
+    first = await sessions_endpoint.list_sessions(request, limit=10, offset=0, active_only=False)
+    second = await sessions_endpoint.list_sessions(request, limit=10, offset=0, active_only=False)
+
+    assert [s.session_id for s in first.sessions] == ["session_legacy"]
+    assert first.sessions[0].turn_count == 1
+    assert second.total_count == 1
+    assert client.scans == 1
@@ -0,0 +1,164 @@
+"""
+Tests for adaptive span sampling.
+
+Tests cover:
+- Spans beyond the per-name rate are held back; turn-level and error spans are kept
+- A slow turn brings back the spans held back during it
+- High-frequency events are counted and drained into summary attributes
+- Exporter queue depth and saturation drops are reported
+"""
+
+from collections import deque
+from types import SimpleNamespace
+
+from opentelemetry.sdk.trace import SpanProcessor, TracerProvider
+from opentelemetry.sdk.trace.export import (
+    BatchSpanProcessor,
+    SimpleSpanProcessor,
+    SpanExporter,
+    SpanExportResult,
+)
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.trace import Status, StatusCode, set_span_in_context
+from utils.telemetry_config import (
+    FilteringSpanProcessor,
+    SpanSamplingPolicy,
+    _exporter_queues,
+)
+
+MS = 1_000_000
+
+
+def _pipeline(policy: SpanSamplingPolicy):
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(
+        FilteringSpanProcessor(SimpleSpanProcessor(exporter), policy=policy)
+    )
+    return provider.get_tracer("tests"), exporter
+
+
+def _names(exporter: InMemorySpanExporter) -> list[str]:
+    return [span.name for span in exporter.get_finished_spans()]
+
+
+def test_rate_limit_keeps_turn_and_error_spans():
+    policy = SpanSamplingPolicy(rate_per_name=2, slow_span_ms=1000)
+    tracer, exporter = _pipeline(policy)
+    base = 1_700_000_000 * 1000 * MS
+
+    for i in range(5):
+        tracer.start_span("redis.get", start_time=base + i * MS).end(end_time=base + (i + 1) * MS)
+    failed = tracer.start_span("redis.get", start_time=base + 10 * MS)
+    failed.set_status(Status(StatusCode.ERROR, "boom"))
+    failed.end(end_time=base + 11 * MS)
+    tracer.start_span("voice.turn.1.total", start_time=base).end(end_time=base + 20 * MS)
+    tracer.start_span("websocket send", start_time=base).end(end_time=base + MS)
+
+    assert _names(exporter) == ["redis.get", "redis.get", "redis.get", "voice.turn.1.total"]
+    assert exporter.get_finished_spans()[2].status.status_code is StatusCode.ERROR
+    stats = policy.stats()
+    assert stats["sampled"] == 2 and stats["held"] == 3 and stats["turn"] == 1
+    assert stats["held_now"] == 3
+
+
+def test_slow_turn_retains_held_spans_of_its_trace():
+    policy = SpanSamplingPolicy(rate_per_name=0, slow_span_ms=500, tail_buffer_spans=3)
+    tracer, exporter = _pipeline(policy)
+    base = 1_700_000_000 * 1000 * MS
+
+    turn = tracer.start_span("voice.turn.1.total", start_time=base)
+    context = set_span_in_context(turn)
+    for i in range(4):
+        child = tracer.start_span("tts.synthesize", context=context, start_time=base + i * MS)
+        child.end(end_time=base + (i + 1) * MS)
+    tracer.start_span("tts.synthesize", start_time=base).end(end_time=base + MS)  # other trace
+    assert _names(exporter) == []
+
+    turn.end(end_time=base + 900 * MS)
+
+    assert _names(exporter) == ["voice.turn.1.total"] + ["tts.synthesize"] * 3
+    stats = policy.stats()
+    assert stats["retained_tail"] == 3 and stats["dropped"] == 1 and stats["held_now"] == 1
+
+    fast = tracer.start_span("voice.turn.2.total", start_time=base)
+    fast.end(end_time=base + 100 * MS)
+    assert len(exporter.get_finished_spans()) == 5
+
+
+def test_events_are_counted_and_drained():
+    policy = SpanSamplingPolicy()
+    for size in (4800, 4800, 2400):
+        policy.count_event("session-1", "response.audio.delta", size)
+    policy.count_event("session-1", "response.audio_transcript.delta", 5)
+    policy.count_event("session-2", "response.audio.delta", 10)
+
+    summary = policy.drain_events("session-1")
+
+    assert summary == {
+        "telemetry.events.response.audio.delta.count": 3,
+        "telemetry.events.response.audio.delta.bytes": 12000,
+        "telemetry.events.response.audio_transcript.delta.count": 1,
+        "telemetry.events.response.audio_transcript.delta.bytes": 5,
+    }
+    assert policy.drain_events("session-1") == {}
+    assert policy.stats()["aggregated"] == 5
+
+
+class _IdleExporter(SpanExporter):
+    def export(self, spans):
+        return SpanExportResult.SUCCESS
+
+
+class _StalledBatchProcessor(SpanProcessor):
+    """A batch processor whose worker never drains (the pre-1.3x SDK attribute layout)."""
+
+    def __init__(self, max_queue_size: int):
+        self.queue: deque = deque(maxlen=max_queue_size)
+        self.span_exporter = _IdleExporter()
+
+    def on_end(self, span):
+        self.queue.append(span)
+
+
+def test_exporter_queues_are_found_and_saturation_counted():
+    batch = BatchSpanProcessor(_IdleExporter(), max_queue_size=8, max_export_batch_size=4)
+    try:
+        assert [(name, queue.maxlen) for name, queue in _exporter_queues(batch)] == [
+            ("_IdleExporter", 8)
+        ]
+    finally:
+        batch.shutdown()
+
+    stalled = _StalledBatchProcessor(max_queue_size=2)
+    policy = SpanSamplingPolicy(rate_per_name=10)
+    provider = TracerProvider()
+    provider.add_span_processor(FilteringSpanProcessor(stalled, policy=policy))
+    tracer = provider.get_tracer("tests")
+    for _ in range(3):
+        tracer.start_span("redis.get").end()
+
+    assert len(stalled.queue) == 2
+    assert policy.stats()["exporter_dropped"] == 1
+
+
+def test_voicelive_deltas_are_counted_until_response_done(monkeypatch):
+    from apps.artagent.backend.voice.voicelive import handler as voicelive_handler
+
+    policy = SpanSamplingPolicy()
+    monkeypatch.setattr(voicelive_handler, "span_sampling_policy", lambda: policy)
+    handler_cls = voicelive_handler.VoiceLiveSDKHandler
+    handler = SimpleNamespace(
+        session_id="session-vl",
+        call_connection_id="call-vl",
+        _NOISY_EVENT_TYPES=handler_cls._NOISY_EVENT_TYPES,
+    )
+
+    for _ in range(3):
+        handler_cls._observe_event(
+            handler, SimpleNamespace(type="response.audio.delta", delta=b"\0" * 480)
+        )
+    assert policy.stats()["aggregated"] == 3
+
+    handler_cls._observe_event(handler, SimpleNamespace(type="response.done"))
+    assert policy.drain_events("session-vl") == {}
@@ -0,0 +1,181 @@
+"""
+Tests for native synthesizer reuse in SpeechSynthesizer.
+
+Tests cover:
+- One native synthesizer per (voice, output format), reused across sentences
+- Connection pre-opened once per native synthesizer
+- Eviction and rebuild after a failed synthesis
+- Async retries back off without holding the executor
+- Barge-in cancellation stops in-flight native synthesis
+"""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import azure.cognitiveservices.speech as speechsdk
+import pytest
+from src.speech import text_to_speech
+from src.speech.text_to_speech import SpeechSynthesizer
+
+
+class FakeNativeSynthesizer:
+    """Stand-in for speechsdk.SpeechSynthesizer."""
+
+    instances: list["FakeNativeSynthesizer"] = []
+    outcomes: list[str] = []
+
+    def __init__(self, speech_config=None, audio_config=None):
+        self.calls = 0
+        self.authorization_token = None
+        self.started = threading.Event()
+        self.stopped = threading.Event()
+        FakeNativeSynthesizer.instances.append(self)
+
+    def stop_speaking_async(self):
+        self.stopped.set()
+
+    def speak_ssml_async(self, ssml):
+        self.calls += 1
+        outcome = FakeNativeSynthesizer.outcomes.pop(0) if FakeNativeSynthesizer.outcomes else "ok"
+        if outcome == "block":
+            # Long synthesis that only finishes when stopped
+            self.started.set()
+            self.stopped.wait(timeout=5)
+            outcome = "fail"
+        if outcome == "ok":
+            result = SimpleNamespace(
+                reason=speechsdk.ResultReason.SynthesizingAudioCompleted,
+                audio_data=b"\x01\x00" * 160,
+                cancellation_details=None,
+            )
+        else:
+            result = SimpleNamespace(
+                reason=speechsdk.ResultReason.Canceled,
+                audio_data=b"",
+                cancellation_details=SimpleNamespace(
+                    reason=speechsdk.CancellationReason.Error, error_details="transient"
+                ),
+            )
+        return SimpleNamespace(get=lambda: result)
+
+
+class FakeConnection:
+    opened: list[bool] = []
+
+    @classmethod
+    def from_speech_synthesizer(cls, synthesizer):
+        return cls()
+
+    def open(self, for_continuous_recognition):
+        FakeConnection.opened.append(for_continuous_recognition)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def synth(monkeypatch):
+    FakeNativeSynthesizer.instances = []
+    FakeNativeSynthesizer.outcomes = []
+    FakeConnection.opened = []
+    monkeypatch.setattr(speechsdk, "SpeechSynthesizer", FakeNativeSynthesizer)
+    monkeypatch.setattr(speechsdk, "Connection", FakeConnection)
+    monkeypatch.setattr(text_to_speech, "_PCM_RETRY_DELAY_S", 0.0)
+    return SpeechSynthesizer(key="test-key", region="eastus", enable_tracing=False)
+
+
+def test_native_synthesizer_reused_per_voice_and_format(synth):
+    for _ in range(3):
+        assert synth.synthesize_to_pcm("Hello there.", voice="en-US-AvaNeural")
+
+    assert len(FakeNativeSynthesizer.instances) == 1
+    assert FakeNativeSynthesizer.instances[0].calls == 3
+    assert FakeConnection.opened == [True]
+    assert synth.native_synthesizer_stats["hits"] == 2
+
+
+def test_voice_and_sample_rate_changes_get_separate_instances(synth):
+    synth.synthesize_to_pcm("One.", voice="en-US-AvaNeural", sample_rate=16000)
+    synth.synthesize_to_pcm("Two.", voice="en-US-AvaNeural", sample_rate=24000)
+    synth.synthesize_to_pcm("Three.", voice="en-US-AndrewNeural", sample_rate=16000)
+    synth.synthesize_to_pcm("Four.", voice="en-US-AvaNeural", sample_rate=16000)
+
+    assert len(FakeNativeSynthesizer.instances) == 3
+    assert synth.native_synthesizer_stats["cached"] == 3
+
+
+def test_failed_synthesis_rebuilds_native_instance(synth):
+    FakeNativeSynthesizer.outcomes = ["fail", "ok"]
+
+    assert synth.synthesize_to_pcm("Retry me.", voice="en-US-AvaNeural")
+
+    assert len(FakeNativeSynthesizer.instances) == 2
+
+
+def test_cache_is_bounded(synth):
+    for i in range(SpeechSynthesizer._NATIVE_CACHE_SIZE + 2):
+        synth.synthesize_to_pcm("Hi.", voice=f"voice-{i}")
+
+    stats = synth.native_synthesizer_stats
+    assert stats["cached"] == SpeechSynthesizer._NATIVE_CACHE_SIZE
+    assert stats["evictions"] == 2
+
+
+@pytest.mark.asyncio
+async def test_async_synthesis_retries_and_reuses(synth):
+    FakeNativeSynthesizer.outcomes = ["fail", "ok", "ok"]
+
+    first = await synth.synthesize_to_pcm_async("First.", voice="en-US-AvaNeural")
+    second = await synth.synthesize_to_pcm_async("Second.", voice="en-US-AvaNeural")
+
+    assert first and second
+    assert len(FakeNativeSynthesizer.instances) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_synthesis_raises_after_max_attempts(synth):
+    FakeNativeSynthesizer.outcomes = ["fail"] * 10
+
+    with pytest.raises(RuntimeError):
+        await synth.synthesize_to_pcm_async("Nope.", voice="en-US-AvaNeural")
+    await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_cancel_synthesis_stops_native_and_raises(synth):
+    FakeNativeSynthesizer.outcomes = ["block"]
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(
+        None, lambda: synth.synthesize_to_pcm("Long answer.", voice="en-US-AvaNeural")
+    )
+    await loop.run_in_executor(None, lambda: _wait_started())
+
+    wasted_ms = synth.cancel_synthesis()
+
+    with pytest.raises(text_to_speech.SynthesisCancelledError):
+        await future
+    assert FakeNativeSynthesizer.instances[0].stopped.is_set()
+    assert wasted_ms >= 0
+    assert synth.cancellation_stats["cancelled"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelling_async_task_stops_native_synthesis(synth):
+    FakeNativeSynthesizer.outcomes = ["block"]
+    task = asyncio.create_task(synth.synthesize_to_pcm_async("Long.", voice="en-US-AvaNeural"))
+    await asyncio.get_running_loop().run_in_executor(None, lambda: _wait_started())
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert FakeNativeSynthesizer.instances[0].stopped.is_set()
+    assert synth.cancellation_stats["cancelled"] == 1
+
+
+def _wait_started() -> None:
+    for _ in range(500):
+        if FakeNativeSynthesizer.instances and FakeNativeSynthesizer.instances[0].started.is_set():
+            return
+        threading.Event().wait(0.01)
+    raise AssertionError("synthesis never started")
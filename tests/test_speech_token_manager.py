@@ -0,0 +1,148 @@
+"""
+Tests for proactive Speech AAD token refresh.
+
+Tests cover:
+- Fresh tokens are served from cache without a credential call or the lock
+- Tokens near expiry are fetched once, even with concurrent callers
+- The background task refreshes ahead of expiry and records refresh lag
+- Refreshed tokens are pushed to subscribers; collected subscribers are dropped
+- Failed background refreshes are retried and counted
+"""
+
+import asyncio
+import gc
+import threading
+import time
+
+import pytest
+from azure.core.credentials import AccessToken
+from src.pools.executors import shutdown_executors
+from src.speech import auth_manager
+from src.speech.auth_manager import SpeechTokenManager
+
+
+class FakeCredential:
+    def __init__(self, lifetime_s: float = 3600, delay_s: float = 0.0):
+        self.lifetime_s = lifetime_s
+        self.delay_s = delay_s
+        self.calls = 0
+        self.failures = 0
+
+    def get_token(self, *scopes):
+        self.calls += 1
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("AAD unavailable")
+        time.sleep(self.delay_s)
+        return AccessToken(f"token-{self.calls}", time.time() + self.lifetime_s)
+
+
+class FakeConfig:
+    def __init__(self):
+        self.authorization_token = None
+        self.properties = {}
+
+    def set_property_by_name(self, name, value):
+        self.properties[name] = value
+
+
+class Listener:
+    def __init__(self):
+        self.tokens = []
+
+    def on_token(self, token):
+        self.tokens.append(token)
+
+
+@pytest.fixture(autouse=True)
+def _executors():
+    yield
+    shutdown_executors()
+
+
+def test_fresh_token_served_from_cache():
+    credential = FakeCredential()
+    manager = SpeechTokenManager(credential, "resource-id")
+    config = FakeConfig()
+
+    manager.apply_to_config(config)
+    manager._token_lock.acquire()  # a held lock must not block the hot path
+    try:
+        for _ in range(100):
+            assert manager.get_token().token == "token-1"
+    finally:
+        manager._token_lock.release()
+
+    assert credential.calls == 1
+    assert config.authorization_token == "token-1"
+    assert config.properties["SpeechServiceConnection_AzureResourceId"] == "resource-id"
+    assert manager.snapshot()["fetches"]["inline"] == 1
+
+
+def test_expiring_token_fetched_once_by_concurrent_callers():
+    credential = FakeCredential(lifetime_s=60, delay_s=0.05)  # inside the expiry skew
+    manager = SpeechTokenManager(credential, "resource-id")
+    manager.get_token()
+    credential.lifetime_s = 3600
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(manager.get_token())) for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert credential.calls == 2
+    assert {token.token for token in results} == {"token-2"}
+
+
+async def test_background_refresh_ahead_of_expiry_pushes_to_subscribers():
+    credential = FakeCredential(lifetime_s=0.4)
+    manager = SpeechTokenManager(credential, "resource-id", refresh_ahead_s=0.3, jitter_s=0)
+    listener = Listener()
+    manager.subscribe(listener.on_token)
+
+    await manager.start()
+    await asyncio.sleep(0.5)
+    await manager.stop()
+
+    snapshot = manager.snapshot()
+    assert credential.calls >= 2
+    assert snapshot["fetches"]["background"] >= 1
+    assert snapshot["fetches"]["inline"] == 0
+    assert snapshot["refresh_lag_ms"]["count"] == snapshot["fetches"]["background"]
+    assert listener.tokens[-1] == manager._cached_token.token
+    assert snapshot["background_refresh"] is False
+
+
+async def test_failed_refresh_retried(monkeypatch):
+    monkeypatch.setattr(auth_manager, "_RETRY_BACKOFF_SECONDS", (0.01,))
+    credential = FakeCredential(lifetime_s=0.4)
+    manager = SpeechTokenManager(credential, "resource-id", refresh_ahead_s=0.3, jitter_s=0)
+    manager.get_token()
+    credential.failures = 2
+
+    await manager.start()
+    await asyncio.sleep(0.35)
+    await manager.stop()
+
+    snapshot = manager.snapshot()
+    assert snapshot["failures"] == 2
+    assert snapshot["fetches"]["background"] >= 1
+    assert snapshot["refresh_lag_ms"]["min"] >= 10
+
+
+def test_collected_subscribers_dropped():
+    manager = SpeechTokenManager(FakeCredential(), "resource-id")
+    kept, dropped = Listener(), Listener()
+    manager.subscribe(kept.on_token)
+    manager.subscribe(dropped.on_token)
+    del dropped
+    gc.collect()
+
+    manager.refresh()
+
+    assert kept.tokens == ["token-1"]
+    assert manager.snapshot()["listeners"] == 1
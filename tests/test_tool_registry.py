@@ -0,0 +1,150 @@
+"""
+Tests for precompiled tool dispatch plans in the tool registry.
+
+Tests cover:
+- Argument binding styles compiled at registration (no args, dict, model, kwargs)
+- Async / blocking / inline sync classification
+- Tool-list snapshots reused and invalidated on registration
+- Per-tool latency histograms, served by the metrics endpoint
+"""
+
+import threading
+
+import pytest
+from apps.artagent.backend.api.v1.endpoints.metrics import get_tool_latency
+from apps.artagent.backend.registries.toolstore import registry
+from apps.artagent.backend.registries.toolstore.registry import (
+    CALL_DICT,
+    CALL_KWARGS,
+    CALL_MODEL,
+    CALL_NO_ARGS,
+    execute_tool,
+    get_tool_definition,
+    get_tool_latency_stats,
+    get_tools_for_agent,
+    register_tool,
+)
+from pydantic import BaseModel
+
+
+class _Args(BaseModel):
+    value: int
+
+
+def _schema(name: str) -> dict:
+    return {"name": name, "description": f"{name} tool", "parameters": {"type": "object"}}
+
+
+@pytest.fixture(autouse=True)
+def isolated_registry(monkeypatch):
+    monkeypatch.setattr(registry, "_TOOL_DEFINITIONS", dict(registry._TOOL_DEFINITIONS))
+    monkeypatch.setattr(registry, "_TOOL_LIST_SNAPSHOTS", {})
+    monkeypatch.setattr(registry, "_TOOL_LATENCY", {})
+
+
+def test_plan_binding_styles():
+    async def no_args():
+        return {"ok": True}
+
+    async def dict_args(args):
+        return args
+
+    async def model_args(args: _Args):
+        return {"value": args.value}
+
+    async def kw_args(a, b):
+        return {"sum": a + b}
+
+    register_tool("t_none", _schema("t_none"), no_args)
+    register_tool("t_dict", _schema("t_dict"), dict_args)
+    register_tool("t_model", _schema("t_model"), model_args)
+    register_tool("t_kwargs", _schema("t_kwargs"), kw_args)
+
+    assert get_tool_definition("t_none").plan.call_style == CALL_NO_ARGS
+    assert get_tool_definition("t_dict").plan.call_style == CALL_DICT
+    assert get_tool_definition("t_model").plan.call_style == CALL_MODEL
+    assert get_tool_definition("t_kwargs").plan.call_style == CALL_KWARGS
+
+
+@pytest.mark.asyncio
+async def test_execute_follows_plan():
+    async def model_args(args: _Args):
+        return {"value": args.value * 2}
+
+    def kw_args(a, b):
+        return a + b
+
+    register_tool("t_model", _schema("t_model"), model_args)
+    register_tool("t_kwargs", _schema("t_kwargs"), kw_args)
+
+    assert await execute_tool("t_model", {"value": 21}) == {"value": 42}
+    assert await execute_tool("t_kwargs", {"a": 1, "b": 2}) == {"success": True, "result": 3}
+
+
+@pytest.mark.asyncio
+async def test_sync_tools_run_in_thread_unless_non_blocking():
+    main_thread = threading.get_ident()
+
+    def where(args):
+        return {"thread": threading.get_ident()}
+
+    register_tool("t_blocking", _schema("t_blocking"), where)
+    register_tool("t_inline", _schema("t_inline"), where, override=True, blocking=False)
+
+    assert (await execute_tool("t_blocking", {}))["thread"] != main_thread
+    assert (await execute_tool("t_inline", {}))["thread"] == main_thread
+    assert get_tool_definition("t_blocking").plan.blocking
+    assert not get_tool_definition("t_inline").plan.blocking
+
+
+def test_async_callable_object_is_async():
+    class AsyncTool:
+        async def __call__(self, args):
+            return args
+
+    register_tool("t_callable", _schema("t_callable"), AsyncTool())
+
+    plan = get_tool_definition("t_callable").plan
+    assert plan.is_async
+    assert not plan.blocking
+
+
+def test_tool_list_snapshot_reused_and_invalidated():
+    register_tool("t_a", _schema("t_a"), lambda args: args)
+    register_tool("t_b", _schema("t_b"), lambda args: args)
+
+    first = get_tools_for_agent(["t_a", "t_b"])
+    second = get_tools_for_agent(["t_a", "t_b"])
+    assert first == second
+    assert first is not second  # callers get their own list
+    assert first[0] is second[0]  # entries are not rebuilt
+
+    register_tool("t_a", _schema("t_a_v2"), lambda args: args, override=True)
+    assert get_tools_for_agent(["t_a", "t_b"])[0]["function"]["name"] == "t_a_v2"
+
+
+@pytest.mark.asyncio
+async def test_latency_histogram_recorded():
+    async def ok(args):
+        return {"success": True}
+
+    async def boom(args):
+        raise ValueError("nope")
+
+    register_tool("t_ok", _schema("t_ok"), ok)
+    register_tool("t_boom", _schema("t_boom"), boom)
+
+    for _ in range(3):
+        await execute_tool("t_ok", {})
+    result = await execute_tool("t_boom", {})
+
+    assert result["success"] is False
+    stats = get_tool_latency_stats()
+    assert stats["t_ok"]["calls"] == 3
+    assert stats["t_ok"]["errors"] == 0
+    assert stats["t_ok"]["p50_ms"] is not None
+    assert sum(stats["t_ok"]["buckets_ms"].values()) == 3
+    assert stats["t_boom"]["errors"] == 1
+
+    served = await get_tool_latency(name=None)
+    assert served["tools"]["t_ok"]["calls"] == 3
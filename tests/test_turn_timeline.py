@@ -0,0 +1,170 @@
+"""
+Tests for per-turn stage timelines.
+
+Tests cover:
+- Segments follow stage order; the response time runs from end of speech
+- End of speech waits for the transcript; first mark wins except the last frame
+- Finished turns feed the session bucket, process sketches and core memory
+- The registry ignores unknown sessions and stays bounded
+- The waterfall endpoint serves live sessions and falls back to Redis
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from apps.artagent.backend.api.v1.endpoints import metrics as metrics_endpoint
+from fastapi import HTTPException
+from src.tools.latency_sketch import process_sketches
+from src.tools.turn_timeline import (
+    BARGE_IN,
+    CORE_KEY,
+    FIRST_FRAME_SENT,
+    FIRST_SENTENCE,
+    LAST_FRAME_SENT,
+    LLM_FIRST_TOKEN,
+    LLM_REQUEST,
+    STT_FINAL,
+    TTS_FIRST_BYTE,
+    VAD_END,
+    SessionTimeline,
+    TurnTimeline,
+    TurnTimelines,
+    turn_timelines,
+)
+
+
+class _Memo:
+    def __init__(self):
+        self.context = {}
+
+    def get_context(self, key, default=None):
+        return self.context.get(key, default)
+
+    def set_context(self, key, value):
+        self.context[key] = value
+
+
+def _full_turn(session: SessionTimeline, turn: int, base: float) -> None:
+    session.mark(VAD_END, base)
+    session.begin_turn(turn, base + 0.4)
+    for stage, offset in (
+        (LLM_REQUEST, 0.45),
+        (LLM_FIRST_TOKEN, 0.75),
+        (FIRST_SENTENCE, 0.9),
+        (TTS_FIRST_BYTE, 1.1),
+        (FIRST_FRAME_SENT, 1.12),
+        (LAST_FRAME_SENT, 2.0),
+        (LAST_FRAME_SENT, 3.5),
+    ):
+        session.mark(stage, base + offset)
+
+
+def test_segments_follow_stage_order():
+    timeline = TurnTimeline(1)
+    timeline.mark(STT_FINAL, 10.0)
+    timeline.mark(LLM_FIRST_TOKEN, 10.5)
+    timeline.mark(FIRST_FRAME_SENT, 10.8)
+    timeline.mark(BARGE_IN, 11.0)
+
+    segments = timeline.segments()
+
+    assert segments == pytest.approx(
+        {LLM_FIRST_TOKEN: 0.5, FIRST_FRAME_SENT: 0.3, BARGE_IN: 0.2, "response": 0.8}
+    )
+    waterfall = timeline.to_dict()
+    assert list(waterfall["stages"]) == [STT_FINAL, LLM_FIRST_TOKEN, FIRST_FRAME_SENT, BARGE_IN]
+    assert waterfall["stages"][BARGE_IN] == 1000.0
+    with pytest.raises(ValueError):
+        timeline.mark("unknown")
+
+
+def test_vad_end_waits_for_transcript_and_first_mark_wins():
+    session = SessionTimeline("session-vad")
+    session.mark(LLM_REQUEST, 0.5)  # no open turn: ignored
+    session.mark(VAD_END, 1.0)
+    session.mark(VAD_END, 2.0)  # a later pause in the same utterance
+    session.begin_turn(1, 2.3)
+    session.mark(FIRST_FRAME_SENT, 3.0)
+    session.mark(FIRST_FRAME_SENT, 4.0)
+    session.mark(LAST_FRAME_SENT, 4.0)
+    session.mark(LAST_FRAME_SENT, 5.0)
+
+    marks = session.current.marks
+    assert marks == {VAD_END: 2.0, STT_FINAL: 2.3, FIRST_FRAME_SENT: 3.0, LAST_FRAME_SENT: 5.0}
+    assert session.current.segments()["response"] == pytest.approx(1.0)
+
+
+def test_finished_turns_feed_bucket_sketches_and_core_memory():
+    before = process_sketches().summary().get("turn.llm_first_token", {}).get("count", 0)
+    memo = _Memo()
+    session = SessionTimeline("session-finish", memory_manager=memo)
+
+    _full_turn(session, 1, 100.0)
+    assert memo.get_context(CORE_KEY) is None  # still open
+    _full_turn(session, 2, 200.0)
+    assert session.close() is True
+    assert session.close() is False
+
+    stats = memo.get_context("latency")["stage_stats"]
+    assert stats["turn.llm_first_token"]["count"] == 2
+    assert stats["turn.response"]["total"] == pytest.approx(2 * 1.12)
+    assert stats["turn.last_frame_sent"]["max"] == pytest.approx(3.5 - 1.12)
+    after = process_sketches().summary()["turn.llm_first_token"]["count"]
+    assert after == before + 2
+
+    waterfalls = memo.get_context(CORE_KEY)
+    assert [turn["turn"] for turn in waterfalls] == [1, 2]
+    assert waterfalls[0]["stages"][FIRST_FRAME_SENT] == pytest.approx(1120.0)
+    assert waterfalls[0]["segments"][LLM_FIRST_TOKEN] == pytest.approx(300.0)
+
+    resumed = SessionTimeline("session-finish", memory_manager=memo)
+    assert [turn["turn"] for turn in resumed.waterfall()] == [1, 2]
+
+
+def test_registry_ignores_unknown_sessions_and_stays_bounded():
+    registry = TurnTimelines(max_sessions=2)
+    registry.mark("missing", LLM_REQUEST)
+    registry.begin_turn("missing", 1)
+    assert registry.close("missing") is False
+
+    for session_id in ("a", "b", "c"):
+        registry.open(session_id)
+    assert len(registry) == 2
+    assert registry.get("a") is None
+
+    registry.begin_turn("c", 1)
+    registry.mark("c", LLM_REQUEST)
+    assert registry.get("c").waterfall()[0]["in_progress"] is True
+    assert registry.close("c") is True
+    assert registry.get("c") is None
+
+
+def test_waterfall_endpoint_live_and_redis(monkeypatch):
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace()))
+    session = turn_timelines().open("session-endpoint")
+    try:
+        _full_turn(session, 1, 50.0)
+        _full_turn(session, 2, 60.0)
+        live = asyncio.run(metrics_endpoint.get_session_waterfall(request, "session-endpoint", 1))
+    finally:
+        turn_timelines().close("session-endpoint")
+
+    assert live["source"] == "live"
+    assert [turn["turn"] for turn in live["turns"]] == [2]
+    assert live["turns"][0]["in_progress"] is True
+
+    stored = [{"turn": 1, "stages": {STT_FINAL: 0.0}, "segments": {}}]
+
+    async def fake_redis(_request, session_id):
+        if session_id == "session-stored":
+            return {"corememory": {CORE_KEY: stored}}
+        return None
+
+    monkeypatch.setattr(metrics_endpoint, "_get_session_metrics_from_redis", fake_redis)
+    persisted = asyncio.run(metrics_endpoint.get_session_waterfall(request, "session-stored", 20))
+    assert persisted["source"] == "redis"
+    assert persisted["turns"] == stored
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(metrics_endpoint.get_session_waterfall(request, "session-none", 20))
+    assert excinfo.value.status_code == 404
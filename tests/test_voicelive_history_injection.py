@@ -0,0 +1,98 @@
+"""
+Tests for VoiceLive conversation history injection on agent switch.
+
+Tests cover:
+- Long calls are trimmed to whole recent turns led by one summary item
+- The same transcript always injects the same items
+- Against the local VoiceLive stand-in, item count and switch-to-first-audio
+  time stay flat as the call grows
+"""
+
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import aiohttp
+from apps.artagent.backend.voice.shared.history_window import HistoryWindow, HistoryWindowConfig
+from apps.artagent.backend.voice.voicelive.orchestrator import LiveOrchestrator
+from azure.ai.voicelive.aio import VoiceLiveConnection
+
+from tests.load.offline.mock_voicelive import MockVoiceLive, MockVoiceLiveSettings
+
+WINDOW = HistoryWindowConfig(max_tokens=400, pinned_turns=2, summary_max_tokens=80)
+
+
+def _orchestrator(conn, turns: int) -> LiveOrchestrator:
+    orchestrator = LiveOrchestrator(
+        conn=conn,
+        agents={"Concierge": MagicMock()},
+        start_agent="Concierge",
+        messenger=MagicMock(),
+        call_connection_id="call-history",
+    )
+    orchestrator._history_window = HistoryWindow(WINDOW)
+    for i in range(turns):
+        orchestrator._conversation.append(
+            {"role": "user", "content": f"Question {i}: can you check claim number {1000 + i}?"}
+        )
+        orchestrator._conversation.append(
+            {"role": "assistant", "content": f"Claim {1000 + i} is open and under review."}
+        )
+    return orchestrator
+
+
+def _sent_items(conn) -> list[dict]:
+    return [call.kwargs["item"].as_dict() for call in conn.conversation.item.create.call_args_list]
+
+
+async def test_long_call_is_windowed_and_deterministic():
+    conn = MagicMock()
+    conn.conversation.item.create = AsyncMock()
+    orchestrator = _orchestrator(conn, 200)
+
+    await orchestrator._inject_conversation_history()
+    first = _sent_items(conn)
+    conn.conversation.item.create.reset_mock()
+    await orchestrator._inject_conversation_history()
+
+    assert _sent_items(conn) == first
+    assert len(first) < 40
+    assert first[0]["role"] == "system"
+    assert "Earlier in this call (summarized)" in first[0]["content"][0]["text"]
+    assert first[1]["role"] == "user"
+    assert first[-1]["content"][0]["text"] == "Claim 1199 is open and under review."
+
+    short = _orchestrator(conn, 2)
+    conn.conversation.item.create.reset_mock()
+    await short._inject_conversation_history()
+    assert [item["role"] for item in _sent_items(conn)] == ["user", "assistant"] * 2
+
+
+async def _switch_to_first_audio(mock: MockVoiceLive, url: str, turns: int) -> tuple[int, float]:
+    mock.reset()
+    async with aiohttp.ClientSession() as session:
+        ws = await session.ws_connect(url)
+        conn = VoiceLiveConnection(session, ws)
+        await conn.recv()  # session.created
+        orchestrator = _orchestrator(conn, turns)
+
+        started = time.perf_counter()
+        await orchestrator._inject_conversation_history()
+        await conn.response.create()
+        async for event in conn:
+            if event.type == "response.audio.delta":
+                break
+        elapsed = time.perf_counter() - started
+        await ws.close()
+    return len(mock.items), elapsed
+
+
+async def test_switch_to_first_audio_stays_flat_against_stand_in():
+    mock = MockVoiceLive(MockVoiceLiveSettings(item_ms=2, first_audio_ms=10))
+    async with mock.serve() as url:
+        mid_items, mid_s = await _switch_to_first_audio(mock, url, 40)
+        long_items, long_s = await _switch_to_first_audio(mock, url, 400)
+
+    assert mid_items == long_items
+    assert mock.responses == 1
+    # Sending all 800 items of the long call would take at least 1.6 s here
+    assert long_s < max(2 * mid_s, 0.5)
@@ -0,0 +1,92 @@
+"""
+Tests for diff-based, coalesced VoiceLive session updates.
+
+Tests cover:
+- Only changed fields are sent and no-op updates are skipped
+- Scheduled updates within the window are merged; apply folds them in
+- Agent switches reuse cached tool lists and resend only what changed
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from apps.artagent.backend.registries.agentstore.base import UnifiedAgent
+from apps.artagent.backend.voice.voicelive.session_config import SessionConfigManager
+from azure.ai.voicelive.models import AzureStandardVoice, FunctionTool, RequestSession
+
+
+def _conn():
+    conn = MagicMock()
+    conn.session.update = AsyncMock()
+    return conn
+
+
+def _sent(conn) -> list[dict]:
+    return [call.kwargs["session"].as_dict() for call in conn.session.update.call_args_list]
+
+
+async def test_only_changed_fields_are_sent():
+    conn = _conn()
+    manager = SessionConfigManager(conn)
+    voice = AzureStandardVoice(name="en-US-AvaNeural")
+
+    assert await manager.apply(RequestSession(instructions="A", voice=voice)) is True
+    assert await manager.apply(RequestSession(instructions="A", voice=voice)) is False
+    assert await manager.apply(RequestSession(instructions="B", voice=voice)) is True
+
+    assert _sent(conn) == [
+        {"instructions": "A", "voice": {"name": "en-US-AvaNeural", "type": "azure-standard"}},
+        {"instructions": "B"},
+    ]
+    assert manager.diff(RequestSession(instructions="B")) == {}
+    stats = manager.stats.to_dict()
+    assert (stats["sent"], stats["skipped"], stats["fields_sent"]) == (2, 1, 3)
+
+
+async def test_scheduled_updates_coalesce():
+    conn = _conn()
+    manager = SessionConfigManager(conn, coalesce_ms=20)
+
+    for text in ("one", "two", "three"):
+        manager.schedule(RequestSession(instructions=text))
+    await asyncio.sleep(0.06)
+
+    assert _sent(conn) == [{"instructions": "three"}]
+    assert manager.stats.coalesced == 2
+
+    manager.schedule(RequestSession(instructions="four", tool_choice="auto"))
+    await manager.apply(RequestSession(instructions="five"))
+    await asyncio.sleep(0.03)
+
+    assert _sent(conn)[1:] == [{"instructions": "five", "tool_choice": "auto"}]
+    assert conn.session.update.await_count == 2
+
+
+async def test_agent_switch_reuses_tools_and_resends_only_changes():
+    conn = _conn()
+    manager = SessionConfigManager(conn)
+    agent = UnifiedAgent(name="Concierge", prompt_template="Help {{ caller_name }}.")
+    builds = []
+
+    def build_tools(session_id=None):
+        builds.append(session_id)
+        return [FunctionTool(name="lookup", description="Look up", parameters={})]
+
+    agent._build_voicelive_tools_with_handoffs = build_tools
+
+    for caller in ("Ada", "Ada", "Grace"):
+        await agent.apply_voicelive_session(
+            conn, system_vars={"caller_name": caller}, session_id="s-1", session_config=manager
+        )
+
+    sent = _sent(conn)
+    assert len(builds) == 1 and manager.stats.tool_cache_hits == 2
+    assert len(sent) == 2
+    assert {"instructions", "tools", "voice"} <= set(sent[0])
+    assert sent[1] == {"instructions": "Help Grace."}
+
+    manager.invalidate_tools("Concierge")
+    await agent.apply_voicelive_session(
+        conn, system_vars={"caller_name": "Grace"}, session_id="s-1", session_config=manager
+    )
+    assert len(builds) == 2 and conn.session.update.await_count == 2
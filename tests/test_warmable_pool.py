@@ -10,13 +10,14 @@ Tests cover:
 - Metrics tracking
 - Lifecycle management (prepare/shutdown)
 - Edge cases and error handling
+- Arrival-rate estimation, event-driven refill and autoscaled warm targets
 """
 
 import asyncio
 
 import pytest
 from src.pools.on_demand_pool import AllocationTier
-from src.pools.warmable_pool import WarmableResourcePool
+from src.pools.warmable_pool import ArrivalRateEstimator, WarmableResourcePool
 
 
 class MockResource:
@@ -118,6 +119,45 @@ async def test_pool_shutdown():
     assert len(pool._session_cache) == 0
 
 
+@pytest.mark.asyncio
+async def test_shutdown_closes_warm_and_in_flight_resources():
+    """Shutdown closes queued warm resources and ones refills were still warming."""
+    created: list[MockResource] = []
+    closed: list[MockResource] = []
+
+    async def factory() -> MockResource:
+        resource = MockResource(f"r{len(created)}")
+        created.append(resource)
+        return resource
+
+    async def slow_warm_fn(resource: MockResource) -> bool:
+        if len(created) > 1:
+            await asyncio.sleep(10)  # Refills are still warming at shutdown
+        return True
+
+    async def close_fn(resource: MockResource) -> None:
+        closed.append(resource)
+
+    pool = WarmableResourcePool(
+        factory=factory,
+        name="test-pool",
+        warm_pool_size=1,
+        warm_fn=slow_warm_fn,
+        close_fn=close_fn,
+        refill_concurrency=2,
+    )
+    await pool.prepare()
+    pool._warm_pool_size = 3
+    assert pool._start_refills() == 2
+    await asyncio.sleep(0.01)
+
+    await pool.shutdown()
+
+    assert len(created) == 3
+    assert sorted(r.value for r in closed) == ["r0", "r1", "r2"]
+    assert not pool._refill_tasks
+
+
 # ---------- Acquire/Release Operations ----------
 
 
@@ -655,3 +695,137 @@ async def test_concurrent_session_acquires():
     assert tiers == {AllocationTier.DEDICATED}
 
     await pool.shutdown()
+
+
+# ---------- Autoscaling ----------
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_arrival_rate_estimator_tracks_bursts_and_decays():
+    clock = FakeClock()
+    estimator = ArrivalRateEstimator(bucket_sec=1.0, alpha=0.5, beta=0.3, clock=clock)
+
+    for second in range(3):
+        clock.now = second + 0.5
+        estimator.record(10)
+    clock.now = 3.0
+    busy = estimator.rate()
+    clock.now = 13.0
+    idle = estimator.rate()
+
+    assert 6.0 < busy <= 12.0
+    assert idle < 1.0
+    # The bucket in progress counts before it closes
+    estimator.record(5)
+    clock.now = 13.5
+    assert estimator.rate() >= 10.0
+
+
+@pytest.mark.asyncio
+async def test_acquire_triggers_refill_without_waiting_for_interval():
+    pool = WarmableResourcePool(
+        factory=mock_factory,
+        name="test-pool",
+        warm_pool_size=2,
+        enable_background_warmup=True,
+        warmup_interval_sec=60.0,
+    )
+    await pool.prepare()
+
+    await pool.acquire()
+    await pool.acquire()
+    await asyncio.sleep(0.05)
+
+    assert pool._warm_queue.qsize() == 2
+    assert pool._metrics.refills_triggered >= 1
+
+    await pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_autoscale_grows_target_under_load_and_trims_when_idle():
+    async def slow_factory() -> MockResource:
+        await asyncio.sleep(0.02)
+        return MockResource("slow")
+
+    closed: list[MockResource] = []
+
+    async def close_fn(resource: MockResource) -> None:
+        closed.append(resource)
+
+    pool = WarmableResourcePool(
+        factory=slow_factory,
+        name="test-pool",
+        warm_pool_size=1,
+        enable_background_warmup=True,
+        warmup_interval_sec=0.05,
+        close_fn=close_fn,
+        autoscale=True,
+        max_warm_size=6,
+        refill_concurrency=4,
+    )
+    clock = FakeClock()
+    pool._arrivals = ArrivalRateEstimator(clock=clock)
+    await pool.prepare()
+
+    # 100 acquires/s predicted with 20 ms creation -> target above the floor
+    pool._arrivals.record(100)
+    clock.now = 1.0
+    await pool.acquire()
+    await asyncio.sleep(0.15)
+
+    assert pool._warm_pool_size > 1
+    assert pool._warm_queue.qsize() == pool._warm_pool_size
+    assert pool.snapshot()["metrics"]["warm_pool_target"] == pool._warm_pool_size
+
+    # Traffic stops: target falls back to the floor and extras are dropped
+    clock.now = 100.0
+    await asyncio.sleep(0.15)
+
+    assert pool._warm_pool_size == 1
+    assert pool._warm_queue.qsize() == 1
+    assert pool._metrics.resources_trimmed >= 1
+    # Trimmed resources are closed, not just dropped
+    assert len(closed) == pool._metrics.resources_trimmed
+
+    await pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_tiers_and_acquire_latency_recorded():
+    pool = WarmableResourcePool(
+        factory=mock_factory,
+        name="test-pool",
+        warm_pool_size=1,
+        session_awareness=True,
+    )
+    await pool.prepare()
+
+    _, first = await pool.acquire_for_session("session-1")
+    _, cached = await pool.acquire_for_session("session-1")
+    _, second = await pool.acquire_for_session("session-2")
+    _, unbound = await pool.acquire_for_session(None)
+
+    assert (first, cached, second, unbound) == (
+        AllocationTier.WARM,
+        AllocationTier.DEDICATED,
+        AllocationTier.COLD,
+        AllocationTier.COLD,
+    )
+    metrics = pool.snapshot()["metrics"]
+    assert {tier: s["count"] for tier, s in metrics["acquire_latency_ms"].items()} == {
+        "warm": 1,
+        "dedicated": 1,
+        "cold": 2,
+    }
+    assert metrics["recent_cold_fraction"] == 0.5
+    assert metrics["resource_create_ms"] > 0
+
+    await pool.shutdown()
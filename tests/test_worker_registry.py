@@ -0,0 +1,257 @@
+"""
+Tests for multi-process worker mode.
+
+Tests cover:
+- Workers heartbeat into a per-host registry; stopped workers drop out
+- The first worker to claim a call owns it; claims of stopped workers are taken over
+- Only the owner releases a claim
+- Concurrent takeovers of a stopped owner agree on one winner
+- Callbacks for a call owned by another worker are forwarded to it
+- Callbacks fall back to local handling when the owner is unreachable
+- Hand-off HTTP clients are closed on shutdown
+"""
+
+import json
+import time
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from apps.artagent.backend.src.utils.worker_affinity import (
+    FORWARDED_HEADER,
+    WorkerAffinityMiddleware,
+    close_forward_clients,
+)
+from opentelemetry import trace
+from src.pools.worker_registry import (
+    _RELEASE_SCRIPT,
+    _TAKEOVER_SCRIPT,
+    WorkerIdentity,
+    WorkerRegistry,
+)
+from src.redis.manager import AzureRedisManager
+from utils.ml_logging import get_logger
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values: dict[str, str] = {}
+        self.zsets: dict[str, dict[str, float]] = {}
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.values:
+            return None
+        self.values[key] = value
+        return True
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def mget(self, keys):
+        return [self.values.get(key) for key in keys]
+
+    def delete(self, key):
+        return int(self.values.pop(key, None) is not None)
+
+    def zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update(mapping)
+
+    def zrem(self, key, member):
+        self.zsets.get(key, {}).pop(member, None)
+
+    def zremrangebyscore(self, key, low, high):
+        cutoff = float(str(high).lstrip("("))
+        zset = self.zsets.get(key, {})
+        self.zsets[key] = {k: v for k, v in zset.items() if v >= cutoff}
+
+    def zrangebyscore(self, key, low, high):
+        return [k for k, v in self.zsets.get(key, {}).items() if v >= float(low)]
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def eval(self, script, numkeys, key, *args):
+        # Python equivalents of the registry's Lua scripts (atomic here too)
+        current = self.values.get(key)
+        if script == _TAKEOVER_SCRIPT:
+            expected, owner, ttl = args
+            if current is None or current == expected:
+                self.values[key] = owner
+                return owner
+            return current
+        if script == _RELEASE_SCRIPT:
+            return self.delete(key) if current == args[0] else 0
+        raise NotImplementedError(script)
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self._client = client
+        self._calls = []
+
+    def __getattr__(self, name):
+        return lambda *a, **kw: self._calls.append((name, a, kw))
+
+    def execute(self):
+        return [getattr(self._client, name)(*a, **kw) for name, a, kw in self._calls]
+
+
+def _manager(client) -> AzureRedisManager:
+    manager = AzureRedisManager.__new__(AzureRedisManager)
+    manager.redis_client = client
+    manager.logger = get_logger("tests.worker_registry")
+    manager.tracer = trace.get_tracer(__name__)
+    manager.host = "localhost"
+    manager.port = 6379
+    return manager
+
+
+def _registry(manager, index: int) -> WorkerRegistry:
+    identity = WorkerIdentity(
+        worker_id=f"host-a:{index}:{100 + index}",
+        host="host-a",
+        index=index,
+        pid=100 + index,
+        internal_url=f"http://127.0.0.1:{18080 + index}",
+    )
+    return WorkerRegistry(manager, identity, heartbeat_ttl_s=15)
+
+
+@pytest.fixture
+def workers():
+    manager = _manager(FakeRedis())
+    registries = [_registry(manager, 0), _registry(manager, 1)]
+    for registry in registries:
+        registry.heartbeat({"pools": {"tts_pool": {"name": "speech-tts", "ready": True}}})
+    return registries
+
+
+def test_heartbeats_list_live_workers(workers):
+    now = time.time()
+    workers[1].heartbeat(now=now - 60)  # stopped heartbeating a minute ago
+
+    live = workers[0].workers(now=now)
+
+    assert [info["worker_id"] for info in live] == [workers[0].worker_id]
+    assert live[0]["status"]["pools"]["tts_pool"]["ready"] is True
+
+
+def test_first_claim_wins_and_stopped_owner_is_taken_over(workers):
+    first, second = workers
+
+    assert first.claim("call", "call-1") == first.identity
+    assert second.claim("call", "call-1") == first.identity
+    assert second.owner("call", "call-1") == first.identity
+
+    first.deregister()
+
+    assert second.claim("call", "call-1") == second.identity
+    assert first.owner("call", "call-1") == second.identity
+
+
+def test_only_owner_releases_claim(workers):
+    first, second = workers
+    first.claim("call", "call-2")
+
+    second.release("call", "call-2")
+    assert second.owner("call", "call-2") == first.identity
+
+    first.release("call", "call-2")
+    assert second.owner("call", "call-2") is None
+
+
+def test_concurrent_takeover_has_one_winner(workers):
+    first, second = workers
+    manager = second._mgr
+    third = _registry(manager, 2)
+    third.heartbeat()
+    first.claim("call", "call-6")
+    first.deregister()
+
+    # ``third`` takes over between ``second`` seeing the stopped owner and its own takeover
+    worker_info = second.worker_info
+
+    def racing_worker_info(worker_id):
+        if worker_id == first.worker_id:
+            assert third.claim("call", "call-6") == third.identity
+        return worker_info(worker_id)
+
+    second.worker_info = racing_worker_info
+
+    assert second.claim("call", "call-6") == third.identity
+    assert first.owner("call", "call-6") == third.identity
+
+
+def _callback_client(registry, owner_handler):
+    async def local_app(scope, receive, send):
+        message = await receive()
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"local:" + message["body"]})
+
+    middleware = WorkerAffinityMiddleware(local_app, http_paths=("/api/v1/calls/callbacks",))
+    middleware._client = httpx.AsyncClient(transport=httpx.MockTransport(owner_handler))
+    app_holder = SimpleNamespace(state=SimpleNamespace(worker_registry=registry))
+
+    async def entry(scope, receive, send):
+        scope["app"] = app_holder
+        await middleware(scope, receive, send)
+
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=entry), base_url="http://test")
+
+
+async def test_callback_forwarded_to_owning_worker(workers):
+    owner, receiver = workers
+    owner.claim("call", "call-3")
+    forwarded = []
+
+    def owner_handler(request: httpx.Request) -> httpx.Response:
+        forwarded.append(request)
+        return httpx.Response(202, json={"handled_by": "owner"})
+
+    body = json.dumps([{"type": "CallConnected", "data": {"callConnectionId": "call-3"}}])
+    async with _callback_client(receiver, owner_handler) as client:
+        response = await client.post("/api/v1/calls/callbacks", content=body)
+        own = await client.post(
+            "/api/v1/calls/callbacks",
+            content=json.dumps([{"data": {"callConnectionId": "call-4"}}]),
+        )
+
+    assert response.status_code == 202
+    assert response.json() == {"handled_by": "owner"}
+    assert [str(r.url) for r in forwarded] == [
+        f"{owner.identity.internal_url}/api/v1/calls/callbacks"
+    ]
+    assert forwarded[0].headers[FORWARDED_HEADER] == "1"
+    assert forwarded[0].content == body.encode()
+    # An unowned call is claimed and served by the receiving worker
+    assert own.text.startswith("local:")
+    assert receiver.owner("call", "call-4") == receiver.identity
+
+
+async def test_callback_served_locally_when_owner_unreachable(workers):
+    owner, receiver = workers
+    owner.claim("call", "call-5")
+
+    def owner_handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("connection refused", request=request)
+
+    body = json.dumps({"data": {"callConnectionId": "call-5"}})
+    async with _callback_client(receiver, owner_handler) as client:
+        response = await client.post("/api/v1/calls/callbacks", content=body)
+
+    assert response.status_code == 200
+    assert response.text == f"local:{body}"
+
+
+async def test_forward_clients_closed_on_shutdown():
+    async def local_app(scope, receive, send):
+        pass
+
+    middleware = WorkerAffinityMiddleware(local_app, http_paths=("/api/v1/calls/callbacks",))
+    client = httpx.AsyncClient(transport=httpx.MockTransport(lambda r: httpx.Response(200)))
+    middleware._client = client
+
+    await close_forward_clients()
+
+    assert client.is_closed
+    assert middleware._client is None
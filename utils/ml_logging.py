@@ -1,9 +1,14 @@
+import atexit
 import functools
 import json
 import logging
 import os
+import queue
+import threading
 import time
+from collections import Counter
 from collections.abc import Callable
+from logging.handlers import QueueHandler, QueueListener
 
 from colorama import Fore, Style
 from colorama import init as colorama_init
@@ -21,6 +26,7 @@ except Exception:
 _telemetry_disabled = os.getenv("DISABLE_CLOUD_TELEMETRY", "false").lower() == "true"
 
 if not _telemetry_disabled:
+    from opentelemetry import context as otel_context
     from opentelemetry import trace
 
     from utils.telemetry_config import (
@@ -29,6 +35,7 @@ if not _telemetry_disabled:
     )
 else:
     # Mock objects when telemetry is disabled
+    otel_context = None
     trace = None
     setup_azure_monitor = lambda *args, **kwargs: None
     is_azure_monitor_configured = lambda: False
@@ -47,6 +54,19 @@ def keyinfo(self: logging.Logger, message, *args, **kws):
 
 logging.Logger.keyinfo = keyinfo
 
+# Background log pipeline: handlers run on one listener thread behind a bounded queue
+LOG_QUEUE_ENABLED = os.getenv("LOG_QUEUE_ENABLED", "true").lower() in {"1", "true", "yes", "on"}
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+
+# Record attributes copied into JSON logs (set by TraceLogFilter or passed as extra=)
+_CUSTOM_ATTR_PREFIXES = ("call_", "session_", "agent_", "model_", "operation_")
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_custom_attr(name: str) -> bool:
+    """Allowlist check, computed once per attribute name."""
+    return name.startswith(_CUSTOM_ATTR_PREFIXES)
+
 
 class JsonFormatter(logging.Formatter):
     """JSON formatter with optional PII scrubbing for structured logging."""
@@ -99,12 +119,11 @@ class JsonFormatter(logging.Formatter):
         }
 
         # Add any custom span attributes as additional fields
-        for attr_name in dir(record):
-            if attr_name.startswith(("call_", "session_", "agent_", "model_", "operation_")):
-                value = getattr(record, attr_name)
-                # Scrub PII from custom attributes
-                if self._pii_scrubber and isinstance(value, str):
-                    value = self._scrub(value)
+        for attr_name, value in list(record.__dict__.items()):
+            if _is_custom_attr(attr_name):
+                # Scrub PII from custom attributes (strings and nested dicts/lists)
+                if self._pii_scrubber:
+                    value = self._pii_scrubber.scrub_value(value)
                 log_record[attr_name] = value
 
         return json.dumps(log_record)
@@ -321,6 +340,169 @@ class TraceLogFilter(logging.Filter):
         return True
 
 
+class DroppingLogQueue(queue.Queue):
+    """
+    Bounded record queue that never blocks the logging caller.
+
+    When full, the oldest queued DEBUG record is evicted to make room (and
+    then INFO, for WARNING and above); a record that cannot displace a less
+    severe one is dropped. Dropped records are counted per level.
+    """
+
+    def __init__(self, maxsize: int = LOG_QUEUE_SIZE):
+        super().__init__(maxsize)
+        self.dropped: Counter[str] = Counter()
+        # Queued records per level, so a full queue only scans when it can evict
+        self._levels: Counter[int] = Counter()
+
+    def put(self, item, block: bool = False, timeout: float | None = None) -> None:
+        with self.mutex:
+            # The listener's stop sentinel (None) is always accepted
+            if item is not None and 0 < self.maxsize <= self._qsize():
+                record = item[1]
+                if not self._evict_below(record.levelno):
+                    self.dropped[record.levelname] += 1
+                    return
+                self._put(item)
+            else:
+                self._put(item)
+                self.unfinished_tasks += 1
+            self.not_empty.notify()
+
+    def put_nowait(self, item) -> None:
+        self.put(item, block=False)
+
+    def _put(self, item) -> None:
+        if item is not None:
+            self._levels[item[1].levelno] += 1
+        self.queue.append(item)
+
+    def _get(self):
+        item = self.queue.popleft()
+        if item is not None:
+            self._levels[item[1].levelno] -= 1
+        return item
+
+    def _evict_below(self, levelno: int) -> bool:
+        for threshold in (logging.DEBUG, logging.INFO):
+            if threshold >= levelno:
+                return False
+            if not any(count for level, count in self._levels.items() if level <= threshold):
+                continue
+            for index, item in enumerate(self.queue):
+                if item is not None and item[1].levelno <= threshold:
+                    del self.queue[index]
+                    self._levels[item[1].levelno] -= 1
+                    self.dropped[item[1].levelname] += 1
+                    return True
+        return False
+
+
+class LogQueueHandler(QueueHandler):
+    """
+    Hands records to the background log thread, where ``targets`` handle them.
+
+    Only the message is rendered on the calling thread (its arguments may
+    change once the call returns); formatting, PII scrubbing and export run
+    on the listener. The caller's OpenTelemetry context travels with the
+    record so exporters still correlate logs with the active span.
+    """
+
+    def __init__(self, targets: list[logging.Handler], log_queue: queue.Queue | None = None):
+        super().__init__(start_log_queue() if log_queue is None else log_queue)
+        self.targets = tuple(targets)
+
+    def prepare(self, record: logging.LogRecord):
+        if record.args or not isinstance(record.msg, str):
+            record.msg = record.getMessage()
+            record.args = None
+        ctx = otel_context.get_current() if otel_context is not None else None
+        return (self.targets, record, ctx)
+
+
+class _LogListener(QueueListener):
+    def handle(self, item) -> None:
+        targets, record, ctx = item
+        token = otel_context.attach(ctx) if ctx is not None else None
+        try:
+            for handler in targets:
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+        finally:
+            if token is not None:
+                otel_context.detach(token)
+
+
+_LOG_QUEUE: DroppingLogQueue | None = None
+_LOG_LISTENER: _LogListener | None = None
+_LOG_QUEUE_LOCK = threading.Lock()
+_CONSOLE_QUEUE_HANDLERS: dict[bool, LogQueueHandler] = {}
+
+
+def start_log_queue() -> DroppingLogQueue:
+    """Start the background log thread (idempotent) and return its queue."""
+    global _LOG_QUEUE, _LOG_LISTENER
+    with _LOG_QUEUE_LOCK:
+        if _LOG_QUEUE is None:
+            _LOG_QUEUE = DroppingLogQueue(LOG_QUEUE_SIZE)
+        if _LOG_LISTENER is None:
+            _LOG_LISTENER = _LogListener(_LOG_QUEUE)
+            _LOG_LISTENER.start()
+            atexit.register(stop_log_queue)
+        return _LOG_QUEUE
+
+
+def stop_log_queue() -> None:
+    """Drain queued records through their handlers and stop the log thread."""
+    global _LOG_LISTENER
+    with _LOG_QUEUE_LOCK:
+        listener, _LOG_LISTENER = _LOG_LISTENER, None
+    if listener is not None:
+        listener.stop()
+
+
+def log_queue_stats() -> dict[str, object]:
+    """Queue depth, capacity and records dropped per level."""
+    if _LOG_QUEUE is None:
+        return {"queued": 0, "capacity": LOG_QUEUE_SIZE, "dropped": {}}
+    return {
+        "queued": _LOG_QUEUE.qsize(),
+        "capacity": _LOG_QUEUE.maxsize,
+        "dropped": dict(_LOG_QUEUE.dropped),
+    }
+
+
+def _console_queue_handler(is_production: bool) -> LogQueueHandler:
+    handler = _CONSOLE_QUEUE_HANDLERS.get(is_production)
+    if handler is None:
+        sh = logging.StreamHandler()
+        sh.setFormatter(JsonFormatter() if is_production else PrettyFormatter())
+        sh.addFilter(WebSocketNoiseFilter())
+        handler = _CONSOLE_QUEUE_HANDLERS.setdefault(is_production, LogQueueHandler([sh]))
+    return handler
+
+
+def queue_root_handlers() -> None:
+    """
+    Move the root logger's handlers (the Azure Monitor exporter) to the log thread.
+
+    Call after ``setup_azure_monitor()``. PII is scrubbed on the log thread
+    before export.
+    """
+    if not LOG_QUEUE_ENABLED:
+        return
+    root = logging.getLogger()
+    targets = [h for h in root.handlers if not isinstance(h, LogQueueHandler)]
+    if not targets:
+        return
+    for handler in targets:
+        root.removeHandler(handler)
+        handler.addFilter(PIIScrubbingFilter())
+    root.addHandler(LogQueueHandler(targets))
+    # Registered after the exporter's own exit hook, so the queue drains first
+    atexit.register(stop_log_queue)
+
+
 def set_span_correlation_attributes(
     call_connection_id: str | None = None,
     session_id: str | None = None,
@@ -451,15 +633,18 @@ def get_logger(
     if not has_noise_filter:
         logger.addFilter(WebSocketNoiseFilter())
 
-    # Add StreamHandler for console output (not for Azure Monitor)
+    # Add console output (not for Azure Monitor), formatted on the log thread
     if include_stream_handler and not any(
-        isinstance(h, logging.StreamHandler) for h in logger.handlers
+        isinstance(h, (logging.StreamHandler, LogQueueHandler)) for h in logger.handlers
     ):
-        sh = logging.StreamHandler()
-        sh.setFormatter(JsonFormatter() if is_production else PrettyFormatter())
-        sh.addFilter(TraceLogFilter())
-        sh.addFilter(WebSocketNoiseFilter())
-        logger.addHandler(sh)
+        if LOG_QUEUE_ENABLED:
+            logger.addHandler(_console_queue_handler(is_production))
+        else:
+            sh = logging.StreamHandler()
+            sh.setFormatter(JsonFormatter() if is_production else PrettyFormatter())
+            sh.addFilter(TraceLogFilter())
+            sh.addFilter(WebSocketNoiseFilter())
+            logger.addHandler(sh)
 
     return logger
 
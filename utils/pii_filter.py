@@ -19,6 +19,14 @@ Configuration via environment variables:
 - TELEMETRY_PII_SCRUB_CREDIT_CARDS: Scrub credit card numbers (default: true)
 - TELEMETRY_PII_SCRUB_IP_ADDRESSES: Scrub IP addresses (default: false)
 - TELEMETRY_PII_CUSTOM_PATTERNS: JSON array of custom regex patterns to scrub
+- TELEMETRY_PII_CACHE_SIZE: Scrub results cached for repeated strings (default: 4096, 0 disables)
+
+Most text reaching the scrubber contains no PII, so clean text is rejected
+before any redaction pattern runs: a character-class scan for the characters
+the enabled patterns need (digits, ``@``), then a single compiled alternation
+of every pattern that can be anchored on them. Text the alternation matches
+goes through the patterns one after another, exactly as configured, so the
+redacted output is the same as applying each pattern in turn.
 """
 
 from __future__ import annotations
@@ -28,6 +36,7 @@ import logging
 import os
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from re import Pattern
 from typing import Any
 
@@ -38,43 +47,52 @@ logger = logging.getLogger(__name__)
 # ═══════════════════════════════════════════════════════════════════════════════
 
 # Pre-compiled patterns for common PII types
-# Each tuple: (pattern, replacement, description)
-_PII_PATTERNS: list[tuple[Pattern[str], str, str]] = [
+# Each tuple: (pattern, replacement, description, trigger). The trigger is a
+# character every match contains; for r"\d" the pattern also matches starting
+# at a digit whenever it matches at all (leading separators are optional), so
+# the detector only tries digit positions.
+_PII_PATTERNS: list[tuple[Pattern[str], str, str, str]] = [
     # Phone numbers (US formats: +1-xxx-xxx-xxxx, (xxx) xxx-xxxx, xxx-xxx-xxxx, etc.)
     (
         re.compile(r"\+?1?[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b"),
         "[PHONE_REDACTED]",
         "phone_number",
+        r"\d",
     ),
     # Email addresses
     (
         re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"),
         "[EMAIL_REDACTED]",
         "email",
+        "@",
     ),
     # US Social Security Numbers (xxx-xx-xxxx)
     (
         re.compile(r"\b\d{3}-\d{2}-\d{4}\b"),
         "[SSN_REDACTED]",
         "ssn",
+        r"\d",
     ),
     # Credit card numbers (13-19 digits, with optional separators)
     (
         re.compile(r"\b(?:\d{4}[-\s]?){3,4}\d{1,4}\b"),
         "[CARD_REDACTED]",
         "credit_card",
+        r"\d",
     ),
     # IPv4 addresses
     (
         re.compile(r"\b(?:\d{1,3}\.){3}\d{1,3}\b"),
         "[IP_REDACTED]",
         "ip_address",
+        r"\d",
     ),
     # IPv6 addresses (simplified pattern)
     (
         re.compile(r"\b(?:[0-9a-fA-F]{1,4}:){7}[0-9a-fA-F]{1,4}\b"),
         "[IP_REDACTED]",
         "ip_address",
+        ":",
     ),
 ]
 
@@ -137,6 +155,7 @@ class PIIScrubberConfig:
     scrub_credit_cards: bool = True
     scrub_ip_addresses: bool = False  # Disabled by default (may be needed for debugging)
     custom_patterns: list[tuple[Pattern[str], str]] = field(default_factory=list)
+    cache_size: int = 4096  # Scrub results kept for repeated strings (0 disables)
 
     @classmethod
     def from_env(cls) -> PIIScrubberConfig:
@@ -154,6 +173,11 @@ class PIIScrubberConfig:
             scrub_ip_addresses=_bool_env("TELEMETRY_PII_SCRUB_IP_ADDRESSES", False),
         )
 
+        try:
+            config.cache_size = max(0, int(os.getenv("TELEMETRY_PII_CACHE_SIZE", "4096")))
+        except ValueError:
+            logger.warning("Invalid TELEMETRY_PII_CACHE_SIZE; using the default")
+
         # Load custom patterns from JSON environment variable
         custom_patterns_json = os.getenv("TELEMETRY_PII_CUSTOM_PATTERNS")
         if custom_patterns_json:
@@ -170,6 +194,22 @@ class PIIScrubberConfig:
         return config
 
 
+# Strings longer than this are scrubbed without caching (mostly unique payloads)
+_CACHE_MAX_CHARS = 1024
+# Containers nested deeper than this are redacted rather than walked
+_MAX_DEPTH = 16
+
+
+@lru_cache(maxsize=4096)
+def _attribute_policy(name_lower: str) -> str | None:
+    """How an attribute is treated by name: "redact", "pii" or None, computed once per name."""
+    if any(redact_name in name_lower for redact_name in REDACT_ATTRIBUTE_NAMES):
+        return "redact"
+    if any(pii_name in name_lower or name_lower in pii_name for pii_name in PII_ATTRIBUTE_NAMES):
+        return "pii"
+    return None
+
+
 class PIIScrubber:
     """
     Scrubs PII from strings, dictionaries, and telemetry attributes.
@@ -180,13 +220,18 @@ class PIIScrubber:
     def __init__(self, config: PIIScrubberConfig | None = None):
         self.config = config or PIIScrubberConfig.from_env()
         self._active_patterns = self._build_active_patterns()
+        self._prefilter, self._detector, self._contains = self._build_detector()
+        self._scrub_cached = (
+            lru_cache(maxsize=self.config.cache_size)(self._scrub)
+            if self.config.cache_size > 0
+            else None
+        )
 
-    def _build_active_patterns(self) -> list[tuple[Pattern[str], str]]:
-        """Build list of active patterns based on configuration."""
+    def _enabled_builtin_patterns(self) -> list[tuple[Pattern[str], str, str]]:
+        """Enabled built-in patterns as (pattern, replacement, trigger)."""
         if not self.config.enabled:
             return []
 
-        patterns = []
         pattern_flags = {
             "phone_number": self.config.scrub_phone_numbers,
             "email": self.config.scrub_emails,
@@ -194,16 +239,80 @@ class PIIScrubber:
             "credit_card": self.config.scrub_credit_cards,
             "ip_address": self.config.scrub_ip_addresses,
         }
+        return [
+            (pattern, replacement, trigger)
+            for pattern, replacement, pii_type, trigger in _PII_PATTERNS
+            if pattern_flags.get(pii_type, True)
+        ]
 
-        for pattern, replacement, pii_type in _PII_PATTERNS:
-            if pattern_flags.get(pii_type, True):
-                patterns.append((pattern, replacement))
+    def _build_active_patterns(self) -> list[tuple[Pattern[str], str]]:
+        """Build list of active patterns based on configuration."""
+        if not self.config.enabled:
+            return []
+
+        patterns = [
+            (pattern, replacement) for pattern, replacement, _ in self._enabled_builtin_patterns()
+        ]
 
         # Add custom patterns
         patterns.extend(self.config.custom_patterns)
 
         return patterns
 
+    def _build_detector(self) -> tuple[Pattern[str] | None, Pattern[str] | None, tuple[str, ...]]:
+        """
+        Compile the clean-text rejection stages.
+
+        Returns the trigger character class (None when a custom pattern has no
+        known trigger), one alternation of every pattern that can be searched
+        in a single scan, and the characters whose presence alone sends text
+        through the patterns ("@": the email pattern cannot be anchored
+        cheaply). Custom patterns with groups or flags of their own cannot be
+        combined safely, so their presence disables both stages.
+        """
+        if not self._active_patterns:
+            return None, None, ()
+
+        builtins = self._enabled_builtin_patterns()
+        custom = [pattern for pattern, _ in self.config.custom_patterns]
+        default_flags = re.compile("").flags
+        if any(p.groups or p.flags != default_flags for p in custom):
+            return None, None, ()
+
+        alternatives = []
+        digit_led = [p.pattern for p, _, trigger in builtins if trigger == r"\d"]
+        if digit_led:
+            # Only digit positions need to be tried
+            alternatives.append(r"(?=\d)(?:" + "|".join(digit_led) + ")")
+        alternatives.extend(p.pattern for p, _, trigger in builtins if trigger == ":")
+        alternatives.extend(p.pattern for p in custom)
+        contains = tuple(sorted({trigger for _, _, trigger in builtins if trigger == "@"}))
+
+        prefilter = None
+        if not custom:
+            triggers = sorted({trigger for _, _, trigger in builtins})
+            prefilter = re.compile("[" + "".join(triggers) + "]")
+        detector = re.compile("|".join(alternatives)) if alternatives else None
+        return prefilter, detector, contains
+
+    def _scrub_sequential(self, value: str) -> str:
+        """Apply every active pattern in turn (the reference redaction)."""
+        result = value
+        for pattern, replacement in self._active_patterns:
+            result = pattern.sub(replacement, result)
+        return result
+
+    def _scrub(self, value: str) -> str:
+        if self._prefilter is not None and not self._prefilter.search(value):
+            return value
+        if self._detector is not None or self._contains:
+            if not any(char in value for char in self._contains) and (
+                self._detector is None or not self._detector.search(value)
+            ):
+                # No pattern matches the input, so applying them in turn changes nothing
+                return value
+        return self._scrub_sequential(value)
+
     def scrub_string(self, value: str) -> str:
         """
         Scrub PII from a string value.
@@ -217,13 +326,31 @@ class PIIScrubber:
         if not self.config.enabled or not value:
             return value
 
-        result = value
-        for pattern, replacement in self._active_patterns:
-            result = pattern.sub(replacement, result)
+        if self._scrub_cached is not None and len(value) <= _CACHE_MAX_CHARS:
+            return self._scrub_cached(value)
+        return self._scrub(value)
 
-        return result
+    def scrub_value(self, value: Any, _depth: int = 0) -> Any:
+        """
+        Scrub PII from a string or a nested structure of dicts, lists and tuples.
+
+        Dictionaries are scrubbed key by key as in ``scrub_dict``; other values
+        are returned unchanged. Nothing is serialized along the way.
+        """
+        if not self.config.enabled:
+            return value
+        if isinstance(value, str):
+            return self.scrub_string(value)
+        if isinstance(value, dict | list | tuple):
+            if _depth >= _MAX_DEPTH:
+                return "[REDACTED]"
+            if isinstance(value, dict):
+                return self._scrub_mapping(value, _depth + 1)
+            items = [self.scrub_value(item, _depth + 1) for item in value]
+            return items if isinstance(value, list) else tuple(items)
+        return value
 
-    def scrub_attribute_value(self, name: str, value: Any) -> Any:
+    def scrub_attribute_value(self, name: str, value: Any, _depth: int = 0) -> Any:
         """
         Scrub PII from an attribute value based on the attribute name.
 
@@ -237,29 +364,32 @@ class PIIScrubber:
         if not self.config.enabled:
             return value
 
-        name_lower = name.lower()
+        policy = _attribute_policy(name.lower())
 
         # Completely redact sensitive attribute names
-        for redact_name in REDACT_ATTRIBUTE_NAMES:
-            if redact_name in name_lower:
-                return "[REDACTED]"
+        if policy == "redact":
+            return "[REDACTED]"
 
         # Scrub known PII attribute names
-        for pii_name in PII_ATTRIBUTE_NAMES:
-            if pii_name in name_lower or name_lower in pii_name:
-                if isinstance(value, str):
-                    return self.scrub_string(value)
-                return "[REDACTED]"
-
-        # For other string values, apply pattern-based scrubbing
-        if isinstance(value, str):
-            return self.scrub_string(value)
-
-        return value
+        if policy == "pii":
+            if isinstance(value, str):
+                return self.scrub_string(value)
+            return "[REDACTED]"
+
+        # Apply pattern-based scrubbing to strings and nested containers
+        return self.scrub_value(value, _depth)
+
+    def _scrub_mapping(self, data: dict[Any, Any], depth: int) -> dict[Any, Any]:
+        return {
+            key: self.scrub_attribute_value(key, value, depth)
+            if isinstance(key, str)
+            else self.scrub_value(value, depth)
+            for key, value in data.items()
+        }
 
     def scrub_dict(self, data: dict[str, Any]) -> dict[str, Any]:
         """
-        Scrub PII from all values in a dictionary.
+        Scrub PII from all values in a dictionary, including nested ones.
 
         Args:
             data: Dictionary with potentially sensitive values
@@ -270,7 +400,7 @@ class PIIScrubber:
         if not self.config.enabled:
             return data
 
-        return {key: self.scrub_attribute_value(key, value) for key, value in data.items()}
+        return self._scrub_mapping(data, 0)
 
 
 # Module-level singleton for convenience
@@ -293,3 +423,8 @@ def scrub_pii(value: str) -> str:
 def scrub_attributes(attributes: dict[str, Any]) -> dict[str, Any]:
     """Convenience function to scrub PII from a dictionary of attributes."""
     return get_pii_scrubber().scrub_dict(attributes)
+
+
+def scrub_value(value: Any) -> Any:
+    """Convenience function to scrub PII from a string or nested dicts and lists."""
+    return get_pii_scrubber().scrub_value(value)
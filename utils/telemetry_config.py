@@ -13,6 +13,12 @@ Configuration via environment variables:
 - DISABLE_CLOUD_TELEMETRY: Set to "true" to disable all cloud telemetry
 - AZURE_MONITOR_DISABLE_LIVE_METRICS: Disable live metrics stream (auto-disabled for local dev)
 - TELEMETRY_PII_SCRUBBING_ENABLED: Enable PII scrubbing (default: true)
+- TELEMETRY_SPAN_RATE_PER_NAME: Spans of one name exported per second (default: 10);
+  turn-level, error and slow spans are always exported
+- TELEMETRY_SLOW_SPAN_MS: Spans and turns at least this slow are always exported, and
+  a slow turn brings back the spans held back during it (default: 2000)
+- TELEMETRY_TAIL_BUFFER_SPANS / TELEMETRY_TAIL_BUFFER_TRACES: Held-back spans kept
+  per trace (default: 64) and traces tracked (default: 256)
 
 See utils/pii_filter.py for PII scrubbing configuration options.
 """
@@ -23,9 +29,16 @@ import logging
 import os
 import re
 import socket
+import threading
+import time
 import uuid
 import warnings
+from collections import Counter, OrderedDict, deque
+from functools import lru_cache
 from re import Pattern
+from typing import Any
+
+from opentelemetry.trace import StatusCode
 
 # Suppress OpenTelemetry deprecation warnings
 warnings.filterwarnings(
@@ -116,6 +129,221 @@ NOISY_SPAN_PATTERNS: list[Pattern[str]] = [
 ]
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# ADAPTIVE SPAN SAMPLING
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# Turn-level spans: always exported, and the trigger for tail retention
+TURN_SPAN_PATTERNS: list[Pattern[str]] = [
+    re.compile(r"^(voice|voicelive|conversation)\.turn\."),
+    re.compile(r"^cascade\.process_turn$"),
+    re.compile(r"^unified_orchestrator\.route_turn$"),
+    re.compile(r"^(invoke_agent|execute_tool) "),
+    re.compile(r"^voicelive\.response\.events$"),
+]
+
+# Spans of one name exported per second before the rest are held back
+SPAN_RATE_PER_NAME = int(os.getenv("TELEMETRY_SPAN_RATE_PER_NAME", "10"))
+# Spans and turns at least this slow are always exported
+SLOW_SPAN_MS = float(os.getenv("TELEMETRY_SLOW_SPAN_MS", "2000"))
+# Held-back spans kept per trace, and traces tracked, for tail retention
+TAIL_BUFFER_SPANS = int(os.getenv("TELEMETRY_TAIL_BUFFER_SPANS", "64"))
+TAIL_BUFFER_TRACES = int(os.getenv("TELEMETRY_TAIL_BUFFER_TRACES", "256"))
+# Scopes (sessions) with event counts awaiting a summary span
+_MAX_EVENT_SCOPES = 1024
+# Span names with a rate window; the windows restart beyond this
+_MAX_SPAN_NAMES = 4096
+
+
+@lru_cache(maxsize=4096)
+def _is_noisy_span(name: str) -> bool:
+    return any(pattern.match(name) for pattern in NOISY_SPAN_PATTERNS)
+
+
+@lru_cache(maxsize=4096)
+def _is_turn_span(name: str) -> bool:
+    return any(pattern.match(name) for pattern in TURN_SPAN_PATTERNS)
+
+
+class SpanSamplingPolicy:
+    """
+    Decides which finished spans reach the exporter.
+
+    - Turn-level spans (``TURN_SPAN_PATTERNS``), error spans and spans slower
+      than ``SLOW_SPAN_MS`` are always exported.
+    - Other spans are exported up to ``SPAN_RATE_PER_NAME`` per span name per
+      second; the rest are held in a small per-trace buffer.
+    - When a slow or failed turn-level span ends, the held spans of its trace
+      that overlap it are exported with it (tail-based retention); held spans
+      are otherwise dropped as the buffer rolls over.
+
+    High-frequency events that never become spans are counted per scope with
+    ``count_event`` and reported as one summary span by the caller.
+    """
+
+    def __init__(
+        self,
+        rate_per_name: int = SPAN_RATE_PER_NAME,
+        slow_span_ms: float = SLOW_SPAN_MS,
+        tail_buffer_spans: int = TAIL_BUFFER_SPANS,
+        tail_buffer_traces: int = TAIL_BUFFER_TRACES,
+    ):
+        self.rate_per_name = rate_per_name
+        self.slow_span_ns = int(slow_span_ms * 1_000_000)
+        self.tail_buffer_spans = tail_buffer_spans
+        self.tail_buffer_traces = tail_buffer_traces
+        self._lock = threading.Lock()
+        self._window: dict[str, list[int]] = {}  # span name -> [second, exported]
+        self._held: OrderedDict[int, deque] = OrderedDict()
+        self._events: OrderedDict[str, dict[str, list[int]]] = OrderedDict()
+        self.counters: Counter[str] = Counter()
+
+    def admit(self, span: ReadableSpan) -> list[ReadableSpan]:
+        """Spans to export now that ``span`` has ended (possibly none)."""
+        name = span.name
+        duration = (span.end_time or 0) - (span.start_time or 0)
+        failed = span.status.status_code is StatusCode.ERROR
+        if _is_turn_span(name):
+            with self._lock:
+                self.counters["turn"] += 1
+            if failed or duration >= self.slow_span_ns:
+                return [span, *self._release(span)]
+            return [span]
+        second = (span.end_time or time.time_ns()) // 1_000_000_000
+        with self._lock:
+            if failed or duration >= self.slow_span_ns:
+                self.counters["slow_or_error"] += 1
+                return [span]
+            window = self._window.get(name)
+            if window is None or window[0] != second:
+                if len(self._window) >= _MAX_SPAN_NAMES:
+                    self._window.clear()
+                window = self._window[name] = [second, 0]
+            if window[1] < self.rate_per_name:
+                window[1] += 1
+                self.counters["sampled"] += 1
+                return [span]
+            self._hold(span)
+        return []
+
+    def _hold(self, span: ReadableSpan) -> None:
+        trace_id = span.context.trace_id if span.context else 0
+        held = self._held.get(trace_id)
+        if held is None:
+            held = self._held[trace_id] = deque(maxlen=self.tail_buffer_spans)
+            while len(self._held) > self.tail_buffer_traces:
+                _, evicted = self._held.popitem(last=False)
+                self.counters["dropped"] += len(evicted)
+        elif len(held) == held.maxlen:
+            self.counters["dropped"] += 1
+        held.append(span)
+        self.counters["held"] += 1
+
+    def _release(self, turn: ReadableSpan) -> list[ReadableSpan]:
+        trace_id = turn.context.trace_id if turn.context else 0
+        start, end = turn.start_time or 0, turn.end_time or 0
+        with self._lock:
+            held = self._held.get(trace_id)
+            if not held:
+                return []
+            released = [
+                s for s in held if (s.end_time or 0) >= start and (s.start_time or 0) <= end
+            ]
+            for span in released:
+                held.remove(span)
+            self.counters["retained_tail"] += len(released)
+        return released
+
+    def record_exporter_drop(self) -> None:
+        with self._lock:
+            self.counters["exporter_dropped"] += 1
+
+    def count_event(self, scope: str, event_type: str, size: int = 0) -> None:
+        """Count a high-frequency event (and its payload bytes) instead of tracing it."""
+        with self._lock:
+            events = self._events.get(scope)
+            if events is None:
+                events = self._events[scope] = {}
+                while len(self._events) > _MAX_EVENT_SCOPES:
+                    self._events.popitem(last=False)
+            totals = events.get(event_type)
+            if totals is None:
+                events[event_type] = [1, size]
+            else:
+                totals[0] += 1
+                totals[1] += size
+            self.counters["aggregated"] += 1
+
+    def drain_events(self, scope: str) -> dict[str, Any]:
+        """
+        Summary span attributes for the events counted in ``scope`` since the last drain.
+
+        Each event type contributes ``telemetry.events.<type>.count`` and
+        ``.bytes``; empty when nothing was counted.
+        """
+        with self._lock:
+            events = self._events.pop(scope, None)
+        attributes: dict[str, Any] = {}
+        for event_type, (count, size) in (events or {}).items():
+            attributes[f"telemetry.events.{event_type}.count"] = count
+            attributes[f"telemetry.events.{event_type}.bytes"] = size
+        return attributes
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            held = sum(len(spans) for spans in self._held.values())
+        return {
+            **dict(self.counters),
+            "held_now": held,
+            "rate_per_name": self.rate_per_name,
+            "slow_span_ms": self.slow_span_ns / 1_000_000,
+        }
+
+
+_span_sampling_policy = SpanSamplingPolicy()
+
+
+def span_sampling_policy() -> SpanSamplingPolicy:
+    """The process-wide span sampling policy used by ``FilteringSpanProcessor``."""
+    return _span_sampling_policy
+
+
+def _exporter_queues(processor: Any) -> list[tuple[str, deque]]:
+    """(exporter name, batch queue) for every batch span processor under ``processor``."""
+    found = []
+    pending = [processor]
+    while pending:
+        current = pending.pop()
+        pending.extend(getattr(current, "_span_processors", None) or ())
+        if getattr(current, "_next", None) is not None:
+            pending.append(current._next)
+        batch = getattr(current, "_batch_processor", current)
+        queue = getattr(batch, "_queue", None)
+        if queue is None:
+            queue = getattr(batch, "queue", None)  # SDKs before the shared BatchProcessor
+        if isinstance(queue, deque) and queue.maxlen:
+            exporter = getattr(batch, "_exporter", None) or getattr(batch, "span_exporter", None)
+            found.append((type(exporter).__name__, queue))
+    return found
+
+
+def span_pipeline_stats() -> dict[str, Any]:
+    """Sampling counters and exporter queue depth of the installed tracer provider."""
+    exporters = []
+    try:
+        from opentelemetry import trace as otel_trace
+
+        processor = getattr(otel_trace.get_tracer_provider(), "_active_span_processor", None)
+        if processor is not None:
+            exporters = [
+                {"exporter": name, "queued": len(queue), "max_queue_size": queue.maxlen}
+                for name, queue in _exporter_queues(processor)
+            ]
+    except Exception as e:
+        logger.debug(f"Could not inspect span exporter queues: {e}")
+    return {"sampling": span_sampling_policy().stats(), "exporters": exporters}
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # SPAN PROCESSOR WITH FILTERING AND PII SCRUBBING
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -131,10 +359,17 @@ class FilteringSpanProcessor(SpanProcessor):
     for better performance and simpler configuration.
     """
 
-    def __init__(self, next_processor: SpanProcessor, enable_pii_scrubbing: bool = True):
+    def __init__(
+        self,
+        next_processor: SpanProcessor,
+        enable_pii_scrubbing: bool = True,
+        policy: SpanSamplingPolicy | None = None,
+    ):
         self._next = next_processor
         self._enable_pii_scrubbing = enable_pii_scrubbing
         self._pii_scrubber = None
+        self._policy = policy or span_sampling_policy()
+        self._exporter_queues = [queue for _, queue in _exporter_queues(next_processor)]
 
         if enable_pii_scrubbing:
             try:
@@ -149,13 +384,17 @@ class FilteringSpanProcessor(SpanProcessor):
 
     def on_end(self, span: ReadableSpan) -> None:
         # Filter noisy spans
-        for pattern in NOISY_SPAN_PATTERNS:
-            if pattern.match(span.name):
-                return  # Drop span
+        if _is_noisy_span(span.name):
+            return  # Drop span
 
         # PII scrubbing is handled at attribute level during span creation
         # and in the log exporter filter - we pass through here
-        self._next.on_end(span)
+        for admitted in self._policy.admit(span):
+            for queue in self._exporter_queues:
+                if len(queue) >= queue.maxlen:
+                    # A full batch queue silently discards its oldest span to take this one
+                    self._policy.record_exporter_drop()
+            self._next.on_end(admitted)
 
     def shutdown(self) -> None:
         self._next.shutdown()